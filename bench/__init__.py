@@ -0,0 +1 @@
+"""Offline benchmarks: synthetic marketplace orders, fake Google backends and a runner."""
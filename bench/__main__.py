@@ -0,0 +1,7 @@
+"""``python -m bench``: see bench/runner.py for the options."""
+
+import sys
+
+from bench.runner import main
+
+sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,774 @@
+"""A local stand-in for the Google Sheets v4 and Drive v3 APIs.
+
+Implements the subset the app uses: spreadsheet metadata, ``batchUpdate``
+(insertDimension, appendDimension, deleteDimension and grid-checked
+formatting/merge requests), ``values`` get/update/append/batchGet/
+batchUpdate, Drive ``files.list`` (``name contains``/``name =``/``in
+parents``/``trashed`` queries), ``files.create`` with multipart, media and
+resumable uploads, ``files.get`` and ``changes.list``. Latency, jitter,
+injected 429/5xx errors and per-minute quotas are configurable, so
+concurrency, batching and rate limiting can be load-tested offline:
+
+    python -m bench.fake_google --port 8765 --latency-ms 80 --jitter-ms 40 \\
+        --error-429 0.02 --error-5xx 0.01
+    GOOGLE_API_ENDPOINT=http://127.0.0.1:8765 python main.py --cli
+
+Spreadsheets are created on first access with the sheets and header row the
+writer expects; every queried order gets a design file on the fake Drive
+unless ``--no-auto-files`` is given.
+"""
+
+import email.parser
+import itertools
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from bench.fakes import HEADERS, SHEETS
+from google_api.stats import QUOTAS_PER_MINUTE, WINDOW_SECONDS, classify
+
+Response = tuple[int, dict[str, str], bytes]
+
+_SHEETS_RE = re.compile(
+    r"^/v4/spreadsheets/(?P<id>[^/:]+)"
+    r"(?:(?P<batch>:batchUpdate)"
+    r"|/values:(?P<values_batch>batchGet|batchUpdate)"
+    r"|/values/(?P<range>[^:]+)(?P<append>:append)?)?$"
+)
+_DRIVE_RE = re.compile(
+    r"^(?P<upload>/upload)?/drive/v3/"
+    r"(?:files(?:/(?P<file_id>[^/]+))?|changes(?P<start>/startPageToken)?)$"
+)
+_QUOTED = r"'((?:[^'\\]|\\.)*)'"
+_CLAUSES = (
+    (
+        "name_contains",
+        re.compile(rf"^(not\s+)?name\s+contains\s+{_QUOTED}$", re.IGNORECASE),
+    ),
+    ("name_equals", re.compile(rf"^(not\s+)?name\s*=\s*{_QUOTED}$", re.IGNORECASE)),
+    ("parent", re.compile(rf"^(not\s+)?{_QUOTED}\s+in\s+parents$", re.IGNORECASE)),
+    ("trashed", re.compile(r"^()trashed\s*=\s*(true|false)$", re.IGNORECASE)),
+)
+_A1_RE = re.compile(r"^([A-Z]*)(\d*)$")
+
+
+class ApiError(Exception):
+    def __init__(self, code: int, message: str, status: str = "INVALID_ARGUMENT"):
+        super().__init__(message)
+        self.code = code
+        self.status = status
+
+
+@dataclass
+class FakeGoogleConfig:
+    """Behaviour of the fake server; error rates are probabilities per request."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_429: float = 0.0
+    error_5xx: float = 0.0
+    # Requests per minute per quota bucket (see google_api/stats.py); {} = off.
+    quotas: dict[str, int] = field(default_factory=lambda: dict(QUOTAS_PER_MINUTE))
+    auto_files: bool = True
+    sheets: tuple[str, ...] = SHEETS
+    headers: list[str] = field(default_factory=lambda: list(HEADERS))
+    row_count: int = 1000
+    seed: int = 0
+
+
+@dataclass
+class _Sheet:
+    sheet_id: int
+    title: str
+    rows: list[list[Any]]
+    row_count: int
+    column_count: int
+
+    def properties(self, index: int) -> dict[str, Any]:
+        return {
+            "sheetId": self.sheet_id,
+            "title": self.title,
+            "index": index,
+            "sheetType": "GRID",
+            "gridProperties": {
+                "rowCount": self.row_count,
+                "columnCount": self.column_count,
+                "frozenRowCount": 1,
+            },
+        }
+
+
+class FakeGoogle:
+    """The API state and request handling, independent of the HTTP server."""
+
+    def __init__(self, config: FakeGoogleConfig | None = None) -> None:
+        self.config = config or FakeGoogleConfig()
+        self.base_url = ""
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._spreadsheets: dict[str, dict[str, _Sheet]] = {}
+        self._files: dict[str, dict[str, Any]] = {}
+        self._changes: list[dict[str, Any]] = []
+        self._uploads: dict[str, dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self._window: deque[tuple[float, str]] = deque()
+        self.calls: Counter[str] = Counter()
+        self.injected: Counter[int] = Counter()
+        self.throttled = 0
+
+    # ------------------------------------------------------------------
+    # Entry point
+    # ------------------------------------------------------------------
+    def handle(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> Response:
+        parts = urlsplit(target)
+        if parts.path == "/_fake/stats":
+            return _json(200, self.stats())
+
+        self._delay()
+        api, name = classify(method, "http://fake" + parts.path)
+        with self._lock:
+            self.calls[f"{api} {name}"] += 1
+            fault = self._fault(method, parts.path)
+        if fault is not None:
+            return fault
+
+        query = parse_qs(parts.query)
+        result: dict[str, Any] | Response
+        try:
+            with self._lock:
+                if parts.path.startswith("/v4/spreadsheets/"):
+                    result = self._sheets(method, parts.path, query, body)
+                else:
+                    result = self._drive(method, parts.path, query, headers, body)
+        except ApiError as error:
+            return _error(error.code, str(error), error.status, drive=api == "drive")
+        if isinstance(result, tuple):
+            return result
+        return _json(200, result)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": dict(sorted(self.calls.items())),
+                "throttled": self.throttled,
+                "injected": {str(code): count for code, count in self.injected.items()},
+                "files": len(self._files),
+                "rows": {
+                    f"{spreadsheet_id}/{title}": len(sheet.rows) - 1
+                    for spreadsheet_id, sheets in self._spreadsheets.items()
+                    for title, sheet in sheets.items()
+                },
+            }
+
+    def sheet_rows(self, spreadsheet_id: str, title: str) -> list[list[Any]]:
+        """A copy of the cells of one sheet (header row included)."""
+        with self._lock:
+            sheet = self._spreadsheet(spreadsheet_id)[title]
+            return [list(row) for row in sheet.rows]
+
+    def add_file(self, name: str, parents: Sequence[str] = ()) -> dict[str, Any]:
+        """Puts a file on the fake Drive (as if uploaded earlier)."""
+        with self._lock:
+            return self._create_file({"name": name, "parents": list(parents)}, b"")
+
+    # ------------------------------------------------------------------
+    # Latency, injected errors, quotas
+    # ------------------------------------------------------------------
+    def _delay(self) -> None:
+        config = self.config
+        if config.latency_ms <= 0 and config.jitter_ms <= 0:
+            return
+        with self._lock:
+            jitter = self._random.uniform(-config.jitter_ms, config.jitter_ms)
+        time.sleep(max(0.0, config.latency_ms + jitter) / 1000)
+
+    def _fault(self, method: str, path: str) -> Response | None:
+        drive = not path.startswith("/v4/")
+        now = time.monotonic()
+        while self._window and now - self._window[0][0] > WINDOW_SECONDS:
+            self._window.popleft()
+        api, _ = classify(method, "http://fake" + path)
+        write = method.upper() in ("POST", "PUT", "PATCH", "DELETE")
+        bucket = f"{api}.{'write' if write else 'read'}"
+        self._window.append((now, bucket))
+        quota = self.config.quotas.get(bucket)
+        if quota is not None:
+            used = sum(1 for _, name in self._window if name == bucket)
+            if used > quota:
+                self.throttled += 1
+                return _error(
+                    429,
+                    f"Quota exceeded for quota metric '{bucket}' "
+                    f"(limit {quota} per minute)",
+                    "RESOURCE_EXHAUSTED",
+                    drive=drive,
+                )
+
+        roll = self._random.random()
+        if roll < self.config.error_429:
+            self.injected[429] += 1
+            return _error(429, "Rate limit exceeded", "RESOURCE_EXHAUSTED", drive)
+        if roll < self.config.error_429 + self.config.error_5xx:
+            code = self._random.choice((500, 503))
+            self.injected[code] += 1
+            status = "INTERNAL" if code == 500 else "UNAVAILABLE"
+            return _error(code, "Backend error", status, drive=drive)
+        return None
+
+    # ------------------------------------------------------------------
+    # Sheets v4
+    # ------------------------------------------------------------------
+    def _spreadsheet(self, spreadsheet_id: str) -> dict[str, _Sheet]:
+        sheets = self._spreadsheets.get(spreadsheet_id)
+        if sheets is None:
+            config = self.config
+            sheets = self._spreadsheets[spreadsheet_id] = {
+                title: _Sheet(
+                    sheet_id=index,
+                    title=title,
+                    rows=[list(config.headers)],
+                    row_count=config.row_count,
+                    column_count=max(26, len(config.headers)),
+                )
+                for index, title in enumerate(config.sheets)
+            }
+        return sheets
+
+    def _sheets(
+        self, method: str, path: str, query: dict[str, list[str]], body: bytes
+    ) -> dict[str, Any]:
+        match = _SHEETS_RE.match(path)
+        if match is None:
+            raise ApiError(404, f"Unknown Sheets endpoint {path}", "NOT_FOUND")
+        spreadsheet_id = match.group("id")
+        sheets = self._spreadsheet(spreadsheet_id)
+        payload = json.loads(body) if body else {}
+
+        if match.group("batch") and method == "POST":
+            replies = [self._apply(sheets, request) for request in payload["requests"]]
+            return {"spreadsheetId": spreadsheet_id, "replies": replies}
+
+        values_batch = match.group("values_batch")
+        if values_batch == "batchGet" and method == "GET":
+            return {
+                "spreadsheetId": spreadsheet_id,
+                "valueRanges": [
+                    self._get_values(sheets, name) for name in query.get("ranges", [])
+                ],
+            }
+        if values_batch == "batchUpdate" and method == "POST":
+            responses = [
+                self._update_values(sheets, item["range"], item["values"])
+                for item in payload.get("data", [])
+            ]
+            return {"spreadsheetId": spreadsheet_id, "responses": responses}
+
+        range_name = match.group("range")
+        if range_name is not None:
+            range_name = unquote(range_name)
+            if match.group("append") and method == "POST":
+                return self._append_values(sheets, range_name, payload["values"])
+            if method == "GET":
+                return self._get_values(sheets, range_name)
+            if method == "PUT":
+                return self._update_values(sheets, range_name, payload["values"])
+
+        if method == "GET" and not match.group("batch") and values_batch is None:
+            return {
+                "spreadsheetId": spreadsheet_id,
+                "properties": {"title": f"Fake {spreadsheet_id}", "locale": "en_US"},
+                "sheets": [
+                    {"properties": sheet.properties(index)}
+                    for index, sheet in enumerate(sheets.values())
+                ],
+            }
+        raise ApiError(404, f"Unsupported {method} {path}", "NOT_FOUND")
+
+    def _apply(self, sheets: dict[str, _Sheet], request: dict[str, Any]) -> dict:
+        (kind, spec), *_ = request.items()
+        if kind == "insertDimension":
+            grid = spec["range"]
+            sheet = _by_id(sheets, grid["sheetId"])
+            _rows_only(grid)
+            start, end = grid["startIndex"], grid["endIndex"]
+            if start > sheet.row_count:
+                raise ApiError(400, "insertDimension starts beyond the grid")
+            if start < len(sheet.rows):
+                sheet.rows[start:start] = [[] for _ in range(end - start)]
+            sheet.row_count += end - start
+        elif kind == "appendDimension":
+            sheet = _by_id(sheets, spec["sheetId"])
+            if spec.get("dimension", "ROWS") != "ROWS":
+                raise ApiError(400, "Only ROWS dimensions are supported")
+            sheet.row_count += spec["length"]
+        elif kind == "deleteDimension":
+            grid = spec["range"]
+            sheet = _by_id(sheets, grid["sheetId"])
+            _rows_only(grid)
+            del sheet.rows[grid["startIndex"] : grid["endIndex"]]
+            sheet.row_count -= grid["endIndex"] - grid["startIndex"]
+        elif "range" in spec and isinstance(spec["range"], dict):
+            # repeatCell, mergeCells, updateBorders...: only the grid is checked.
+            grid = spec["range"]
+            sheet = _by_id(sheets, grid.get("sheetId", 0))
+            if grid.get("endRowIndex", 0) > sheet.row_count:
+                raise ApiError(
+                    400,
+                    f"Range ({sheet.title}!R{grid['endRowIndex']}) exceeds grid "
+                    f"limits. Max rows: {sheet.row_count}",
+                )
+        return {}
+
+    def _locate(
+        self, sheets: dict[str, _Sheet], range_name: str
+    ) -> tuple[_Sheet, int, int | None, int, int | None]:
+        """Sheet and 0-based [row, row_end) x [col, col_end) of an A1 range."""
+        title, _, cells = range_name.rpartition("!")
+        if not title:
+            title, cells = cells, ""
+        if title.startswith("'") and title.endswith("'"):
+            title = title[1:-1].replace("''", "'")
+        sheet = sheets.get(title)
+        if sheet is None:
+            raise ApiError(400, f"Unable to parse range: {range_name}")
+        if not cells:
+            return sheet, 0, None, 0, None
+
+        start, _, end = cells.upper().partition(":")
+        start_col, start_row = _a1(start, range_name)
+        end_col, end_row = _a1(end, range_name) if end else (start_col, start_row)
+        row = start_row - 1 if start_row else 0
+        col = start_col - 1 if start_col else 0
+        row_end = end_row if end_row else None
+        col_end = end_col if end_col else None
+        if not end and start_row:
+            row_end = start_row
+        return sheet, row, row_end, col, col_end
+
+    def _get_values(self, sheets: dict[str, _Sheet], range_name: str) -> dict:
+        sheet, row, row_end, col, col_end = self._locate(sheets, range_name)
+        values = []
+        for cells in sheet.rows[row:row_end]:
+            values.append(_trim([_formatted(v) for v in cells[col:col_end]]))
+        while values and not values[-1]:
+            values.pop()
+        result: dict[str, Any] = {"range": range_name, "majorDimension": "ROWS"}
+        if values:
+            result["values"] = values
+        return result
+
+    def _update_values(
+        self, sheets: dict[str, _Sheet], range_name: str, values: list[list[Any]]
+    ) -> dict[str, Any]:
+        sheet, row, _, col, _ = self._locate(sheets, range_name)
+        self._write(sheet, row, col, values)
+        return {
+            "updatedRange": range_name,
+            "updatedRows": len(values),
+            "updatedColumns": max((len(r) for r in values), default=0),
+            "updatedCells": sum(len(r) for r in values),
+        }
+
+    def _append_values(
+        self, sheets: dict[str, _Sheet], range_name: str, values: list[list[Any]]
+    ) -> dict[str, Any]:
+        sheet, _, _, col, _ = self._locate(sheets, range_name)
+        row = len(sheet.rows)
+        self._write(sheet, row, col, values)
+        return {"updates": {"updatedRange": range_name, "updatedRows": len(values)}}
+
+    @staticmethod
+    def _write(sheet: _Sheet, row: int, col: int, values: list[list[Any]]) -> None:
+        if row + len(values) > sheet.row_count:
+            raise ApiError(
+                400,
+                f"Range ({sheet.title}!R{row + len(values)}) exceeds grid limits. "
+                f"Max rows: {sheet.row_count}",
+            )
+        while len(sheet.rows) < row + len(values):
+            sheet.rows.append([])
+        for offset, new_values in enumerate(values):
+            cells = sheet.rows[row + offset]
+            if len(cells) < col + len(new_values):
+                cells.extend([""] * (col + len(new_values) - len(cells)))
+            cells[col : col + len(new_values)] = new_values
+
+    # ------------------------------------------------------------------
+    # Drive v3
+    # ------------------------------------------------------------------
+    def _drive(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, list[str]],
+        headers: dict[str, str],
+        body: bytes,
+    ) -> dict[str, Any] | Response:
+        match = _DRIVE_RE.match(path)
+        if match is None:
+            raise ApiError(404, f"Unknown Drive endpoint {path}", "NOT_FOUND")
+        param = {key: values[-1] for key, values in query.items()}
+
+        if match.group("start"):
+            return {"startPageToken": str(len(self._changes) + 1)}
+        if path.endswith("/changes"):
+            return self._list_changes(param)
+
+        if match.group("upload"):
+            return self._upload(method, param, headers, body)
+        file_id = match.group("file_id")
+        if method == "GET" and file_id:
+            file = self._files.get(file_id)
+            if file is None:
+                raise ApiError(404, f"File not found: {file_id}", "NOT_FOUND")
+            return file
+        if method == "GET":
+            return {"kind": "drive#fileList", "files": self._list_files(param)}
+        if method == "POST":
+            return self._create_file(json.loads(body) if body else {}, b"")
+        raise ApiError(404, f"Unsupported {method} {path}", "NOT_FOUND")
+
+    def _list_files(self, param: dict[str, str]) -> list[dict[str, Any]]:
+        clauses = _parse_query(param.get("q", ""))
+        found = [file for file in self._files.values() if _matches(file, clauses)]
+        if not found and self.config.auto_files:
+            wanted = [
+                value
+                for kind, negated, value in clauses
+                if kind == "name_contains" and not negated
+            ]
+            if wanted and not any(".pdf" in value for value in wanted):
+                name = f"24x36 {' '.join(wanted)}.svg"
+                found = [self._create_file({"name": name}, b"")]
+        return found
+
+    def _list_changes(self, param: dict[str, str]) -> dict[str, Any]:
+        try:
+            start = int(param.get("pageToken", "1"))
+        except ValueError as error:
+            raise ApiError(400, "Invalid pageToken") from error
+        size = int(param.get("pageSize", "100"))
+        changes = self._changes[start - 1 : start - 1 + size]
+        result: dict[str, Any] = {"kind": "drive#changeList", "changes": changes}
+        if start - 1 + size < len(self._changes):
+            result["nextPageToken"] = str(start + size)
+        else:
+            result["newStartPageToken"] = str(len(self._changes) + 1)
+        return result
+
+    def _upload(
+        self,
+        method: str,
+        param: dict[str, str],
+        headers: dict[str, str],
+        body: bytes,
+    ) -> dict[str, Any] | Response:
+        upload_type = param.get("uploadType", "media")
+        content_type = headers.get("content-type", "")
+
+        if upload_type == "resumable" and "upload_id" in param:
+            upload = self._uploads.get(param["upload_id"])
+            if upload is None:
+                raise ApiError(404, "Unknown upload", "NOT_FOUND")
+            upload["data"] += body
+            total = _content_range_total(headers.get("content-range", ""))
+            if total is not None and len(upload["data"]) < total:
+                done = f"bytes=0-{len(upload['data']) - 1}"
+                return 308, {"Range": done}, b""
+            del self._uploads[param["upload_id"]]
+            return self._create_file(upload["metadata"], upload["data"])
+
+        if upload_type == "resumable":
+            upload_id = str(next(self._ids))
+            self._uploads[upload_id] = {
+                "metadata": json.loads(body) if body else {},
+                "data": b"",
+            }
+            location = (
+                f"{self.base_url}/upload/drive/v3/files"
+                f"?uploadType=resumable&upload_id={upload_id}"
+            )
+            return 200, {"Location": location}, b""
+
+        if upload_type == "multipart":
+            message = email.parser.BytesParser().parsebytes(
+                f"Content-Type: {content_type}\r\n\r\n".encode() + body
+            )
+            payloads = [
+                payload
+                for part in message.get_payload()
+                if not isinstance(part, str)
+                and isinstance(payload := part.get_payload(decode=True), bytes)
+            ]
+            if len(payloads) != 2:
+                raise ApiError(400, "Malformed multipart upload")
+            metadata, data = payloads
+            return self._create_file(json.loads(metadata or b"{}"), data)
+
+        return self._create_file({"name": "Untitled"}, body)
+
+    def _create_file(self, metadata: dict[str, Any], data: bytes) -> dict[str, Any]:
+        file_id = f"fake{next(self._ids)}"
+        name = metadata.get("name", "Untitled")
+        file = {
+            "kind": "drive#file",
+            "id": file_id,
+            "name": name,
+            "mimeType": metadata.get("mimeType", _mime_type(name)),
+            "parents": list(metadata.get("parents", [])),
+            "size": str(len(data)),
+            "trashed": False,
+            "webViewLink": f"https://drive.google.com/file/d/{file_id}/view",
+        }
+        self._files[file_id] = file
+        self._changes.append(
+            {
+                "kind": "drive#change",
+                "type": "file",
+                "changeType": "file",
+                "fileId": file_id,
+                "removed": False,
+                "time": datetime.now(UTC).isoformat(timespec="milliseconds"),
+                "file": file,
+            }
+        )
+        return file
+
+
+def _a1(cell: str, range_name: str) -> tuple[int, int]:
+    """Column and row numbers (1-based, 0 = open) of "B12", "B" or "12"."""
+    match = _A1_RE.match(cell)
+    if match is None:
+        raise ApiError(400, f"Unable to parse range: {range_name}")
+    letters, digits = match.groups()
+    column = 0
+    for letter in letters:
+        column = column * 26 + ord(letter) - ord("A") + 1
+    return column, int(digits) if digits else 0
+
+
+def _by_id(sheets: dict[str, _Sheet], sheet_id: int) -> _Sheet:
+    for sheet in sheets.values():
+        if sheet.sheet_id == sheet_id:
+            return sheet
+    raise ApiError(400, f"No grid with id: {sheet_id}")
+
+
+def _rows_only(grid: dict[str, Any]) -> None:
+    if grid.get("dimension", "ROWS") != "ROWS":
+        raise ApiError(400, "Only ROWS dimensions are supported")
+
+
+def _formatted(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _trim(cells: list[str]) -> list[str]:
+    while cells and cells[-1] == "":
+        cells.pop()
+    return cells
+
+
+def _parse_query(q: str) -> list[tuple[str, bool, str]]:
+    clauses = []
+    for text in filter(
+        None, (c.strip() for c in re.split(r"\s+and\s+", q, flags=re.IGNORECASE))
+    ):
+        for kind, pattern in _CLAUSES:
+            match = pattern.match(text)
+            if match:
+                negated, value = match.groups()
+                clauses.append((kind, bool(negated), value.replace("\\'", "'")))
+                break
+        else:
+            raise ApiError(400, f"Invalid Value: unsupported query clause {text!r}")
+    return clauses
+
+
+def _matches(file: dict[str, Any], clauses: list[tuple[str, bool, str]]) -> bool:
+    for kind, negated, value in clauses:
+        if kind == "name_contains":
+            hit = value.lower() in file["name"].lower()
+        elif kind == "name_equals":
+            hit = file["name"] == value
+        elif kind == "parent":
+            hit = value in file["parents"]
+        else:
+            hit = file["trashed"] == (value.lower() == "true")
+        if hit == negated:
+            return False
+    return True
+
+
+def _mime_type(name: str) -> str:
+    extension = name.rsplit(".", 1)[-1].lower()
+    return {
+        "pdf": "application/pdf",
+        "svg": "image/svg+xml",
+        "png": "image/png",
+        "jpg": "image/jpeg",
+        "jpeg": "image/jpeg",
+    }.get(extension, "application/octet-stream")
+
+
+def _content_range_total(header: str) -> int | None:
+    """The total of "bytes 0-99/250" (None for "*" or no header)."""
+    total = header.rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _json(status: int, payload: Any) -> Response:
+    body = json.dumps(payload).encode("utf-8")
+    return status, {"Content-Type": "application/json; charset=UTF-8"}, body
+
+
+def _error(code: int, message: str, status: str, drive: bool = False) -> Response:
+    error: dict[str, Any] = {"code": code, "message": message, "status": status}
+    if drive:
+        # Drive errors carry the legacy "errors" list gspread's back-off reads.
+        reason = "rateLimitExceeded" if code == 429 else "backendError"
+        domain = "usageLimits" if code == 429 else "global"
+        error["errors"] = [{"domain": domain, "reason": reason, "message": message}]
+    return _json(code, {"error": error})
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {key.lower(): value for key, value in self.headers.items()}
+        status, extra, payload = self.server.api.handle(
+            self.command, self.path, headers, body
+        )
+        self.send_response(status)
+        for key, value in extra.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    api: FakeGoogle
+
+
+class FakeGoogleServer:
+    """Runs FakeGoogle on a local port in a background thread.
+
+    ``with FakeGoogleServer() as server:`` then point the clients at
+    ``server.url`` (GOOGLE_API_ENDPOINT).
+    """
+
+    def __init__(
+        self,
+        config: FakeGoogleConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.api = FakeGoogle(config)
+        self._host = host
+        self._server = _Server((host, port), _Handler)
+        self._server.api = self.api
+        self.api.base_url = self.url
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self._server.server_port}"
+
+    def start(self) -> Self:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="fake-google",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def config_from_argv(argv: Sequence[str]) -> tuple[FakeGoogleConfig, int]:
+    """Reads ``--port 8765 --latency-ms 80 --jitter-ms 40 --error-429 0.02
+    --error-5xx 0.01 --quota sheets.write=60 --no-quota --no-auto-files
+    --seed 1``."""
+    args = list(argv)
+
+    def value_after(flag: str, default: str) -> str:
+        try:
+            return args[args.index(flag) + 1]
+        except (ValueError, IndexError):
+            return default
+
+    quotas = {} if "--no-quota" in args else dict(QUOTAS_PER_MINUTE)
+    for index, arg in enumerate(args[:-1]):
+        if arg == "--quota":
+            bucket, _, limit = args[index + 1].partition("=")
+            quotas[bucket] = int(limit)
+    config = FakeGoogleConfig(
+        latency_ms=float(value_after("--latency-ms", "0")),
+        jitter_ms=float(value_after("--jitter-ms", "0")),
+        error_429=float(value_after("--error-429", "0")),
+        error_5xx=float(value_after("--error-5xx", "0")),
+        quotas=quotas,
+        auto_files="--no-auto-files" not in args,
+        seed=int(value_after("--seed", "0")),
+    )
+    return config, int(value_after("--port", "8765"))
+
+
+def main(argv: Sequence[str]) -> int:
+    config, port = config_from_argv(argv)
+    server = FakeGoogleServer(config, port=port)
+    print(f"Fake Google APIs on {server.url}")
+    print(f"Point the app at it with GOOGLE_API_ENDPOINT={server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(json.dumps(server.api.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,116 @@
+"""In-memory stand-ins for Google Drive and Sheets used by the benchmarks.
+
+They subclass the real finder and writer and replace only the network
+edge, so the query cache, sheet routing, row layout and request builders
+run exactly as in production.
+"""
+
+import threading
+from typing import Any
+
+from core.constants import SHEET_COLUMNS, SHEET_NAMES
+from google_api.gdrive_finder import GoogleDriveFinder
+from google_api.gsheet_writer import GSheetWriter
+
+HEADERS = list(SHEET_COLUMNS)
+
+SHEETS = SHEET_NAMES
+
+
+class _FakeRequest:
+    def __init__(self, response: dict[str, Any]) -> None:
+        self._response = response
+
+    def execute(self, num_retries: int = 0) -> dict[str, Any]:
+        return self._response
+
+
+class _FakeFiles:
+    def list(self, q: str, **kwargs: Any) -> _FakeRequest:
+        # Every query finds one design file named "<W>x<H> <query words>.svg".
+        name = q.split("'")[1] if "'" in q else q
+        return _FakeRequest(
+            {
+                "files": [
+                    {
+                        "id": f"id-{name}",
+                        "name": f"24x36 {name}.svg",
+                        "webViewLink": f"https://drive.google.com/file/d/{name}/view",
+                    }
+                ]
+            }
+        )
+
+
+class _FakeDriveService:
+    def files(self) -> _FakeFiles:
+        return _FakeFiles()
+
+
+class OfflineFinder(GoogleDriveFinder):
+    """A GoogleDriveFinder whose Drive answers every search with one file."""
+
+    @property
+    def service(self):
+        return _FakeDriveService()
+
+    def upload_shipping_labels(self, order_id: str) -> str:
+        return f"https://drive.google.com/file/d/{order_id}.pdf/view"
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet: "FakeSpreadsheet", title: str, sheet_id: int):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.rows: list[list[Any]] = [list(HEADERS)]
+        # Grid size of a new Google sheet
+        self.row_count = 1000
+
+    def row_values(self, row: int) -> list[str]:
+        return [str(value) for value in self.rows[row - 1]]
+
+    def get_all_values(self) -> list[list[Any]]:
+        return [list(row) for row in self.rows]
+
+    def update(self, values: list[list[Any]], range_name: str, **kwargs: Any) -> None:
+        start = int(range_name.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ")) - 1
+        with self.spreadsheet.lock:
+            self.rows[start:start] = [list(row) for row in values]
+
+
+class FakeSpreadsheet:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requests: list[dict[str, Any]] = []
+        self.worksheets = {
+            title: FakeWorksheet(self, title, sheet_id)
+            for sheet_id, title in enumerate(SHEETS)
+        }
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        return self.worksheets[title]
+
+    def batch_update(self, body: dict[str, Any]) -> dict[str, Any]:
+        with self.lock:
+            self.requests.extend(body["requests"])
+        return {"replies": []}
+
+    def values_batch_update(self, body: dict[str, Any]) -> dict[str, Any]:
+        for value_range in body["data"]:
+            title, cell = value_range["range"].rsplit("!", 1)
+            self.worksheets[title.strip("'")].update(value_range["values"], cell)
+        return {"responses": []}
+
+
+class OfflineWriter(GSheetWriter):
+    """A GSheetWriter writing into a FakeSpreadsheet."""
+
+    def __init__(self) -> None:
+        self.spreadsheet = FakeSpreadsheet()  # type: ignore[assignment]
+        self._worksheets = {}
+        self._headers = {}
+        self._layouts = {}
+        self._next_rows = {}
+        self._grid_rows = {}
+        self._grid_checked = False
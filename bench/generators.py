@@ -0,0 +1,410 @@
+"""Synthetic order pages for every marketplace.
+
+Each generator builds a page carrying exactly the markup its parser selects
+(classes, ids, data attributes, the detection URL), plus optional filler
+markup that stands in for the navigation, scripts and widgets of a real
+saved page. Pages are deterministic for a given order number.
+"""
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from html import escape
+
+_FIRST_NAMES = ("Olivia", "Liam", "Emma", "Noah", "Ava", "Mason", "Sophia", "Ethan")
+_LAST_NAMES = ("Smith", "Johnson", "Brown", "Miller", "Davis", "Wilson", "Moore")
+_STREETS = ("Oak St", "Maple Ave", "Cedar Ln", "Pine Rd", "Elm Dr", "Birch Ct")
+_CITIES = (
+    ("Springfield", "IL", "62701"),
+    ("Austin", "TX", "73301"),
+    ("Portland", "OR", "97201"),
+    ("Columbus", "OH", "43004"),
+)
+_PRODUCTS = ("Mountain Range", "Forest Mural", "World Map", "Palm Leaves", "Skyline")
+_COLORS = ("Matte Black", "Sage Green", "Navy Blue", "Dusty Rose", "Warm Grey")
+_SIZES = ((24, 36), (18, 24), (36, 48), (12, 18), (30, 40))
+
+
+@dataclass
+class _Item:
+    index: int
+    product: str
+    color: str
+    width: int
+    height: int
+    quantity: int
+    price: float
+
+
+class _Order:
+    """The random but reproducible facts shared by all markups of one order."""
+
+    def __init__(self, number: int, items: int) -> None:
+        rng = random.Random(number)
+        self.number = number
+        self.name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+        self.street = f"{rng.randint(10, 9999)} {rng.choice(_STREETS)}"
+        self.city, self.state, self.zip = rng.choice(_CITIES)
+        self.phone = f"+1 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+        self.tracking = f"9400{number:018d}"
+        self.items = [
+            _Item(
+                index,
+                rng.choice(_PRODUCTS),
+                rng.choice(_COLORS),
+                *rng.choice(_SIZES),
+                quantity=rng.randint(1, 3),
+                price=round(rng.uniform(15, 120), 2),
+            )
+            for index in range(max(1, items))
+        ]
+        self.items_total = round(sum(i.price * i.quantity for i in self.items), 2)
+
+
+def filler(kilobytes: int, seed: int = 0) -> str:
+    """Neutral nested markup of roughly ``kilobytes`` KiB (no parser selectors)."""
+    if kilobytes <= 0:
+        return ""
+    rng = random.Random(seed)
+    blocks: list[str] = []
+    size = 0
+    while size < kilobytes * 1024:
+        links = "".join(
+            f'<li class="nav-item"><a class="nav-link" href="/section/{rng.randint(1, 9999)}">'
+            f'<span class="nav-label">Section {rng.randint(1, 999)}</span></a></li>'
+            for _ in range(8)
+        )
+        block = (
+            f'<div class="bench-filler" data-block="{len(blocks)}">'
+            f'<ul class="nav-list">{links}</ul>'
+            f'<p class="help-text">Lorem ipsum dolor sit amet, {rng.random():.6f}.</p>'
+            "</div>"
+        )
+        blocks.append(block)
+        size += len(block)
+    return "".join(blocks)
+
+
+def _page(title: str, head_link: str, body: str, filler_kb: int, seed: int) -> str:
+    half = filler(filler_kb // 2, seed)
+    rest = filler(filler_kb - filler_kb // 2, seed + 1)
+    return (
+        f"<html><head><title>{escape(title)}</title></head><body>"
+        f'<a class="home-link" href="{head_link}">Home</a>'
+        f"{half}{body}{rest}</body></html>"
+    )
+
+
+def etsy_order(number: int, items: int = 1, filler_kb: int = 0) -> str:
+    order = _Order(number, items)
+    order_id = f"3{number:09d}"
+    rows = []
+    listings = []
+    for item in order.items:
+        title = f"{item.product} Wall Decal"
+        rows.append(
+            '<tr class="col-group pl-xs-0 pt-xs-3 pr-xs-0 pb-xs-3">'
+            '<td class="col-xs-8"><div class="flag-body prose">'
+            f'<span data-test-id="unsanitize">{title}</span>'
+            f"<ul><li>Size: {item.width} x {item.height} inches</li>"
+            f"<li>Color: {item.color}</li></ul></div>"
+            '<span class="mb-xs-1"><p>SKU: '
+            f'<span data-test-id="unsanitize">ED-{number}-{item.index}</span></p></span>'
+            "</td>"
+            f'<td class="col-xs-2 pl-xs-0 text-center">{item.quantity}</td>'
+            "</tr>"
+        )
+        listings.append(
+            f'<a href="https://www.etsy.com/listing/{number}{item.index:03d}/'
+            f'{item.product.lower().replace(" ", "-")}?ref=sold">{title}</a>'
+        )
+
+    body = (
+        '<div class="mt-xs-6 mb-xs-4">Ship by Jan 15, 2025</div>'
+        '<span id="order-details-order-info" class="display-inline-block">'
+        '<a classname="text-gray-darker">BenchDecals</a> '
+        f'<a classname="strong">{order_id}</a></span>'
+        '<div data-testid="destination" class="panel mb-xs-0 mt-xs-2">'
+        '<div class="address break-word fs-mask"><p>'
+        f'<span class="name">{order.name}</span>'
+        f'<span class="first-line">{order.street}</span>'
+        f'<span class="city">{order.city}</span>'
+        f'<span class="state">{order.state}</span>'
+        f'<span class="zip">{order.zip}</span>'
+        '<span class="country-name">United States</span>'
+        "</p></div></div>"
+        f'<table class="order-items">{"".join(rows)}</table>'
+        f'<div class="listing-links">{"".join(listings)}</div>'
+        "<ul>"
+        '<li class="col-group wt-p-xs-0 wt-mt-xs-1 wt-mb-xs-1">Item total'
+        f'<div class="col-xs-3 text-right wt-pr-xs-0">${order.items_total:,.2f}</div></li>'
+        '<li class="col-group wt-p-xs-0 wt-mt-xs-1 wt-mb-xs-1">Shipping price'
+        '<div class="col-xs-3 text-right wt-pr-xs-0">$4.99</div></li>'
+        "</ul>"
+        '<div class="wt-flex-md-1 text-right"><strong class="mr-xs-1">$5.20</strong></div>'
+        '<div class="text-truncate">Label</div>'
+        '<div class="pl-xs-1 mr-xs-2"><p class="text-truncate">USPS First Class</p></div>'
+        '<div class="col-xs-9 wt-wrap">'
+        f'<a href="https://www.etsy.com/track/{order.tracking}">{order.tracking}</a></div>'
+        '<div class="strong text-body-smaller">'
+        '<span data-test-id="unsanitize">Standard Shipping</span></div>'
+    )
+    return _page(
+        f"Etsy order {order_id}",
+        "https://www.etsy.com/your/orders",
+        body,
+        filler_kb,
+        number,
+    )
+
+
+def amazon_order(number: int, items: int = 1, filler_kb: int = 0) -> str:
+    order = _Order(number, items)
+    order_id = f"114-{number:07d}-{number % 9999999:07d}"
+    rows = []
+    for item in order.items:
+        title = f"{item.product} Wall Decal AZ-{number}-{item.index} (Large)"
+        rows.append(
+            "<tr>"
+            f'<td><img src="/images/{number}.jpg"/>'
+            f'<a href="https://www.amazon.com/dp/B0{number:08d}">{escape(title)}</a></td>'
+            f"<td>{item.quantity}</td>"
+            '<td><div class="more-info-column-word-wrap-break-word">'
+            f"{escape(title)}</div>"
+            '<div class="a-row a-expander-container a-expander-extend-container">'
+            "<div>Customizations</div><div>Order item</div><div>Details</div>"
+            f"<div>Size: {item.width} x {item.height} inches</div>"
+            f"<div>Color: {item.color}</div></div></td>"
+            "</tr>"
+        )
+
+    body = (
+        '<div class="dropdown-account-switcher-header-label">'
+        '<span class="dropdown-account-switcher-header-label-global">BenchDecals'
+        "</span></div>"
+        '<div class="a-row a-spacing-mini">Order ID: '
+        f'<span data-test-id="order-id-value" class="a-text-bold">{order_id}</span></div>'
+        '<div data-test-id="shipping-section-buyer-address">'
+        f"<span>{order.name}</span><span>{order.street}</span>"
+        f"<span>{order.city}, {order.state}</span><span>{order.zip}</span></div>"
+        f'<span data-test-id="shipping-section-phone">{order.phone}</span>'
+        '<div class="a-box-group a-spacing-top-micro">'
+        '<span class="a-color-">$5.20</span>'
+        '<div class="a-column a-span3">Wed, Jan 15, 2025</div>'
+        '<div class="a-column a-span3">USPS</div>'
+        '<a class="a-popover-trigger a-declarative" data-test-id="tracking-id-value">'
+        f"{order.tracking}</a></div>"
+        '<span data-test-id="order-summary-shipping-service-value">'
+        '<span class="">Standard</span></span>'
+        f'<table class="a-keyvalue"><tbody>{"".join(rows)}</tbody></table>'
+        '<div class="a-row a-spacing-none order-details-bordered-box-sale-proceeds">'
+        "<table><tr><td>Items total:</td>"
+        '<td class="a-text-right a-align-bottom">'
+        f'<span class="a-color-">${order.items_total:.2f}</span></td></tr>'
+        '<tr><td>Shipping total:</td><td class="a-text-right a-align-bottom">'
+        '<span class="a-color-">$4.99</span></td></tr></table></div>'
+    )
+    return _page(
+        f"Amazon order {order_id}",
+        "https://sellercentral.amazon.com/orders-v3",
+        body,
+        filler_kb,
+        number,
+    )
+
+
+def ebay_order(number: int, items: int = 1, filler_kb: int = 0) -> str:
+    order = _Order(number, items)
+    order_id = f"12-{number:05d}-{number % 99999:05d}"
+    cards = []
+    for item in order.items:
+        cards.append(
+            '<div class="lineItemCardInfo__summary">'
+            f'<span class="PSEUDOLINK">{item.product} Wall Decal {item.color}</span>'
+            '<div class="details">'
+            f'<a href="https://www.ebay.com/itm/{number}{item.index:03d}">View item</a>'
+            "</div>"
+            '<div class="data-items"><div class="info-item"><dt>MPN</dt>'
+            f'<dd class="info-value">EB-{number}-{item.index}</dd></div></div>'
+            '<div class="quantity__value">Quantity '
+            f'<span class="sh-bold">{item.quantity}</span></div>'
+            '<div class="lineItemCardInfo__aspects spaceTop">'
+            '<span class="sh-bold">Color</span>'
+            f'<span class="sh-bold">{item.width} x {item.height} in</span></div>'
+            "</div>"
+        )
+
+    body = (
+        '<div class="order-info"><dl><dt>Order number</dt>'
+        f'<dd class="info-value">{order_id}</dd></dl></div>'
+        '<div class="shipping-address">'
+        f'<button class="tooltip__host clickable">{order.name}</button>'
+        f'<button class="tooltip__host clickable">{order.street}</button>'
+        f'<button class="tooltip__host clickable">{order.city}, {order.state}</button>'
+        f'<button class="tooltip__host clickable">{order.zip}</button></div>'
+        f'<span id="nid-mu6-3"><button>{order.phone}</button></span>'
+        '<div class="earnings"><dl><dd class="amount">'
+        f'<span class="sh-bold">${order.items_total:.2f}</span></dd></dl>'
+        '<div class="data-item">Shipping label'
+        '<span class="sh-secondary">-$5.20</span></div></div>'
+        '<div class="buyer-paid"><div class="data-item">Subtotal'
+        f'<div class="value">${order.items_total:.2f}</div></div>'
+        '<div class="data-item">Shipping<div class="value">$4.99</div></div></div>'
+        '<dl class="total"><dd class="amount">'
+        f"${order.items_total - 0.21:.2f}</dd></dl>"
+        '<div class="shipping-info"><div class="tracking-info">'
+        f'<button class="fake-link">{order.tracking}</button></div></div>'
+        '<dl class="ship-itm"><dd class="info-value">USPS Ground Advantage</dd></dl>'
+        f'<div class="item-info">{"".join(cards)}</div>'
+        '<div class="note buyer"><div class="note-content">Please pack carefully</div></div>'
+    )
+    return _page(
+        f"eBay order {order_id}",
+        "https://www.ebay.com/sh/ord/details",
+        body,
+        filler_kb,
+        number,
+    )
+
+
+_WAYFAIR_TEXT = 'data-tag-default="order-details_orderDetails_Text"'
+_WAYFAIR_CELL = (
+    'data-tag-default="order-details_useOrderItemsTableColumns_Text" data-hb-id="Text"'
+)
+_WAYFAIR_TD = "b62nt5ix b62nt5l b62nt51bx b62nt5196 b62nt512h b62nt51d7 _9pl4ko0"
+
+
+def wayfair_order(number: int, items: int = 1, filler_kb: int = 0) -> str:
+    order = _Order(number, items)
+    order_id = f"CS{number:09d}"
+    details = (
+        f"PO {order_id}",
+        "01/15/2025",
+        "Open",
+        "Dropship",
+        f"${order.items_total:,.2f}",
+        "1 package",
+        "United Parcel Service",
+        "Ground",
+        "FedEx Home Delivery",
+    )
+    rows = []
+    listings = []
+    for item in order.items:
+        rows.append(
+            '<tr data-hb-id="TableRow">'
+            f'<td class="{_WAYFAIR_TD}"><div class="b62nt5ct">'
+            f"<p {_WAYFAIR_CELL}>{item.product} Peel and Stick Wallpaper</p></div></td>"
+            f'<td class="{_WAYFAIR_TD}">'
+            '<div class="b62nt513e b62nt5hp b62nt59r b62nt51bd">'
+            f'<p class="b62nt5bl b62nt518y">WP-{item.width}x{item.height} Peel and Stick '
+            f"{item.color}</p></div>"
+            f"<p {_WAYFAIR_CELL}>Ships in 1 day</p></td>"
+            f'<td class="{_WAYFAIR_TD}"><p {_WAYFAIR_CELL}>{item.quantity}</p></td>'
+            "<td>Living room</td>"
+            "</tr>"
+        )
+        listings.append(
+            f'<a href="https://www.wayfair.com/decor/pdp/bench-{number}-{item.index}'
+            f'?piid={number}">View</a>'
+        )
+
+    body = (
+        '<h1 class="b62nt518y mb5j687 mb5j68d mb5j68v" data-hb-id="Heading">'
+        f"{order_id}</h1>"
+        '<strong data-tag-default="order-details_orderDetails_strong">Supplier</strong>'
+        '<strong data-tag-default="order-details_orderDetails_strong">BenchDecals</strong>'
+        '<div data-tag-default="order-details_orderDetails_Text_48">'
+        f"<p>{order.name}</p><p>{order.street}</p>"
+        f"<p>{order.city}, {order.state} {order.zip}</p></div>"
+        + "".join(f"<strong {_WAYFAIR_TEXT}>{value}</strong>" for value in details)
+        + f"<p {_WAYFAIR_TEXT}>Tracking Number(s)</p>"
+        f"<p {_WAYFAIR_TEXT}>1Z{number:016d}</p>"
+        "<table><thead><tr><th>Product</th><th>Part Number</th><th>Quantity</th>"
+        "<th>Customization Text</th></tr></thead>"
+        f'<tbody data-hb-id="TableBody">{"".join(rows)}</tbody></table>'
+        f'<div class="listing-links">{"".join(listings)}</div>'
+    )
+    return _page(
+        f"Wayfair order {order_id}",
+        "https://partners.wayfair.com/v/landing/index",
+        body,
+        filler_kb,
+        number,
+    )
+
+
+def overstock_order(number: int, items: int = 1, filler_kb: int = 0) -> str:
+    order = _Order(number, items)
+    order_id = f"OS{number:08d}"
+    rows = []
+    listings = []
+    for item in order.items:
+        rows.append(
+            "<tr>"
+            f'<td id="lineQuantityCell">{item.quantity}</td>'
+            f'<td id="lineProductCell">Wall Decal - {item.color}'
+            f"<div>OS-{number}-{item.index}</div>"
+            f'<p class="listing-title">{item.product} Wall Decal {item.width} x {item.height}</p>'
+            "</td>"
+            f'<td id="lineFirstCostCell">${item.price:.2f}</td>'
+            "</tr>"
+        )
+        listings.append(
+            f'<a href="https://www.overstock.com/Home-Garden/bench-{number}-'
+            f'{item.index}/product.html?option=1">View</a>'
+        )
+
+    body = (
+        f'<div id="soId"><h6>Retailer Order #</h6><p>{order_id}</p></div>'
+        f'<div id="soId"><h6>Supplier Order #</h6><p>S{order_id}</p></div>'
+        '<div id="soChannel"><p>Overstock</p></div>'
+        '<div id="soShippingAddress"><p>'
+        f"{order.name}<br/>{order.street}<br/>"
+        f"{order.city}, {order.state} {order.zip}</p></div>"
+        '<div id="soShipMethod"><p>Ground</p></div>'
+        '<table class="table table-hover data-table">'
+        f"<tbody>{''.join(rows)}</tbody></table>"
+        '<div class="existingShipments">Ship by 01/15/2025 '
+        '<span class="carrierCode existing_carrier">USPS</span>'
+        f'<span class="existing_tracking_number">{order.tracking}</span>'
+        f'<a href="https://tools.usps.com/track/{order.tracking}">Track</a></div>'
+        f'<div class="listing-links">{"".join(listings)}</div>'
+    )
+    return _page(
+        f"Overstock order {order_id}",
+        "https://edge.supplieroasis.com/dashboard/",
+        body,
+        filler_kb,
+        number,
+    )
+
+
+GENERATORS: dict[str, Callable[..., str]] = {
+    "Etsy": etsy_order,
+    "Amazon": amazon_order,
+    "Wayfair": wayfair_order,
+    "Overstock": overstock_order,
+    "Ebay": ebay_order,
+}
+
+
+def generate(marketplace: str, number: int, items: int = 1, filler_kb: int = 0) -> str:
+    """One order page of ``marketplace`` (a name from core.dispatcher, any case)."""
+    for name, generator in GENERATORS.items():
+        if name.lower() == marketplace.lower():
+            return generator(number, items=items, filler_kb=filler_kb)
+    raise KeyError(marketplace)
+
+
+def orders_file(
+    count: int,
+    items: int = 1,
+    filler_kb: int = 0,
+    marketplaces: tuple[str, ...] = tuple(GENERATORS),
+) -> str:
+    """An orders.txt body of ``count`` pages cycling through ``marketplaces``."""
+    return "\n".join(
+        generate(marketplaces[number % len(marketplaces)], number + 1, items, filler_kb)
+        for number in range(count)
+    )
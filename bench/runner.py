@@ -0,0 +1,351 @@
+"""Offline benchmark runner: times every pipeline stage on synthetic orders.
+
+Measured per marketplace: ``detect`` (marketplace detection), ``soup``
+(BeautifulSoup construction), ``parse_order`` and ``build_rows``; for the
+mixed batch, ``process_order_list`` end to end against the in-memory Drive
+and Sheets of bench/fakes.py. Results are saved per commit to
+bench/results/<commit>.json and compared with an earlier commit; a case
+that got slower than the threshold fails the run.
+"""
+
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from bs4 import BeautifulSoup as Soup
+
+from bench.fakes import HEADERS, OfflineFinder, OfflineWriter
+from bench.generators import GENERATORS, generate, orders_file
+from core import console
+from core.dispatcher import detect_marketplace
+from core.processor import process_order_list, split_orders
+from google_api.gsheet_writer import build_rows
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, "bench", "results")
+
+# Distinct pages per marketplace each round cycles through.
+PAGES_PER_MARKETPLACE = 5
+# Growth below this is timer noise, whatever the percentage (sub-µs cases).
+NOISE_FLOOR_MS = 0.001
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    """Workload and comparison settings (see ``config_from_argv``)."""
+
+    items: int = 3
+    filler_kb: int = 64
+    orders: int = 25
+    rounds: int = 20
+    marketplaces: tuple[str, ...] = tuple(GENERATORS)
+    baseline: str = ""
+    threshold: float = 0.25
+    save: bool = True
+
+    def workload(self) -> dict[str, Any]:
+        """The settings that make two result files comparable."""
+        return {
+            "items": self.items,
+            "filler_kb": self.filler_kb,
+            "orders": self.orders,
+            "marketplaces": list(self.marketplaces),
+        }
+
+
+def config_from_argv(argv: Sequence[str]) -> BenchConfig:
+    """Reads ``--items 3 --filler-kb 64 --orders 25 --rounds 20
+    --marketplace etsy,amazon --baseline <commit|path> --threshold 0.25
+    --no-save``."""
+
+    def value_after(flag: str, default: str) -> str:
+        try:
+            return argv[list(argv).index(flag) + 1]
+        except (ValueError, IndexError):
+            return default
+
+    defaults = BenchConfig()
+    wanted = {
+        name.strip().lower()
+        for name in value_after("--marketplace", "").split(",")
+        if name.strip()
+    }
+    marketplaces = tuple(
+        name for name in GENERATORS if not wanted or name.lower() in wanted
+    )
+    return BenchConfig(
+        items=int(value_after("--items", str(defaults.items))),
+        filler_kb=int(value_after("--filler-kb", str(defaults.filler_kb))),
+        orders=int(value_after("--orders", str(defaults.orders))),
+        rounds=max(1, int(value_after("--rounds", str(defaults.rounds)))),
+        marketplaces=marketplaces or defaults.marketplaces,
+        baseline=value_after("--baseline", ""),
+        threshold=float(value_after("--threshold", str(defaults.threshold))),
+        save="--no-save" not in argv,
+    )
+
+
+@dataclass
+class CaseResult:
+    """Per-operation times of one case over all rounds."""
+
+    ops: int
+    samples_ms: list[float] = field(repr=False)
+
+    @property
+    def best_ms(self) -> float:
+        return min(self.samples_ms)
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.samples_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "ops": self.ops,
+            "rounds": len(self.samples_ms),
+            "best_ms": round(self.best_ms, 4),
+            "median_ms": round(self.median_ms, 4),
+            "per_second": round(1000 / self.best_ms, 1) if self.best_ms else None,
+        }
+
+
+def measure(
+    operation: Callable[[Any], object], inputs: Sequence[Any], rounds: int
+) -> CaseResult:
+    """Runs ``operation`` over all ``inputs`` per round, after one warm-up round;
+    a sample is the mean time of one call in that round."""
+    for value in inputs:
+        operation(value)
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for value in inputs:
+            operation(value)
+        samples.append((time.perf_counter() - started) * 1000 / len(inputs))
+    return CaseResult(len(inputs), samples)
+
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    """Keeps the journal of benchmarked runs off the terminal and the file log."""
+    null_logger = logging.getLogger("orders_parser.bench")
+    null_logger.addHandler(logging.NullHandler())
+    null_logger.propagate = False
+    previous = console._logger
+    console._logger = null_logger
+    try:
+        with redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        console._logger = previous
+
+
+def run_benchmarks(config: BenchConfig) -> dict[str, CaseResult]:
+    results: dict[str, CaseResult] = {}
+    finder = OfflineFinder()
+
+    for name in config.marketplaces:
+        key = name.lower()
+        pages = [
+            generate(name, number, config.items, config.filler_kb)
+            for number in range(1, PAGES_PER_MARKETPLACE + 1)
+        ]
+        spec = detect_marketplace(pages[0])
+        if spec is None or spec.name != name:
+            raise RuntimeError(f"the generated {name} page is detected as {spec}")
+
+        with console.capture():
+            parsers = [spec.parser_cls(page, finder=finder) for page in pages]
+            rows = [parser.parse_order() for parser in parsers]
+
+            results[f"{key}.detect"] = measure(detect_marketplace, pages, config.rounds)
+            results[f"{key}.soup"] = measure(
+                lambda page: Soup(page, "lxml"), pages, config.rounds
+            )
+            results[f"{key}.parse_order"] = measure(
+                lambda parser: parser.parse_order(), parsers, config.rounds
+            )
+        results[f"{key}.build_rows"] = measure(
+            lambda items: build_rows(items, HEADERS), rows, config.rounds
+        )
+
+    orders = split_orders(
+        orders_file(config.orders, config.items, config.filler_kb, config.marketplaces)
+    )
+
+    def pipeline(batch: list[str]) -> None:
+        _, failed = process_order_list(
+            batch, writer=OfflineWriter(), finder=OfflineFinder()
+        )
+        if failed:
+            raise RuntimeError(f"{failed} synthetic order(s) failed")
+
+    with quiet():
+        batch = measure(pipeline, [orders], max(3, config.rounds // 4))
+    # Reported per order, so batches of different sizes stay comparable.
+    results["pipeline.process_order_list"] = CaseResult(
+        len(orders), [sample / len(orders) for sample in batch.samples_ms]
+    )
+    return results
+
+
+def current_commit() -> tuple[str, bool]:
+    """Short hash of HEAD and whether tracked files are modified."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", True
+    return commit, bool(status.strip())
+
+
+def build_record(config: BenchConfig, results: dict[str, CaseResult]) -> dict:
+    commit, dirty = current_commit()
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "workload": config.workload(),
+        "rounds": config.rounds,
+        "results": {name: result.as_dict() for name, result in results.items()},
+    }
+
+
+def save_record(record: dict, results_dir: str = RESULTS_DIR) -> str:
+    os.makedirs(results_dir, exist_ok=True)
+    suffix = "-dirty" if record["dirty"] else ""
+    path = os.path.join(results_dir, f"{record['commit']}{suffix}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(record, f, indent=2)
+    return path
+
+
+def load_records(results_dir: str = RESULTS_DIR) -> list[dict]:
+    """All saved results, oldest first."""
+    records = []
+    try:
+        names = os.listdir(results_dir)
+    except OSError:
+        return []
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(results_dir, name), encoding="utf-8") as f:
+                records.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return sorted(records, key=lambda record: record.get("created", ""))
+
+
+def find_baseline(
+    record: dict, wanted: str = "", results_dir: str = RESULTS_DIR
+) -> dict | None:
+    """The result to compare with: a file path, a commit prefix, or by default
+    the latest result of another commit measured on the same workload."""
+    if wanted and os.path.isfile(wanted):
+        with open(wanted, encoding="utf-8") as f:
+            return json.load(f)
+
+    candidates = [
+        other
+        for other in load_records(results_dir)
+        if other.get("workload") == record["workload"]
+    ]
+    if wanted:
+        matching = [c for c in candidates if c.get("commit", "").startswith(wanted)]
+    else:
+        matching = [c for c in candidates if c.get("commit") != record["commit"]]
+    return matching[-1] if matching else None
+
+
+def compare(
+    record: dict, baseline: dict, threshold: float
+) -> list[tuple[str, float, float, float]]:
+    """Cases whose best time grew by more than ``threshold`` (0.25 = 25 %):
+    ``(case, baseline ms, current ms, change)``."""
+    regressions = []
+    for name, current in record["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("best_ms"):
+            continue
+        change = current["best_ms"] / previous["best_ms"] - 1
+        growth = current["best_ms"] - previous["best_ms"]
+        if change > threshold and growth > NOISE_FLOOR_MS:
+            regressions.append((name, previous["best_ms"], current["best_ms"], change))
+    return regressions
+
+
+def format_table(record: dict, baseline: dict | None) -> list[str]:
+    header = (
+        f"{'case':<34}{'best ms':>10}{'median ms':>11}{'per s':>10}"
+        f"{'base ms':>10}{'change':>9}"
+    )
+    lines = [header]
+    previous_results = baseline.get("results", {}) if baseline else {}
+    for name, result in record["results"].items():
+        previous = previous_results.get(name)
+        if previous and previous.get("best_ms"):
+            change = f"{(result['best_ms'] / previous['best_ms'] - 1) * 100:+.1f}%"
+            base = f"{previous['best_ms']:.4f}"
+        else:
+            change = base = "-"
+        lines.append(
+            f"{name:<34}{result['best_ms']:>10.4f}{result['median_ms']:>11.4f}"
+            f"{result['per_second'] or 0:>10.1f}{base:>10}{change:>9}"
+        )
+    return lines
+
+
+def main(argv: Sequence[str]) -> int:
+    config = config_from_argv(argv)
+    results = run_benchmarks(config)
+    record = build_record(config, results)
+    baseline = find_baseline(record, config.baseline)
+
+    for line in format_table(record, baseline):
+        print(line)
+    if config.save:
+        print(f"\nsaved {save_record(record)}")
+
+    if baseline is None:
+        print("no earlier result on this workload to compare with")
+        return 0
+
+    regressions = compare(record, baseline, config.threshold)
+    print(
+        f"compared with {baseline.get('commit')} ({baseline.get('created')}), "
+        f"threshold {config.threshold:.0%}"
+    )
+    for name, previous, current, change in regressions:
+        print(
+            f"REGRESSION {name}: {previous:.3f} ms -> {current:.3f} ms ({change:+.0%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
@@ -0,0 +1,14 @@
+"""The settings model (pydantic); imported lazily by config.settings."""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.settings import get_config_path
+
+
+class Settings(BaseSettings):
+    SHIPPING_LABEL_FOLDER: str
+    TABLE_ID: str
+    # A stand-in for the Google APIs (bench/fake_google.py); empty = Google
+    GOOGLE_API_ENDPOINT: str = ""
+
+    model_config = SettingsConfigDict(env_file=get_config_path(), extra="ignore")
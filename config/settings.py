@@ -1,10 +1,16 @@
-"""Application settings (.env next to config/)."""
+"""Application settings (.env next to config/).
+
+pydantic is only imported when the settings are first needed, so startup
+does not pay for it (see config/schema.py for the model itself).
+"""
 
 import os
 import sys
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+if TYPE_CHECKING:
+    from config.schema import Settings
 
 
 def get_config_path() -> str:
@@ -12,21 +18,20 @@ def get_config_path() -> str:
     return os.path.join(base_dir, "config", ".env")
 
 
-class Settings(BaseSettings):
-    SHIPPING_LABEL_FOLDER: str
-    TABLE_ID: str
-
-    model_config = SettingsConfigDict(env_file=get_config_path(), extra="ignore")
-
-
 @lru_cache(maxsize=1)
-def get_settings() -> Settings:
+def get_settings() -> "Settings":
     """The single settings instance for the whole application."""
+    from config.schema import Settings
+
     return Settings()  # type: ignore[call-arg]
 
 
 def __getattr__(name: str):
-    """Backwards compatibility: ``from config.settings import settings``."""
+    """Backwards compatibility: ``from config.settings import settings`` / ``Settings``."""
     if name == "settings":
         return get_settings()
+    if name == "Settings":
+        from config.schema import Settings
+
+        return Settings
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,45 +1,296 @@
 """CLI runner shared by source runs and the Windows Server build."""
 
 import sys
+from typing import TYPE_CHECKING
 
-from core.console import cprint
+from core.console import cmessage, cprint
 from core.constants import APP_VERSION
 from core.i18n import tr
 from core.paths import get_orders_file_path
+from core.profiling import ProfileConfig, mark_startup, report_startup
 
+if TYPE_CHECKING:
+    from core.event_log import EventQuery
+    from core.ingest import IngestConfig
+    from core.order_archive import OrderArchive
+    from core.sinks import SinkConfig
+    from core.watch import WatchConfig
 
-def run_cli(*, wait_for_enter: bool = True) -> None:
-    """Process orders from orders.txt without starting the desktop UI."""
+
+def run_cli(
+    *,
+    wait_for_enter: bool = True,
+    show_stats: bool = False,
+    profile: ProfileConfig | None = None,
+    sink: "SinkConfig | None" = None,
+    inputs: list[str] | None = None,
+    archive: "OrderArchive | None" = None,
+    reprocess: list[str] | None = None,
+) -> None:
+    """Process orders from orders.txt without starting the desktop UI.
+
+    ``show_stats`` (--stats) prints the Google API call counts of the run;
+    ``profile`` (--profile...) profiles the run or the selected orders;
+    ``sink`` (--sink...) writes the rows to a local file instead of Sheets;
+    ``inputs`` (--input...) reads these files, folders, globs or stdin
+    instead of orders.txt, all in one run (core/inputs.py);
+    ``archive`` (--order-archive) keeps every processed order compressed
+    (core/order_archive.py); ``reprocess`` (--reprocess) processes these
+    order IDs again from that archive.
+    """
+    from core.order_archive import OrderArchive
     from core.processor import process_orders
+    from google_api.auth import warm_up_credentials
+    from google_api.stats import get_api_stats
+
+    # The first access token is fetched while orders.txt is being read
+    warm_up_credentials()
 
     cprint(f"---Orders Parser v{APP_VERSION} by Daniel K---", "header")
 
-    orders_path = get_orders_file_path()
-    try:
-        with open(orders_path, "r", encoding="utf-8") as f:
-            orders_content = f.read()
-    except FileNotFoundError:
-        cprint(tr("File {path} not found.", path=orders_path))
-        return
-
-    ok, failed = process_orders(orders_content)
-
-    cprint(
-        tr(
-            "<-- All data added successfully. Please double-check the data in the spreadsheet! -->"
-        ),
+    orders_content: str | list[str]
+    if reprocess is not None:
+        orders_content = _read_archived(archive or OrderArchive(), reprocess)
+        # Already archived: this run does not store them again
+        archive = None
+        if not orders_content:
+            _wait(wait_for_enter)
+            return
+    elif inputs is None:
+        orders_path = get_orders_file_path()
+        try:
+            with open(orders_path, "r", encoding="utf-8") as f:
+                orders_content = f.read()
+        except FileNotFoundError:
+            cmessage("File {path} not found.", path=orders_path)
+            return
+    else:
+        orders_content = _read_inputs(inputs)
+        if not orders_content:
+            _wait(wait_for_enter)
+            return
+
+    mark_startup("ready to process")
+    get_api_stats().reset()
+    if sink is not None:
+        cmessage(
+            "---Dry run: rows go to {path} ({kind}), not to the spreadsheet---",
+            "warning",
+            path=sink.target,
+            kind=sink.kind,
+        )
+    ok, failed = process_orders(
+        orders_content,
+        result_callback=archive.add_result if archive is not None else None,
+        report=True,
+        profile=profile,
+        sink=sink,
+    )
+    mark_startup("run finished")
+
+    cmessage(
+        "<-- All data added successfully. Please double-check the data in the spreadsheet! -->",
         "header",
     )
     if failed:
-        cprint(
-            tr(
-                "Warning: {failed} order(s) skipped due to errors, written: {ok}.",
-                failed=failed,
-                ok=ok,
-            ),
+        cmessage(
+            "Warning: {failed} order(s) skipped due to errors, written: {ok}.",
             "warning",
+            failed=failed,
+            ok=ok,
+        )
+
+    if show_stats:
+        cmessage("---Google API calls---", "header")
+        for line in get_api_stats().report_lines():
+            cprint(line)
+
+    report_startup()
+    _wait(wait_for_enter)
+
+
+def _read_inputs(inputs: list[str]) -> list[str]:
+    """The orders of all --input sources; unreadable ones are listed."""
+    from core.inputs import read_inputs
+
+    batch = read_inputs(inputs)
+    for path, error in batch.errors:
+        cmessage(
+            "!!!Could not read {path}: {error}!!!", "error", path=path, error=error
+        )
+    if batch.orders:
+        cmessage(
+            "---{orders} order(s) read from {files} file(s)---",
+            orders=len(batch.orders),
+            files=batch.files,
+        )
+    else:
+        cmessage("---No orders found in the input files---", "warning")
+    return batch.orders
+
+
+def _read_archived(archive: "OrderArchive", order_ids: list[str]) -> list[str]:
+    """The archived orders to reprocess; missing IDs are listed."""
+    orders = []
+    for order_id in order_ids:
+        order = archive.get(order_id)
+        if order is None:
+            cmessage(
+                "!!!Order {order_id} is not in the order archive!!!",
+                "error",
+                order_id=order_id,
+            )
+        else:
+            orders.append(order)
+    return orders
+
+
+def run_replay(*, wait_for_enter: bool = True) -> None:
+    """Writes the orders waiting in the offline spool (--replay-spool).
+
+    Orders the spreadsheet rejected stay in the spool and are listed.
+    """
+    from core.spool import Spool, replay_spool
+    from google_api.auth import warm_up_credentials
+    from google_api.gdrive_finder import GoogleDriveFinder
+    from google_api.gsheet_writer import GSheetWriter
+
+    warm_up_credentials()
+    cprint(f"---Orders Parser v{APP_VERSION} by Daniel K---", "header")
+
+    spool = Spool()
+    if spool.count():
+        replay_spool(GSheetWriter(), GoogleDriveFinder(), spool)
+    else:
+        cmessage("---The offline spool is empty---")
+    for entry in spool.failed():
+        cmessage(
+            "!!!Order {order_id} from {created} stays in the spool: {error}!!!",
+            "error",
+            order_id=entry.order_id,
+            created=entry.created,
+            error=entry.failed,
         )
+    _wait(wait_for_enter)
+
+
+def run_watch(config: "WatchConfig", *, sink: "SinkConfig | None" = None) -> None:
+    """Keeps processing the order files saved into the inbox (--watch).
+
+    Runs until the process is stopped (Ctrl+C or the service manager).
+    """
+    import threading
+
+    from core.watch import WatchDaemon, make_session
+    from google_api.auth import warm_up_credentials
+
+    warm_up_credentials()
+    cprint(f"---Orders Parser v{APP_VERSION} by Daniel K---", "header")
+    if sink is not None:
+        cmessage(
+            "---Dry run: rows go to {path} ({kind}), not to the spreadsheet---",
+            "warning",
+            path=sink.target,
+            kind=sink.kind,
+        )
+
+    session = make_session(config, sink)
+    try:
+        WatchDaemon(config, session).run(threading.Event())
+    finally:
+        session.close()
+
+
+def run_serve(config: "IngestConfig", *, sink: "SinkConfig | None" = None) -> None:
+    """Serves the local HTTP ingestion endpoint (--serve) until stopped."""
+    import threading
+
+    from core.ingest import (
+        TOKEN_HEADER,
+        IngestWorker,
+        JobQueue,
+        get_token_path,
+        ingest_token,
+        make_server,
+    )
+    from core.session import ProcessingSession
+    from google_api.auth import warm_up_credentials
+
+    warm_up_credentials()
+    cprint(f"---Orders Parser v{APP_VERSION} by Daniel K---", "header")
+    if sink is not None:
+        cmessage(
+            "---Dry run: rows go to {path} ({kind}), not to the spreadsheet---",
+            "warning",
+            path=sink.target,
+            kind=sink.kind,
+        )
+
+    queue = JobQueue()
+    session = ProcessingSession(idle_timeout=float("inf"), sink=sink)
+    worker = IngestWorker(queue, session, batch_window=config.batch_window)
+    token_path = get_token_path(queue)
+    server = make_server(
+        queue, worker, config.host, config.port, token=ingest_token(token_path)
+    )
+    stop = threading.Event()
+    thread = threading.Thread(target=worker.run, args=(stop,), name="ingest")
+    thread.start()
+    cmessage(
+        "---Listening on http://{host}:{port}/orders, jobs are kept in {path}---",
+        "header",
+        host=config.host,
+        port=server.server_address[1],
+        path=queue.path,
+    )
+    cmessage(
+        "---Clients send the token from {path} in the {header} header---",
+        "header",
+        path=token_path,
+        header=TOKEN_HEADER,
+    )
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        stop.set()
+        thread.join()
+        session.close()
+
+
+def run_history(order_id: str | None = None, *, wait_for_enter: bool = True) -> None:
+    """Prints the run history of an order, or the latest orders (--history)."""
+    from core.history import RunHistory
+
+    history = RunHistory()
+    entries = history.find(order_id) if order_id else history.query(limit=20)
+    if not entries:
+        cmessage("---Nothing in the run history---", "warning")
+    for entry in entries:
+        where = f"{entry.sheet} row {entry.row}" if entry.row else entry.sheet or "-"
+        cprint(
+            f"{entry.processed}  {entry.order_id or '-'}  {entry.marketplace or '-'}  "
+            f"{entry.status}  {where}  {entry.items} item(s)  {entry.total_ms} ms"
+            + (f"  {entry.error}" if entry.error else "")
+        )
+    _wait(wait_for_enter)
+
+
+def run_events(query: "EventQuery", *, wait_for_enter: bool = True) -> None:
+    """Prints the structured log records of an order, or its errors (--events)."""
+    from core.event_log import format_record, query_events
+
+    records = query_events(query)
+    if not records:
+        cmessage("---Nothing found in the event log---", "warning")
+    for record in records:
+        cprint(
+            format_record(record), "error" if record.get("level") == "error" else "info"
+        )
+    _wait(wait_for_enter)
+
 
+def _wait(wait_for_enter: bool) -> None:
     if wait_for_enter and sys.stdin is not None:
         try:
             input(tr("Press Enter to exit..."))
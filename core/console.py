@@ -1,23 +1,42 @@
-"""The single output point for all messages."""
+"""The single output point for all messages.
 
+Everything printed goes through here as a LogEvent: a typed record of what
+happened (a field value, a problem, a banner...) rather than a pre-formatted
+string. Text is rendered lazily — in the current language — only where text
+is needed: the terminal, the file log and legacy text consumers. The UI reads
+the event fields directly.
+
+The file log is written off the processing path: lines go through a
+QueueHandler to a QueueListener thread, which writes them in batches (one
+flush per batch) to parser_<date>.log, starting a new file every day and
+rotating a day's file once it is too large.
+"""
+
+import atexit
 import logging
 import os
+import queue
 import re
 import sys
 import threading
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import date
 from collections.abc import Callable, Iterator
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from functools import cache
 from typing import Literal
 
 from colorama import Fore, Style
 from colorama import init as colorama_init
 
+from core.i18n import get_language, tr, translate
 from core.paths import get_logs_dir
 
 colorama_init(autoreset=True)
 
 Level = Literal["info", "success", "warning", "error", "header"]
+EventKind = Literal["plain", "banner", "field", "problem", "note", "done"]
 
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 
@@ -29,24 +48,111 @@ _COLOR_BY_LEVEL: dict[Level, str] = {
     "header": Fore.CYAN,
 }
 
-_subscribers: list[Callable[[str, Level], None]] = []
+
+@dataclass(slots=True)
+class LogEvent:
+    """One journal record.
+
+    ``key`` is the i18n key: the field label for "field" events, the full
+    message template (markers included) for problem/note/done events.
+    ``value`` holds the field value, or the raw text of a "plain" line.
+    ``run`` and ``order`` tell which order of which run the event belongs
+    to (see order_scope()); both are empty outside the processing pipeline.
+
+    Nothing is translated or formatted until the text is read: ``text`` in
+    the current language (cached until the language changes), render() in
+    any language.
+    """
+
+    kind: EventKind
+    level: Level = "info"
+    key: str = ""
+    value: str = ""
+    marketplace: str = ""
+    args: dict[str, object] = field(default_factory=dict)
+    style: str | None = None
+    run: str = ""
+    order: int | None = None
+    # (language, text): one tuple, so threads never see a mismatched pair
+    _text: tuple[str, str] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def label(self) -> str:
+        """The translated field label."""
+        return tr(self.key)
+
+    @property
+    def text(self) -> str:
+        """The classic console line ("- Key: value", "|||...|||"), ANSI-free."""
+        language = get_language()
+        cached = self._text
+        if cached is None or cached[0] != language:
+            cached = self._text = (language, self.render(language))
+        return cached[1]
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def message(self) -> str:
+        """The message without its |||, <<<>>> or --- markers."""
+        text = self.text.strip()
+        if self.kind == "problem":
+            return text.strip("|!").strip()
+        if self.kind == "done":
+            return text.strip("<>").strip()
+        if self.kind == "note":
+            return text.strip("-").strip()
+        return text
+
+    def render(self, language: str | None = None) -> str:
+        """The console line in ``language`` (the current one when None)."""
+        if self.kind == "plain" and not self.key:
+            return _ANSI_RE.sub("", self.value).rstrip()
+        if self.kind == "banner":
+            return f"----- {translate('New order', None, language)} {self.marketplace} -----"
+        if self.kind == "field":
+            separator = ":\n" if "\n" in self.value else ": "
+            return f"- {translate(self.key, None, language)}{separator}{self.value}"
+        return translate(self.key, self.args, language)
+
+
+@cache
+def _message_kind(key: str) -> EventKind:
+    """Event kind of a message template, decided once per template by its markers."""
+    if key.startswith(("|||", "!!!")):
+        return "problem"
+    if key.startswith("<<<"):
+        return "done"
+    if key.startswith("---"):
+        return "note"
+    return "plain"
+
+
+_subscribers: list[Callable[[LogEvent], None]] = []
 _lock = threading.Lock()
 _logger: logging.Logger | None = None
+_log_queue: "queue.Queue[logging.LogRecord] | None" = None
+_listener: QueueListener | None = None
 
 
-def subscribe(callback: Callable[[str, Level], None]) -> None:
-    """Subscribes a handler (ANSI-free text, level). Used by the UI."""
+def subscribe(callback: Callable[[LogEvent], None]) -> None:
+    """Subscribes a handler that receives every LogEvent. Used by the UI."""
     with _lock:
         _subscribers.append(callback)
 
 
-def unsubscribe(callback: Callable[[str, Level], None]) -> None:
+def unsubscribe(callback: Callable[[LogEvent], None]) -> None:
     with _lock:
         if callback in _subscribers:
             _subscribers.remove(callback)
 
 
-_LOG_NAME_RE = re.compile(r"^parser_(\d{4}-\d{2}-\d{2})\.log$")
+_LOG_NAME_RE = re.compile(
+    r"^(?:parser|events|run|profile)_(\d{4}-\d{2}-\d{2})"
+    r"(?:\.log(?:\.\d+)?|\.jsonl(?:\.\d+)?"
+    r"|_\d{2}-\d{2}-\d{2}(?:-\d{3})?(?: \(\d+\))?\.(?:json|pstats|collapsed))$"
+)
 
 
 def cleanup_old_logs(
@@ -57,7 +163,10 @@ def cleanup_old_logs(
     """Deletes logs older than max_age_days (based on the date in the filename).
 
     Called at application startup; touches only files named
-    parser_YYYY-MM-DD.log inside the logs folder. Returns the number of
+    parser_YYYY-MM-DD.log (and its rotated parser_YYYY-MM-DD.log.N),
+    events_YYYY-MM-DD.jsonl (the structured log, core/event_log.py),
+    run_YYYY-MM-DD_HH-MM-SS.json (timing reports) and
+    profile_YYYY-MM-DD_HH-MM-SS.pstats/.collapsed inside the logs folder. Returns the number of
     deleted files. Any filesystem errors are silently ignored — the cleanup
     must never get in the way of the application.
     """
@@ -94,9 +203,109 @@ def cleanup_old_logs(
     return deleted
 
 
+class LogFileHandler(RotatingFileHandler):
+    """<prefix>_<date><suffix> in ``log_dir`` (parser_<date>.log by default):
+    a new file every day, rotated to parser_<date>.log.1, .2, ... when it
+    grows past ``max_bytes``.
+
+    Lines are not flushed one by one: the listener calls flush_batch() once
+    the queue is empty.
+    """
+
+    def __init__(
+        self,
+        log_dir: str,
+        max_bytes: int | None = None,
+        backup_count: int | None = None,
+        today: Callable[[], date] = date.today,
+        *,
+        prefix: str = "parser",
+        suffix: str = ".log",
+    ) -> None:
+        from core.constants import LOG_BACKUP_COUNT, LOG_MAX_BYTES
+
+        self._log_dir = log_dir
+        self._prefix = prefix
+        self._suffix = suffix
+        self._today = today
+        self._date = today()
+        super().__init__(
+            self._path(self._date),
+            maxBytes=LOG_MAX_BYTES if max_bytes is None else max_bytes,
+            backupCount=LOG_BACKUP_COUNT if backup_count is None else backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+
+    def _path(self, day: date) -> str:
+        return os.path.join(
+            self._log_dir, f"{self._prefix}_{day:%Y-%m-%d}{self._suffix}"
+        )
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        return self._today() != self._date or bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        day = self._today()
+        if day == self._date:
+            super().doRollover()
+            return
+        # A new day: switch to its file, nothing is renamed
+        if self.stream:
+            self.stream.close()
+            self.stream = None  # type: ignore[assignment]
+        self._date = day
+        self.baseFilename = os.path.abspath(self._path(day))
+
+    def flush(self) -> None:
+        """Deferred to flush_batch()."""
+
+    def flush_batch(self) -> None:
+        super().flush()
+
+
+class BatchingListener(QueueListener):
+    """Flushes the file once per batch of queued lines instead of per line."""
+
+    def __init__(
+        self, log_queue: "queue.Queue[logging.LogRecord]", *handlers: logging.Handler
+    ) -> None:
+        super().__init__(log_queue, *handlers)
+        self._log_queue = log_queue
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self._log_queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, LogFileHandler):
+                    handler.flush_batch()
+
+
+class _LazyQueueHandler(QueueHandler):
+    """Queues records unformatted: the listener thread renders the event."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def flush_logs() -> None:
+    """Waits until every line logged so far is in the file."""
+    if _log_queue is not None and _listener is not None:
+        _log_queue.join()
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
 def _get_logger() -> logging.Logger:
     """Lazy initialization of the file log next to the executable."""
-    global _logger
+    global _logger, _log_queue, _listener
     if _logger is not None:
         return _logger
 
@@ -106,23 +315,40 @@ def _get_logger() -> logging.Logger:
     try:
         log_dir = get_logs_dir()
         os.makedirs(log_dir, exist_ok=True)
-        log_path = os.path.join(log_dir, f"parser_{date.today():%Y-%m-%d}.log")
-        handler = logging.FileHandler(log_path, encoding="utf-8")
+        handler = LogFileHandler(log_dir)
         handler.setFormatter(logging.Formatter("%(asctime)s | %(message)s"))
-        logger.addHandler(handler)
     except OSError:
         logger.addHandler(logging.NullHandler())
+    else:
+        _log_queue = queue.Queue()
+        _listener = BatchingListener(_log_queue, handler)
+        _listener.start()
+        atexit.register(_stop_listener)
+        logger.addHandler(_LazyQueueHandler(_log_queue))
     _logger = logger
     return logger
 
 
 _capture_ctx = threading.local()
+_order_ctx = threading.local()
+
+
+@contextmanager
+def order_scope(run: str, order: int) -> Iterator[None]:
+    """Stamps the events emitted (or replayed) on this thread with the run
+    and order number."""
+    previous = getattr(_order_ctx, "scope", None)
+    _order_ctx.scope = (run, order)
+    try:
+        yield
+    finally:
+        _order_ctx.scope = previous
 
 
 @contextmanager
-def capture() -> Iterator[list[str]]:
-    """Captures all cprint output of the current thread into a list of raw lines.."""
-    buffer: list[str] = []
+def capture() -> Iterator[list[LogEvent]]:
+    """Captures all output of the current thread into a list of events."""
+    buffer: list[LogEvent] = []
     previous = getattr(_capture_ctx, "buffer", None)
     _capture_ctx.buffer = buffer
     try:
@@ -131,15 +357,10 @@ def capture() -> Iterator[list[str]]:
         _capture_ctx.buffer = previous
 
 
-def replay(raw_lines: list[str]) -> None:
-    """Replays captured lines: console, log file and subscribers."""
-    for raw in raw_lines:
-        if ":" in raw:
-            level_tag, _, text = raw.partition(":")
-            if level_tag in _COLOR_BY_LEVEL:
-                _emit(text, level=level_tag)  # type: ignore[arg-type]
-                continue
-        _emit(raw)
+def replay(events: list[LogEvent]) -> None:
+    """Replays captured events: console, log file and subscribers."""
+    for event in events:
+        _emit(event)
 
 
 def cprint(
@@ -149,7 +370,7 @@ def cprint(
     level: Level = "info",
     style: str | None = None,
 ) -> None:
-    """Prints to the console (with colors) and mirrors the message to the log and subscribers.
+    """Prints free-form text to the console (with colors), the log and subscribers.
 
     ``level`` controls the terminal color and what subscribers receive:
       - "success"  → green
@@ -164,45 +385,71 @@ def cprint(
     Callers may pass the level as the last positional argument for brevity:
     ``cprint("msg", "success")`` is equivalent to ``cprint("msg", level="success")``.
 
-    If capture() is active in the current thread, the line goes into the
+    Structured output has dedicated helpers: cfield(), cmessage(), cbanner().
+    If capture() is active in the current thread, the event goes into the
     buffer and is emitted later via replay() — in the correct order.
     """
     if args and isinstance(args[-1], str) and args[-1] in _COLOR_BY_LEVEL:
         level = args[-1]  # type: ignore[assignment]
         args = args[:-1]
     text = sep.join(str(a) for a in args)
+    _dispatch(LogEvent("plain", level, value=text, style=style), end=end)
+
+
+def cfield(key: str, value: object, level: Level = "success") -> None:
+    """A parsed order field: ``cfield("Order ID", order_id)`` → "- Order ID: 123"."""
+    _dispatch(LogEvent("field", level, key=key, value=str(value)))
+
 
+def cmessage(key: str, level: Level = "info", **args: object) -> None:
+    """A translatable message; its |||, ---, <<<>>> markers define the event kind."""
+    _dispatch(LogEvent(_message_kind(key), level, key=key, args=args))
+
+
+def cbanner(marketplace: str, style: str | None = None) -> None:
+    """The "New order <Marketplace>" banner that opens every order."""
+    _dispatch(LogEvent("banner", "header", marketplace=marketplace, style=style))
+
+
+def _dispatch(event: LogEvent, end: str = "\n") -> None:
     buffer = getattr(_capture_ctx, "buffer", None)
     if buffer is not None:
-        # Store as "level:text" for replay()
-        buffer.append(f"{level}:{text}")
+        buffer.append(event)
         return
-
-    _emit(text, level=level, end=end, style=style)
+    _emit(event, end=end)
 
 
-def _emit(
-    text: str, level: Level = "info", end: str = "\n", style: str | None = None
-) -> None:
-    plain = _ANSI_RE.sub("", text).rstrip()
+def _emit(event: LogEvent, end: str = "\n") -> None:
+    scope = getattr(_order_ctx, "scope", None)
+    if scope is not None and not event.run:
+        event.run, event.order = scope
 
     if sys.stdout is not None:
         try:
-            color = style if style is not None else _COLOR_BY_LEVEL.get(level, "")
-            sys.stdout.write(color + plain + (Style.RESET_ALL if color else "") + end)
+            plain = event.text
+            color = (
+                event.style
+                if event.style is not None
+                else _COLOR_BY_LEVEL.get(event.level, "")
+            )
+            lead = "\n" if event.kind == "done" else ""
+            sys.stdout.write(
+                lead + color + plain + (Style.RESET_ALL if color else "") + end
+            )
             sys.stdout.flush()
         except (OSError, ValueError):
             pass
 
-    if not plain:
+    if event.kind == "plain" and not event.text:
         return
 
-    _get_logger().info(plain)
+    # Rendered for the file by the log thread (see _LazyQueueHandler)
+    _get_logger().info("%s", event)
 
     with _lock:
         subscribers = list(_subscribers)
     for callback in subscribers:
         try:
-            callback(plain, level)
+            callback(event)
         except Exception:  # noqa: BLE001
             pass
@@ -12,6 +12,8 @@ APP_TITLE = f"Orders Parser v{APP_VERSION} by Daniel K"
 # --- Marker values (used by all parsers) ---
 ERROR_VALUE = "!ERROR!"
 FILE_NOT_FOUND = "File Not Found"
+# The shipping label could not be uploaded yet (Drive unreachable, core/spool.py)
+LABEL_PENDING = "Label Upload Pending"
 
 # --- Google Sheets columns ---
 COL_STATUS = "Status"
@@ -38,6 +40,33 @@ COL_SHIPPING_TOTAL = "Shipping total"
 COL_SHIPPING_PRICE = "Shipping price"
 COL_TOTAL = "Total"
 
+# Column order of the spreadsheet header row (and of the local output sinks)
+SHEET_COLUMNS = (
+    COL_STATUS,
+    COL_ADDITIONAL_INFO,
+    COL_DATE,
+    COL_STORE,
+    COL_CHANNEL,
+    COL_SKU,
+    COL_LISTING_LINK,
+    COL_ORDER_ID,
+    COL_TITLE,
+    COL_ADDRESS,
+    COL_QUANTITY,
+    COL_CUSTOMIZATION,
+    COL_FILE_LINK,
+    COL_SHIPPING_LABEL,
+    COL_TRACK_ID,
+    COL_SHIP_BY,
+    COL_POSTAL_SERVICE,
+    COL_SHIPPING_SPEED,
+    COL_TRACK_PACKAGE,
+    COL_ITEMS_TOTAL,
+    COL_SHIPPING_TOTAL,
+    COL_SHIPPING_PRICE,
+    COL_TOTAL,
+)
+
 # Columns highlighted with the order color for multi-item orders
 HIGHLIGHT_COLUMNS = [COL_ORDER_ID, COL_ADDRESS, COL_SHIPPING_LABEL, COL_TRACK_ID]
 
@@ -58,6 +87,13 @@ SHEET_COLORED = "Colored"
 SHEET_22_ROLL = "22 roll"
 SHEET_46_ROLL = "46 roll"
 SHEET_ERROR = "ERROR"
+SHEET_NAMES = (
+    SHEET_WALLPAPER,
+    SHEET_COLORED,
+    SHEET_22_ROLL,
+    SHEET_46_ROLL,
+    SHEET_ERROR,
+)
 
 # Extensions of "colored" files (routed to the Colored sheet)
 COLORED_EXTENSIONS = {"png", "jpg", "jpeg", "eps"}
@@ -102,6 +138,14 @@ DATE_FORMAT = "%d.%m.%Y"
 # How many days to keep file logs (older ones are removed at startup)
 LOG_RETENTION_DAYS = 3
 
+# A day's file log is rotated (parser_<date>.log.1, .2, ...) past this size
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# How long a warm processing session (Google clients, sheet caches, parse
+# threads) survives without runs before it is released, minutes
+SESSION_IDLE_TIMEOUT_MINUTES = 15
+
 # --- Wallpaper: Peel & Stick / Non-Woven (moved verbatim from gsheet_writer) ---
 WALLPAPER_PATTERN = re.compile(
     r"""(?ix)
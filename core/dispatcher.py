@@ -1,57 +1,79 @@
 """Marketplace detection based on the HTML content."""
 
 from collections.abc import Callable
-from typing import NamedTuple
+from importlib import import_module
+from typing import TYPE_CHECKING, NamedTuple
 
 from colorama import Fore
 
-from marketplaces.amazon_parser import AmazonParser
-from marketplaces.base_parser import BaseParser
-from marketplaces.ebay_parser import EbayParser
-from marketplaces.etsy_parser import EtsyParser
-from marketplaces.overstock_parser import OverstockParser
-from marketplaces.wayfair_parser import WayfairParser
+if TYPE_CHECKING:
+    from marketplaces.base_parser import BaseParser
 
 
 class MarketplaceSpec(NamedTuple):
-    """Marketplace descriptor: name, detector, parser class and colorama banner color."""
+    """Marketplace descriptor: name, detector, parser and colorama banner color.
+
+    ``parser`` is either the parser class itself or its import path
+    ("package.module:ClassName"). Paths are imported on first use, so the
+    parser modules (and bs4/Google clients behind them) are not loaded until
+    an order of that marketplace is actually detected.
+    """
 
     name: str
     detect: Callable[[str], bool]
-    parser_cls: type[BaseParser]
+    parser: "str | type[BaseParser]"
     banner_style: str  # colorama Fore.* ANSI string
 
+    @property
+    def parser_cls(self) -> "type[BaseParser]":
+        if isinstance(self.parser, str):
+            return load_parser(self.parser)
+        return self.parser
+
+
+_loaded_parsers: dict[str, "type[BaseParser]"] = {}
+
+
+def load_parser(path: str) -> "type[BaseParser]":
+    """Imports a parser class by its "module:ClassName" path (cached)."""
+    parser_cls = _loaded_parsers.get(path)
+    if parser_cls is None:
+        module_name, _, class_name = path.partition(":")
+        parser_cls = getattr(import_module(module_name), class_name)
+        _loaded_parsers[path] = parser_cls
+    return parser_cls
+
 
 # Entry order = check order in the legacy main.py
 MARKETPLACES: tuple[MarketplaceSpec, ...] = (
     MarketplaceSpec(
         name="Etsy",
         detect=lambda order: "etsy.com" in order,
-        parser_cls=EtsyParser,
+        parser="marketplaces.etsy_parser:EtsyParser",
         banner_style=Fore.GREEN,
     ),
     MarketplaceSpec(
         name="Amazon",
         detect=lambda order: "amazon.com" in order or "Order ID" in order,
-        parser_cls=AmazonParser,
+        parser="marketplaces.amazon_parser:AmazonParser",
         banner_style=Fore.LIGHTBLUE_EX,
     ),
     MarketplaceSpec(
         name="Wayfair",
         detect=lambda order: "https://partners.wayfair.com/v/landing/index" in order,
-        parser_cls=WayfairParser,
+        parser="marketplaces.wayfair_parser:WayfairParser",
         banner_style=Fore.LIGHTMAGENTA_EX,
     ),
     MarketplaceSpec(
         name="Overstock",
         detect=lambda order: "https://edge.supplieroasis.com/dashboard/" in order,
-        parser_cls=OverstockParser,
+        parser="marketplaces.overstock_parser:OverstockParser",
         banner_style=Fore.LIGHTYELLOW_EX,
     ),
     MarketplaceSpec(
         name="Ebay",
         detect=lambda order: "https://www.ebay.com" in order,
-        parser_cls=EbayParser,
+        parser="marketplaces.ebay_parser:EbayParser",
         banner_style=Fore.BLUE,
     ),
 )
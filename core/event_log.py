@@ -0,0 +1,291 @@
+"""The structured event log (``--event-log``): one compact JSON line per event.
+
+parser_<date>.log is written for people: localized text with |||, ---
+markers, which tooling would have to parse back with regexes. With
+``--event-log`` every journal event is also written to
+events_<date>.jsonl in the logs folder as a JSON record of its fields —
+the run and order number it belongs to, level, kind, the untranslated
+message key and its arguments, the field value, the marketplace — and
+every processed order adds an "order" record with its order ID, status,
+sheet, row and stage durations in milliseconds.
+
+Records are serialized and written on a background thread in batches, like
+the text log (core/console.py), and rotate and expire the same way.
+
+``main_cli.py --events ORDER_ID`` prints everything logged about an order,
+``--events --errors [TEXT]`` the errors (whose message contains TEXT), both
+limited to the last ``--days N`` days if given. Lines are filtered as text
+before they are decoded, so a search over days of logs stays fast.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from core import console
+from core.console import BatchingListener, LogEvent, LogFileHandler
+from core.history import order_status, stage_ms
+from core.paths import get_logs_dir
+
+if TYPE_CHECKING:
+    from core.processor import OrderResult
+
+EVENT_LOG_PREFIX = "events"
+EVENT_LOG_SUFFIX = ".jsonl"
+
+_FILE_RE = re.compile(r"^events_(\d{4}-\d{2}-\d{2})\.jsonl(?:\.(\d+))?$")
+
+
+@dataclass
+class EventQuery:
+    """What ``--events`` looks for; ``error`` "" means every error."""
+
+    order_id: str | None = None
+    error: str | None = None
+    days: int | None = None
+
+
+def event_query_from_argv(argv: list[str]) -> EventQuery | None:
+    """``--events [ORDER_ID] [--errors [TEXT]] [--days N]``; None without
+    ``--events``."""
+    if "--events" not in argv:
+        return None
+    query = EventQuery(order_id=_value_after(argv, "--events"))
+    if "--errors" in argv:
+        query.error = _value_after(argv, "--errors") or ""
+    days = _value_after(argv, "--days")
+    if days is not None:
+        try:
+            query.days = max(1, int(days))
+        except ValueError:
+            pass
+    return query
+
+
+def _value_after(argv: list[str], flag: str) -> str | None:
+    if flag not in argv:
+        return None
+    try:
+        value = argv[argv.index(flag) + 1]
+    except IndexError:
+        return None
+    return None if value.startswith("--") else value
+
+
+class _RecordFormatter(logging.Formatter):
+    """A queued event or order record → one compact JSON line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = record.payload  # type: ignore[attr-defined]
+        ts = datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds")
+        if isinstance(payload, LogEvent):
+            fields: dict[str, Any] = {
+                "ts": ts,
+                "run": payload.run,
+                "order": payload.order,
+                "level": payload.level,
+                "kind": payload.kind,
+                "key": payload.key,
+                "value": payload.value,
+                "marketplace": payload.marketplace,
+                "args": {name: str(value) for name, value in payload.args.items()},
+            }
+        else:
+            fields = {"ts": ts, **payload}
+        return json.dumps(
+            {
+                name: value
+                for name, value in fields.items()
+                if value not in ("", None, {})
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+
+
+class EventLog:
+    """Subscribes to the journal and writes its events to events_<date>.jsonl."""
+
+    def __init__(self, log_dir: str | None = None) -> None:
+        log_dir = log_dir or get_logs_dir()
+        os.makedirs(log_dir, exist_ok=True)
+        self._handler = LogFileHandler(
+            log_dir, prefix=EVENT_LOG_PREFIX, suffix=EVENT_LOG_SUFFIX
+        )
+        self._handler.setFormatter(_RecordFormatter())
+        self._queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        self._listener = BatchingListener(self._queue, self._handler)
+        self._listener.start()
+        console.subscribe(self.log_event)
+
+    def log_event(self, event: LogEvent) -> None:
+        self._queue.put_nowait(logging.makeLogRecord({"payload": event}))
+
+    def log_result(self, run: str, result: "OrderResult") -> None:
+        status = order_status(result)
+        payload = {
+            "run": run,
+            "order": result.number,
+            "level": "error" if status == "failed" else "success",
+            "kind": "order",
+            "order_id": result.order_id,
+            "marketplace": result.marketplace,
+            "status": status,
+            "sheet": result.sheet,
+            "row": result.row,
+            "items": result.items,
+            "error": result.error,
+            "ms": {name: round(ms, 1) for name, ms in stage_ms(result).items()},
+        }
+        self._queue.put_nowait(logging.makeLogRecord({"payload": payload}))
+
+    def flush(self) -> None:
+        """Waits until every record so far is in the file."""
+        self._queue.join()
+
+    def close(self) -> None:
+        console.unsubscribe(self.log_event)
+        self._listener.stop()
+        self._handler.close()
+
+
+_active: EventLog | None = None
+
+
+def enable_event_log(log_dir: str | None = None) -> EventLog:
+    """Starts writing the structured log for the rest of the process."""
+    global _active
+    if _active is None:
+        _active = EventLog(log_dir)
+        atexit.register(disable_event_log)
+    return _active
+
+
+def disable_event_log() -> None:
+    global _active
+    if _active is not None:
+        _active.close()
+        _active = None
+
+
+def log_result(run: str, result: "OrderResult") -> None:
+    """Adds the order record of a processed order (when the log is on)."""
+    if _active is not None:
+        _active.log_result(run, result)
+
+
+def event_log_files(
+    log_dir: str | None = None, days: int | None = None, today: date | None = None
+) -> list[str]:
+    """The structured log files, oldest first (rotated parts before the
+    current one); only the last ``days`` days if given."""
+    log_dir = log_dir or get_logs_dir()
+    try:
+        names = os.listdir(log_dir)
+    except OSError:
+        return []
+    first = None
+    if days is not None:
+        first = (today or date.today()) - timedelta(days=days - 1)
+    found = []
+    for name in names:
+        match = _FILE_RE.match(name)
+        if not match:
+            continue
+        if first is not None and match.group(1) < first.isoformat():
+            continue
+        found.append((match.group(1), -int(match.group(2) or 0), name))
+    return [os.path.join(log_dir, name) for *_, name in sorted(found)]
+
+
+def iter_records(
+    paths: list[str], contains: tuple[str, ...] = ()
+) -> Iterator[dict[str, Any]]:
+    """The records of the files; lines without any of ``contains`` are
+    skipped without being decoded."""
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    if contains and not any(text in line for text in contains):
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # A line cut short by a crash
+                        continue
+        except OSError:
+            continue
+
+
+def query_events(
+    query: EventQuery, log_dir: str | None = None, today: date | None = None
+) -> list[dict[str, Any]]:
+    """The records matching the query, in the order they were written."""
+    paths = event_log_files(log_dir, query.days, today)
+    records: Iterator[dict[str, Any]]
+    if query.order_id:
+        orders = {
+            (record.get("run"), record.get("order"))
+            for record in iter_records(paths, (json.dumps(query.order_id),))
+            if _is_order(record, query.order_id)
+        }
+        runs = tuple(f'"run":"{run}"' for run, _ in orders if run)
+        if not runs:
+            return []
+        records = (
+            record
+            for record in iter_records(paths, runs)
+            if (record.get("run"), record.get("order")) in orders
+        )
+    else:
+        records = iter_records(paths, ('"level":"error"',))
+
+    if query.error is None:
+        return list(records)
+    text = query.error.lower()
+    return [
+        record
+        for record in records
+        if record.get("level") == "error"
+        and text in json.dumps(record, ensure_ascii=False).lower()
+    ]
+
+
+def _is_order(record: dict[str, Any], order_id: str) -> bool:
+    if record.get("kind") == "order":
+        return bool(record.get("order_id") == order_id)
+    return record.get("key") == "Order ID" and record.get("value") == order_id
+
+
+def format_record(record: dict[str, Any]) -> str:
+    """One record as a journal line (messages in the current language)."""
+    where = f"#{record['order']}" if "order" in record else "-"
+    if record.get("kind") == "order":
+        stages = record.get("ms", {})
+        total = round(stages.get("parse", 0.0) + stages.get("write", 0.0), 1)
+        text = (
+            f"{record.get('order_id') or '-'} {record.get('marketplace') or '-'} "
+            f"{record['status']} {record.get('sheet') or '-'}"
+            + (f" row {record['row']}" if "row" in record else "")
+            + f" {total} ms"
+            + (f"  {record['error']}" if "error" in record else "")
+        )
+    else:
+        text = LogEvent(
+            record.get("kind", "plain"),
+            record.get("level", "info"),
+            key=record.get("key", ""),
+            value=record.get("value", ""),
+            marketplace=record.get("marketplace", ""),
+            args=record.get("args", {}),
+        ).text
+    return f"{record['ts']}  {where}  {text}"
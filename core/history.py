@@ -0,0 +1,259 @@
+"""The run history: every processed order, kept in a local SQLite database.
+
+The journal and the text logs answer "what happened in this run"; the logs
+are deleted after a few days (core/console.cleanup_old_logs). The history
+answers "when was order X written, to which sheet and row, and how long did
+it take" for as long as the database is kept: at the end of every run the
+OrderResults are saved in one transaction, with the routing inputs
+(extension, size, customization), the first sheet row of the order and the
+stage timings. Indexes on order ID, marketplace and date keep lookups
+instant; the database runs in WAL mode, so the UI, a CLI query and a run
+can use it at the same time.
+
+Query it with ``main_cli.py --history [ORDER_ID]`` or RunHistory.find() /
+RunHistory.query().
+"""
+
+import json
+import os
+import sqlite3
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from core.paths import get_history_path
+
+if TYPE_CHECKING:
+    from core.processor import OrderResult
+
+# Stages that together make up the time of an order (the others nest inside)
+_TOP_STAGES = ("parse", "write")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        started TEXT NOT NULL,
+        output TEXT NOT NULL,
+        wall_ms REAL NOT NULL,
+        orders INTEGER NOT NULL,
+        ok INTEGER NOT NULL,
+        failed INTEGER NOT NULL,
+        spooled INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id INTEGER NOT NULL REFERENCES runs (id),
+        processed TEXT NOT NULL,
+        number INTEGER NOT NULL,
+        order_id TEXT,
+        marketplace TEXT,
+        status TEXT NOT NULL,
+        sheet TEXT,
+        row INTEGER,
+        items INTEGER NOT NULL,
+        extension TEXT,
+        smaller_size TEXT,
+        customization TEXT,
+        error TEXT,
+        total_ms REAL NOT NULL,
+        timings TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS orders_by_order_id ON orders (order_id)",
+    "CREATE INDEX IF NOT EXISTS orders_by_marketplace ON orders (marketplace, processed)",
+    "CREATE INDEX IF NOT EXISTS orders_by_date ON orders (processed)",
+)
+
+_COLUMNS = (
+    "run_id, processed, number, order_id, marketplace, status, sheet, row, "
+    "items, extension, smaller_size, customization, error, total_ms, timings"
+)
+
+
+@dataclass
+class HistoryEntry:
+    """One processed order as the history keeps it."""
+
+    run_id: int
+    processed: str
+    number: int
+    order_id: str | None
+    marketplace: str | None
+    status: str
+    sheet: str | None
+    row: int | None
+    items: int
+    extension: str | None
+    smaller_size: str | None
+    customization: str | None
+    error: str | None
+    total_ms: float
+    timings: dict[str, float]
+
+
+def history_query_from_argv(argv: list[str]) -> str | None:
+    """``--history [ORDER_ID]``: the order to look up ("" = the latest
+    orders); None without the flag."""
+    if "--history" not in argv:
+        return None
+    try:
+        value = argv[argv.index("--history") + 1]
+    except IndexError:
+        return ""
+    return "" if value.startswith("--") else value
+
+
+def order_status(result: "OrderResult") -> str:
+    """written, spooled or failed."""
+    if result.ok:
+        return "written"
+    return "spooled" if result.spooled else "failed"
+
+
+def stage_ms(result: "OrderResult") -> dict[str, float]:
+    """Milliseconds per stage of an order (repeated stages added up)."""
+    stages: dict[str, float] = defaultdict(float)
+    for name, seconds in result.timings:
+        stages[name] += seconds * 1000
+    return dict(stages)
+
+
+class RunHistory:
+    """Runs and their orders in a SQLite file (WAL mode).
+
+    Like the offline spool, every call opens its own short connection.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or get_history_path()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                yield connection
+        finally:
+            connection.close()
+
+    def record_run(
+        self,
+        results: list["OrderResult"],
+        wall_seconds: float,
+        output: str = "sheets",
+        started: datetime | None = None,
+    ) -> int:
+        """Saves a run and all its orders in one transaction; returns the run id.
+
+        ``started`` is when the run began (by default ``wall_seconds`` ago);
+        the orders are stamped with the time they are saved.
+        """
+        finished = datetime.now()
+        if started is None:
+            started = finished - timedelta(seconds=wall_seconds)
+        now = finished.isoformat(timespec="seconds")
+        statuses = [order_status(result) for result in results]
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (started, output, wall_ms, orders, ok, failed, "
+                "spooled) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    started.isoformat(timespec="seconds"),
+                    output,
+                    round(wall_seconds * 1000, 1),
+                    len(results),
+                    statuses.count("written"),
+                    statuses.count("failed"),
+                    statuses.count("spooled"),
+                ),
+            )
+            run_id = cursor.lastrowid
+            assert run_id is not None
+            connection.executemany(
+                f"INSERT INTO orders ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    _order_row(run_id, now, result, status)
+                    for result, status in zip(results, statuses, strict=True)
+                ],
+            )
+        return run_id
+
+    def find(self, order_id: str) -> list[HistoryEntry]:
+        """Every time this order was processed, newest first."""
+        return self._select("WHERE order_id = ? ORDER BY id DESC", (order_id,))
+
+    def query(
+        self,
+        *,
+        marketplace: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 100,
+    ) -> list[HistoryEntry]:
+        """Processed orders, newest first; ``since``/``until`` are ISO dates
+        (``until`` exclusive)."""
+        conditions: list[str] = []
+        args: list[Any] = []
+        for column, operator, value in (
+            ("marketplace", "=", marketplace),
+            ("status", "=", status),
+            ("processed", ">=", since),
+            ("processed", "<", until),
+        ):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                args.append(value)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        return self._select(f"{where}ORDER BY id DESC LIMIT ?", (*args, limit))
+
+    def _select(self, where: str, args: tuple[Any, ...]) -> list[HistoryEntry]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT {_COLUMNS} FROM orders {where}", args
+            ).fetchall()
+        names = [column.name for column in fields(HistoryEntry)]
+        entries = []
+        for row in rows:
+            values = dict(zip(names, row, strict=True))
+            values["timings"] = json.loads(values["timings"])
+            entries.append(HistoryEntry(**values))
+        return entries
+
+
+def _order_row(
+    run_id: int, processed: str, result: "OrderResult", status: str
+) -> tuple[Any, ...]:
+    stages = stage_ms(result)
+    total_ms = sum(stages.get(name, 0.0) for name in _TOP_STAGES)
+    return (
+        run_id,
+        processed,
+        result.number,
+        result.order_id,
+        result.marketplace,
+        status,
+        result.sheet,
+        result.row,
+        result.items,
+        result.extension,
+        None if result.smaller_size is None else str(result.smaller_size),
+        result.customization,
+        result.error,
+        round(total_ms, 1),
+        json.dumps({name: round(ms, 1) for name, ms in stages.items()}),
+    )
@@ -1,4 +1,16 @@
-"""Runtime message catalog (gettext-style)."""
+"""Runtime message catalog (gettext-style).
+
+The catalogs below are compiled once, at import, into one lookup table per
+language. The selected language is a single reference to its table, swapped
+in one assignment by set_language(), so a thread rendering a message always
+sees one whole table, never a half-switched state.
+
+Messages do not have to be rendered when they are produced: a console
+LogEvent keeps the key and the values and renders them on demand, through
+translate(), in the current language or in the one a reader asks for.
+"""
+
+from collections.abc import Mapping
 
 LANGUAGES = ("en", "ru", "uk")
 
@@ -7,8 +19,9 @@ _current_language = "ru"
 
 def set_language(code: str) -> None:
     """Selects the language for all subsequent runtime messages."""
-    global _current_language
+    global _current_language, _table
     if code in LANGUAGES:
+        _table = _TABLES[code]
         _current_language = code
 
 
@@ -23,9 +36,17 @@ def tr(key: str, **kwargs: object) -> str:
     ``key`` is the English source text. Unknown keys fall back to the key
     itself, so a missing translation can never crash processing.
     """
-    catalog = _CATALOG.get(_current_language)
-    template = catalog.get(key, key) if catalog else key
-    return template.format(**kwargs) if kwargs else template
+    template = _table.get(key, key)
+    return template.format_map(kwargs) if kwargs else template
+
+
+def translate(
+    key: str, args: Mapping[str, object] | None = None, language: str | None = None
+) -> str:
+    """tr() in a given language (the current one when None)."""
+    table = _table if language is None else _TABLES.get(language, {})
+    template = table.get(key, key)
+    return template.format_map(args) if args else template
 
 
 _RU = {
@@ -108,6 +129,58 @@ _RU = {
     "The program was interrupted by the user.": "Работа программы была прервана пользователем.",
     "Fatal error: {message}": "Критическая ошибка: {message}",
     "marketplace not recognized": "маркетплейс не распознан",
+    # --- run reports ---
+    "---Timing report saved: {path}---": "---Отчёт о времени выполнения сохранён: {path}---",
+    "--- {stage}: p50 {p50} ms, p95 {p95} ms, max {max} ms ({count}×) ---": "--- {stage}: p50 {p50} мс, p95 {p95} мс, макс. {max} мс ({count}×) ---",
+    "!!!Could not save the timing report: {error}!!!": "!!!Не удалось сохранить отчёт о времени выполнения: {error}!!!",
+    "---Google API calls---": "---Вызовы Google API---",
+    "---Profile saved: {path}---": "---Профиль сохранён: {path}---",
+    "---No orders matched the profiling filter---": "---Ни один заказ не подошёл под фильтр профилирования---",
+    "!!!Could not save the profile: {error}!!!": "!!!Не удалось сохранить профиль: {error}!!!",
+    # --- local output sinks ---
+    "<<<Order saved to the local {kind} output>>>": "<<<Заказ сохранён в локальный вывод {kind}>>>",
+    "---{rows} row(s) written to {path}---": "---Строк записано в {path}: {rows}---",
+    "---Dry run: rows go to {path} ({kind}), not to the spreadsheet---": "---Пробный запуск: строки пишутся в {path} ({kind}), а не в таблицу---",
+    "!!!Could not write the buffered rows: {error}!!!": "!!!Не удалось записать накопленные строки: {error}!!!",
+    # --- offline spool ---
+    "||| Google Sheets is unreachable ({error}); this and the remaining orders of the run go to the offline spool |||": "||| Google Таблицы недоступны ({error}); этот и оставшиеся заказы запуска сохраняются в офлайн-очередь |||",
+    "---Order {order_id} saved in the offline spool (sheet {sheet})---": "---Заказ {order_id} сохранён в офлайн-очередь (лист {sheet})---",
+    "!!!Could not save the order in the offline spool: {error}!!!": "!!!Не удалось сохранить заказ в офлайн-очередь: {error}!!!",
+    "!!!Could not read the offline spool: {error}!!!": "!!!Не удалось прочитать офлайн-очередь: {error}!!!",
+    "||| {count} order(s) wait in the offline spool and will be written once Google is reachable |||": "||| Заказов в офлайн-очереди: {count}, они будут записаны, когда Google станет доступен |||",
+    "||| Google Drive is unreachable, the shipping label will be uploaded later: {error} |||": "||| Google Диск недоступен, транспортная этикетка будет загружена позже: {error} |||",
+    "---Writing {count} order(s) from the offline spool---": "---Запись заказов из офлайн-очереди: {count}---",
+    "||| Google is still unreachable, {count} order(s) stay in the offline spool |||": "||| Google всё ещё недоступен, в офлайн-очереди остаётся заказов: {count} |||",
+    "<<<All {count} spooled order(s) are in the spreadsheet>>>": "<<<Все заказы из очереди ({count}) записаны в таблицу>>>",
+    "!!!Spooled order {order_id} was rejected by the spreadsheet: {error}!!!": "!!!Таблица отклонила заказ {order_id} из очереди: {error}!!!",
+    "!!!Spooled order {order_id} was only partly written, check the sheet: {error}!!!": "!!!Заказ {order_id} из очереди записан в таблицу не полностью, проверьте лист: {error}!!!",
+    "<<<{count} order(s) added to the spreadsheet>>>": "<<<Заказов добавлено в таблицу: {count}>>>",
+    "---The offline spool is empty---": "---Офлайн-очередь пуста---",
+    "!!!Order {order_id} from {created} stays in the spool: {error}!!!": "!!!Заказ {order_id} от {created} остаётся в очереди: {error}!!!",
+    # --- watch folder ---
+    "---Watching {inbox} for new orders, processed files go to {archive}---": "---Отслеживается папка {inbox}, обработанные файлы переносятся в {archive}---",
+    "!!!Could not read {path}: {error}!!!": "!!!Не удалось прочитать {path}: {error}!!!",
+    "---{files} file(s) with {orders} order(s) picked up from the inbox---": "---Из входящей папки взято файлов: {files}, заказов: {orders}---",
+    "!!!The run stopped: {error}. The files are moved to the failed folder!!!": "!!!Запуск прерван: {error}. Файлы перенесены в папку failed!!!",
+    "<<<Inbox run finished: {ok} written, {failed} failed>>>": "<<<Файлы из входящей папки обработаны: записано {ok}, с ошибкой {failed}>>>",
+    "!!!Could not take {path} from the inbox, it is tried again later: {error}!!!": "!!!Не удалось забрать {path} из входящей папки, попытка повторится позже: {error}!!!",
+    "!!!Could not move {path} to the archive: {error}!!!": "!!!Не удалось перенести {path} в архив: {error}!!!",
+    # --- http ingestion ---
+    "---Listening on http://{host}:{port}/orders, jobs are kept in {path}---": "---Приём заказов на http://{host}:{port}/orders, задания хранятся в {path}---",
+    "---Clients send the token from {path} in the {header} header---": "---Клиенты передают токен из {path} в заголовке {header}---",
+    "---{count} order(s) taken from the ingestion queue---": "---Заказов взято из очереди приёма: {count}---",
+    "!!!The ingestion batch stopped: {error}!!!": "!!!Обработка пакета из очереди приёма прервана: {error}!!!",
+    # --- input files ---
+    "---{orders} order(s) read from {files} file(s)---": "---Прочитано заказов: {orders}, файлов: {files}---",
+    "---No orders found in the input files---": "---Во входных файлах не найдено заказов---",
+    # --- order archive ---
+    "!!!Order {order_id} is not in the order archive!!!": "!!!Заказа {order_id} нет в архиве заказов!!!",
+    "!!!Could not archive order {order_id}: {error}!!!": "!!!Не удалось сохранить заказ {order_id} в архив: {error}!!!",
+    # --- run history ---
+    "!!!Could not save the run history: {error}!!!": "!!!Не удалось сохранить историю запусков: {error}!!!",
+    "---Nothing in the run history---": "---В истории запусков ничего нет---",
+    # --- event log ---
+    "---Nothing found in the event log---": "---В журнале событий ничего не найдено---",
 }
 
 _UK = {
@@ -190,11 +263,76 @@ _UK = {
     "The program was interrupted by the user.": "Роботу програми було перервано користувачем.",
     "Fatal error: {message}": "Критична помилка: {message}",
     "marketplace not recognized": "маркетплейс не розпізнано",
+    # --- run reports ---
+    "---Timing report saved: {path}---": "---Звіт про час виконання збережено: {path}---",
+    "--- {stage}: p50 {p50} ms, p95 {p95} ms, max {max} ms ({count}×) ---": "--- {stage}: p50 {p50} мс, p95 {p95} мс, макс. {max} мс ({count}×) ---",
+    "!!!Could not save the timing report: {error}!!!": "!!!Не вдалося зберегти звіт про час виконання: {error}!!!",
+    "---Google API calls---": "---Виклики Google API---",
+    "---Profile saved: {path}---": "---Профіль збережено: {path}---",
+    "---No orders matched the profiling filter---": "---Жодне замовлення не підійшло під фільтр профілювання---",
+    "!!!Could not save the profile: {error}!!!": "!!!Не вдалося зберегти профіль: {error}!!!",
+    # --- local output sinks ---
+    "<<<Order saved to the local {kind} output>>>": "<<<Замовлення збережено в локальний вивід {kind}>>>",
+    "---{rows} row(s) written to {path}---": "---Рядків записано до {path}: {rows}---",
+    "---Dry run: rows go to {path} ({kind}), not to the spreadsheet---": "---Пробний запуск: рядки пишуться до {path} ({kind}), а не до таблиці---",
+    "!!!Could not write the buffered rows: {error}!!!": "!!!Не вдалося записати накопичені рядки: {error}!!!",
+    # --- offline spool ---
+    "||| Google Sheets is unreachable ({error}); this and the remaining orders of the run go to the offline spool |||": "||| Google Таблиці недоступні ({error}); це та решта замовлень запуску зберігаються в офлайн-чергу |||",
+    "---Order {order_id} saved in the offline spool (sheet {sheet})---": "---Замовлення {order_id} збережено в офлайн-чергу (аркуш {sheet})---",
+    "!!!Could not save the order in the offline spool: {error}!!!": "!!!Не вдалося зберегти замовлення в офлайн-чергу: {error}!!!",
+    "!!!Could not read the offline spool: {error}!!!": "!!!Не вдалося прочитати офлайн-чергу: {error}!!!",
+    "||| {count} order(s) wait in the offline spool and will be written once Google is reachable |||": "||| Замовлень в офлайн-черзі: {count}, їх буде записано, коли Google стане доступним |||",
+    "||| Google Drive is unreachable, the shipping label will be uploaded later: {error} |||": "||| Google Диск недоступний, транспортну етикетку буде завантажено пізніше: {error} |||",
+    "---Writing {count} order(s) from the offline spool---": "---Запис замовлень з офлайн-черги: {count}---",
+    "||| Google is still unreachable, {count} order(s) stay in the offline spool |||": "||| Google досі недоступний, в офлайн-черзі залишається замовлень: {count} |||",
+    "<<<All {count} spooled order(s) are in the spreadsheet>>>": "<<<Усі замовлення з черги ({count}) записано до таблиці>>>",
+    "!!!Spooled order {order_id} was rejected by the spreadsheet: {error}!!!": "!!!Таблиця відхилила замовлення {order_id} з черги: {error}!!!",
+    "!!!Spooled order {order_id} was only partly written, check the sheet: {error}!!!": "!!!Замовлення {order_id} з черги записано до таблиці не повністю, перевірте аркуш: {error}!!!",
+    "<<<{count} order(s) added to the spreadsheet>>>": "<<<Замовлень додано до таблиці: {count}>>>",
+    "---The offline spool is empty---": "---Офлайн-черга порожня---",
+    "!!!Order {order_id} from {created} stays in the spool: {error}!!!": "!!!Замовлення {order_id} від {created} залишається в черзі: {error}!!!",
+    # --- watch folder ---
+    "---Watching {inbox} for new orders, processed files go to {archive}---": "---Відстежується тека {inbox}, оброблені файли переносяться до {archive}---",
+    "!!!Could not read {path}: {error}!!!": "!!!Не вдалося прочитати {path}: {error}!!!",
+    "---{files} file(s) with {orders} order(s) picked up from the inbox---": "---З вхідної теки взято файлів: {files}, замовлень: {orders}---",
+    "!!!The run stopped: {error}. The files are moved to the failed folder!!!": "!!!Запуск перервано: {error}. Файли перенесено до теки failed!!!",
+    "<<<Inbox run finished: {ok} written, {failed} failed>>>": "<<<Файли з вхідної теки оброблено: записано {ok}, з помилкою {failed}>>>",
+    "!!!Could not take {path} from the inbox, it is tried again later: {error}!!!": "!!!Не вдалося забрати {path} із вхідної папки, спробу буде повторено пізніше: {error}!!!",
+    "!!!Could not move {path} to the archive: {error}!!!": "!!!Не вдалося перенести {path} до архіву: {error}!!!",
+    # --- http ingestion ---
+    "---Listening on http://{host}:{port}/orders, jobs are kept in {path}---": "---Приймання замовлень на http://{host}:{port}/orders, завдання зберігаються в {path}---",
+    "---Clients send the token from {path} in the {header} header---": "---Клієнти передають токен із {path} у заголовку {header}---",
+    "---{count} order(s) taken from the ingestion queue---": "---Замовлень взято з черги приймання: {count}---",
+    "!!!The ingestion batch stopped: {error}!!!": "!!!Обробку пакета з черги приймання перервано: {error}!!!",
+    # --- input files ---
+    "---{orders} order(s) read from {files} file(s)---": "---Прочитано замовлень: {orders}, файлів: {files}---",
+    "---No orders found in the input files---": "---У вхідних файлах не знайдено замовлень---",
+    # --- order archive ---
+    "!!!Order {order_id} is not in the order archive!!!": "!!!Замовлення {order_id} немає в архіві замовлень!!!",
+    "!!!Could not archive order {order_id}: {error}!!!": "!!!Не вдалося зберегти замовлення {order_id} до архіву: {error}!!!",
+    # --- run history ---
+    "!!!Could not save the run history: {error}!!!": "!!!Не вдалося зберегти історію запусків: {error}!!!",
+    "---Nothing in the run history---": "---В історії запусків нічого немає---",
+    # --- event log ---
+    "---Nothing found in the event log---": "---У журналі подій нічого не знайдено---",
 }
 
 _CATALOG: dict[str, dict[str, str]] = {"ru": _RU, "uk": _UK}
 
 
+def _compile(catalog: dict[str, str]) -> dict[str, str]:
+    """The lookup table of a language: entries that translate to the key
+    itself are left out, so they take the same fast miss path as English."""
+    return {key: value for key, value in catalog.items() if value != key}
+
+
+_TABLES: dict[str, dict[str, str]] = {
+    "en": {},
+    **{code: _compile(catalog) for code, catalog in _CATALOG.items()},
+}
+_table = _TABLES[_current_language]
+
+
 def banner_words() -> list[str]:
     """All translations of the "New order" banner word, for log parsing."""
     words = ["New order"]
@@ -0,0 +1,434 @@
+"""Local HTTP ingestion of orders (``main_cli.py --serve``).
+
+A small HTTP service on localhost that lets other tools, e.g. a browser
+extension posting the order page that is open, push orders into the
+pipeline instead of pasting them into the UI or orders.txt:
+
+- ``POST /orders``      the order HTML (several orders may be sent at once,
+                        like in orders.txt); answers 202 with the job ids;
+- ``GET /jobs/<id>``    the status of one job and, once it is done, its
+                        OrderResult (order ID, sheet, items, error);
+- ``GET /jobs``         the latest jobs, ``?status=queued`` to filter.
+
+Every order becomes a job in a SQLite queue (core/paths.get_jobs_path), so
+nothing posted is lost when the process stops: jobs interrupted mid-run are
+queued again on the next start (see JobQueue.requeue_running for the
+catch). One worker thread feeds the jobs through a single long-lived
+ProcessingSession (warm spreadsheet, caches and parse threads). Orders arriving close together are processed as one small batch:
+the worker waits ``--batch-window`` seconds after the first one.
+
+The service binds to 127.0.0.1 only. Since any web page the operator has
+open can post to localhost, every request must carry the ``X-Ingest-Token``
+header with the token kept in ingest_token.txt beside the queue (created on
+the first start), and orders are only taken as text/html or
+application/json. A custom header cannot be sent cross-site without a CORS
+preflight, which the service does not answer.
+"""
+
+import hmac
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+from core.console import cmessage
+from core.paths import get_jobs_path
+
+if TYPE_CHECKING:
+    from core.processor import OrderResult
+    from core.session import ProcessingSession
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# How long the worker waits for more orders after the first one arrives
+DEFAULT_BATCH_WINDOW = 0.5
+DEFAULT_BATCH_SIZE = 20
+# Larger requests are refused (a single order page is well under 1 MB)
+MAX_BODY_BYTES = 16 * 1024 * 1024
+TOKEN_HEADER = "X-Ingest-Token"
+_POST_TYPES = ("text/html", "application/json")
+# How often the offline spool is retried while no orders arrive
+SPOOL_RETRY_SECONDS = 60.0
+# Upper bound of one idle wait, so a stop request is noticed quickly
+_TICK_SECONDS = 1.0
+
+JOB_STATUSES = ("queued", "running", "done", "failed", "spooled")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created TEXT NOT NULL,
+    finished TEXT,
+    status TEXT NOT NULL,
+    html TEXT NOT NULL,
+    result TEXT
+)
+"""
+
+
+@dataclass(frozen=True)
+class IngestConfig:
+    """Where the service listens and how it batches."""
+
+    port: int = DEFAULT_PORT
+    host: str = DEFAULT_HOST
+    batch_window: float = DEFAULT_BATCH_WINDOW
+
+
+def ingest_config_from_argv(argv: list[str]) -> IngestConfig | None:
+    """Reads ``--serve [PORT]`` and ``--batch-window SECONDS``; None when
+    the service is off."""
+    if "--serve" not in argv:
+        return None
+
+    def value_after(flag: str) -> str:
+        try:
+            value = argv[argv.index(flag) + 1]
+        except (ValueError, IndexError):
+            return ""
+        return "" if value.startswith("--") else value
+
+    port = value_after("--serve")
+    window = value_after("--batch-window")
+    try:
+        batch_window = float(window) if window else DEFAULT_BATCH_WINDOW
+    except ValueError:
+        batch_window = DEFAULT_BATCH_WINDOW
+    return IngestConfig(
+        port=int(port) if port.isdigit() else DEFAULT_PORT,
+        batch_window=max(batch_window, 0.0),
+    )
+
+
+def result_fields(result: "OrderResult") -> dict[str, Any]:
+    """The part of an OrderResult a client needs (no order text or timings)."""
+    return {
+        "number": result.number,
+        "marketplace": result.marketplace,
+        "ok": result.ok,
+        "spooled": result.spooled,
+        "order_id": result.order_id,
+        "sheet": result.sheet,
+        "items": result.items,
+        "error": result.error,
+    }
+
+
+class JobQueue:
+    """Posted orders and their results in a SQLite file.
+
+    Like the offline spool, every call opens its own short connection, so
+    the HTTP threads and the worker can share the file.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or get_jobs_path()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                connection.execute(_SCHEMA)
+                yield connection
+        finally:
+            connection.close()
+
+    def add(self, orders: list[str]) -> list[int]:
+        """Queues the orders, in one transaction; returns their job ids."""
+        created = _now()
+        with self._connect() as connection:
+            ids = []
+            for html in orders:
+                cursor = connection.execute(
+                    "INSERT INTO jobs (created, status, html) VALUES (?, 'queued', ?)",
+                    (created, html),
+                )
+                assert cursor.lastrowid is not None
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def claim(self, limit: int = DEFAULT_BATCH_SIZE) -> list[tuple[int, str]]:
+        """Marks the oldest queued jobs running; returns their ids and HTML."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT id, html FROM jobs WHERE status = 'queued' ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE jobs SET status = 'running' WHERE id = ?",
+                [(job_id,) for job_id, _ in rows],
+            )
+        return rows
+
+    def finish(self, job_id: int, result: "OrderResult") -> None:
+        """Stores the outcome of a job."""
+        if result.ok:
+            status = "done"
+        elif result.spooled:
+            status = "spooled"
+        else:
+            status = "failed"
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, finished = ?, result = ? WHERE id = ?",
+                (status, _now(), json.dumps(result_fields(result)), job_id),
+            )
+
+    def fail(self, job_ids: list[int], error: str) -> None:
+        """Fails the jobs of an interrupted batch that got no result."""
+        result = json.dumps({"ok": False, "error": error})
+        with self._connect() as connection:
+            connection.executemany(
+                "UPDATE jobs SET status = 'failed', finished = ?, result = ? "
+                "WHERE id = ? AND status = 'running'",
+                [(_now(), result, job_id) for job_id in job_ids],
+            )
+
+    def requeue_running(self) -> int:
+        """Queues again the jobs a stopped process left running.
+
+        Each job gets its result as soon as its order is processed, so only
+        the orders of the interrupted batch without one run again. An order
+        whose write reached the sheet just before the process stopped, but
+        whose result was not saved yet, is written twice.
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                "UPDATE jobs SET status = 'queued' WHERE status = 'running'"
+            ).rowcount
+
+    def count(self, status: str = "queued") -> int:
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)
+            ).fetchone()[0]
+
+    def get(self, job_id: int) -> dict[str, Any] | None:
+        """A job as the API returns it; None if there is no such job."""
+        jobs = self._select("WHERE id = ?", (job_id,))
+        return jobs[0] if jobs else None
+
+    def recent(self, status: str | None = None, limit: int = 100) -> list[dict]:
+        """The latest jobs, newest first."""
+        if status is None:
+            return self._select("ORDER BY id DESC LIMIT ?", (limit,))
+        return self._select(
+            "WHERE status = ? ORDER BY id DESC LIMIT ?", (status, limit)
+        )
+
+    def _select(self, where: str, args: tuple[Any, ...]) -> list[dict[str, Any]]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT id, created, finished, status, result FROM jobs {where}", args
+            ).fetchall()
+        return [
+            {
+                "id": row[0],
+                "created": row[1],
+                "finished": row[2],
+                "status": row[3],
+                "result": json.loads(row[4]) if row[4] else None,
+            }
+            for row in rows
+        ]
+
+
+class IngestWorker:
+    """Feeds the queued jobs through one warm session, in small batches."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        session: "ProcessingSession",
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.queue = queue
+        self.session = session
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self._clock = clock
+        self._wake = threading.Event()
+
+    def wake(self) -> None:
+        """Called after new jobs are queued."""
+        self._wake.set()
+
+    def run(self, stop: threading.Event) -> None:
+        """Processes jobs as they arrive until ``stop`` is set."""
+        if self.queue.requeue_running() or self.queue.count():
+            self._wake.set()
+        next_replay = self._clock() + SPOOL_RETRY_SECONDS
+        while not stop.is_set():
+            if not self._wake.wait(_TICK_SECONDS):
+                if self._clock() >= next_replay:
+                    next_replay = self._clock() + SPOOL_RETRY_SECONDS
+                    self._replay_spool()
+                continue
+            self._wake.clear()
+            # Let the orders posted right after this one join its batch
+            stop.wait(self.batch_window)
+            while not stop.is_set() and self.process_batch():
+                pass
+            next_replay = self._clock() + SPOOL_RETRY_SECONDS
+
+    def process_batch(self) -> int:
+        """Processes up to ``batch_size`` queued jobs; returns how many."""
+        jobs = self.queue.claim(self.batch_size)
+        if not jobs:
+            return 0
+        job_ids = [job_id for job_id, _ in jobs]
+        cmessage(
+            "---{count} order(s) taken from the ingestion queue---", count=len(jobs)
+        )
+
+        def on_result(result: "OrderResult") -> None:
+            self.queue.finish(job_ids[result.number - 1], result)
+
+        try:
+            self.session.process_order_list(
+                [html for _, html in jobs], result_callback=on_result
+            )
+        except Exception as error:  # noqa: BLE001
+            cmessage("!!!The ingestion batch stopped: {error}!!!", "error", error=error)
+            self.queue.fail(job_ids, str(error))
+        return len(jobs)
+
+    def _replay_spool(self) -> None:
+        try:
+            if self.session.spool.count():
+                self.session.replay_spool()
+        except Exception as error:  # noqa: BLE001
+            cmessage(
+                "!!!Could not read the offline spool: {error}!!!", "error", error=error
+            )
+
+
+def ingest_token(path: str) -> str:
+    """The shared token clients must send; created (owner-only) if missing."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            token = file.read().strip()
+        if token:
+            return token
+    except FileNotFoundError:
+        pass
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    token = secrets.token_urlsafe(32)
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+        file.write(token + "\n")
+    return token
+
+
+def get_token_path(queue: JobQueue) -> str:
+    """ingest_token.txt beside the job queue."""
+    return os.path.join(os.path.dirname(queue.path), "ingest_token.txt")
+
+
+def make_server(
+    queue: JobQueue,
+    worker: IngestWorker,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    *,
+    token: str,
+) -> ThreadingHTTPServer:
+    """The HTTP front of the queue (port 0 picks a free port); requests
+    without ``token`` in the X-Ingest-Token header are refused."""
+    from core.processor import split_orders
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "OrdersParserByDK"
+
+        def do_POST(self) -> None:
+            if not self._authorized():
+                return
+            if urlsplit(self.path).path.rstrip("/") != "/orders":
+                self._reply(HTTPStatus.NOT_FOUND, {"error": "not found"})
+                return
+            if self.headers.get_content_type() not in _POST_TYPES:
+                self._reply(
+                    HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                    {"error": "send text/html or application/json"},
+                )
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_BYTES:
+                self._reply(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "too large"})
+                return
+            body = self.rfile.read(length).decode("utf-8", errors="replace")
+            if self.headers.get_content_type() == "application/json":
+                try:
+                    body = str(json.loads(body).get("html") or "")
+                except (ValueError, AttributeError):
+                    self._reply(HTTPStatus.BAD_REQUEST, {"error": "invalid JSON"})
+                    return
+            orders = split_orders(body)
+            if not orders:
+                self._reply(HTTPStatus.BAD_REQUEST, {"error": "no order HTML"})
+                return
+            job_ids = queue.add(orders)
+            worker.wake()
+            self._reply(HTTPStatus.ACCEPTED, {"jobs": job_ids})
+
+        def do_GET(self) -> None:
+            if not self._authorized():
+                return
+            url = urlsplit(self.path)
+            parts = url.path.strip("/").split("/")
+            if parts == ["jobs"]:
+                status = parse_qs(url.query).get("status", [None])[0]
+                if status is not None and status not in JOB_STATUSES:
+                    self._reply(HTTPStatus.BAD_REQUEST, {"error": "unknown status"})
+                    return
+                self._reply(HTTPStatus.OK, {"jobs": queue.recent(status)})
+            elif len(parts) == 2 and parts[0] == "jobs" and parts[1].isdigit():
+                job = queue.get(int(parts[1]))
+                if job is None:
+                    self._reply(HTTPStatus.NOT_FOUND, {"error": "no such job"})
+                else:
+                    self._reply(HTTPStatus.OK, job)
+            else:
+                self._reply(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+        def _authorized(self) -> bool:
+            sent = self.headers.get(TOKEN_HEADER) or ""
+            if hmac.compare_digest(sent.encode(), token.encode()):
+                return True
+            self._reply(HTTPStatus.UNAUTHORIZED, {"error": "missing or wrong token"})
+            return False
+
+        def _reply(self, status: HTTPStatus, payload: dict[str, Any]) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            """Requests are not logged; the jobs are in the journal."""
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
@@ -0,0 +1,167 @@
+"""Order input files for the CLI (``--input``).
+
+By default the CLI reads orders.txt next to the app. ``--input`` takes any
+number of sources instead, all processed as one run on the same clients
+and caches:
+
+- files: order HTML exports or orders.txt-style files with several orders;
+- globs (``exports/2024-05-*.html``), expanded here as well because the
+  Windows shell does not;
+- directories: every order file directly inside, by name;
+- ``-``: standard input;
+- gzip (``.gz``) and zstd (``.zst``, needs the ``zstandard`` package)
+  compressed versions of all of the above.
+
+Files are read and decompressed in parallel, as streams: the text is split
+into orders while it is being decompressed, so a multi-gigabyte bundle never
+sits in memory compressed and decompressed at once. The orders keep the
+order of the arguments; the files of a directory or glob are sorted by name.
+"""
+
+import codecs
+import glob
+import gzip
+import io
+import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+STDIN = "-"
+ORDER_SUFFIXES = (".html", ".htm", ".txt")
+COMPRESSED_SUFFIXES = (".gz", ".zst")
+DEFAULT_READ_WORKERS = 8
+# Bytes decompressed and decoded at a time
+CHUNK_BYTES = 1024 * 1024
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+@dataclass
+class InputBatch:
+    """The orders of all inputs, in argument order, and what could not be read."""
+
+    orders: list[str] = field(default_factory=list)
+    files: int = 0
+    errors: list[tuple[str, str]] = field(default_factory=list)
+
+
+def inputs_from_argv(argv: list[str]) -> list[str] | None:
+    """The values after ``--input`` up to the next flag; None without it."""
+    if "--input" not in argv:
+        return None
+    values = []
+    for value in argv[argv.index("--input") + 1 :]:
+        if value.startswith("--"):
+            break
+        values.append(value)
+    return values
+
+
+def is_order_file(name: str) -> bool:
+    """Whether a file name looks like order input, compressed or not."""
+    name = name.lower()
+    for suffix in COMPRESSED_SUFFIXES:
+        name = name.removesuffix(suffix)
+    return name.endswith(ORDER_SUFFIXES)
+
+
+def expand_inputs(specs: list[str]) -> list[str]:
+    """Files, directories and globs → the input files, in argument order.
+
+    A source that matches nothing is kept as it is, so reading it reports
+    the missing file.
+    """
+    paths: list[str] = []
+    for spec in specs:
+        if spec == STDIN:
+            paths.append(spec)
+        elif os.path.isdir(spec):
+            paths += sorted(
+                entry.path
+                for entry in os.scandir(spec)
+                if entry.is_file() and is_order_file(entry.name)
+            )
+        elif glob.has_magic(spec):
+            paths += sorted(path for path in glob.glob(spec) if os.path.isfile(path))
+        else:
+            paths.append(spec)
+    return paths
+
+
+@contextmanager
+def open_input(path: str) -> Iterator[io.BufferedIOBase]:
+    """The decompressed byte stream of one input.
+
+    The compression is told by the suffix, and for standard input by the
+    magic bytes. Nothing is decompressed up front.
+    """
+    with ExitStack() as stack:
+        source: Any
+        if path == STDIN:
+            source = sys.stdin.buffer
+            if not isinstance(source, io.BufferedReader):
+                source = io.BufferedReader(source)
+            magic = source.peek(4)[:4]
+        else:
+            source = stack.enter_context(open(path, "rb"))
+            magic = b""
+
+        lowered = path.lower()
+        if lowered.endswith(".gz") or magic[:2] == GZIP_MAGIC:
+            yield stack.enter_context(gzip.GzipFile(fileobj=source))
+        elif lowered.endswith(".zst") or magic == ZSTD_MAGIC:
+            try:
+                import zstandard
+            except ImportError as error:
+                raise OSError("zstd input needs the zstandard package") from error
+            reader = zstandard.ZstdDecompressor().stream_reader(source, closefd=False)
+            yield stack.enter_context(reader)
+        else:
+            yield source
+
+
+def iter_input(path: str, chunk_bytes: int = CHUNK_BYTES) -> Iterator[str]:
+    """The text of one input, decoded chunk by chunk."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    with open_input(path) as stream:
+        while data := stream.read(chunk_bytes):
+            yield decoder.decode(data)
+    yield decoder.decode(b"", final=True)
+
+
+def read_orders(path: str) -> list[str]:
+    """The orders of one input, split while it is being decompressed."""
+    from core.processor import iter_orders
+
+    return list(iter_orders(iter_input(path)))
+
+
+def read_inputs(
+    specs: list[str], max_workers: int = DEFAULT_READ_WORKERS
+) -> InputBatch:
+    """Reads every input in parallel and splits it into orders."""
+    paths = expand_inputs(specs)
+    batch = InputBatch()
+    if not paths:
+        return batch
+
+    def load(path: str) -> list[str] | tuple[str, str]:
+        try:
+            return read_orders(path)
+        except Exception as error:  # noqa: BLE001
+            # Missing and corrupt files, bad encodings, zstd stream errors
+            return path, str(error)
+
+    workers = max(1, min(max_workers, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="read") as pool:
+        for outcome in pool.map(load, paths):
+            if isinstance(outcome, tuple):
+                batch.errors.append(outcome)
+            else:
+                batch.files += 1
+                batch.orders += outcome
+    return batch
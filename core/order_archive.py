@@ -0,0 +1,288 @@
+"""Compressed retention of processed orders (``--order-archive``).
+
+Saved order pages are mostly the same markup over and over: the scripts,
+styles and layout of the marketplace around a few kilobytes of order data.
+The archive keeps every processed order in one SQLite file, each compressed
+on its own, so any past order can be read back by its order ID in
+milliseconds (``--reprocess``) without unpacking a whole bundle.
+
+Compressed one by one, orders would lose most of that redundancy, so every
+marketplace gets a shared dictionary: once ``DICTIONARY_SAMPLES`` orders of
+a marketplace are stored, the markup fragments that most of them repeat
+are collected into a zlib preset dictionary (``zdict``), and later orders
+of that marketplace are compressed against it. Each order records the
+dictionary it was compressed with, so a dictionary can be trained again
+(``train``) without touching the orders already stored.
+"""
+
+import os
+import sqlite3
+import zlib
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from core.console import cmessage
+from core.paths import get_order_archive_path
+
+if TYPE_CHECKING:
+    from core.processor import OrderResult
+
+# Orders of a marketplace stored before its dictionary is trained
+DICTIONARY_SAMPLES = 8
+# zlib only looks back 32 KB, so a larger dictionary would not help
+DICTIONARY_BYTES = 32 * 1024
+# Fragments shorter than this are cheaper to encode than to look up
+_MIN_FRAGMENT = 16
+COMPRESSION_LEVEL = 9
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS dictionaries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        marketplace TEXT NOT NULL,
+        created TEXT NOT NULL,
+        data BLOB NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_id TEXT,
+        marketplace TEXT,
+        created TEXT NOT NULL,
+        dictionary INTEGER REFERENCES dictionaries (id),
+        size INTEGER NOT NULL,
+        data BLOB NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS orders_by_order_id ON orders (order_id)",
+    "CREATE INDEX IF NOT EXISTS orders_by_marketplace ON orders (marketplace)",
+)
+
+
+def order_archive_from_argv(argv: list[str]) -> "OrderArchive | None":
+    """``--order-archive [PATH]`` (next to the app by default); None when
+    archiving is off."""
+    if "--order-archive" not in argv:
+        return None
+    try:
+        value = argv[argv.index("--order-archive") + 1]
+    except IndexError:
+        value = ""
+    return OrderArchive(None if value.startswith("--") else value or None)
+
+
+def reprocess_ids_from_argv(argv: list[str]) -> list[str] | None:
+    """``--reprocess ID[,ID...]``: archived orders to process again."""
+    if "--reprocess" not in argv:
+        return None
+    try:
+        value = argv[argv.index("--reprocess") + 1]
+    except IndexError:
+        return []
+    if value.startswith("--"):
+        return []
+    return [order_id.strip() for order_id in value.split(",") if order_id.strip()]
+
+
+def train_dictionary(samples: list[str], size: int = DICTIONARY_BYTES) -> bytes:
+    """A zlib preset dictionary of the markup most ``samples`` share.
+
+    The pages are cut into tag-sized fragments; the fragments found in at
+    least half of the samples are kept, the most common ones last, because
+    zlib encodes the closest matches with the fewest bits.
+    """
+    seen: Counter[str] = Counter()
+    for sample in samples:
+        seen.update(
+            {
+                fragment + ">"
+                for fragment in sample.split(">")
+                if len(fragment) >= _MIN_FRAGMENT
+            }
+        )
+    needed = max(2, (len(samples) + 1) // 2)
+    common = sorted(
+        (fragment for fragment, count in seen.items() if count >= needed),
+        key=lambda fragment: (seen[fragment], len(fragment)),
+    )
+    parts: list[bytes] = []
+    left = size
+    for fragment in reversed(common):
+        data = fragment.encode("utf-8")
+        if len(data) <= left:
+            parts.append(data)
+            left -= len(data)
+    return b"".join(reversed(parts))
+
+
+class OrderArchive:
+    """Processed orders, compressed per marketplace, in a SQLite file.
+
+    Like the offline spool, every call opens its own short connection; the
+    dictionaries are cached once read.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or get_order_archive_path()
+        self._dictionaries: dict[int, bytes] = {}
+        self._current: dict[str, int | None] = {}
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                yield connection
+        finally:
+            connection.close()
+
+    def add(
+        self, order_text: str, *, order_id: str | None, marketplace: str | None
+    ) -> int:
+        """Stores one order; returns its archive id."""
+        key = marketplace or ""
+        if key not in self._current:
+            self._current[key] = self._latest_dictionary(key)
+        archive_id = self._insert(order_text, order_id, key, self._current[key])
+        if self._current[key] is None and self._count(key) >= DICTIONARY_SAMPLES:
+            # The next orders of the marketplace are compressed against it
+            self.train(key)
+        return archive_id
+
+    def add_result(self, result: "OrderResult") -> None:
+        """result_callback of a run: keeps every order the run processed."""
+        if not result.order_text.strip():
+            return
+        try:
+            self.add(
+                result.order_text,
+                order_id=result.order_id,
+                marketplace=result.marketplace,
+            )
+        except (OSError, sqlite3.Error, zlib.error) as error:
+            # Archiving is a side job: the run goes on without it
+            cmessage(
+                "!!!Could not archive order {order_id}: {error}!!!",
+                "error",
+                order_id=result.order_id,
+                error=error,
+            )
+
+    def train(self, marketplace: str, samples: int = DICTIONARY_SAMPLES * 4) -> int:
+        """Trains a new dictionary from the latest orders of the marketplace."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT dictionary, data FROM orders WHERE marketplace = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (marketplace, samples),
+            ).fetchall()
+        texts = [self._decompress(dictionary, data) for dictionary, data in rows]
+        data = train_dictionary(texts)
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO dictionaries (marketplace, created, data) VALUES (?, ?, ?)",
+                (marketplace, _now(), data),
+            )
+        assert cursor.lastrowid is not None
+        self._dictionaries[cursor.lastrowid] = data
+        self._current[marketplace] = cursor.lastrowid
+        return cursor.lastrowid
+
+    def get(self, order_id: str) -> str | None:
+        """The latest archived order with this order ID."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT dictionary, data FROM orders WHERE order_id = ? "
+                "ORDER BY id DESC LIMIT 1",
+                (order_id,),
+            ).fetchone()
+        return None if row is None else self._decompress(*row)
+
+    def order_ids(self, marketplace: str | None = None) -> list[str]:
+        """The archived order IDs, oldest first."""
+        query = "SELECT DISTINCT order_id FROM orders WHERE order_id IS NOT NULL"
+        args: tuple[str, ...] = ()
+        if marketplace is not None:
+            query += " AND marketplace = ?"
+            args = (marketplace,)
+        with self._connect() as connection:
+            rows = connection.execute(query + " ORDER BY id", args).fetchall()
+        return [row[0] for row in rows]
+
+    def sizes(self) -> tuple[int, int]:
+        """Original and stored bytes of all archived orders."""
+        with self._connect() as connection:
+            original, stored = connection.execute(
+                "SELECT COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) "
+                "FROM orders"
+            ).fetchone()
+        return original, stored
+
+    def _insert(
+        self,
+        order_text: str,
+        order_id: str | None,
+        marketplace: str,
+        dictionary_id: int | None,
+    ) -> int:
+        raw = order_text.encode("utf-8")
+        data = self._compress(raw, dictionary_id)
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO orders (order_id, marketplace, created, dictionary, "
+                "size, data) VALUES (?, ?, ?, ?, ?, ?)",
+                (order_id, marketplace, _now(), dictionary_id, len(raw), data),
+            )
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+    def _compress(self, raw: bytes, dictionary_id: int | None) -> bytes:
+        if dictionary_id is None:
+            compressor = zlib.compressobj(COMPRESSION_LEVEL)
+        else:
+            zdict = self._dictionary(dictionary_id)
+            compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=zdict)
+        return compressor.compress(raw) + compressor.flush()
+
+    def _decompress(self, dictionary_id: int | None, data: bytes) -> str:
+        if dictionary_id is None:
+            decompressor = zlib.decompressobj()
+        else:
+            decompressor = zlib.decompressobj(zdict=self._dictionary(dictionary_id))
+        return (decompressor.decompress(data) + decompressor.flush()).decode("utf-8")
+
+    def _dictionary(self, dictionary_id: int) -> bytes:
+        if dictionary_id not in self._dictionaries:
+            with self._connect() as connection:
+                (data,) = connection.execute(
+                    "SELECT data FROM dictionaries WHERE id = ?", (dictionary_id,)
+                ).fetchone()
+            self._dictionaries[dictionary_id] = data
+        return self._dictionaries[dictionary_id]
+
+    def _latest_dictionary(self, marketplace: str) -> int | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT MAX(id) FROM dictionaries WHERE marketplace = ?",
+                (marketplace,),
+            ).fetchone()
+        return row[0]
+
+    def _count(self, marketplace: str) -> int:
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM orders WHERE marketplace = ?", (marketplace,)
+            ).fetchone()[0]
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
@@ -3,7 +3,7 @@
 import os
 import sys
 
-from platformdirs import user_log_dir
+from platformdirs import user_data_dir, user_log_dir
 
 
 def resource_path(relative_path: str) -> str:
@@ -33,3 +33,57 @@ def get_logs_dir() -> str:
 def get_orders_file_path() -> str:
     """Path to orders.txt next to the executable (same as before)."""
     return os.path.join(get_executable_dir(), "orders.txt")
+
+
+def get_output_dir() -> str:
+    """Directory of the local output sinks (--sink), next to the executable."""
+    return os.path.join(get_executable_dir(), "output")
+
+
+def get_spool_path() -> str:
+    """SQLite file of the offline spool (core/spool.py).
+
+    Like the logs, it lives in the user's application data on Windows and
+    next to the executable elsewhere.
+    """
+    if sys.platform == "win32":
+        return os.path.join(
+            user_data_dir("OrdersParserByDK", "DanielK"), "spool.sqlite3"
+        )
+    return os.path.join(get_executable_dir(), "spool.sqlite3")
+
+
+def get_jobs_path() -> str:
+    """SQLite file of the HTTP ingestion queue (core/ingest.py), beside the spool."""
+    return os.path.join(os.path.dirname(get_spool_path()), "jobs.sqlite3")
+
+
+def get_history_path() -> str:
+    """SQLite file of the run history (core/history.py), beside the spool."""
+    return os.path.join(os.path.dirname(get_spool_path()), "history.sqlite3")
+
+
+def get_order_archive_path() -> str:
+    """SQLite file of the compressed order archive (core/order_archive.py), next to the executable."""
+    return os.path.join(get_executable_dir(), "order_archive.sqlite3")
+
+
+def get_inbox_dir() -> str:
+    """Folder watched for new order files and labels (--watch), next to the executable."""
+    return os.path.join(get_executable_dir(), "inbox")
+
+
+def get_archive_dir() -> str:
+    """Where the watch mode moves processed inputs, next to the executable."""
+    return os.path.join(get_executable_dir(), "archive")
+
+
+def unique_path(folder: str, file_path: str) -> str:
+    """``folder/<name of file_path>``, with a counter added if it is taken."""
+    stem, suffix = os.path.splitext(os.path.basename(file_path))
+    target = os.path.join(folder, stem + suffix)
+    counter = 1
+    while os.path.exists(target):
+        target = os.path.join(folder, f"{stem} ({counter}){suffix}")
+        counter += 1
+    return target
@@ -1,17 +1,26 @@
 """The order-processing pipeline: read → detect → parse → write."""
 
+import time
 import traceback
-from collections.abc import Callable
-from concurrent.futures import Future, ThreadPoolExecutor
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
 from dataclasses import dataclass, field
+from datetime import datetime
 
 
-from core import console
-from core.console import cprint
+from core import console, event_log, timing
+from core.console import cbanner, cmessage, cprint
 from core.i18n import tr
 from core.dispatcher import detect_marketplace
+from core.history import RunHistory
+from core.profiling import ProfileConfig, RunProfiler
+from core.sinks import OrderSink, SinkConfig
+from core.spool import Spool, label_pending, order_id_of, replay_spool
+from google_api.errors import is_unavailable
 from google_api.gdrive_finder import GoogleDriveFinder
-from google_api.gsheet_writer import GSheetWriter
+from google_api.gsheet_writer import GSheetWriter, OrderWrite, select_sheet_name
 
 
 DEFAULT_MAX_WORKERS = 4
@@ -28,7 +37,16 @@ class OrderResult:
     sheet: str | None = None
     items: int = 0
     error: str | None = None
+    # Waiting in the offline spool (core/spool.py): neither written nor failed
+    spooled: bool = False
+    # First sheet row of the order, when the output knows it
+    row: int | None = None
+    # The routing inputs the sheet was picked from
+    extension: str | None = None
+    smaller_size: float | str | None = None
+    customization: str | None = None
     order_text: str = field(default="", repr=False)
+    timings: timing.Timings = field(default_factory=list, repr=False)
 
 
 @dataclass
@@ -38,7 +56,8 @@ class _ParsedOrder:
     number: int
     order_text: str
     marketplace: str | None
-    log_lines: list[str]
+    log_events: list[console.LogEvent]
+    timings: timing.Timings
     order_data: list[dict] | None = None
     extension: str | None = None
     smaller_size: float | str | None = None
@@ -51,6 +70,16 @@ def split_orders(orders_content: str) -> list[str]:
     return [order for order in orders_content.split("</html>") if order.strip()]
 
 
+def iter_orders(chunks: Iterable[str]) -> Iterator[str]:
+    """split_orders() over text arriving in chunks (e.g. a decompressed stream)."""
+    tail = ""
+    for chunk in chunks:
+        *orders, tail = (tail + chunk).split("</html>")
+        yield from (order for order in orders if order.strip())
+    if tail.strip():
+        yield tail
+
+
 def first_customization(order_data: list[dict]) -> str | None:
     """The first non-empty customization of the order to pick the Wallpaper sheet"""
     return next(
@@ -63,58 +92,84 @@ def first_customization(order_data: list[dict]) -> str | None:
     )
 
 
-def _parse_one(number: int, order: str, finder: GoogleDriveFinder) -> _ParsedOrder:
+def _parse_one(
+    number: int,
+    order: str,
+    finder: GoogleDriveFinder,
+    profiler: RunProfiler | None = None,
+) -> _ParsedOrder:
     """The parsing phase of a single order (runs in a worker thread).
 
     All output is captured into a buffer and will be replayed by the
-    pipeline in the original order of the orders.
+    pipeline in the original order of the orders; stage timings are
+    recorded alongside. With a ``profiler``, the parser of a selected
+    order runs under it.
     """
-    with console.capture() as log_lines:
-        spec = detect_marketplace(order)
-        if spec is None:
-            cprint(
-                tr(
-                    "||| Order {number}: marketplace not recognized, skipping |||",
-                    number=number,
-                ),
-                "warning",
-            )
-            return _ParsedOrder(
-                number, order, None, log_lines, error=tr("marketplace not recognized")
-            )
+    with (
+        console.capture() as log_events,
+        timing.recording() as timings,
+        timing.stage("parse"),
+    ):
+        return _parse_stages(number, order, finder, log_events, timings, profiler)
+
 
-        cprint(
-            f"----- {tr('New order')} {spec.name} -----",
-            level="header",
-            style=spec.banner_style,
+def _parse_stages(
+    number: int,
+    order: str,
+    finder: GoogleDriveFinder,
+    log_events: list[console.LogEvent],
+    timings: timing.Timings,
+    profiler: RunProfiler | None,
+) -> _ParsedOrder:
+    with timing.stage("detect"):
+        spec = detect_marketplace(order)
+    if spec is None:
+        cmessage(
+            "||| Order {number}: marketplace not recognized, skipping |||",
+            "warning",
+            number=number,
+        )
+        return _ParsedOrder(
+            number,
+            order,
+            None,
+            log_events,
+            timings,
+            error=tr("marketplace not recognized"),
         )
+
+    cbanner(spec.name, style=spec.banner_style)
+    # Outside the try: the profiler must never be the reason an order fails
+    with profiler.order(number, spec.name) if profiler else nullcontext():
         try:
             parser = spec.parser_cls(order, finder=finder)
-            order_data = parser.parse_order()
-            extension = parser.get_extension()
-            smaller_size = parser.get_smaller_size()
+            with timing.stage("extract"):
+                order_data = parser.parse_order()
+                extension = parser.get_extension()
+                smaller_size = parser.get_smaller_size()
             customization = first_customization(order_data)
             return _ParsedOrder(
                 number,
                 order,
                 spec.name,
-                log_lines,
+                log_events,
+                timings,
                 order_data=order_data,
                 extension=extension,
                 smaller_size=smaller_size,
                 customization=customization,
             )
         except Exception as error:  # noqa: BLE001
-            cprint(
-                tr(
-                    "||| Error processing the {name} order: {error} |||",
-                    name=spec.name,
-                    error=error,
-                ),
+            cmessage(
+                "||| Error processing the {name} order: {error} |||",
                 "error",
+                name=spec.name,
+                error=error,
             )
             cprint(traceback.format_exc(), "error")
-            return _ParsedOrder(number, order, spec.name, log_lines, error=str(error))
+            return _ParsedOrder(
+                number, order, spec.name, log_events, timings, error=str(error)
+            )
 
 
 def process_order_list(
@@ -122,95 +177,334 @@ def process_order_list(
     progress_callback: Callable[[int, int], None] | None = None,
     result_callback: Callable[[OrderResult], None] | None = None,
     max_workers: int = DEFAULT_MAX_WORKERS,
+    *,
+    writer: OrderSink | None = None,
+    finder: GoogleDriveFinder | None = None,
+    executor: Executor | None = None,
+    report: bool = False,
+    profile: ProfileConfig | None = None,
+    spool: Spool | None = None,
+    history: RunHistory | None = None,
 ) -> tuple[int, int]:
-    """Processes a list of orders."""
+    """Processes a list of orders.
+
+    ``writer``, ``finder`` and ``executor`` let a long-lived session (see
+    core/session.py) reuse warm clients and parse threads; by default a
+    fresh set is created for this call only. ``writer`` may also be a local
+    sink (core/sinks.py); whatever it buffers is flushed at the end, and its
+    orders are only reported once their rows are written (as failed if the
+    last write fails). With
+    ``report`` the stage timings of the run are saved as JSON next to the
+    logs and summarized in the journal. ``profile`` runs the selected
+    orders (or the whole run) under cProfile or the sampling profiler and
+    saves the profile to the logs folder.
+
+    With a ``spool``, orders whose write finds Google unreachable are kept
+    there instead of failing, and so is the rest of the run, to preserve
+    the order. Orders left from earlier runs are written first. Spooled
+    orders count neither as written nor as failed.
+
+    With a ``history`` the results of the run are saved there at the end
+    (core/history.py).
+    """
     total = len(orders)
     if total == 0:
         return 0, 0
 
-    ok = 0
-    failed = 0
+    spooling = False
+    results: list[OrderResult] = []
+    # Decided orders not reported yet: a buffering sink has not written
+    # their rows (or the rows of an order before them) so far
+    held: list[OrderResult] = []
+    started = time.perf_counter()
+    started_at = datetime.now()
+    # Tells the orders of this run apart in the structured log
+    run = uuid.uuid4().hex[:12]
+    profiler = RunProfiler(profile) if profile is not None else None
+    write_profiler = profiler if profile is not None and profile.whole_run else None
 
-    writer = GSheetWriter()
-    finder = GoogleDriveFinder()
+    if writer is None:
+        writer = GSheetWriter()
+    if finder is None:
+        finder = GoogleDriveFinder()
 
-    workers = max(1, min(max_workers, total))
-    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parse") as pool:
+    with ExitStack() as stack:
+        if executor is None:
+            workers = max(1, min(max_workers, total))
+            executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parse")
+            )
         futures: list[Future[_ParsedOrder]] = [
-            pool.submit(_parse_one, number, order, finder)
+            executor.submit(_parse_one, number, order, finder, profiler)
             for number, order in enumerate(orders, start=1)
         ]
+        if spool is not None:
+            spooling = not _replay_first(writer, finder, spool)
 
         for future in futures:
             parsed = future.result()
-            console.replay(parsed.log_lines)
+            with console.order_scope(run, parsed.number):
+                console.replay(parsed.log_events)
 
-            result = OrderResult(
-                number=parsed.number,
-                marketplace=parsed.marketplace,
-                ok=False,
-                order_text=parsed.order_text,
-            )
+                result = OrderResult(
+                    number=parsed.number,
+                    marketplace=parsed.marketplace,
+                    ok=False,
+                    order_text=parsed.order_text,
+                    timings=parsed.timings,
+                )
 
-            if parsed.error is not None:
-                failed += 1
-                result.error = parsed.error
-            else:
-                assert parsed.order_data is not None
-                try:
-                    sheet = writer.append_order(
+                if parsed.error is not None:
+                    result.error = parsed.error
+                else:
+                    assert parsed.order_data is not None
+                    order = OrderWrite(
                         parsed.order_data,
                         parsed.extension,  # type: ignore[arg-type]
                         parsed.smaller_size,  # type: ignore[arg-type]
                         parsed.customization,
                     )
-                    ok += 1
-                    result.ok = True
-                    result.sheet = sheet
-                    result.items = len(parsed.order_data)
-                    result.order_id = next(
-                        (
-                            item.get("Order ID")
-                            for item in parsed.order_data
-                            if item.get("Order ID")
-                        ),
-                        None,
-                    )
-                except Exception as error:  # noqa: BLE001
-                    failed += 1
-                    result.error = str(error)
-                    cprint(
-                        tr(
-                            "||| Error writing the {marketplace} order: {error} |||",
-                            marketplace=parsed.marketplace,
-                            error=error,
-                        ),
-                        "error",
-                    )
-                    cprint(traceback.format_exc(), "error")
-                    cprint(
-                        tr("||| Order skipped, moving on to the next one |||"),
-                        "warning",
-                    )
+                    result.extension = order.extension
+                    result.smaller_size = order.smaller_size
+                    result.customization = order.customization_info
+                    if (
+                        spool is not None
+                        and order.order_items
+                        and (spooling or label_pending(order.order_items))
+                    ):
+                        reason = (
+                            "behind earlier spooled orders"
+                            if spooling
+                            else "shipping label upload pending"
+                        )
+                        _spool_order(spool, parsed, order, result, reason)
+                    else:
+                        with (
+                            write_profiler.section()
+                            if write_profiler
+                            else nullcontext()
+                        ):
+                            try:
+                                with (
+                                    timing.recording(result.timings),
+                                    timing.stage("write"),
+                                ):
+                                    sheet = writer.append_order(*order)
+                                result.ok = True
+                                result.sheet = sheet
+                                result.row = writer.last_row
+                                result.items = len(parsed.order_data)
+                                result.order_id = order_id_of(parsed.order_data)
+                            except Exception as error:  # noqa: BLE001
+                                if spool is not None and is_unavailable(error):
+                                    cmessage(
+                                        "||| Google Sheets is unreachable ({error}); this and the remaining orders of the run go to the offline spool |||",
+                                        "warning",
+                                        error=error,
+                                    )
+                                    spooling = True
+                                    _spool_order(
+                                        spool, parsed, order, result, str(error)
+                                    )
+                                else:
+                                    result.error = str(error)
+                                    cmessage(
+                                        "||| Error writing the {marketplace} order: {error} |||",
+                                        "error",
+                                        marketplace=parsed.marketplace,
+                                        error=error,
+                                    )
+                                    cprint(traceback.format_exc(), "error")
+                                    cmessage(
+                                        "||| Order skipped, moving on to the next one |||",
+                                        "warning",
+                                    )
+
+                held.append(result)
+                if progress_callback:
+                    progress_callback(parsed.number, total)
+            if not writer.buffered:
+                _report_results(run, held, results, result_callback)
 
-            if result_callback:
-                result_callback(result)
-            if progress_callback:
-                progress_callback(parsed.number, total)
+    try:
+        writer.flush()
+    except Exception as error:  # noqa: BLE001
+        cmessage(
+            "!!!Could not write the buffered rows: {error}!!!", "error", error=error
+        )
+        cprint(traceback.format_exc(), "error")
+        # Reported as failed, so they must not be written by a later flush
+        writer.discard()
+        for result in held:
+            if result.ok:
+                result.ok = False
+                result.error = str(error)
+    _report_results(run, held, results, result_callback)
 
+    ok = sum(1 for result in results if result.ok)
+    spooled = sum(1 for result in results if result.spooled)
+    failed = len(results) - ok - spooled
+    if spooled:
+        cmessage(
+            "||| {count} order(s) wait in the offline spool and will be written once Google is reachable |||",
+            "warning",
+            count=spooled,
+        )
+    if history is not None:
+        _record_history(
+            history, results, started_at, time.perf_counter() - started, writer
+        )
+    if report:
+        report_timings(results, time.perf_counter() - started)
+    if profiler is not None:
+        save_profile(profiler)
     return ok, failed
 
 
+def _report_results(
+    run: str,
+    held: list[OrderResult],
+    results: list[OrderResult],
+    result_callback: Callable[[OrderResult], None] | None,
+) -> None:
+    """Hands the held results on once nothing of them waits in a buffer."""
+    for result in held:
+        results.append(result)
+        event_log.log_result(run, result)
+        if result_callback:
+            result_callback(result)
+    held.clear()
+
+
+def _replay_first(writer: OrderSink, finder: GoogleDriveFinder, spool: Spool) -> bool:
+    """Writes what earlier runs left in the spool; False if some is still there."""
+    try:
+        return not replay_spool(writer, finder, spool).stopped
+    except Exception as error:  # noqa: BLE001
+        cmessage(
+            "!!!Could not read the offline spool: {error}!!!", "error", error=error
+        )
+        cprint(traceback.format_exc(), "error")
+        return False
+
+
+def _record_history(
+    history: RunHistory,
+    results: list[OrderResult],
+    started_at: datetime,
+    wall_seconds: float,
+    writer: OrderSink,
+) -> None:
+    """Saves the run in the history; a failure only costs the history entry."""
+    try:
+        history.record_run(
+            results,
+            wall_seconds,
+            getattr(writer, "kind", "sheets"),
+            started=started_at,
+        )
+    except Exception as error:  # noqa: BLE001
+        cmessage("!!!Could not save the run history: {error}!!!", "error", error=error)
+
+
+def _spool_order(
+    spool: Spool,
+    parsed: _ParsedOrder,
+    order: OrderWrite,
+    result: OrderResult,
+    reason: str,
+) -> None:
+    """Puts a parsed order into the spool and marks its result as spooled."""
+    sheet = select_sheet_name(
+        order.extension, order.smaller_size, order.customization_info
+    )
+    try:
+        spool.add(order, sheet=sheet, marketplace=parsed.marketplace, reason=reason)
+    except Exception as error:  # noqa: BLE001
+        result.error = str(error)
+        cmessage(
+            "!!!Could not save the order in the offline spool: {error}!!!",
+            "error",
+            error=error,
+        )
+        return
+    result.spooled = True
+    result.sheet = sheet
+    result.items = len(order.order_items)
+    result.order_id = order_id_of(order.order_items)
+    cmessage(
+        "---Order {order_id} saved in the offline spool (sheet {sheet})---",
+        "warning",
+        order_id=result.order_id,
+        sheet=sheet,
+    )
+
+
+def save_profile(profiler: RunProfiler) -> None:
+    """Writes the profile files and lists them in the journal."""
+    try:
+        paths = profiler.save()
+    except OSError as error:
+        cmessage("!!!Could not save the profile: {error}!!!", "error", error=error)
+        return
+    if not paths:
+        cmessage("---No orders matched the profiling filter---", "warning")
+    for path in paths:
+        cmessage("---Profile saved: {path}---", path=path)
+
+
+def report_timings(results: list[OrderResult], wall_seconds: float) -> None:
+    """Saves the run report (with the API call counts) and prints the slowest stages."""
+    from google_api.stats import get_api_stats
+
+    run_report = timing.build_report(results, wall_seconds)
+    run_report["api"] = get_api_stats().snapshot()
+    try:
+        path = timing.write_report(run_report)
+    except OSError as error:
+        cmessage(
+            "!!!Could not save the timing report: {error}!!!", "error", error=error
+        )
+        return
+
+    cmessage("---Timing report saved: {path}---", path=path)
+    for name, stats in timing.slowest_stages(run_report):
+        cmessage(
+            "--- {stage}: p50 {p50} ms, p95 {p95} ms, max {max} ms ({count}×) ---",
+            stage=name,
+            p50=stats["p50_ms"],
+            p95=stats["p95_ms"],
+            max=stats["max_ms"],
+            count=stats["count"],
+        )
+
+
 def process_orders(
-    orders_content: str,
+    orders_content: str | list[str],
     progress_callback: Callable[[int, int], None] | None = None,
     result_callback: Callable[[OrderResult], None] | None = None,
     max_workers: int = DEFAULT_MAX_WORKERS,
+    *,
+    report: bool = False,
+    profile: ProfileConfig | None = None,
+    sink: SinkConfig | None = None,
 ) -> tuple[int, int]:
-    """Processes all orders from the orders.txt content."""
+    """Processes all orders from the orders.txt content (or already split
+    orders, e.g. read from several files by core/inputs.py).
+
+    ``sink`` writes the rows to a local file instead of Google Sheets;
+    without it, what Google cannot take waits in the offline spool.
+    """
+    if isinstance(orders_content, str):
+        orders_content = split_orders(orders_content)
     return process_order_list(
-        split_orders(orders_content),
+        orders_content,
         progress_callback=progress_callback,
         result_callback=result_callback,
         max_workers=max_workers,
+        writer=sink.create() if sink is not None else None,
+        report=report,
+        profile=profile,
+        spool=Spool() if sink is None else None,
+        history=RunHistory(),
     )
@@ -0,0 +1,546 @@
+"""Profiling: startup import times, and cProfile / sampling profiles of runs.
+
+``--profile-startup`` times imports and startup milestones; the import hook
+must be installed before anything heavy is imported, so the entry points do
+it first thing. ``--profile`` (and the hidden UI toggle) profiles a run, or
+only selected orders, and saves .pstats and .collapsed files to the logs.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from itertools import pairwise
+from types import FrameType, ModuleType
+from typing import Any, Literal
+
+_PROCESS_START = time.perf_counter()
+
+
+class _TimedLoader(Loader):
+    """Wraps a module loader and reports how long exec_module() took."""
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler", name: str) -> None:
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._enter()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave(self._name, time.perf_counter() - started)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(MetaPathFinder):
+    """Times every module imported after install(): cumulative and self time."""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, tuple[float, float]] = {}
+        self.milestones: list[tuple[str, float]] = []
+        self.total = 0.0
+        self._local = threading.local()
+
+    @property
+    def _children(self) -> list[float]:
+        """Stack of nested import times; per thread (warm-up imports run in parallel)."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self, fullname)
+            return spec
+        return None
+
+    def mark(self, milestone: str) -> None:
+        """Records a named moment, measured from process start."""
+        self.milestones.append((milestone, time.perf_counter() - _PROCESS_START))
+
+    def _enter(self) -> None:
+        self._children.append(0.0)
+
+    def _leave(self, name: str, elapsed: float) -> None:
+        children = self._children.pop()
+        self.timings[name] = (elapsed, elapsed - children)
+        if self._children:
+            self._children[-1] += elapsed
+        else:
+            self.total += elapsed
+
+    def report(self, top: int = 25) -> list[str]:
+        """Human-readable report: milestones, then the slowest imports."""
+        lines = [
+            f"{name}: {seconds * 1000:.0f} ms" for name, seconds in self.milestones
+        ]
+        lines.append(
+            f"imports: {len(self.timings)} modules, {self.total * 1000:.0f} ms"
+        )
+        slowest = sorted(
+            self.timings.items(), key=lambda item: item[1][0], reverse=True
+        )
+        for name, (cumulative, own) in slowest[:top]:
+            lines.append(
+                f"  {cumulative * 1000:8.1f} ms  (self {own * 1000:6.1f})  {name}"
+            )
+        return lines
+
+
+_profiler: ImportProfiler | None = None
+
+
+def enable_startup_profiling() -> ImportProfiler:
+    """Installs the import hook (idempotent)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler()
+        _profiler.install()
+    return _profiler
+
+
+def startup_profiling_enabled() -> bool:
+    return _profiler is not None
+
+
+def mark_startup(milestone: str) -> None:
+    """Records a startup milestone if --profile-startup is active."""
+    if _profiler is not None:
+        _profiler.mark(milestone)
+
+
+def report_startup() -> None:
+    """Prints the startup report (console + file log) if profiling is active."""
+    if _profiler is None:
+        return
+    from core.console import cprint
+
+    cprint("---Startup profile---", "header")
+    for line in _profiler.report():
+        cprint(line)
+
+
+ProfileMode = Literal["cprofile", "sample"]
+
+# Pause between two stack samples of the sampling profiler
+SAMPLE_INTERVAL_SECONDS = 0.005
+# cProfile runs on sys.monitoring (3.12+): one profile for the whole process
+_PROCESS_WIDE_PROFILES = hasattr(sys, "monitoring")
+
+
+@dataclass(frozen=True)
+class ProfileConfig:
+    """What to profile: the whole run, or only some orders.
+
+    ``orders`` holds 1-based order numbers and ``marketplaces`` lowercase
+    marketplace names; when both are empty the whole run is profiled (every
+    order's parsing plus the spreadsheet writes).
+    """
+
+    mode: ProfileMode = "cprofile"
+    orders: frozenset[int] = frozenset()
+    marketplaces: frozenset[str] = frozenset()
+
+    @property
+    def whole_run(self) -> bool:
+        return not self.orders and not self.marketplaces
+
+    def wants(self, number: int, marketplace: str) -> bool:
+        if self.whole_run:
+            return True
+        return number in self.orders or marketplace.lower() in self.marketplaces
+
+
+def _parse_numbers(text: str) -> frozenset[int]:
+    numbers: set[int] = set()
+    for part in text.split(","):
+        first, _, last = part.strip().partition("-")
+        if first.isdigit():
+            end = int(last) if last.isdigit() else int(first)
+            numbers.update(range(int(first), end + 1))
+    return frozenset(numbers)
+
+
+def profile_config_from_argv(argv: list[str]) -> ProfileConfig | None:
+    """Reads ``--profile[=sample]``, ``--profile-orders 3,7-9`` and
+    ``--profile-marketplace etsy,amazon``; None when profiling is off."""
+
+    def value_after(flag: str) -> str:
+        try:
+            return argv[argv.index(flag) + 1]
+        except (ValueError, IndexError):
+            return ""
+
+    mode: ProfileMode = "cprofile"
+    enabled = False
+    for arg in argv:
+        if arg == "--profile":
+            enabled = True
+        elif arg.startswith("--profile="):
+            enabled = True
+            if arg.partition("=")[2] == "sample":
+                mode = "sample"
+
+    orders = _parse_numbers(value_after("--profile-orders"))
+    marketplaces = frozenset(
+        name.strip().lower()
+        for name in value_after("--profile-marketplace").split(",")
+        if name.strip()
+    )
+    if not (enabled or orders or marketplaces):
+        return None
+    return ProfileConfig(mode=mode, orders=orders, marketplaces=marketplaces)
+
+
+_FrameKey = tuple[str, int, str]
+
+
+def _frame_key(frame: FrameType) -> _FrameKey:
+    code = frame.f_code
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+class SamplingProfiler:
+    """Samples the stacks of registered threads at a fixed interval.
+
+    Cheap enough to leave on for a whole run: the target threads are only
+    paused by the GIL switch while sys._current_frames() is read.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS) -> None:
+        self.interval = interval
+        self.samples: Counter[tuple[_FrameKey, ...]] = Counter()
+        self._threads: Counter[int] = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @contextmanager
+    def sampling(self) -> Iterator[None]:
+        """Samples the calling thread for the duration of the block."""
+        ident = threading.get_ident()
+        with self._lock:
+            self._threads[ident] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._threads[ident] -= 1
+                if self._threads[ident] <= 0:
+                    del self._threads[ident]
+
+    def sample(self) -> None:
+        """Takes one sample of every registered thread."""
+        with self._lock:
+            targets = set(self._threads)
+        if not targets:
+            return
+        frames = sys._current_frames()
+        for ident in targets:
+            frame: FrameType | None = frames.get(ident)
+            stack: list[_FrameKey] = []
+            while frame is not None:
+                stack.append(_frame_key(frame))
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                with self._lock:
+                    self.samples[tuple(stack)] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def collapsed_lines(self) -> list[str]:
+        """Stacks in the "folded" format read by flamegraph.pl and speedscope."""
+        lines = []
+        for stack, count in sorted(self.samples.items()):
+            frames = ";".join(
+                f"{name} ({os.path.basename(filename)}:{line})"
+                for filename, line, name in stack
+            )
+            lines.append(f"{frames} {count}")
+        return lines
+
+    def pstats_data(self) -> dict:
+        """The samples as a pstats dictionary (times = samples × interval)."""
+        own: Counter[_FrameKey] = Counter()
+        inclusive: Counter[_FrameKey] = Counter()
+        edges: Counter[tuple[_FrameKey, _FrameKey]] = Counter()
+        for stack, count in self.samples.items():
+            own[stack[-1]] += count
+            for key in set(stack):
+                inclusive[key] += count
+            for caller, callee in set(pairwise(stack)):
+                edges[(caller, callee)] += count
+
+        callers: dict[_FrameKey, dict] = {key: {} for key in inclusive}
+        for (caller, callee), count in edges.items():
+            seconds = count * self.interval
+            callers[callee][caller] = (count, count, 0.0, seconds)
+        return {
+            key: (
+                count,
+                count,
+                own[key] * self.interval,
+                count * self.interval,
+                callers[key],
+            )
+            for key, count in inclusive.items()
+        }
+
+
+class RunProfiler:
+    """Profiles the sections of a run selected by a ProfileConfig.
+
+    Sections run in parallel (orders are parsed in worker threads). Since
+    Python 3.12 only one cProfile.Profile may be active in the process and
+    an active one sees every thread, so the run shares one, enabled while
+    any section runs; it keeps a single call stack, so the caller links of
+    code that runs in several threads at once are approximate (the sampling
+    mode keeps every thread's stack). Before 3.12 a profiler only sees its
+    own thread, so every thread has its own and save() merges them. In
+    "sample" mode a SamplingProfiler watches the same sections instead; its
+    thread only runs while a section does.
+    """
+
+    def __init__(self, config: ProfileConfig) -> None:
+        self.config = config
+        # The profiles that were enabled at least once (what save() writes)
+        self._profiles: list[Any] = []
+        self._shared: Any = None
+        self._local = threading.local()
+        # Open sections of the shared profile (3.12+)
+        self._depth = 0
+        self._enabled = False
+        self._error: str | None = None
+        self._sampler = SamplingProfiler() if config.mode == "sample" else None
+        self._sampling_sections = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def section(self) -> Iterator[None]:
+        """Profiles the block (and, while it runs, the process)."""
+        if self._sampler is not None:
+            with self._sampler_running(), self._sampler.sampling():
+                yield
+            return
+        if not _PROCESS_WIDE_PROFILES:
+            with self._thread_section():
+                yield
+            return
+
+        import cProfile
+
+        # Only the bookkeeping is locked: the sections themselves overlap
+        with self._lock:
+            self._depth += 1
+            if self._depth == 1:
+                if self._shared is None:
+                    self._shared = cProfile.Profile()
+                self._enabled = self._enable(self._shared)
+                if self._enabled and not self._profiles:
+                    self._profiles.append(self._shared)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0 and self._enabled:
+                    self._shared.disable()
+                    self._enabled = False
+
+    @contextmanager
+    def _thread_section(self) -> Iterator[None]:
+        import cProfile
+
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth == 0:
+            profile = getattr(local, "profile", None)
+            if profile is None:
+                profile = cProfile.Profile()
+            local.enabled = self._enable(profile)
+            if local.enabled and getattr(local, "profile", None) is None:
+                local.profile = profile
+                with self._lock:
+                    self._profiles.append(profile)
+        local.depth = depth + 1
+        try:
+            yield
+        finally:
+            local.depth -= 1
+            if local.depth == 0 and local.enabled:
+                local.profile.disable()
+                local.enabled = False
+
+    def _enable(self, profile: Any) -> bool:
+        try:
+            profile.enable()
+        except ValueError as error:
+            # Another profiler (a debugger, an outer cProfile) is active:
+            # the section runs unprofiled and save() reports why.
+            self._error = str(error)
+            return False
+        return True
+
+    @contextmanager
+    def _sampler_running(self) -> Iterator[None]:
+        assert self._sampler is not None
+        with self._lock:
+            self._sampling_sections += 1
+            if self._sampling_sections == 1:
+                self._sampler.start()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._sampling_sections -= 1
+                if self._sampling_sections == 0:
+                    self._sampler.stop()
+
+    def order(self, number: int, marketplace: str):
+        """section() for a selected order, a no-op context otherwise."""
+        if self.config.wants(number, marketplace):
+            return self.section()
+        return _NOT_PROFILED
+
+    def save(self, log_dir: str | None = None) -> list[str]:
+        """Writes the results; returns the file paths ([] without any).
+
+        Raises RuntimeError if nothing could be profiled because another
+        profiler was active.
+        """
+        import marshal
+        import pstats
+
+        from core.paths import get_logs_dir, unique_path
+
+        stats = None
+        if self._sampler is None:
+            with self._lock:
+                profiles = list(self._profiles)
+            if profiles:
+                stats = pstats.Stats(*profiles)
+            elif self._error:
+                raise RuntimeError(self._error)
+            else:
+                return []
+        elif not self._sampler.samples:
+            return []
+
+        if log_dir is None:
+            log_dir = get_logs_dir()
+        os.makedirs(log_dir, exist_ok=True)
+        # Watch and serve modes profile every small batch: keep them apart
+        now = datetime.now()
+        name = f"profile_{now:%Y-%m-%d_%H-%M-%S}-{now.microsecond // 1000:03d}"
+        base = os.path.splitext(unique_path(log_dir, name + ".pstats"))[0]
+
+        if self._sampler is not None:
+            with open(base + ".pstats", "wb") as f:
+                marshal.dump(self._sampler.pstats_data(), f)
+            collapsed = self._sampler.collapsed_lines()
+        else:
+            assert stats is not None
+            stats.dump_stats(base + ".pstats")
+            collapsed = _collapsed_from_pstats(stats)
+
+        with open(base + ".collapsed", "w", encoding="utf-8") as f:
+            f.write("\n".join(collapsed) + "\n")
+        return [base + ".pstats", base + ".collapsed"]
+
+
+class _NotProfiled:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOT_PROFILED = _NotProfiled()
+
+
+def _frame_label(key: _FrameKey) -> str:
+    filename, line, name = key
+    if filename == "~":  # built-ins, e.g. "<method 'find_all' ...>"
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def _collapsed_from_pstats(stats: Any, min_seconds: float = 1e-6) -> list[str]:
+    """Folded stacks (weights in microseconds) rebuilt from a cProfile call graph.
+
+    cProfile keeps caller -> callee edges, not whole stacks, so the time of
+    a function reached along several paths is split between them in
+    proportion to the edge times. Good enough to spot the hot branches.
+    """
+    data: dict = stats.stats
+    callees: dict[_FrameKey, dict[_FrameKey, float]] = {}
+    for callee, (_, _, _, _, callers) in data.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[callee] = edge[3]
+
+    folded: Counter[str] = Counter()
+
+    def walk(key: _FrameKey, share: float, path: list[str], seen: set) -> None:
+        _, _, own, total, _ = data[key]
+        if total <= 0 or share < min_seconds:
+            return
+        path.append(_frame_label(key))
+        seen.add(key)
+        folded[";".join(path)] += round(own * share / total * 1_000_000)
+        for callee, edge_seconds in callees.get(key, {}).items():
+            if callee not in seen and callee in data:
+                walk(callee, edge_seconds * share / total, path, seen)
+        seen.discard(key)
+        path.pop()
+
+    for key, (_, _, _, total, callers) in data.items():
+        # Roots: called from frames that were already running when
+        # profiling started (those frames are not in the profile).
+        if not any(caller in data for caller in callers):
+            walk(key, total, [], set())
+    return [f"{stack} {weight}" for stack, weight in sorted(folded.items()) if weight]
@@ -0,0 +1,197 @@
+"""A long-lived processing context reused across runs."""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from core.constants import SESSION_IDLE_TIMEOUT_MINUTES
+from core.history import RunHistory
+from core.processor import DEFAULT_MAX_WORKERS, OrderResult, process_order_list
+from core.profiling import ProfileConfig
+from core.sinks import OrderSink, SinkConfig
+from core.spool import ReplayResult, Spool, replay_spool
+from google_api.auth import ensure_fresh_credentials
+from google_api.errors import is_unavailable
+from google_api.gdrive_finder import GoogleDriveFinder
+from google_api.gsheet_writer import GSheetWriter
+
+
+class ProcessingSession:
+    """Keeps the spreadsheet handle, sheet caches and parse threads warm.
+
+    The first run opens the spreadsheet and starts the parse pool, whose
+    threads build their own Drive services (google_api/auth.py). Later runs
+    only revalidate the cached headers and row cursors with one request and
+    start writing right away. After ``idle_timeout`` seconds without a run
+    everything is released; any unexpected error does the same, so the next
+    run starts from a clean state. With a ``sink`` the rows go to that local
+    output (core/sinks.py) instead of the spreadsheet.
+
+    Spreadsheet runs keep what Google could not take in ``spool``
+    (core/spool.py); replay_spool() writes it between runs.
+    ``finder_factory`` builds the Drive finder (e.g. with extra label
+    folders, see core/watch.py). Every run is saved in ``history``
+    (core/history.py).
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = SESSION_IDLE_TIMEOUT_MINUTES * 60,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+        sink: SinkConfig | None = None,
+        spool: Spool | None = None,
+        finder_factory: Callable[[], GoogleDriveFinder] | None = None,
+        history: RunHistory | None = None,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self._max_workers = max_workers
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._busy = False
+        self._last_used = clock()
+        self._sink = sink
+        self.spool = spool if spool is not None else Spool()
+        self._finder_factory = finder_factory
+        self.history = history if history is not None else RunHistory()
+        self._writer: OrderSink | None = None
+        self._finder: GoogleDriveFinder | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether the next run can reuse an already opened spreadsheet."""
+        return self._writer is not None
+
+    @property
+    def sink(self) -> SinkConfig | None:
+        """The local output of the next runs (None = Google Sheets)."""
+        return self._sink
+
+    @sink.setter
+    def sink(self, sink: SinkConfig | None) -> None:
+        with self._lock:
+            if sink != self._sink:
+                self._sink = sink
+                self._writer = None
+
+    def process_order_list(
+        self,
+        orders: list[str],
+        progress_callback: Callable[[int, int], None] | None = None,
+        result_callback: Callable[[OrderResult], None] | None = None,
+        *,
+        report: bool = False,
+        profile: ProfileConfig | None = None,
+    ) -> tuple[int, int]:
+        """Runs process_order_list() on the warm clients of this session."""
+        self._enter()
+        try:
+            writer, finder, pool = self._acquire()
+            return process_order_list(
+                orders,
+                progress_callback=progress_callback,
+                result_callback=result_callback,
+                writer=writer,
+                finder=finder,
+                executor=pool,
+                report=report,
+                profile=profile,
+                spool=self.spool if self._sink is None else None,
+                history=self.history,
+            )
+        except BaseException:
+            with self._lock:
+                self._release_locked()
+            raise
+        finally:
+            self._leave()
+
+    def replay_spool(self) -> ReplayResult | None:
+        """Writes the spooled orders with this session's writer.
+
+        Occupies the session like a run does. Returns None without touching
+        anything when a run is in progress or the output is a local sink.
+        """
+        if self._sink is not None or not self._enter(wait=False):
+            return None
+        try:
+            writer, finder, _ = self._acquire()
+            return replay_spool(writer, finder, self.spool)
+        except BaseException:
+            with self._lock:
+                self._release_locked()
+            raise
+        finally:
+            self._leave()
+
+    def _enter(self, wait: bool = True) -> bool:
+        """Marks the session busy; False (or an error) when it already is."""
+        with self._lock:
+            if self._busy:
+                if not wait:
+                    return False
+                raise RuntimeError("the processing session is already running")
+            self._busy = True
+            if self._is_idle_locked():
+                self._release_locked()
+            return True
+
+    def _leave(self) -> None:
+        with self._lock:
+            self._busy = False
+            self._last_used = self._clock()
+
+    def expire_if_idle(self) -> bool:
+        """Releases the session if it has not been used for idle_timeout seconds."""
+        with self._lock:
+            if self._busy or not self._has_resources() or not self._is_idle_locked():
+                return False
+            self._release_locked()
+            return True
+
+    def close(self) -> None:
+        """Releases the clients and stops the parse threads."""
+        with self._lock:
+            self._release_locked()
+
+    def _acquire(self) -> tuple[OrderSink, GoogleDriveFinder, ThreadPoolExecutor]:
+        try:
+            ensure_fresh_credentials()
+        except Exception as error:
+            # Offline: the run still parses and spools, the writes will tell
+            if not is_unavailable(error):
+                raise
+        if self._writer is None:
+            sink = self._sink
+            self._writer = GSheetWriter() if sink is None else sink.create()
+        else:
+            self._writer.revalidate()
+        if self._finder is None:
+            factory = self._finder_factory or GoogleDriveFinder
+            self._finder = factory()
+        else:
+            self._finder.clear_cache()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="parse"
+            )
+        return self._writer, self._finder, self._pool
+
+    def _has_resources(self) -> bool:
+        return (
+            self._writer is not None
+            or self._finder is not None
+            or self._pool is not None
+        )
+
+    def _is_idle_locked(self) -> bool:
+        return self._clock() - self._last_used >= self.idle_timeout
+
+    def _release_locked(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._writer = None
+        self._finder = None
+        self._pool = None
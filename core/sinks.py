@@ -0,0 +1,307 @@
+"""Output sinks: where parsed orders are written.
+
+The pipeline hands every order to a sink's ``append_order``; GSheetWriter
+(google_api/gsheet_writer.py) is the Google Sheets one. The local sinks
+below keep the same routing (``select_sheet_name``) and the same column
+layout (``build_rows`` over SHEET_COLUMNS) but write to files instead, for
+dry runs, benchmarks, reconciliation, or when Sheets is unavailable:
+
+- ``jsonl``  one JSON object per row, with its sheet, appended to one file;
+- ``csv``    one CSV file per sheet in a directory;
+- ``sqlite`` one ``rows`` table with a ``sheet`` column.
+
+Rows are buffered and written in bulk (at ``buffer_rows`` and at the end
+of every run), so a local run is bounded by parsing, not by the output.
+Selected with ``--sink jsonl|csv|sqlite [--sink-path PATH]`` or the output
+setting of the UI.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal, Protocol, get_args
+
+from core.console import cmessage
+from core.constants import SHEET_COLUMNS
+from core.paths import get_output_dir
+from google_api.gsheet_writer import (
+    OrderWrite,
+    compile_layout,
+    report_sheet,
+    select_sheet_name,
+)
+
+SinkKind = Literal["jsonl", "csv", "sqlite"]
+SINK_KINDS: tuple[SinkKind, ...] = get_args(SinkKind)
+
+# Buffered rows that trigger a bulk write before the end of the run
+DEFAULT_BUFFER_ROWS = 500
+
+
+class OrderSink(Protocol):
+    """What the pipeline needs from an output (GSheetWriter or a local sink)."""
+
+    # First sheet row of the last appended order (None when not known)
+    last_row: int | None
+
+    @property
+    def buffered(self) -> int:
+        """Appended orders whose rows wait for flush()."""
+        ...
+
+    def append_order(
+        self,
+        order_items: list[dict[str, None | str | int]],
+        extension: str,
+        smaller_size: float | str,
+        customization_info: str | None = None,
+    ) -> str | None: ...
+
+    def append_orders(self, orders: Sequence[OrderWrite]) -> list[str | None]: ...
+
+    def revalidate(self) -> None: ...
+
+    def flush(self) -> None: ...
+
+    def discard(self) -> None: ...
+
+
+class LocalSink(ABC):
+    """Routes orders like GSheetWriter and buffers their rows for bulk writes."""
+
+    kind: SinkKind
+    # Local outputs have no sheet rows
+    last_row: int | None = None
+
+    def __init__(
+        self,
+        path: str,
+        headers: Sequence[str] = SHEET_COLUMNS,
+        buffer_rows: int = DEFAULT_BUFFER_ROWS,
+    ) -> None:
+        self.path = path
+        self.headers = list(headers)
+        self._layout = compile_layout(tuple(headers))
+        self.buffer_rows = buffer_rows
+        self._pending: list[tuple[str, list[list[Any]]]] = []
+        self._pending_rows = 0
+
+    def append_order(
+        self,
+        order_items: list[dict[str, None | str | int]],
+        extension: str,
+        smaller_size: float | str,
+        customization_info: str | None = None,
+    ) -> str | None:
+        """Buffers the rows of the order; returns the sheet it is routed to."""
+        if not order_items:
+            cmessage(
+                "||| Order not added: the parser found no items in the HTML |||",
+                "error",
+            )
+            return None
+
+        sheet_name = select_sheet_name(extension, smaller_size, customization_info)
+        report_sheet(sheet_name)
+        rows = self._layout.build_rows(order_items)
+        self._pending.append((sheet_name, rows))
+        self._pending_rows += len(rows)
+        if self._pending_rows >= self.buffer_rows:
+            try:
+                self.flush()
+            except Exception:
+                # This order fails with the write; the ones before it stay
+                # buffered for the next flush
+                self._pending.pop()
+                self._pending_rows -= len(rows)
+                raise
+        cmessage(
+            "<<<Order saved to the local {kind} output>>>", "success", kind=self.kind
+        )
+        return sheet_name
+
+    def append_orders(self, orders: Sequence[OrderWrite]) -> list[str | None]:
+        """Buffers several orders (they are written in bulk anyway)."""
+        return [self.append_order(*order) for order in orders]
+
+    def revalidate(self) -> None:
+        """Nothing is cached about the output between runs."""
+
+    @property
+    def buffered(self) -> int:
+        return len(self._pending)
+
+    def discard(self) -> None:
+        """Drops the buffered rows (their orders are reported as failed)."""
+        self._pending, self._pending_rows = [], 0
+
+    def flush(self) -> None:
+        """Writes out the buffered rows in one go."""
+        if not self._pending:
+            return
+        # The rows stay buffered until they are written, so a failed write
+        # (disk full, locked database) is retried by the next flush.
+        self._write(self._pending)
+        rows = self._pending_rows
+        self._pending, self._pending_rows = [], 0
+        cmessage("---{rows} row(s) written to {path}---", rows=rows, path=self.path)
+
+    @abstractmethod
+    def _write(self, orders: list[tuple[str, list[list[Any]]]]) -> None:
+        """Writes the buffered ``(sheet, rows)`` pairs to the output."""
+
+
+class JsonlSink(LocalSink):
+    """Every row as ``{"sheet": ..., "row": {column: value}}`` on its own line."""
+
+    kind = "jsonl"
+
+    def _write(self, orders: list[tuple[str, list[list[Any]]]]) -> None:
+        lines = [
+            json.dumps(
+                {"sheet": sheet, "row": dict(zip(self.headers, row, strict=True))},
+                ensure_ascii=False,
+                default=str,
+            )
+            + "\n"
+            for sheet, rows in orders
+            for row in rows
+        ]
+        _make_parent(self.path)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+
+class CsvSink(LocalSink):
+    """``<path>/<sheet>.csv`` per sheet, each starting with the header row."""
+
+    kind = "csv"
+
+    def _write(self, orders: list[tuple[str, list[list[Any]]]]) -> None:
+        by_sheet: dict[str, list[list[Any]]] = {}
+        for sheet, rows in orders:
+            by_sheet.setdefault(sheet, []).extend(rows)
+
+        os.makedirs(self.path, exist_ok=True)
+        for sheet, rows in by_sheet.items():
+            path = os.path.join(self.path, f"{sheet}.csv")
+            new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+            # utf-8-sig: Excel opens the files with the right encoding
+            encoding = "utf-8-sig" if new_file else "utf-8"
+            with open(path, "a", encoding=encoding, newline="") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(self.headers)
+                writer.writerows(rows)
+
+
+class SqliteSink(LocalSink):
+    """One ``rows`` table: id, sheet, written-at time and one column per header."""
+
+    kind = "sqlite"
+
+    def _write(self, orders: list[tuple[str, list[list[Any]]]]) -> None:
+        columns = ", ".join(_quote(name) for name in self.headers)
+        placeholders = ", ".join("?" * (len(self.headers) + 2))
+        written = datetime.now().isoformat(timespec="seconds")
+        values = [
+            (sheet, written, *(_sql_value(value) for value in row))
+            for sheet, rows in orders
+            for row in rows
+        ]
+
+        _make_parent(self.path)
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                self._ensure_table(connection)
+                connection.executemany(
+                    f"INSERT INTO rows (sheet, written, {columns}) "
+                    f"VALUES ({placeholders})",
+                    values,
+                )
+        finally:
+            connection.close()
+
+    def _ensure_table(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS rows ("
+            "id INTEGER PRIMARY KEY, sheet TEXT NOT NULL, written TEXT NOT NULL)"
+        )
+        existing = {row[1] for row in connection.execute("PRAGMA table_info(rows)")}
+        for name in self.headers:
+            if name not in existing:
+                connection.execute(f"ALTER TABLE rows ADD COLUMN {_quote(name)}")
+
+
+_SINKS: dict[SinkKind, type[LocalSink]] = {
+    "jsonl": JsonlSink,
+    "csv": CsvSink,
+    "sqlite": SqliteSink,
+}
+
+_DEFAULT_NAMES: dict[SinkKind, str] = {
+    "jsonl": "orders.jsonl",
+    "csv": "csv",
+    "sqlite": "orders.sqlite3",
+}
+
+
+@dataclass(frozen=True)
+class SinkConfig:
+    """A local output: its kind and file (directory for csv); "" = default."""
+
+    kind: SinkKind
+    path: str = ""
+
+    @property
+    def target(self) -> str:
+        return self.path or os.path.join(get_output_dir(), _DEFAULT_NAMES[self.kind])
+
+    def create(self) -> LocalSink:
+        return _SINKS[self.kind](self.target)
+
+
+def sink_config(kind: str, path: str = "") -> SinkConfig | None:
+    """The config for ``kind``; None for Google Sheets ("" or "sheets")."""
+    kind = kind.strip().lower()
+    if kind in ("", "sheets"):
+        return None
+    if kind not in SINK_KINDS:
+        raise ValueError(
+            f"unknown sink {kind!r}, expected sheets, {', '.join(SINK_KINDS)}"
+        )
+    return SinkConfig(kind=kind, path=path)  # type: ignore[arg-type]
+
+
+def sink_config_from_argv(argv: list[str]) -> SinkConfig | None:
+    """Reads ``--sink jsonl|csv|sqlite|sheets`` and ``--sink-path PATH``."""
+
+    def value_after(flag: str) -> str:
+        try:
+            return argv[argv.index(flag) + 1]
+        except (ValueError, IndexError):
+            return ""
+
+    return sink_config(value_after("--sink"), value_after("--sink-path"))
+
+
+def _make_parent(path: str) -> None:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
@@ -0,0 +1,370 @@
+"""The offline spool: parsed orders waiting for Google to come back.
+
+When a write to Sheets (or a shipping-label upload to Drive) fails because
+Google cannot be reached — connection errors, timeouts, 429/5xx that
+survived the client retries, see google_api/errors.py — the pipeline does
+not drop the order. Its parsed items, the file extension, size and
+customization the routing is decided from, and the sheet it was routed to
+go into a small SQLite file (core/paths.get_spool_path), in arrival order.
+From then on the rest of the run goes to the spool as well, so the sheets
+keep the order the orders came in.
+
+``replay_spool`` drains the spool oldest first: pending label uploads are
+done first, then every batch is written with GSheetWriter.append_orders
+(three API calls per batch) and removed from the spool in one transaction.
+It stops at the first "still unavailable" error and picks up from there
+next time. An order the spreadsheet itself rejects is kept, marked failed,
+and no longer replayed; so is a batch that failed after part of it reached
+the sheets (PartialWriteError), since writing it again would duplicate
+rows. Nothing is ever parsed or written twice.
+
+Replays happen at the start of every run, from the UI in the background,
+and with ``main_cli.py --replay-spool``.
+"""
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from core.console import cmessage
+from core.constants import (
+    COL_ORDER_ID,
+    COL_SHIPPING_LABEL,
+    FILE_NOT_FOUND,
+    LABEL_PENDING,
+)
+from core.paths import get_spool_path
+from google_api.errors import PartialWriteError, is_unavailable
+from google_api.gsheet_writer import OrderWrite
+
+if TYPE_CHECKING:
+    from core.sinks import OrderSink
+    from google_api.gdrive_finder import GoogleDriveFinder
+
+# Orders written per replay batch (one batchUpdate + one values.batchUpdate)
+DEFAULT_REPLAY_BATCH = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created TEXT NOT NULL,
+    order_id TEXT,
+    marketplace TEXT,
+    sheet TEXT NOT NULL,
+    items TEXT NOT NULL,
+    extension TEXT NOT NULL,
+    smaller_size TEXT NOT NULL,
+    customization TEXT,
+    reason TEXT,
+    failed TEXT
+)
+"""
+
+_COLUMNS = (
+    "id, created, order_id, marketplace, sheet, items, extension, "
+    "smaller_size, customization, reason, failed"
+)
+
+
+def order_id_of(order_items: list[dict[str, Any]]) -> str | None:
+    """The first non-empty Order ID of the items."""
+    return next(
+        (item.get(COL_ORDER_ID) for item in order_items if item.get(COL_ORDER_ID)),
+        None,
+    )
+
+
+def label_pending(order_items: list[dict[str, Any]]) -> bool:
+    """Whether a shipping label of the order still has to be uploaded."""
+    return any(item.get(COL_SHIPPING_LABEL) == LABEL_PENDING for item in order_items)
+
+
+@dataclass
+class SpooledOrder:
+    """One order in the spool, ready to be written as it is."""
+
+    id: int
+    order: OrderWrite
+    order_id: str | None
+    marketplace: str | None
+    sheet: str
+    created: str
+    reason: str | None = None
+    failed: str | None = None
+
+
+class Spool:
+    """A FIFO of parsed orders in a SQLite file.
+
+    Every call opens its own short connection, so the pipeline thread, the
+    UI replayer and a CLI replay can share one file safely. The file is only
+    created when the first order is spooled.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or get_spool_path()
+
+    @contextmanager
+    def _connect(self, create: bool = False) -> Iterator[sqlite3.Connection | None]:
+        if not create and not os.path.exists(self.path):
+            yield None
+            return
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                connection.execute(_SCHEMA)
+                yield connection
+        finally:
+            connection.close()
+
+    def add(
+        self,
+        order: OrderWrite,
+        *,
+        sheet: str,
+        marketplace: str | None = None,
+        reason: str | None = None,
+    ) -> int:
+        """Appends an order; returns its spool id."""
+        with self._connect(create=True) as connection:
+            assert connection is not None
+            cursor = connection.execute(
+                "INSERT INTO orders (created, order_id, marketplace, sheet, items, "
+                "extension, smaller_size, customization, reason) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now().isoformat(timespec="seconds"),
+                    order_id_of(order.order_items),
+                    marketplace,
+                    sheet,
+                    _dumps(order.order_items),
+                    order.extension,
+                    _dumps(order.smaller_size),
+                    order.customization_info,
+                    reason,
+                ),
+            )
+            assert cursor.lastrowid is not None
+            return cursor.lastrowid
+
+    def count(self) -> int:
+        """Orders waiting to be written (failed ones not included)."""
+        with self._connect() as connection:
+            if connection is None:
+                return 0
+            return connection.execute(
+                "SELECT COUNT(*) FROM orders WHERE failed IS NULL"
+            ).fetchone()[0]
+
+    def pending(self, limit: int = DEFAULT_REPLAY_BATCH) -> list[SpooledOrder]:
+        """The oldest orders waiting to be written."""
+        return self._select("WHERE failed IS NULL ORDER BY id LIMIT ?", (limit,))
+
+    def failed(self) -> list[SpooledOrder]:
+        """Orders the spreadsheet rejected; they stay here for a manual look."""
+        return self._select("WHERE failed IS NOT NULL ORDER BY id", ())
+
+    def update_items(self, entry_id: int, order_items: list[dict[str, Any]]) -> None:
+        """Saves the items after a label upload, before they are written."""
+        with self._connect() as connection:
+            if connection is not None:
+                connection.execute(
+                    "UPDATE orders SET items = ? WHERE id = ?",
+                    (_dumps(order_items), entry_id),
+                )
+
+    def remove(self, entry_ids: list[int]) -> None:
+        """Drops written orders, all in one transaction."""
+        with self._connect() as connection:
+            if connection is not None:
+                connection.executemany(
+                    "DELETE FROM orders WHERE id = ?", [(i,) for i in entry_ids]
+                )
+
+    def mark_failed(self, entry_id: int, error: str) -> None:
+        """Takes an order out of the replay queue, keeping it with the error."""
+        with self._connect() as connection:
+            if connection is not None:
+                connection.execute(
+                    "UPDATE orders SET failed = ? WHERE id = ?", (error, entry_id)
+                )
+
+    def _select(self, where: str, args: tuple[Any, ...]) -> list[SpooledOrder]:
+        with self._connect() as connection:
+            if connection is None:
+                return []
+            rows = connection.execute(
+                f"SELECT {_COLUMNS} FROM orders {where}", args
+            ).fetchall()
+        return [
+            SpooledOrder(
+                id=row[0],
+                created=row[1],
+                order_id=row[2],
+                marketplace=row[3],
+                sheet=row[4],
+                order=OrderWrite(
+                    order_items=json.loads(row[5]),
+                    extension=row[6],
+                    smaller_size=json.loads(row[7]),
+                    customization_info=row[8],
+                ),
+                reason=row[9],
+                failed=row[10],
+            )
+            for row in rows
+        ]
+
+
+@dataclass
+class ReplayResult:
+    """What a replay did: written and rejected orders, and what is left."""
+
+    written: int = 0
+    failed: int = 0
+    left: int = 0
+    sheets: list[str | None] = field(default_factory=list, repr=False)
+
+    @property
+    def stopped(self) -> bool:
+        """Google was still unreachable: orders are left for the next replay."""
+        return self.left > 0
+
+
+def replay_spool(
+    writer: "OrderSink",
+    finder: "GoogleDriveFinder",
+    spool: Spool,
+    batch_size: int = DEFAULT_REPLAY_BATCH,
+) -> ReplayResult:
+    """Writes the spooled orders oldest first, in batches (see the module doc)."""
+    result = ReplayResult()
+    waiting = spool.count()
+    if not waiting:
+        return result
+    cmessage("---Writing {count} order(s) from the offline spool---", count=waiting)
+
+    while batch := spool.pending(batch_size):
+        ready = _upload_labels(batch, finder, spool)
+        if not ready or not _write_batch(ready, writer, spool, result):
+            break
+
+    result.left = spool.count()
+    if result.left:
+        cmessage(
+            "||| Google is still unreachable, {count} order(s) stay in the offline spool |||",
+            "warning",
+            count=result.left,
+        )
+    elif result.written:
+        cmessage(
+            "<<<All {count} spooled order(s) are in the spreadsheet>>>",
+            "success",
+            count=result.written,
+        )
+    return result
+
+
+def _upload_labels(
+    batch: list[SpooledOrder], finder: "GoogleDriveFinder", spool: Spool
+) -> list[SpooledOrder]:
+    """Uploads the pending shipping labels of the batch.
+
+    Returns the orders that can be written now: the batch up to the first
+    order whose label Drive still does not take.
+    """
+    ready: list[SpooledOrder] = []
+    for entry in batch:
+        items = entry.order.order_items
+        if entry.order_id and label_pending(items):
+            link = finder.upload_shipping_labels(entry.order_id)
+            if link == LABEL_PENDING:
+                break
+            if link == FILE_NOT_FOUND:
+                found = finder.search_file_by_name(
+                    query=f"name contains '{entry.order_id}' and name contains '.pdf'"
+                )
+                link = found[0]["link"] if found else FILE_NOT_FOUND
+            for item in items:
+                if item.get(COL_SHIPPING_LABEL) == LABEL_PENDING:
+                    item[COL_SHIPPING_LABEL] = link
+            # The local PDF is gone after the upload: keep the link safe
+            spool.update_items(entry.id, items)
+        ready.append(entry)
+    return ready
+
+
+def _write_batch(
+    ready: list[SpooledOrder],
+    writer: "OrderSink",
+    spool: Spool,
+    result: ReplayResult,
+) -> bool:
+    """Writes one batch; False when Google is unreachable again."""
+    try:
+        result.sheets += writer.append_orders([entry.order for entry in ready])
+    except PartialWriteError as error:
+        _mark_partly_written(ready, spool, result, error)
+        return not is_unavailable(error.error)
+    except Exception as error:  # noqa: BLE001
+        if is_unavailable(error):
+            return False
+        # Nothing was written, but something in the batch is rejected:
+        # find out which order, one by one
+        for entry in ready:
+            try:
+                result.sheets += writer.append_orders([entry.order])
+            except PartialWriteError as entry_error:
+                _mark_partly_written([entry], spool, result, entry_error)
+                if is_unavailable(entry_error.error):
+                    return False
+                continue
+            except Exception as entry_error:  # noqa: BLE001
+                if is_unavailable(entry_error):
+                    return False
+                cmessage(
+                    "!!!Spooled order {order_id} was rejected by the spreadsheet: {error}!!!",
+                    "error",
+                    order_id=entry.order_id,
+                    error=entry_error,
+                )
+                spool.mark_failed(entry.id, str(entry_error))
+                result.failed += 1
+                continue
+            spool.remove([entry.id])
+            result.written += 1
+        return True
+
+    spool.remove([entry.id for entry in ready])
+    result.written += len(ready)
+    return True
+
+
+def _mark_partly_written(
+    entries: list[SpooledOrder],
+    spool: Spool,
+    result: ReplayResult,
+    error: PartialWriteError,
+) -> None:
+    """Takes orders that reached the sheets in part out of the replay queue."""
+    for entry in entries:
+        cmessage(
+            "!!!Spooled order {order_id} was only partly written, check the sheet: {error}!!!",
+            "error",
+            order_id=entry.order_id,
+            error=error,
+        )
+        spool.mark_failed(entry.id, str(error))
+        result.failed += 1
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
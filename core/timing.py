@@ -0,0 +1,130 @@
+"""Per-order stage timings and the run performance report."""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from core.paths import get_logs_dir, unique_path
+
+if TYPE_CHECKING:
+    from core.processor import OrderResult
+
+Timings = list[tuple[str, float]]
+
+_local = threading.local()
+
+
+@contextmanager
+def recording(into: Timings | None = None) -> Iterator[Timings]:
+    """Collects the stages timed on this thread into the yielded list
+    (``into``, when given)."""
+    previous = getattr(_local, "timings", None)
+    timings: Timings = [] if into is None else into
+    _local.timings = timings
+    try:
+        yield timings
+    finally:
+        _local.timings = previous
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Times the block as ``name`` (a no-op outside ``recording()``).
+
+    Stages may nest: "extract" includes the Drive queries made while
+    parsing, "write" includes every Sheets call of the order.
+    """
+    timings = getattr(_local, "timings", None)
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((name, time.perf_counter() - start))
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(values)))
+    return values[rank - 1]
+
+
+def stage_stats(timings: Iterable[tuple[str, float]]) -> dict[str, dict[str, Any]]:
+    """count / total / p50 / p95 / max in milliseconds for every stage."""
+    samples: dict[str, list[float]] = defaultdict(list)
+    for name, seconds in timings:
+        samples[name].append(seconds * 1000)
+
+    stats = {}
+    for name, values in samples.items():
+        values.sort()
+        stats[name] = {
+            "count": len(values),
+            "total_ms": round(sum(values), 1),
+            "p50_ms": round(percentile(values, 0.50), 1),
+            "p95_ms": round(percentile(values, 0.95), 1),
+            "max_ms": round(values[-1], 1),
+        }
+    return stats
+
+
+def build_report(results: list["OrderResult"], wall_seconds: float) -> dict[str, Any]:
+    """Aggregates the per-order timings of a run."""
+    by_marketplace: dict[str, list[OrderResult]] = defaultdict(list)
+    by_sheet: dict[str, list[OrderResult]] = defaultdict(list)
+    for result in results:
+        by_marketplace[result.marketplace or "unknown"].append(result)
+        if result.sheet:
+            by_sheet[result.sheet].append(result)
+
+    def group(members: list["OrderResult"]) -> dict[str, Any]:
+        return {
+            "orders": len(members),
+            "stages": stage_stats(t for r in members for t in r.timings),
+        }
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "orders": len(results),
+        "ok": sum(1 for r in results if r.ok),
+        "spooled": sum(1 for r in results if r.spooled),
+        "failed": sum(1 for r in results if not r.ok and not r.spooled),
+        "wall_ms": round(wall_seconds * 1000, 1),
+        "stages": stage_stats(t for r in results for t in r.timings),
+        "marketplaces": {name: group(m) for name, m in sorted(by_marketplace.items())},
+        "sheets": {name: group(m) for name, m in sorted(by_sheet.items())},
+    }
+
+
+def write_report(report: dict[str, Any], log_dir: str | None = None) -> str:
+    """Saves the report as run_YYYY-MM-DD_HH-MM-SS-mmm.json next to the file logs.
+
+    Watch and serve modes report every small batch, so the name goes down
+    to the millisecond and gets a counter if that is still taken.
+    """
+    if log_dir is None:
+        log_dir = get_logs_dir()
+    os.makedirs(log_dir, exist_ok=True)
+    now = datetime.now()
+    name = f"run_{now:%Y-%m-%d_%H-%M-%S}-{now.microsecond // 1000:03d}.json"
+    path = unique_path(log_dir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def slowest_stages(report: dict[str, Any], limit: int = 5) -> list[tuple[str, dict]]:
+    """The stages that took the most time in total, slowest first."""
+    stages = report.get("stages", {})
+    return sorted(stages.items(), key=lambda item: -item[1]["total_ms"])[:limit]
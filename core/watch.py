@@ -0,0 +1,350 @@
+"""Watch-folder mode for the server build (``main_cli.py --watch``).
+
+Instead of processing orders.txt once, the app keeps running and watches an
+inbox folder. Every order file saved there (``.html``, ``.htm``, ``.txt``,
+e.g. orders.txt, also gzip/zstd compressed, see core/inputs.py) is picked up as soon as it has settled, processed through
+one long-lived ProcessingSession — the spreadsheet, sheet caches, Drive
+services and parse threads stay warm between files — and moved to the
+archive folder (``archive/<date>/``, or ``archive/failed/`` when it could
+not be read or the run stopped). A file is moved to
+``archive/processing/`` before it is read, so it is never processed twice;
+a file that cannot be moved (e.g. locked on Windows) stays in the inbox
+until it can. Shipping-label PDFs dropped into the inbox are found there by
+the finder when their order is processed and are archived to
+``archive/labels/`` once uploaded; a new PDF also retries the offline spool
+(core/spool.py), which may be waiting for exactly that label.
+
+On Linux the inbox is watched with inotify (through libc, no extra
+dependency), so a file is seen the moment it is closed; elsewhere, or on
+file systems without inotify, the folder is polled every ``--poll-interval``
+seconds (1 by default).
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import shutil
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Protocol
+
+from core.console import cmessage
+from core.inputs import is_order_file, read_orders
+from core.paths import get_archive_dir, get_inbox_dir, unique_path
+
+if TYPE_CHECKING:
+    from core.session import ProcessingSession
+    from core.sinks import SinkConfig
+
+LABEL_SUFFIX = ".pdf"
+# Files taken from the inbox wait here until their run is over
+PROCESSING_FOLDER = "processing"
+
+DEFAULT_POLL_SECONDS = 1.0
+# A file is read only once nothing has written to it for this long:
+# browsers and copy tools save in several steps
+DEFAULT_SETTLE_SECONDS = 0.5
+# How often the offline spool is retried while the inbox is quiet
+SPOOL_RETRY_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class WatchConfig:
+    """The watched inbox and the archive; "" = the folder next to the app."""
+
+    inbox: str = ""
+    archive: str = ""
+    poll_seconds: float = DEFAULT_POLL_SECONDS
+    settle_seconds: float = DEFAULT_SETTLE_SECONDS
+
+    @property
+    def inbox_dir(self) -> str:
+        return self.inbox or get_inbox_dir()
+
+    @property
+    def archive_dir(self) -> str:
+        return self.archive or get_archive_dir()
+
+
+def watch_config_from_argv(argv: list[str]) -> WatchConfig | None:
+    """Reads ``--watch [INBOX]``, ``--archive DIR`` and ``--poll-interval SECONDS``;
+    None when the watch mode is off."""
+    if "--watch" not in argv:
+        return None
+
+    def value_after(flag: str) -> str:
+        try:
+            value = argv[argv.index(flag) + 1]
+        except (ValueError, IndexError):
+            return ""
+        return "" if value.startswith("--") else value
+
+    try:
+        poll_seconds = float(value_after("--poll-interval") or DEFAULT_POLL_SECONDS)
+    except ValueError:
+        poll_seconds = DEFAULT_POLL_SECONDS
+    return WatchConfig(
+        inbox=value_after("--watch"),
+        archive=value_after("--archive"),
+        poll_seconds=max(poll_seconds, 0.1),
+    )
+
+
+class Watcher(Protocol):
+    def wait(self, timeout: float, stop: threading.Event) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class PollingWatcher:
+    """Wakes up every ``interval`` seconds (any OS, any file system)."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+    def wait(self, timeout: float, stop: threading.Event) -> None:
+        stop.wait(min(timeout, self.interval))
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class InotifyWatcher:
+    """Wakes up as soon as a file is written or moved into the folder (Linux)."""
+
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_TO = 0x00000080
+    # Upper bound of one wait, so a stop request is noticed quickly
+    _TICK_SECONDS = 1.0
+
+    def __init__(self, folder: str) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self._IN_CLOSE_WRITE | self._IN_MOVED_TO
+        if libc.inotify_add_watch(fd, os.fsencode(folder), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch failed for {folder}")
+        self._fd = fd
+
+    def wait(self, timeout: float, stop: threading.Event) -> None:
+        ready, _, _ = select.select(
+            [self._fd], [], [], min(timeout, self._TICK_SECONDS)
+        )
+        if ready:
+            # The events themselves are not needed: the folder is rescanned
+            while True:
+                try:
+                    if not os.read(self._fd, 64 * 1024):
+                        break
+                except BlockingIOError:
+                    break
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(folder: str, poll_seconds: float) -> Watcher:
+    """inotify where it works, polling everywhere else."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(folder)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(poll_seconds)
+
+
+def make_session(
+    config: WatchConfig, sink: "SinkConfig | None" = None
+) -> "ProcessingSession":
+    """A session that never goes cold and finds labels in the inbox."""
+    from core.session import ProcessingSession
+    from google_api.gdrive_finder import GoogleDriveFinder
+
+    labels = os.path.join(config.archive_dir, "labels")
+    return ProcessingSession(
+        idle_timeout=float("inf"),
+        sink=sink,
+        finder_factory=lambda: GoogleDriveFinder(
+            label_dirs=[config.inbox_dir], label_archive=labels
+        ),
+    )
+
+
+class WatchDaemon:
+    """Processes the order files of the inbox through one warm session."""
+
+    def __init__(
+        self,
+        config: WatchConfig,
+        session: "ProcessingSession",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.config = config
+        self.session = session
+        self._clock = clock
+        self._labels: set[str] = set()
+        # Inbox files that could not be taken (reported once)
+        self._stuck: set[str] = set()
+        self._next_replay = 0.0
+
+    def run(self, stop: threading.Event) -> None:
+        """Watches the inbox until ``stop`` is set."""
+        inbox = self.config.inbox_dir
+        os.makedirs(inbox, exist_ok=True)
+        os.makedirs(self.config.archive_dir, exist_ok=True)
+        watcher = make_watcher(inbox, self.config.poll_seconds)
+        cmessage(
+            "---Watching {inbox} for new orders, processed files go to {archive}---",
+            "header",
+            inbox=inbox,
+            archive=self.config.archive_dir,
+        )
+        self._next_replay = self._clock() + SPOOL_RETRY_SECONDS
+        try:
+            while not stop.is_set():
+                settling = self.poll_once()
+                timeout = self.config.poll_seconds if settling is None else settling
+                watcher.wait(timeout, stop)
+        finally:
+            watcher.close()
+
+    def poll_once(self) -> float | None:
+        """Processes every settled order file of the inbox.
+
+        Returns the seconds until the next file still being written settles
+        (None when there is none).
+        """
+        files, labels, settling = self._scan()
+        new_labels = labels - self._labels
+        self._labels = labels
+        if files:
+            self._process(files)
+        elif new_labels or self._clock() >= self._next_replay:
+            self._replay_spool()
+        return settling
+
+    def _scan(self) -> tuple[list[str], set[str], float | None]:
+        """Settled order files (oldest first), label PDFs, and the settle wait."""
+        now = self._clock()
+        ready: list[tuple[float, str]] = []
+        labels: set[str] = set()
+        settling: float | None = None
+        with os.scandir(self.config.inbox_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.lower().endswith(LABEL_SUFFIX):
+                    labels.add(entry.name)
+                    continue
+                if not is_order_file(entry.name):
+                    continue
+                mtime = entry.stat().st_mtime
+                age = now - mtime
+                if age >= self.config.settle_seconds:
+                    ready.append((mtime, entry.path))
+                else:
+                    left = self.config.settle_seconds - age
+                    settling = left if settling is None else min(settling, left)
+        return [path for _, path in sorted(ready)], labels, settling
+
+    def _process(self, files: list[str]) -> None:
+        orders: list[str] = []
+        taken: list[str] = []
+        for inbox_path in files:
+            path = self._claim(inbox_path)
+            if path is None:
+                continue
+            try:
+                orders += read_orders(path)
+            except Exception as error:  # noqa: BLE001
+                cmessage(
+                    "!!!Could not read {path}: {error}!!!",
+                    "error",
+                    path=path,
+                    error=error,
+                )
+                self._archive(path, failed=True)
+                continue
+            taken.append(path)
+
+        failed_run = False
+        if orders:
+            cmessage(
+                "---{files} file(s) with {orders} order(s) picked up from the inbox---",
+                "header",
+                files=len(taken),
+                orders=len(orders),
+            )
+            try:
+                ok, failed = self.session.process_order_list(orders, report=True)
+            except Exception as error:  # noqa: BLE001
+                failed_run = True
+                cmessage(
+                    "!!!The run stopped: {error}. The files are moved to the failed folder!!!",
+                    "error",
+                    error=error,
+                )
+            else:
+                cmessage(
+                    "<<<Inbox run finished: {ok} written, {failed} failed>>>",
+                    "success",
+                    ok=ok,
+                    failed=failed,
+                )
+        for path in taken:
+            self._archive(path, failed=failed_run)
+        self._next_replay = self._clock() + SPOOL_RETRY_SECONDS
+
+    def _replay_spool(self) -> None:
+        self._next_replay = self._clock() + SPOOL_RETRY_SECONDS
+        try:
+            if self.session.spool.count():
+                self.session.replay_spool()
+        except Exception as error:  # noqa: BLE001
+            cmessage(
+                "!!!Could not read the offline spool: {error}!!!", "error", error=error
+            )
+
+    def _claim(self, path: str) -> str | None:
+        """Moves the file out of the inbox before it is read; None if it is locked."""
+        folder = os.path.join(self.config.archive_dir, PROCESSING_FOLDER)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            claimed = shutil.move(path, unique_path(folder, path))
+        except OSError as error:
+            if path not in self._stuck:
+                self._stuck.add(path)
+                cmessage(
+                    "!!!Could not take {path} from the inbox, it is tried again later: {error}!!!",
+                    "error",
+                    path=path,
+                    error=error,
+                )
+            return None
+        self._stuck.discard(path)
+        return claimed
+
+    def _archive(self, path: str, failed: bool = False) -> None:
+        folder = os.path.join(
+            self.config.archive_dir,
+            "failed" if failed else datetime.now().strftime("%Y-%m-%d"),
+        )
+        try:
+            os.makedirs(folder, exist_ok=True)
+            shutil.move(path, unique_path(folder, path))
+        except OSError as error:
+            # Out of the inbox already: it stays in the processing folder
+            cmessage(
+                "!!!Could not move {path} to the archive: {error}!!!",
+                "error",
+                path=path,
+                error=error,
+            )
@@ -1,14 +1,28 @@
-"""Unified Google API authorization."""
+"""Unified Google API authorization.
+
+The Google client libraries are heavy to import, so they are loaded inside
+the functions that need them: startup and runs that never reach the API do
+not pay for them.
+"""
 
 import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
 from functools import lru_cache
-
-import gspread
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from gspread.http_client import BackOffHTTPClient
+from typing import TYPE_CHECKING, Any
 
 from core.paths import resource_path
+from google_api.endpoint import (
+    EndpointHttp,
+    api_endpoint,
+    local_credentials,
+    mount_endpoint,
+)
+from google_api.stats import CountingHttp, record_requests_response
+
+if TYPE_CHECKING:
+    import gspread
+    from google.oauth2 import service_account
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -17,19 +31,145 @@ SCOPES = [
 
 TOKEN_PATH = "config/token.json"
 
+# Refresh the access token this long before it expires (google-auth itself
+# only refreshes ~4 minutes before expiry, inside whichever request hits it)
+REFRESH_MARGIN_SECONDS = 5 * 60
+# Pause before retrying a failed background refresh
+REFRESH_RETRY_SECONDS = 30
+
+
+def _load_service_account() -> "service_account.Credentials":
+    if api_endpoint():
+        return local_credentials()
+
+    from google.oauth2 import service_account
 
-@lru_cache(maxsize=1)
-def get_credentials() -> service_account.Credentials:
-    """Service-account credentials with both scopes (Sheets + Drive)."""
     return service_account.Credentials.from_service_account_file(
         resource_path(TOKEN_PATH), scopes=SCOPES
     )
 
 
+class CredentialManager:
+    """Owns the single credentials object and keeps its token fresh.
+
+    The same object is handed to the gspread client and to every Drive
+    service, so one refresh serves them all. warm_up() loads token.json and
+    fetches the first access token in a background thread, which then stays
+    alive and refreshes the token REFRESH_MARGIN_SECONDS before it expires —
+    workers never block on a token round trip mid-run.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], "service_account.Credentials"] = _load_service_account,
+        request_factory: Callable[[], Any] | None = None,
+        margin: float = REFRESH_MARGIN_SECONDS,
+    ) -> None:
+        self._loader = loader
+        self._request_factory = request_factory
+        self._margin = margin
+        self._credentials: service_account.Credentials | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def credentials(self) -> "service_account.Credentials":
+        """The shared credentials (loaded on first use, token not guaranteed)."""
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self._loader()
+            return self._credentials
+
+    def seconds_left(self) -> float | None:
+        """Seconds until the current token expires; None when there is no token."""
+        credentials = self._credentials
+        if credentials is None or not credentials.token or credentials.expiry is None:
+            return None
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return (credentials.expiry - now).total_seconds()
+
+    def refresh_if_needed(self) -> "service_account.Credentials":
+        """Refreshes the token if it is missing or expires within the margin."""
+        credentials = self.credentials()
+        with self._lock:
+            left = self.seconds_left()
+            if left is None or left <= self._margin:
+                credentials.refresh(self._make_request())
+        return credentials
+
+    def _make_request(self) -> Any:
+        if self._request_factory is None:
+            from google.auth.transport.requests import Request
+
+            self._request_factory = Request
+        return self._request_factory()
+
+    def warm_up(self) -> None:
+        """Starts the background refresher (idempotent, never raises)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._refresh_loop, name="credentials", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background refresher."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1)
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh_if_needed()
+                left = self.seconds_left() or 0.0
+                delay = max(left - self._margin, REFRESH_RETRY_SECONDS)
+            except Exception:  # noqa: BLE001
+                # A missing token.json or no network: the run itself will
+                # surface the real error, here we just try again later.
+                delay = REFRESH_RETRY_SECONDS
+            self._stop.wait(delay)
+
+
+_manager = CredentialManager()
+
+
+def get_credentials() -> "service_account.Credentials":
+    """Service-account credentials with both scopes (Sheets + Drive)."""
+    return _manager.credentials()
+
+
+def ensure_fresh_credentials() -> "service_account.Credentials":
+    """The shared credentials with an access token valid beyond the refresh margin."""
+    return _manager.refresh_if_needed()
+
+
+def warm_up_credentials() -> None:
+    """Fetches the first token in the background and keeps it refreshed."""
+    _manager.warm_up()
+
+
 @lru_cache(maxsize=1)
-def get_gspread_client() -> gspread.Client:
-    """One gspread client per application, with retries on 429/5xx."""
-    return gspread.authorize(get_credentials(), http_client=BackOffHTTPClient)
+def get_gspread_client() -> "gspread.Client":
+    """One gspread client per application, with retries on 429/5xx.
+
+    Every HTTP attempt (retries included) is counted in google_api/stats.py.
+    With GOOGLE_API_ENDPOINT set, requests go to that server instead.
+    """
+    import gspread
+    from gspread.http_client import BackOffHTTPClient
+
+    client = gspread.authorize(get_credentials(), http_client=BackOffHTTPClient)
+    session = client.http_client.session
+    session.hooks["response"].append(record_requests_response)
+    endpoint = api_endpoint()
+    if endpoint:
+        mount_endpoint(session, endpoint)
+    return client
 
 
 _thread_local = threading.local()
@@ -41,12 +181,19 @@ def get_drive_service():
     httplib2, which googleapiclient runs on, is not thread-safe, so during
     parallel parsing every worker thread needs its own service. Credentials
     are shared, service creation is cheap (cache_discovery=False) and
-    happens once per thread.
+    happens once per thread. Requests go through CountingHttp for the API
+    call accounting, and to GOOGLE_API_ENDPOINT when it is set.
     """
     service = getattr(_thread_local, "drive_service", None)
     if service is None:
-        service = build(
-            "drive", "v3", credentials=get_credentials(), cache_discovery=False
-        )
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.discovery import build
+        from googleapiclient.http import build_http
+
+        http: Any = AuthorizedHttp(get_credentials(), http=build_http())
+        endpoint = api_endpoint()
+        if endpoint:
+            http = EndpointHttp(http, endpoint)
+        service = build("drive", "v3", http=CountingHttp(http), cache_discovery=False)
         _thread_local.drive_service = service
     return service
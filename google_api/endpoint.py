@@ -0,0 +1,77 @@
+"""Pointing the Google clients at a stand-in server instead of googleapis.com.
+
+With ``GOOGLE_API_ENDPOINT`` set (e.g. ``http://127.0.0.1:8765``, the fake
+server of bench/fake_google.py), every Sheets and Drive request keeps its
+path and query but is sent to that host. Requests are rewritten at the
+transport, below the API statistics, so the accounting still sees the real
+Google URLs.
+"""
+
+from typing import Any
+
+GOOGLE_HOSTS = ("https://sheets.googleapis.com", "https://www.googleapis.com")
+
+
+def api_endpoint() -> str:
+    """The configured stand-in server ("" when talking to Google)."""
+    from config.settings import get_settings
+
+    return get_settings().GOOGLE_API_ENDPOINT.rstrip("/")
+
+
+def redirect_url(url: str, endpoint: str) -> str:
+    """``url`` with a Google API host replaced by ``endpoint``."""
+    for host in GOOGLE_HOSTS:
+        if url == host or url.startswith(host + "/"):
+            return endpoint + url[len(host) :]
+    return url
+
+
+class EndpointHttp:
+    """Wraps an httplib2-style Http (the Drive service) and sends it to ``endpoint``."""
+
+    def __init__(self, http: Any, endpoint: str) -> None:
+        self._http = http
+        self._endpoint = endpoint
+
+    def request(self, uri: str, method: str = "GET", *args: Any, **kwargs: Any):
+        return self._http.request(
+            redirect_url(uri, self._endpoint), method, *args, **kwargs
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._http, name)
+
+
+def mount_endpoint(session: Any, endpoint: str) -> None:
+    """Routes a ``requests`` session (the gspread one) to ``endpoint``."""
+    from requests.adapters import HTTPAdapter
+
+    class EndpointAdapter(HTTPAdapter):
+        def send(self, request, *args, **kwargs):
+            original_url = request.url
+            request.url = redirect_url(original_url, endpoint)
+            try:
+                response = super().send(request, *args, **kwargs)
+            finally:
+                request.url = original_url
+            return response
+
+    adapter = EndpointAdapter()
+    for host in GOOGLE_HOSTS:
+        session.mount(host + "/", adapter)
+
+
+def local_credentials() -> Any:
+    """Credentials for the stand-in server: a dummy bearer token, no token.json."""
+    from datetime import UTC, datetime, timedelta
+
+    from google.auth.credentials import Credentials
+
+    class LocalCredentials(Credentials):
+        def refresh(self, request: Any) -> None:
+            self.token = "local"
+            now = datetime.now(UTC).replace(tzinfo=None)
+            self.expiry = now + timedelta(days=1)
+
+    return LocalCredentials()
@@ -0,0 +1,68 @@
+"""Telling "Google is unreachable right now" apart from every other error.
+
+Writes and uploads that fail this way are not lost: the pipeline puts the
+parsed order into the offline spool (core/spool.py) and writes it later.
+The client libraries are imported lazily, like everywhere in google_api/.
+"""
+
+import socket
+
+# Statuses that mean "try again later" besides 5xx (the clients have
+# already retried them with back-off by the time we see the error)
+RETRYABLE_STATUSES = frozenset({408, 429})
+
+
+def _transport_errors() -> tuple[type[BaseException], ...]:
+    import httplib2
+    import requests
+    from google.auth.exceptions import TransportError
+
+    return (
+        ConnectionError,
+        TimeoutError,
+        socket.gaierror,
+        requests.ConnectionError,
+        requests.Timeout,
+        httplib2.ServerNotFoundError,
+        TransportError,
+    )
+
+
+def _status_of(error: BaseException) -> int | None:
+    """The HTTP status of a gspread APIError or a googleapiclient HttpError."""
+    from googleapiclient.errors import HttpError
+    from gspread.exceptions import APIError
+
+    if isinstance(error, APIError):
+        return error.code
+    if isinstance(error, HttpError):
+        return error.status_code
+    return None
+
+
+def is_unavailable(error: BaseException) -> bool:
+    """Whether the error means the API could not be reached or is failing.
+
+    True for connection errors and timeouts, and for 408, 429 and 5xx
+    answers that survived the client's own retries. A 400 or 403 is about
+    the request itself and would fail again the same way.
+    """
+    if isinstance(error, _transport_errors()):
+        return True
+    status = _status_of(error)
+    return status is not None and (status in RETRYABLE_STATUSES or status >= 500)
+
+
+class PartialWriteError(Exception):
+    """A write that failed after part of it had reached the spreadsheet.
+
+    Writing the order again would duplicate its rows, so it is neither
+    spooled nor replayed: ``done`` says what went through and ``where``
+    which rows to check by hand. ``error`` is the error that stopped it.
+    """
+
+    def __init__(self, done: str, where: str, error: BaseException) -> None:
+        super().__init__(f"{error}; {done}: {where}")
+        self.done = done
+        self.where = where
+        self.error = error
@@ -1,28 +1,43 @@
 """Searching and uploading files on Google Drive."""
 
 import os
+import shutil
 import sys
 import threading
+from collections.abc import Sequence
 from typing import Any
 
-from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
-
 from config.settings import get_settings
-from core.console import cprint
-from core.i18n import tr
-from core.constants import FILE_NOT_FOUND
-from core.paths import resource_path  # noqa: F401
+from core import timing
+from core.console import cfield, cmessage
+from core.constants import FILE_NOT_FOUND, LABEL_PENDING
+from core.paths import resource_path, unique_path  # noqa: F401
 from google_api.auth import get_drive_service
+from google_api.errors import is_unavailable
+from google_api.stats import get_api_stats
 
 
 class GoogleDriveFinder:
     """Finds files on Google Drive"""
 
-    def __init__(self) -> None:
-        """Initialization: a query cache shared between threads, guarded by a lock."""
+    def __init__(
+        self, label_dirs: Sequence[str] = (), label_archive: str | None = None
+    ) -> None:
+        """Initialization: a query cache shared between threads, guarded by a lock.
+
+        ``label_dirs`` are searched for shipping-label PDFs before the app
+        folder; with ``label_archive`` uploaded labels are moved there
+        instead of being deleted (the watch-folder mode, core/watch.py).
+        """
         self._search_cache: dict[str, list[dict[str, Any]] | None] = {}
         self._cache_lock = threading.Lock()
+        self.label_dirs = list(label_dirs)
+        self.label_archive = label_archive
+
+    def clear_cache(self) -> None:
+        """Forgets all cached queries (a reused finder starts every run fresh)."""
+        with self._cache_lock:
+            self._search_cache.clear()
 
     @property
     def service(self):
@@ -37,14 +52,21 @@ class GoogleDriveFinder:
         """
         with self._cache_lock:
             if query in self._search_cache:
+                get_api_stats().count("finder.search (cached)")
                 return self._search_cache[query]
+        get_api_stats().count("finder.search")
+
+        from googleapiclient.errors import HttpError
 
         try:
-            file_results = (
-                self.service.files()
-                .list(q=query, spaces="drive", fields="files(id, name, webViewLink)")
-                .execute(num_retries=3)
-            )
+            with timing.stage("drive.search"):
+                file_results = (
+                    self.service.files()
+                    .list(
+                        q=query, spaces="drive", fields="files(id, name, webViewLink)"
+                    )
+                    .execute(num_retries=3)
+                )
 
             files = file_results.get("files", [])
             result = [
@@ -57,21 +79,24 @@ class GoogleDriveFinder:
             return found
 
         except HttpError as error:
-            cprint(tr("!!!An error occurred: {error}!!!", error=error), "error")
+            cmessage("!!!An error occurred: {error}!!!", "error", error=error)
             return None
 
     def upload_shipping_labels(self, order_id: str) -> Any | None | str:
-        """Uploads shipping-label files and removes them locally afterwards"""
-        if getattr(sys, "frozen", False):
-            current_folder = os.path.dirname(sys.executable)
-        else:
-            current_folder = os.getcwd()
+        """Uploads shipping-label files and removes them locally afterwards
 
-        files_list = os.listdir(current_folder)
+        When Drive cannot be reached the file stays where it is and
+        LABEL_PENDING is returned: the order then waits in the offline spool
+        (core/spool.py), which uploads the label before writing the order.
+        """
         shipping_label_name = f"{order_id}.pdf"
 
-        for label in files_list:
+        for current_folder, label in self._label_files():
             if shipping_label_name == label.strip():
+                get_api_stats().count("finder.upload")
+                from googleapiclient.errors import HttpError
+                from googleapiclient.http import MediaFileUpload
+
                 try:
                     file_metadata: dict[str, Any] = {"name": label}
                     folder_id = get_settings().SHIPPING_LABEL_FOLDER
@@ -81,35 +106,62 @@ class GoogleDriveFinder:
                     file_path = os.path.join(current_folder, label)
                     media = MediaFileUpload(file_path, mimetype="application/pdf")
 
-                    file = (
-                        self.service.files()
-                        .create(
-                            body=file_metadata,
-                            media_body=media,
-                            fields="id, webViewLink",
+                    with timing.stage("drive.upload"):
+                        file = (
+                            self.service.files()
+                            .create(
+                                body=file_metadata,
+                                media_body=media,
+                                fields="id, webViewLink",
+                            )
+                            .execute(num_retries=3)
                         )
-                        .execute(num_retries=3)
-                    )
 
-                    cprint(
-                        f"- {tr('Shipping label uploaded')}: {file['webViewLink']}",
-                        "success",
-                    )
+                    cfield("Shipping label uploaded", file["webViewLink"])
 
                     link = file.get("webViewLink")
                     if link:
                         del media
-                        os.remove(file_path)
+                        self._dispose_label(file_path)
                     return link
 
-                except HttpError as error:
-                    cprint(tr("!!!An error occurred: {error}!!!", error=error), "error")
+                except Exception as error:
+                    if is_unavailable(error):
+                        cmessage(
+                            "||| Google Drive is unreachable, the shipping label will be uploaded later: {error} |||",
+                            "warning",
+                            error=error,
+                        )
+                        return LABEL_PENDING
+                    if not isinstance(error, HttpError):
+                        raise
+                    cmessage("!!!An error occurred: {error}!!!", "error", error=error)
                     return None
 
-        cprint(
-            tr(
-                "||| Check that the shipping label exists, most likely it is not in the app folder |||"
-            ),
+        cmessage(
+            "||| Check that the shipping label exists, most likely it is not in the app folder |||",
             "error",
         )
         return FILE_NOT_FOUND
+
+    def _label_files(self) -> list[tuple[str, str]]:
+        """(folder, file name) of everything in the label folders, app folder last."""
+        if getattr(sys, "frozen", False):
+            app_folder = os.path.dirname(sys.executable)
+        else:
+            app_folder = os.getcwd()
+
+        files: list[tuple[str, str]] = []
+        for folder in (*self.label_dirs, app_folder):
+            try:
+                files += [(folder, name) for name in os.listdir(folder)]
+            except FileNotFoundError:
+                continue
+        return files
+
+    def _dispose_label(self, file_path: str) -> None:
+        if self.label_archive is None:
+            os.remove(file_path)
+            return
+        os.makedirs(self.label_archive, exist_ok=True)
+        shutil.move(file_path, unique_path(self.label_archive, file_path))
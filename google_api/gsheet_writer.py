@@ -1,14 +1,14 @@
 """Writing orders to Google Sheets."""
 
 import random
-from typing import Any
-
-from gspread import Spreadsheet, Worksheet
-from gspread.utils import ValueInputOption
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from config.settings import get_settings
-from core.console import cprint
-from core.i18n import tr
+from core import timing
+from core.console import cmessage
 from core.constants import (
     COL_STATUS,
     COLORED_EXTENSIONS,
@@ -25,6 +25,20 @@ from core.constants import (
     WALLPAPER_PATTERN,  # noqa: F401
 )
 from google_api.auth import get_gspread_client
+from google_api.errors import PartialWriteError
+from google_api.stats import get_api_stats
+
+if TYPE_CHECKING:
+    from gspread import Spreadsheet, Worksheet
+
+
+class OrderWrite(NamedTuple):
+    """One parsed order, as append_order takes it (for batched writes)."""
+
+    order_items: list[dict[str, None | str | int]]
+    extension: str
+    smaller_size: float | str
+    customization_info: str | None = None
 
 
 def select_sheet_name(
@@ -47,20 +61,77 @@ def select_sheet_name(
     return SHEET_ERROR
 
 
+def report_sheet(sheet_name: str) -> None:
+    """Tells the journal which sheet the order goes to."""
+    if sheet_name == SHEET_ERROR:
+        cmessage(
+            "---Order file not found on the Drive, so the file extension could not be determined for sheet routing.\n"
+            "The order was added to the ERROR sheet---",
+            "warning",
+        )
+    else:
+        cmessage("---Routing to sheet: {sheet}---", "success", sheet=sheet_name)
+
+
+@dataclass(frozen=True, slots=True)
+class SheetLayout:
+    """The column plan of a sheet, worked out once from its header row.
+
+    ``positions`` maps a column name to its index; the highlight, status and
+    merge indices are the ones the formatting requests use. Columns the
+    header lacks are left out and listed in ``missing``.
+    """
+
+    headers: tuple[str, ...]
+    positions: dict[str, int]
+    highlight_columns: tuple[int, ...]
+    status_column: int | None
+    merge_columns: tuple[int, ...]
+    missing: tuple[str, ...]
+
+    def build_rows(
+        self, order_items: list[dict[str, None | str | int]]
+    ) -> list[list[Any]]:
+        """Lays out the order dicts across the sheet columns."""
+        width = len(self.headers)
+        positions = self.positions
+        rows: list[list[Any]] = []
+        for order_item in order_items:
+            row_data: list[Any] = [""] * width
+            for column, value in order_item.items():
+                col_index = positions.get(column)
+                if col_index is not None:
+                    row_data[col_index] = value
+            rows.append(row_data)
+        return rows
+
+
+@lru_cache(maxsize=32)
+def compile_layout(headers: tuple[str, ...]) -> SheetLayout:
+    """The SheetLayout of a header row (cached per distinct header row)."""
+    # Values go to the last column of a repeated name (as build_rows always
+    # did), the formatting to the first one (as headers.index() always did).
+    positions = {name: idx for idx, name in enumerate(headers)}
+    required = [*HIGHLIGHT_COLUMNS, COL_STATUS, *MERGE_COLUMNS]
+    return SheetLayout(
+        headers=headers,
+        positions=positions,
+        highlight_columns=tuple(
+            headers.index(col) for col in HIGHLIGHT_COLUMNS if col in positions
+        ),
+        status_column=headers.index(COL_STATUS) if COL_STATUS in positions else None,
+        merge_columns=tuple(
+            headers.index(col) for col in MERGE_COLUMNS if col in positions
+        ),
+        missing=tuple(col for col in required if col not in positions),
+    )
+
+
 def build_rows(
-    order_items: list[dict[str, None | str | int]], headers: list[str]
+    order_items: list[dict[str, None | str | int]], headers: Sequence[str]
 ) -> list[list[Any]]:
     """Lays out the order dicts across the sheet columns."""
-    header_index = {name: idx for idx, name in enumerate(headers)}
-    rows: list[list[Any]] = []
-    for order_item in order_items:
-        row_data: list[Any] = ["" for _ in range(len(headers))]
-        for column, value in order_item.items():
-            col_index = header_index.get(column)
-            if col_index is not None:
-                row_data[col_index] = value
-        rows.append(row_data)
-    return rows
+    return compile_layout(tuple(headers)).build_rows(order_items)
 
 
 def build_insert_rows_request(
@@ -80,6 +151,17 @@ def build_insert_rows_request(
     }
 
 
+def build_append_rows_request(sheet_id: int, num_rows: int) -> dict[str, Any]:
+    """appendDimension: blank rows after the last row of the grid."""
+    return {
+        "appendDimension": {
+            "sheetId": sheet_id,
+            "dimension": "ROWS",
+            "length": num_rows,
+        }
+    }
+
+
 def build_format_requests(
     sheet_id: int,
     start_row_index: int,
@@ -179,55 +261,276 @@ def build_merge_requests(
     ]
 
 
+def coalesce_requests(requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Shrinks the insert + format requests of a batch of appended orders.
+
+    Row inserts that continue each other on a sheet become one insert, and
+    they all go first, with the grid appends: every order of a batch lands
+    at or below the orders before it on its sheet, so no insert shifts the
+    rows an earlier request formats. repeatCell requests with the same cell,
+    fields and columns whose rows touch or overlap are merged into one range
+    (repeats of the same formatting disappear), unless a request in between
+    sets the same field of the same cells. Per-order colours differ, so those
+    stay separate.
+    """
+    inserts: list[dict[str, Any]] = []
+    formats: list[dict[str, Any]] = []
+    for request in requests:
+        if "insertDimension" in request:
+            _merge_insert(inserts, request)
+        elif "appendDimension" in request:
+            inserts.append(request)
+        elif "repeatCell" in request:
+            _merge_repeat(formats, request)
+        else:
+            formats.append(request)
+    return inserts + formats
+
+
+def _merge_insert(inserts: list[dict[str, Any]], request: dict[str, Any]) -> None:
+    new = request["insertDimension"]
+    for position, earlier in enumerate(inserts):
+        old = earlier.get("insertDimension")
+        if old is None:
+            # A grid append of another sheet
+            continue
+        old_range, new_range = old["range"], new["range"]
+        if (
+            old_range["sheetId"] == new_range["sheetId"]
+            and old_range["dimension"] == new_range["dimension"]
+            and old["inheritFromBefore"] == new["inheritFromBefore"]
+            and old_range["endIndex"] == new_range["startIndex"]
+        ):
+            inserts[position] = {
+                "insertDimension": {
+                    **old,
+                    "range": {**old_range, "endIndex": new_range["endIndex"]},
+                }
+            }
+            return
+    inserts.append(request)
+
+
+def _merge_repeat(formats: list[dict[str, Any]], request: dict[str, Any]) -> None:
+    new = request["repeatCell"]
+    new_range = new["range"]
+    for position in range(len(formats) - 1, -1, -1):
+        earlier = formats[position].get("repeatCell")
+        if earlier is None:
+            break
+        old_range = earlier["range"]
+        if (
+            old_range["sheetId"] == new_range["sheetId"]
+            and old_range["startColumnIndex"] == new_range["startColumnIndex"]
+            and old_range["endColumnIndex"] == new_range["endColumnIndex"]
+            and earlier["fields"] == new["fields"]
+            and earlier["cell"] == new["cell"]
+            and old_range["startRowIndex"] <= new_range["endRowIndex"]
+            and new_range["startRowIndex"] <= old_range["endRowIndex"]
+        ):
+            formats[position] = {
+                "repeatCell": {
+                    **earlier,
+                    "range": {
+                        **old_range,
+                        "startRowIndex": min(
+                            old_range["startRowIndex"], new_range["startRowIndex"]
+                        ),
+                        "endRowIndex": max(
+                            old_range["endRowIndex"], new_range["endRowIndex"]
+                        ),
+                    },
+                }
+            }
+            return
+        if _conflicts(earlier, new):
+            # Moving the request above this one could change the result
+            break
+    formats.append(request)
+
+
+def _conflicts(first: dict[str, Any], second: dict[str, Any]) -> bool:
+    """Whether two repeatCells set the same field of the same cells."""
+    if not set(first["fields"].split(",")) & set(second["fields"].split(",")):
+        return False
+    first, second = first["range"], second["range"]
+    return (
+        first["sheetId"] == second["sheetId"]
+        and first["startRowIndex"] < second["endRowIndex"]
+        and second["startRowIndex"] < first["endRowIndex"]
+        and first["startColumnIndex"] < second["endColumnIndex"]
+        and second["startColumnIndex"] < first["endColumnIndex"]
+    )
+
+
 class GSheetWriter:
     """Writes order data to Google Sheets"""
 
+    # Every order is written as soon as it is appended
+    buffered = 0
+
     def __init__(self) -> None:
-        """The client and the spreadsheet are opened once; worksheets, headers and
-        the first free row number are cached for the whole run."""
+        """The client and the spreadsheet are opened once; worksheets, headers,
+        the first free row number and the grid size are cached for the whole
+        run."""
         self.client = get_gspread_client()
-        self.spreadsheet: Spreadsheet = self.client.open_by_key(get_settings().TABLE_ID)
+        self._table_id = get_settings().TABLE_ID
+        self._spreadsheet: Spreadsheet | None = None
         self._worksheets: dict[str, Worksheet] = {}
         self._headers: dict[str, list[str]] = {}
+        self._layouts: dict[str, SheetLayout] = {}
         self._next_rows: dict[str, int] = {}
-
-    def _get_worksheet(self, title: str) -> Worksheet:
+        self._grid_rows: dict[str, int] = {}
+        self._grid_checked = False
+        # First row of the last order append_order() wrote (for the run history)
+        self.last_row: int | None = None
+
+    @property
+    def spreadsheet(self) -> "Spreadsheet":
+        """The spreadsheet, opened on first use: a writer created while Google is
+        unreachable still lets the run parse and spool its orders."""
+        if self._spreadsheet is None:
+            self._spreadsheet = self.client.open_by_key(self._table_id)
+        return self._spreadsheet
+
+    @spreadsheet.setter
+    def spreadsheet(self, spreadsheet: "Spreadsheet") -> None:
+        self._spreadsheet = spreadsheet
+
+    def _get_worksheet(self, title: str) -> "Worksheet":
         if title not in self._worksheets:
-            self._worksheets[title] = self.spreadsheet.worksheet(title)
+            with timing.stage("sheets.worksheet"):
+                worksheet = self._worksheets[title] = self.spreadsheet.worksheet(title)
+            self._grid_rows[title] = worksheet.row_count
         return self._worksheets[title]
 
-    def _get_headers(self, worksheet: Worksheet) -> list[str]:
+    def _get_headers(self, worksheet: "Worksheet") -> list[str]:
         if worksheet.title not in self._headers:
-            self._headers[worksheet.title] = worksheet.row_values(1)
+            with timing.stage("sheets.headers"):
+                self._headers[worksheet.title] = worksheet.row_values(1)
         return self._headers[worksheet.title]
 
-    def _get_next_row(self, worksheet: Worksheet) -> int:
+    def _get_layout(self, worksheet: "Worksheet") -> SheetLayout:
+        """The column plan of the sheet, compiled once per header row."""
+        layout = self._layouts.get(worksheet.title)
+        if layout is None:
+            headers = tuple(self._get_headers(worksheet))
+            layout = self._layouts[worksheet.title] = compile_layout(headers)
+        return layout
+
+    def _get_next_row(self, worksheet: "Worksheet") -> int:
         """The first free row of the sheet (1-based)."""
         if worksheet.title not in self._next_rows:
-            self._next_rows[worksheet.title] = len(worksheet.get_all_values()) + 1
+            with timing.stage("sheets.row_count"):
+                values = worksheet.get_all_values()
+            self._next_rows[worksheet.title] = len(values) + 1
         return self._next_rows[worksheet.title]
 
+    def _get_grid_rows(self, worksheet: "Worksheet") -> int | None:
+        """The number of rows in the sheet grid, None if unknown.
+
+        Known from the worksheet fetch and kept up to date by our own
+        writes; after revalidate() the sizes of all sheets are re-read once
+        with one metadata request.
+        """
+        if worksheet.title not in self._grid_rows and not self._grid_checked:
+            self._grid_checked = True
+            try:
+                with timing.stage("sheets.grid"):
+                    metadata = self.spreadsheet.fetch_sheet_metadata(
+                        {"fields": "sheets.properties(title,gridProperties.rowCount)"}
+                    )
+            except Exception:  # noqa: BLE001
+                # Unknown sizes only mean rows are inserted, as before
+                metadata = {}
+            for sheet in metadata.get("sheets", []):
+                properties = sheet.get("properties", {})
+                row_count = properties.get("gridProperties", {}).get("rowCount")
+                if isinstance(row_count, int):
+                    self._grid_rows[properties["title"]] = row_count
+        return self._grid_rows.get(worksheet.title)
+
+    def _at_grid_end(self, worksheet: "Worksheet", start_row: int) -> bool:
+        """True if no grid row lies at or below start_row (1-based): the rows
+        can be appended to the grid instead of inserted."""
+        grid_rows = self._get_grid_rows(worksheet)
+        return grid_rows is not None and start_row - 1 >= grid_rows
+
+    def revalidate(self) -> None:
+        """Re-checks the cached headers and free-row cursors with one request.
+
+        Used when a writer is reused across runs (core/session.py): someone
+        may have edited the spreadsheet in between. For every cached sheet
+        the header row and the rows from the last written one onwards are
+        fetched in a single values.batchGet. Rows added below our cursor move
+        it down; if the last written row is gone, the cursor is dropped and
+        recounted on the next write. The grid sizes are forgotten (someone
+        may have added or deleted rows) and re-read on the next write. Any
+        API error resets all caches.
+        """
+        self._grid_rows.clear()
+        self._grid_checked = False
+        titles = list(self._next_rows)
+        if not titles:
+            return
+
+        from gspread.utils import absolute_range_name, rowcol_to_a1
+
+        ranges: list[str] = []
+        for title in titles:
+            last_col = rowcol_to_a1(1, max(len(self._headers.get(title, [])), 1))
+            last_col = last_col.rstrip("0123456789")
+            tail_start = max(self._next_rows[title] - 1, 1)
+            ranges.append(absolute_range_name(title, "1:1"))
+            ranges.append(absolute_range_name(title, f"A{tail_start}:{last_col}"))
+
+        try:
+            response = self.spreadsheet.values_batch_get(ranges)
+        except Exception:  # noqa: BLE001
+            self._worksheets.clear()
+            self._headers.clear()
+            self._layouts.clear()
+            self._next_rows.clear()
+            return
+
+        value_ranges = response.get("valueRanges", [])
+        for position, title in enumerate(titles):
+            try:
+                header_range = value_ranges[2 * position]
+                tail_range = value_ranges[2 * position + 1]
+            except IndexError:
+                self._next_rows.pop(title, None)
+                continue
+
+            header_values = header_range.get("values", [])
+            if header_values:
+                if header_values[0] != self._headers.get(title):
+                    self._layouts.pop(title, None)
+                self._headers[title] = header_values[0]
+
+            tail = tail_range.get("values", [])
+            if not tail or not any(tail[0]):
+                self._next_rows.pop(title, None)
+                continue
+            tail_start = max(self._next_rows[title] - 1, 1)
+            self._next_rows[title] = tail_start + len(tail)
+
+    def flush(self) -> None:
+        """Nothing to do: every order is written as soon as it is appended."""
+
+    def discard(self) -> None:
+        """Nothing is buffered."""
+
     def __sort_by_sheets(
         self,
         extension: str,
         smaller_size: float | str,
         customization_info: str | None = None,
-    ) -> Worksheet:
+    ) -> "Worksheet":
         """Routes the order to a sheet using the size and the file extension"""
         sheet_name = select_sheet_name(extension, smaller_size, customization_info)
-
-        if sheet_name == SHEET_ERROR:
-            cprint(
-                tr(
-                    "---Order file not found on the Drive, so the file extension could not be determined for sheet routing.\n"
-                    "The order was added to the ERROR sheet---"
-                ),
-                "warning",
-            )
-            return self._get_worksheet(sheet_name)
-
         worksheet = self._get_worksheet(sheet_name)
-        cprint(tr("---Routing to sheet: {sheet}---", sheet=worksheet.title), "success")
+        report_sheet(sheet_name)
         return worksheet
 
     def append_order(
@@ -243,57 +546,223 @@ class GSheetWriter:
         Returns the name of the sheet the order was written to (for the UI summary).
         """
 
+        self.last_row = None
         if not order_items:
-            cprint(
-                tr("||| Order not added: the parser found no items in the HTML |||"),
+            cmessage(
+                "||| Order not added: the parser found no items in the HTML |||",
                 "error",
             )
             return None
 
+        get_api_stats().count("writer.append_order")
         worksheet = self.__sort_by_sheets(extension, smaller_size, customization_info)
-        headers = self._get_headers(worksheet)
+        layout = self._get_layout(worksheet)
+        rows = layout.build_rows(order_items)
+        start_row = self._get_next_row(worksheet)
+        at_end = self._at_grid_end(worksheet, start_row)
+        requests, merge_requests = _order_requests(
+            worksheet.id, layout, start_row - 1, len(rows), insert=not at_end
+        )
+        if at_end:
+            grid_rows = self._grid_rows[worksheet.title]
+            requests.insert(
+                0,
+                build_append_rows_request(
+                    worksheet.id, start_row - 1 + len(rows) - grid_rows
+                ),
+            )
+        try:
+            with timing.stage("sheets.insert_format"):
+                worksheet.spreadsheet.batch_update({"requests": requests})
+        except Exception:
+            self._grid_rows.pop(worksheet.title, None)
+            raise
+        if worksheet.title in self._grid_rows:
+            if at_end:
+                self._grid_rows[worksheet.title] = start_row - 1 + len(rows)
+            else:
+                self._grid_rows[worksheet.title] += len(rows)
+
+        from gspread.utils import ValueInputOption
+
+        where = _rows_label(worksheet.title, start_row, len(rows))
+        try:
+            with timing.stage("sheets.values"):
+                worksheet.update(
+                    rows,
+                    f"A{start_row}",
+                    value_input_option=ValueInputOption.user_entered,
+                )
+        except Exception as error:
+            raise PartialWriteError(_BLANK_ROWS, where, error) from error
 
-        highlight_cols = [headers.index(col) for col in HIGHLIGHT_COLUMNS]
-        status_col = headers.index(COL_STATUS)
-        merge_cols = [headers.index(col) for col in MERGE_COLUMNS]
+        self._next_rows[worksheet.title] = start_row + len(rows)
+        self.last_row = start_row
 
-        rows = build_rows(order_items, headers)
-        start_row = self._get_next_row(worksheet)
-        start_row_index = start_row - 1
+        if merge_requests:
+            try:
+                with timing.stage("sheets.merge"):
+                    worksheet.spreadsheet.batch_update({"requests": merge_requests})
+            except Exception as error:
+                raise PartialWriteError(_NO_MERGES, where, error) from error
 
-        red, green, blue = random.choice(MULTI_ITEM_PALETTE)
-        rgb = {"red": red, "green": green, "blue": blue}
+        cmessage("<<<Order added to the spreadsheet>>>", "success")
+        return worksheet.title
+
+    def append_orders(self, orders: Sequence[OrderWrite]) -> list[str | None]:
+        """Appends several orders with three API calls in total.
+
+        The same requests append_order sends per order, batched: every row
+        insert and format in one batchUpdate (coalesced, so consecutive
+        orders on a sheet share their inserts and formatting ranges; a sheet
+        whose grid ends at the cursor gets one appendDimension for all its
+        orders instead of inserts), every
+        value range in one values.batchUpdate and every merge in a last
+        batchUpdate. Used to replay the offline spool (core/spool.py). If the
+        first call fails nothing is written, and the row cursors and grid
+        sizes of the sheets involved are dropped and recounted next time; if
+        a later one fails, PartialWriteError says what reached the sheets.
+
+        Returns the sheet of every order (None for an order without items).
+        """
+        get_api_stats().count("writer.append_orders")
+        from gspread.utils import ValueInputOption, absolute_range_name
+
+        requests: list[dict[str, Any]] = []
+        merge_requests: list[dict[str, Any]] = []
+        value_ranges: list[dict[str, Any]] = []
+        next_rows: dict[str, int] = {}
+        # Sheets whose rows are appended to the grid: title -> (sheet id, grid rows)
+        appends: dict[str, tuple[int, int]] = {}
+        sheets: list[str | None] = []
+        for order in orders:
+            if not order.order_items:
+                sheets.append(None)
+                continue
+            worksheet = self.__sort_by_sheets(
+                order.extension, order.smaller_size, order.customization_info
+            )
+            layout = self._get_layout(worksheet)
+            rows = layout.build_rows(order.order_items)
+            start_row = next_rows.get(worksheet.title)
+            if start_row is None:
+                start_row = self._get_next_row(worksheet)
+                if self._at_grid_end(worksheet, start_row):
+                    grid_rows = self._grid_rows[worksheet.title]
+                    appends[worksheet.title] = (worksheet.id, grid_rows)
+            order_requests, order_merges = _order_requests(
+                worksheet.id,
+                layout,
+                start_row - 1,
+                len(rows),
+                insert=worksheet.title not in appends,
+            )
+            requests += order_requests
+            merge_requests += order_merges
+            value_ranges.append(
+                {
+                    "range": absolute_range_name(worksheet.title, f"A{start_row}"),
+                    "values": rows,
+                }
+            )
+            next_rows[worksheet.title] = start_row + len(rows)
+            sheets.append(worksheet.title)
+
+        if not value_ranges:
+            return sheets
 
         requests = [
-            build_insert_rows_request(worksheet.id, start_row_index, len(rows)),
-            *build_format_requests(
-                sheet_id=worksheet.id,
-                start_row_index=start_row_index,
-                num_rows=len(rows),
-                num_columns=len(headers),
-                highlight_col_indices=highlight_cols,
-                status_col_index=status_col,
-                rgb=rgb,
-            ),
-        ]
-        worksheet.spreadsheet.batch_update({"requests": requests})
-
-        worksheet.update(
-            rows,
-            f"A{start_row}",
-            value_input_option=ValueInputOption.user_entered,
+            build_append_rows_request(sheet_id, next_rows[title] - 1 - grid_rows)
+            for title, (sheet_id, grid_rows) in appends.items()
+        ] + requests
+        try:
+            with timing.stage("sheets.insert_format"):
+                self.spreadsheet.batch_update({"requests": coalesce_requests(requests)})
+        except Exception:
+            for title in next_rows:
+                self._next_rows.pop(title, None)
+                self._grid_rows.pop(title, None)
+            raise
+
+        for title, next_row in next_rows.items():
+            if title in appends:
+                self._grid_rows[title] = next_row - 1
+            elif title in self._grid_rows:
+                self._grid_rows[title] += next_row - self._next_rows[title]
+        where = ", ".join(
+            _rows_label(
+                title, self._next_rows[title], next_row - self._next_rows[title]
+            )
+            for title, next_row in next_rows.items()
         )
+        try:
+            with timing.stage("sheets.values"):
+                self.spreadsheet.values_batch_update(
+                    {
+                        "valueInputOption": ValueInputOption.user_entered,
+                        "data": value_ranges,
+                    }
+                )
+        except Exception as error:
+            raise PartialWriteError(_BLANK_ROWS, where, error) from error
 
-        merge_requests = build_merge_requests(
-            sheet_id=worksheet.id,
-            start_row_index=start_row_index,
-            num_rows=len(rows),
-            merge_col_indices=merge_cols,
-        )
+        self._next_rows.update(next_rows)
         if merge_requests:
-            worksheet.spreadsheet.batch_update({"requests": merge_requests})
+            try:
+                with timing.stage("sheets.merge"):
+                    self.spreadsheet.batch_update({"requests": merge_requests})
+            except Exception as error:
+                raise PartialWriteError(_NO_MERGES, where, error) from error
+        cmessage(
+            "<<<{count} order(s) added to the spreadsheet>>>",
+            "success",
+            count=len(value_ranges),
+        )
+        return sheets
 
-        self._next_rows[worksheet.title] = start_row + len(rows)
 
-        cprint("\n" + tr("<<<Order added to the spreadsheet>>>") + "\n", "success")
-        return worksheet.title
+_BLANK_ROWS = "blank rows were added, their values were not written"
+_NO_MERGES = "the rows were written without their cell merges"
+
+
+def _rows_label(title: str, first_row: int, num_rows: int) -> str:
+    return f"{title} rows {first_row}-{first_row + num_rows - 1}"
+
+
+def _order_requests(
+    sheet_id: int,
+    layout: SheetLayout,
+    start_row_index: int,
+    num_rows: int,
+    *,
+    insert: bool = True,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """The insert + format requests of one order, and its merge requests.
+
+    Without ``insert`` the rows already exist (appended to the grid) and
+    only the formatting is sent.
+    """
+    if layout.missing or layout.status_column is None:
+        raise ValueError(
+            f"columns missing from the sheet header: {', '.join(layout.missing)}"
+        )
+    red, green, blue = random.choice(MULTI_ITEM_PALETTE)
+    requests: list[dict[str, Any]] = []
+    if insert:
+        requests.append(build_insert_rows_request(sheet_id, start_row_index, num_rows))
+    requests += build_format_requests(
+        sheet_id=sheet_id,
+        start_row_index=start_row_index,
+        num_rows=num_rows,
+        num_columns=len(layout.headers),
+        highlight_col_indices=list(layout.highlight_columns),
+        status_col_index=layout.status_column,
+        rgb={"red": red, "green": green, "blue": blue},
+    )
+    merge_requests = build_merge_requests(
+        sheet_id=sheet_id,
+        start_row_index=start_row_index,
+        num_rows=num_rows,
+        merge_col_indices=list(layout.merge_columns),
+    )
+    return requests, merge_requests
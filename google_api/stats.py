@@ -0,0 +1,261 @@
+"""Google API call accounting: counts, bytes, retries, 429s and latency per method."""
+
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+# Default per-user quotas (requests per minute) the headroom is measured against.
+QUOTAS_PER_MINUTE = {
+    "sheets.read": 60,
+    "sheets.write": 60,
+    "drive.read": 12000,
+    "drive.write": 12000,
+}
+
+WINDOW_SECONDS = 60.0
+
+_RETRYABLE = {408, 429}
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+_SHEETS_PATH_RE = re.compile(r"^/v4/spreadsheets(?:/[^/:]+)?(?P<rest>.*)$")
+_DRIVE_PATH_RE = re.compile(
+    r"^(?:/upload)?/drive/v3/(?P<resource>[^/]+)(?P<id>/[^/]+)?"
+)
+
+
+@dataclass
+class MethodStats:
+    """Totals of one API method (e.g. ``sheets values.update``)."""
+
+    calls: int = 0
+    errors: int = 0
+    throttled: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+def classify(http_method: str, url: str) -> tuple[str, str]:
+    """Maps a request to ``(api, method)``, e.g. ("sheets", "values.update")."""
+    parts = urlsplit(url)
+    http_method = http_method.upper()
+
+    if parts.path.startswith("/v4/spreadsheets"):
+        match = _SHEETS_PATH_RE.match(parts.path)
+        rest = match.group("rest") if match else ""
+        resource = "values" if rest.startswith("/values") else "spreadsheets"
+        if ":" in rest:
+            verb = rest.rsplit(":", 1)[1]
+        else:
+            verb = {"GET": "get", "PUT": "update", "POST": "create"}.get(
+                http_method, http_method.lower()
+            )
+        return "sheets", f"{resource}.{verb}"
+
+    match = _DRIVE_PATH_RE.match(parts.path)
+    if match:
+        if http_method == "GET":
+            verb = "get" if match.group("id") else "list"
+        else:
+            verb = {"POST": "create", "PATCH": "update", "DELETE": "delete"}.get(
+                http_method, http_method.lower()
+            )
+        return "drive", f"{match.group('resource')}.{verb}"
+
+    return parts.hostname or "other", f"{http_method} {parts.path}"
+
+
+class ApiStats:
+    """Thread-safe counters of the Google API traffic of this process.
+
+    Totals are kept per method until ``reset()`` (done when a run starts);
+    the rolling one-minute window of requests is never reset, because the
+    quotas it is compared against are per minute, not per run.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._methods: dict[tuple[str, str], MethodStats] = {}
+        self._operations: dict[str, int] = {}
+        self._window: deque[tuple[float, str]] = deque()
+        self._peaks: dict[str, int] = {}
+        self._last_failed = threading.local()
+
+    def record(
+        self,
+        http_method: str,
+        url: str,
+        status: int,
+        seconds: float,
+        sent: int = 0,
+        received: int = 0,
+    ) -> None:
+        """Accounts one HTTP attempt (every retry is an attempt of its own)."""
+        api, method = classify(http_method, url)
+        key = (http_method.upper(), url)
+        retry = getattr(self._last_failed, "key", None) == key
+        self._last_failed.key = key if status in _RETRYABLE or status >= 500 else None
+
+        bucket = f"{api}.{'write' if http_method.upper() in _WRITE_METHODS else 'read'}"
+        now = self._clock()
+        with self._lock:
+            stats = self._methods.get((api, method))
+            if stats is None:
+                stats = self._methods[(api, method)] = MethodStats()
+            stats.calls += 1
+            stats.errors += status >= 400
+            stats.throttled += status == 429
+            stats.retries += retry
+            stats.bytes_sent += sent
+            stats.bytes_received += received
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+
+            self._window.append((now, bucket))
+            self._expire_locked(now)
+            current = sum(1 for _, name in self._window if name == bucket)
+            self._peaks[bucket] = max(self._peaks.get(bucket, 0), current)
+
+    def count(self, operation: str) -> None:
+        """Counts a logical operation (a finder lookup, an order write...)."""
+        with self._lock:
+            self._operations[operation] = self._operations.get(operation, 0) + 1
+
+    def reset(self) -> None:
+        """Starts new totals (the per-minute window is kept)."""
+        with self._lock:
+            self._methods.clear()
+            self._operations.clear()
+            self._peaks.clear()
+
+    def per_minute(self) -> dict[str, int]:
+        """Requests per quota bucket during the last minute."""
+        with self._lock:
+            self._expire_locked(self._clock())
+            counts = dict.fromkeys(QUOTAS_PER_MINUTE, 0)
+            for _, bucket in self._window:
+                counts[bucket] = counts.get(bucket, 0) + 1
+            return counts
+
+    def snapshot(self) -> dict[str, Any]:
+        """Everything as plain data, for the run report and the UI."""
+        per_minute = self.per_minute()
+        with self._lock:
+            methods = {
+                f"{api} {method}": asdict(stats)
+                for (api, method), stats in sorted(self._methods.items())
+            }
+            operations = dict(sorted(self._operations.items()))
+            peaks = dict(self._peaks)
+        return {
+            "methods": methods,
+            "operations": operations,
+            "per_minute": per_minute,
+            "peak_per_minute": peaks,
+            "quota_per_minute": dict(QUOTAS_PER_MINUTE),
+        }
+
+    def summary(self) -> dict[str, int]:
+        """Flat totals for the live UI panel."""
+        snapshot = self.snapshot()
+        summary = {
+            "sheetsCalls": 0,
+            "driveCalls": 0,
+            "throttled": 0,
+            "retries": 0,
+            "errors": 0,
+        }
+        for name, stats in snapshot["methods"].items():
+            api = name.split(" ", 1)[0]
+            if api in ("sheets", "drive"):
+                summary[f"{api}Calls"] += stats["calls"]
+            summary["throttled"] += stats["throttled"]
+            summary["retries"] += stats["retries"]
+            summary["errors"] += stats["errors"]
+        for bucket, quota in QUOTAS_PER_MINUTE.items():
+            api, kind = bucket.split(".")
+            summary[f"{api}{kind.title()}sPerMinute"] = snapshot["per_minute"][bucket]
+            summary[f"{api}{kind.title()}sQuota"] = quota
+        return summary
+
+    def report_lines(self) -> list[str]:
+        """A fixed-width table for the CLI ``--stats`` summary."""
+        snapshot = self.snapshot()
+        lines = [
+            (
+                f"{'method':<34}{'calls':>6}{'err':>5}{'429':>5}{'retry':>6}"
+                f"{'KB out':>8}{'KB in':>8}{'avg ms':>8}{'max ms':>8}"
+            )
+        ]
+        for name, stats in snapshot["methods"].items():
+            average = stats["total_seconds"] / stats["calls"] * 1000
+            lines.append(
+                f"{name:<34}{stats['calls']:>6}{stats['errors']:>5}"
+                f"{stats['throttled']:>5}{stats['retries']:>6}"
+                f"{stats['bytes_sent'] / 1024:>8.1f}"
+                f"{stats['bytes_received'] / 1024:>8.1f}"
+                f"{average:>8.0f}{stats['max_seconds'] * 1000:>8.0f}"
+            )
+        for name, count in snapshot["operations"].items():
+            lines.append(f"{name:<34}{count:>6}")
+        for bucket, quota in snapshot["quota_per_minute"].items():
+            peak = snapshot["peak_per_minute"].get(bucket, 0)
+            lines.append(f"{bucket + ' peak/min':<34}{peak:>6} of {quota}")
+        return lines
+
+    def _expire_locked(self, now: float) -> None:
+        while self._window and now - self._window[0][0] > WINDOW_SECONDS:
+            self._window.popleft()
+
+
+_stats = ApiStats()
+
+
+def get_api_stats() -> ApiStats:
+    """The process-wide Google API counters."""
+    return _stats
+
+
+def record_requests_response(response: Any, *args: Any, **kwargs: Any) -> None:
+    """A ``requests`` response hook (the gspread session)."""
+    request = response.request
+    body = request.body or b""
+    _stats.record(
+        request.method or "GET",
+        request.url or "",
+        response.status_code,
+        response.elapsed.total_seconds(),
+        sent=len(body),
+        received=len(response.content or b""),
+    )
+
+
+class CountingHttp:
+    """Wraps an httplib2-style Http (the Drive service) and records every request."""
+
+    def __init__(self, http: Any, stats: ApiStats | None = None) -> None:
+        self._http = http
+        self._stats = stats if stats is not None else _stats
+
+    def request(self, uri: str, method: str = "GET", body: Any = None, **kwargs: Any):
+        start = time.perf_counter()
+        response, content = self._http.request(uri, method, body=body, **kwargs)
+        self._stats.record(
+            method,
+            uri,
+            int(response.status),
+            time.perf_counter() - start,
+            sent=len(body) if isinstance(body, bytes | str) else 0,
+            received=len(content or b""),
+        )
+        return response, content
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._http, name)
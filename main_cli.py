@@ -2,7 +2,11 @@
 
 import sys
 
-from core.cli import run_cli
+if "--profile-startup" in sys.argv:
+    from core.profiling import enable_startup_profiling
+
+    enable_startup_profiling()
+
 from core.console import cleanup_old_logs, cprint
 from core.i18n import set_language, tr
 
@@ -17,7 +21,61 @@ def main() -> None:
         except IndexError:
             pass
 
-    run_cli()
+    if "--event-log" in sys.argv:
+        from core.event_log import enable_event_log
+
+        enable_event_log()
+
+    if "--replay-spool" in sys.argv:
+        from core.cli import run_replay
+
+        run_replay()
+    elif "--history" in sys.argv:
+        from core.cli import run_history
+        from core.history import history_query_from_argv
+
+        run_history(history_query_from_argv(sys.argv))
+    elif "--events" in sys.argv:
+        from core.cli import run_events
+        from core.event_log import event_query_from_argv
+
+        query = event_query_from_argv(sys.argv)
+        assert query is not None
+        run_events(query)
+    elif "--serve" in sys.argv:
+        from core.cli import run_serve
+        from core.ingest import ingest_config_from_argv
+        from core.sinks import sink_config_from_argv
+
+        serve = ingest_config_from_argv(sys.argv)
+        assert serve is not None
+        run_serve(serve, sink=sink_config_from_argv(sys.argv))
+    elif "--watch" in sys.argv:
+        from core.cli import run_watch
+        from core.sinks import sink_config_from_argv
+        from core.watch import watch_config_from_argv
+
+        config = watch_config_from_argv(sys.argv)
+        assert config is not None
+        run_watch(config, sink=sink_config_from_argv(sys.argv))
+    else:
+        from core.cli import run_cli
+        from core.inputs import inputs_from_argv
+        from core.order_archive import (
+            order_archive_from_argv,
+            reprocess_ids_from_argv,
+        )
+        from core.profiling import profile_config_from_argv
+        from core.sinks import sink_config_from_argv
+
+        run_cli(
+            show_stats="--stats" in sys.argv,
+            profile=profile_config_from_argv(sys.argv),
+            sink=sink_config_from_argv(sys.argv),
+            inputs=inputs_from_argv(sys.argv),
+            archive=order_archive_from_argv(sys.argv),
+            reprocess=reprocess_ids_from_argv(sys.argv),
+        )
 
 
 if __name__ == "__main__":
@@ -4,8 +4,7 @@ import datetime
 from typing import Any
 
 
-from core.console import cprint
-from core.i18n import tr
+from core.console import cfield, cmessage
 from core.constants import ERROR_VALUE
 from marketplaces.base_parser import BaseParser, OrderItem
 
@@ -94,7 +93,7 @@ class AmazonParser(BaseParser):
                     )
                     .text.strip()
                 )
-                cprint(f"- {tr('Shop name')}: {store_title}", "success")
+                cfield("Shop name", store_title)
                 return store_title
             except AttributeError:
                 store_title = (
@@ -103,10 +102,10 @@ class AmazonParser(BaseParser):
                     .find("b")
                     .text.strip()
                 )
-                cprint(f"- {tr('Shop name')}: {store_title}", "success")
+                cfield("Shop name", store_title)
                 return store_title
         except AttributeError:
-            cprint(tr("||| Could not get the shop name |||"), "error")
+            cmessage("||| Could not get the shop name |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -119,13 +118,11 @@ class AmazonParser(BaseParser):
             sku = listing_title.split(" ")[-1].strip()
             if len(sku) == 1:
                 sku = listing_title.split(" ")[-2].strip()
-        cprint(
-            tr(
-                "The SKU was taken from the title, verify it after it lands in the spreadsheet!"
-            ),
+        cmessage(
+            "The SKU was taken from the title, verify it after it lands in the spreadsheet!",
             "warning",
         )
-        cprint(f"- {tr('Item SKU')}: {sku}", "success")
+        cfield("Item SKU", sku)
         return sku
 
     @staticmethod
@@ -135,18 +132,16 @@ class AmazonParser(BaseParser):
             link = item.find("a", href=True)
             if link:
                 listing_link = link.get("href").strip()
-                cprint(f"- {tr('Listing link')}: {listing_link}", "success")
+                cfield("Listing link", listing_link)
                 return listing_link
             else:
-                cprint(tr("||| Could not find the listing link |||"), "error")
+                cmessage("||| Could not find the listing link |||", "error")
                 return None
         except Exception as e:
-            cprint(
-                tr(
-                    "||| Error while searching for the listing link: {error} |||",
-                    error=str(e),
-                ),
+            cmessage(
+                "||| Error while searching for the listing link: {error} |||",
                 "error",
+                error=str(e),
             )
             return None
 
@@ -158,10 +153,10 @@ class AmazonParser(BaseParser):
                 .find("span", {"data-test-id": "order-id-value"}, class_="a-text-bold")
                 .text.strip()
             )
-            cprint(f"- {tr('Order ID')}: {order_id}", "success")
+            cfield("Order ID", order_id)
             return order_id
         except AttributeError:
-            cprint(tr("||| Could not get the order ID |||"), "error")
+            cmessage("||| Could not get the order ID |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -171,10 +166,10 @@ class AmazonParser(BaseParser):
             listing_title = item.find(
                 "div", class_="more-info-column-word-wrap-break-word"
             ).text.strip('"')
-            cprint(f"- {tr('Product title')}: {listing_title}", "success")
+            cfield("Product title", listing_title)
             return listing_title
         except AttributeError:
-            cprint(tr("||| Could not get the listing title |||"), "error")
+            cmessage("||| Could not get the listing title |||", "error")
             return ERROR_VALUE
 
     def __get_address(self) -> str:
@@ -218,18 +213,18 @@ class AmazonParser(BaseParser):
                 if phone_number:
                     full_address += f"\nPhone: {phone_number}"
 
-                cprint(f"- {tr('Customer address')}:\n{full_address}", "success")
+                cfield("Customer address", full_address)
                 return full_address
 
             except IndexError:
-                cprint(
-                    tr("||| The address is too long/short, could not process it |||"),
+                cmessage(
+                    "||| The address is too long/short, could not process it |||",
                     "error",
                 )
                 return ERROR_VALUE
 
         except AttributeError:
-            cprint(tr("||| Could not get the customer address |||"), "error")
+            cmessage("||| Could not get the customer address |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -238,10 +233,10 @@ class AmazonParser(BaseParser):
         try:
             quantity_td = item.find("td", text=True)
             quantity = quantity_td.text.strip()
-            cprint(f"- {tr('Quantity')}: {quantity}", "success")
+            cfield("Quantity", quantity)
             return int(quantity)
         except AttributeError:
-            cprint(tr("||| Could not get the quantity |||"), "error")
+            cmessage("||| Could not get the quantity |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -254,11 +249,11 @@ class AmazonParser(BaseParser):
             customization_items = "".join(
                 [line.text + "\n" for line in customization_block.find_all("div")][3::]
             ).replace("\xa0", " ")
-            cprint(f"- {tr('Customization')}:\n{customization_items}", "success")
+            cfield("Customization", customization_items)
             return customization_items.strip()
         except AttributeError:
-            cprint(
-                tr("||| Could not get the customization, it may not be specified |||"),
+            cmessage(
+                "||| Could not get the customization, it may not be specified |||",
                 "warning",
             )
             return ""
@@ -278,10 +273,10 @@ class AmazonParser(BaseParser):
             if items_total.startswith("CA"):
                 items_total = items_total.replace("CA", "")
             items_total = float(items_total.strip("$"))
-            cprint(f"- {tr('Items total')}: {items_total}", "success")
+            cfield("Items total", items_total)
             return items_total
         except AttributeError:
-            cprint(tr("||| Could not get the items total |||"), "error")
+            cmessage("||| Could not get the items total |||", "error")
             return 0
 
     def __get_shipping_total_value(self) -> float | int:
@@ -292,10 +287,10 @@ class AmazonParser(BaseParser):
             ).find("span", class_="a-color-")
             total_shipping = shipping_values.text.strip("$")
 
-            cprint(f"- {tr('Shipping paid by us')}: {total_shipping}", "success")
+            cfield("Shipping paid by us", total_shipping)
             return float(total_shipping)
         except (AttributeError, ValueError):
-            cprint(tr("||| Could not get the shipping amount we paid |||"), "error")
+            cmessage("||| Could not get the shipping amount we paid |||", "error")
             return 0
 
     def __get_shipping_price(self) -> float | int:
@@ -316,12 +311,10 @@ class AmazonParser(BaseParser):
                 shipping_price_value = float(shipping_total.strip("$"))
             else:
                 shipping_price_value = 0
-            cprint(
-                f"- {tr('Shipping price charged')}: {shipping_price_value}", "success"
-            )
+            cfield("Shipping price charged", shipping_price_value)
             return shipping_price_value
         except (AttributeError, IndexError):
-            cprint(tr("||| Shipping price charged not found |||"), "error")
+            cmessage("||| Shipping price charged not found |||", "error")
             return 0
 
     def __ship_by_date(self) -> str:
@@ -343,12 +336,12 @@ class AmazonParser(BaseParser):
             else:
                 formatted_date = self._today()
 
-            cprint(f"- {tr('Ship by')}: {formatted_date}", "success")
+            cfield("Ship by", formatted_date)
             return formatted_date
 
         except AttributeError:
             formatted_date = self._today()
-            cprint(f"- {tr('Ship by')}: {formatted_date}", "success")
+            cfield("Ship by", formatted_date)
             return formatted_date
 
     def __get_postal_service(self) -> str:
@@ -360,10 +353,10 @@ class AmazonParser(BaseParser):
             postal_service = postal_service_divs.find_all(
                 "div", class_="a-column a-span3"
             )[1].text.strip()
-            cprint(f"- {tr('Carrier')}: {postal_service}", "success")
+            cfield("Carrier", postal_service)
             return postal_service
         except AttributeError:
-            cprint(tr("||| Could not get the carrier name |||"), "error")
+            cmessage("||| Could not get the carrier name |||", "error")
             return ERROR_VALUE
 
     def __get_tracking_number(self) -> str:
@@ -375,7 +368,7 @@ class AmazonParser(BaseParser):
         )
         if tracking_number:
             tracking_number = tracking_number.text.strip()
-            cprint(f"- {tr('Tracking number')}: {tracking_number}", "success")
+            cfield("Tracking number", tracking_number)
             return tracking_number
 
         tracking_number = self.soup.find(
@@ -383,12 +376,9 @@ class AmazonParser(BaseParser):
         )
         if tracking_number:
             tracking_number = tracking_number.text.strip()
-            cprint(
-                f"- {tr('Tracking number (label bought outside Amazon)')}: {tracking_number}",
-                "success",
-            )
+            cfield("Tracking number (label bought outside Amazon)", tracking_number)
             return tracking_number
-        cprint(tr("||| Could not get the tracking number |||"), "error")
+        cmessage("||| Could not get the tracking number |||", "error")
         return ERROR_VALUE
 
     def __get_tracking_link(
@@ -407,8 +397,8 @@ class AmazonParser(BaseParser):
                 .find("span", class_="")
                 .text.strip()
             )
-            cprint(f"- {tr('Shipping method')}: {shipping_type}", "success")
+            cfield("Shipping method", shipping_type)
             return shipping_type
         except AttributeError:
-            cprint(tr("||| Shipping method not found |||"), "error")
+            cmessage("||| Shipping method not found |||", "error")
             return ERROR_VALUE
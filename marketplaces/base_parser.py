@@ -7,8 +7,8 @@ from typing import Any
 
 from bs4 import BeautifulSoup as Soup
 
-from core.console import cprint
-from core.i18n import tr
+from core import timing
+from core.console import cfield, cmessage
 from core.constants import (
     COL_ADDITIONAL_INFO,
     COL_ADDRESS,
@@ -51,7 +51,8 @@ class BaseParser(ABC):
     def __init__(self, order: str, finder: GoogleDriveFinder | None = None) -> None:
         """Initializes the order data variables and the Soup instance."""
         self.order = order
-        self.soup = Soup(order, "lxml")
+        with timing.stage("soup"):
+            self.soup = Soup(order, "lxml")
         self.finder = finder if finder is not None else GoogleDriveFinder()
         self.sku: str | None = None
         self.order_id: str | None = None
@@ -64,7 +65,7 @@ class BaseParser(ABC):
     def _today(self) -> str:
         """Today's date"""
         self.today = datetime.date.today().strftime(DATE_FORMAT)
-        cprint(f"- {tr('Processing date')}: {self.today}", "success")
+        cfield("Processing date", self.today)
         return self.today
 
     # ------------------------------------------------------------------
@@ -137,13 +138,13 @@ class BaseParser(ABC):
                         width = float(size[0].strip())
                         height = float(size[1].strip())
                         return float(min(width, height))
-            cprint(
-                tr("||| Could not get the smaller size for sheet routing |||"), "error"
+            cmessage(
+                "||| Could not get the smaller size for sheet routing |||", "error"
             )
             return ERROR_VALUE
         except (ValueError, AttributeError, IndexError):
-            cprint(
-                tr("||| Could not get the smaller size for sheet routing |||"), "error"
+            cmessage(
+                "||| Could not get the smaller size for sheet routing |||", "error"
             )
             return ERROR_VALUE
 
@@ -156,7 +157,7 @@ class BaseParser(ABC):
         if template is None:
             return None
         tracking_link = template.format(number=tracking_number)
-        cprint(f"- {tr('Tracking link')}: {tracking_link}", "success")
+        cfield("Tracking link", tracking_link)
         return tracking_link
 
     @staticmethod
@@ -169,11 +170,9 @@ class BaseParser(ABC):
         try:
             return (items_total + shipping_price) - shipping_total  # type: ignore[operator]
         except TypeError:
-            cprint(
-                tr(
-                    "||| Could not compute the Total: some amounts failed to parse, "
-                    "the cell will hold !ERROR! — check the order manually |||"
-                ),
+            cmessage(
+                "||| Could not compute the Total: some amounts failed to parse, "
+                "the cell will hold !ERROR! — check the order manually |||",
                 "warning",
             )
             return ERROR_VALUE
@@ -3,8 +3,7 @@
 from typing import Any
 
 
-from core.console import cprint
-from core.i18n import tr
+from core.console import cfield, cmessage
 from core.constants import ERROR_VALUE
 from marketplaces.base_parser import BaseParser, OrderItem
 
@@ -86,20 +85,20 @@ class EbayParser(BaseParser):
                 .find("dd", class_="info-value")
                 .text.strip()
             )
-            cprint(f"- {tr('Order ID')}: {order_id}", "success")
+            cfield("Order ID", order_id)
             return order_id
         except AttributeError:
-            cprint(tr("||| Could not get the order ID |||"), "error")
+            cmessage("||| Could not get the order ID |||", "error")
             return ERROR_VALUE
 
     def __get_store_title(self) -> str:
         """Extracts the shop name"""
         try:
             store_title = "stickalz"
-            cprint(f"- {tr('Shop name')}: {store_title}", "success")
+            cfield("Shop name", store_title)
             return store_title
         except AttributeError:
-            cprint(tr("||| Could not get the shop name |||"), "error")
+            cmessage("||| Could not get the shop name |||", "error")
             return ERROR_VALUE
 
     def __get_address(self) -> str:
@@ -140,18 +139,18 @@ class EbayParser(BaseParser):
                 if phone_number:
                     full_address += f"\nPhone: {phone_number}"
 
-                cprint(f"- {tr('Customer address')}:\n{full_address}", "success")
+                cfield("Customer address", full_address)
                 return full_address
 
             except IndexError:
-                cprint(
-                    tr("||| The address is too long/short, could not process it |||"),
+                cmessage(
+                    "||| The address is too long/short, could not process it |||",
                     "error",
                 )
                 return ERROR_VALUE
 
         except AttributeError:
-            cprint(tr("||| Could not get the customer address |||"), "error")
+            cmessage("||| Could not get the customer address |||", "error")
             return ERROR_VALUE
 
     def __get_items_total(self) -> float | int:
@@ -166,10 +165,10 @@ class EbayParser(BaseParser):
             if items_total.startswith("CA"):
                 items_total = items_total.replace("CA", "")
             items_total = float(items_total.strip("$"))
-            cprint(f"- {tr('Items total')}: {items_total}", "success")
+            cfield("Items total", items_total)
             return items_total
         except AttributeError:
-            cprint(tr("||| Could not get the items total |||"), "error")
+            cmessage("||| Could not get the items total |||", "error")
             return 0
 
     def __get_shipping_total_value(self) -> float | int:
@@ -188,10 +187,10 @@ class EbayParser(BaseParser):
             if total_shipping.startswith("CA"):
                 total_shipping = total_shipping.replace("CA", "")
 
-            cprint(f"- {tr('Shipping paid by us')}: {total_shipping}", "success")
+            cfield("Shipping paid by us", total_shipping)
             return float(total_shipping)
         except (AttributeError, ValueError):
-            cprint(tr("||| Could not get the shipping amount we paid |||"), "error")
+            cmessage("||| Could not get the shipping amount we paid |||", "error")
             return 0
 
     def __get_shipping_price(self) -> float | int:
@@ -208,12 +207,10 @@ class EbayParser(BaseParser):
                 shipping_price_value = float(shipping_total.strip("$"))
             else:
                 shipping_price_value = 0
-            cprint(
-                f"- {tr('Shipping price charged')}: {shipping_price_value}", "success"
-            )
+            cfield("Shipping price charged", shipping_price_value)
             return shipping_price_value
         except (AttributeError, IndexError):
-            cprint(tr("||| Shipping price charged not found |||"), "error")
+            cmessage("||| Shipping price charged not found |||", "error")
             return 0
 
     def __get_total(self) -> float | int:
@@ -226,10 +223,10 @@ class EbayParser(BaseParser):
             )
             order_earnings = float(order_earnings.replace("CA", "").replace("$", ""))
 
-            cprint(f"- {tr('Total')}: {order_earnings}", "success")
+            cfield("Total", order_earnings)
             return order_earnings
         except (AttributeError, IndexError):
-            cprint(tr("||| Total not found |||"), "error")
+            cmessage("||| Total not found |||", "error")
             return 0
 
     def __get_tracking_number(self) -> str:
@@ -254,14 +251,14 @@ class EbayParser(BaseParser):
                     tracking_number = None
 
             if tracking_number:
-                cprint(f"- {tr('Tracking number')}: {tracking_number}", "success")
+                cfield("Tracking number", tracking_number)
                 return tracking_number
             else:
-                cprint(tr("||| Could not get the tracking number |||"), "error")
+                cmessage("||| Could not get the tracking number |||", "error")
                 return ERROR_VALUE
 
         except AttributeError:
-            cprint(tr("||| Could not get the tracking number |||"), "error")
+            cmessage("||| Could not get the tracking number |||", "error")
             return ERROR_VALUE
 
     def __get_postal_service(self, tracking_number: str) -> str | None:
@@ -285,10 +282,10 @@ class EbayParser(BaseParser):
             ):
                 postal_service = "DHL"
 
-            cprint(f"- {tr('Carrier')}: {postal_service}", "success")
+            cfield("Carrier", postal_service)
             return postal_service
         except AttributeError:
-            cprint(tr("||| Could not get the carrier name |||"), "error")
+            cmessage("||| Could not get the carrier name |||", "error")
             return ERROR_VALUE
 
     def __get_tracking_link(
@@ -315,21 +312,21 @@ class EbayParser(BaseParser):
                 shipping_type = "Next Day"
             else:
                 shipping_type = "Standard"
-            cprint(f"- {tr('Shipping method')}: {shipping_type}", "success")
+            cfield("Shipping method", shipping_type)
             return shipping_type
         except AttributeError:
-            cprint(tr("||| Shipping method not found |||"), "error")
+            cmessage("||| Shipping method not found |||", "error")
             return ERROR_VALUE
 
     def __ship_by_date(self) -> str:
         """Extracts the ship-by deadline date"""
         try:
             formatted_date = self._today()
-            cprint(f"- {tr('Ship by')}: {formatted_date}", "success")
+            cfield("Ship by", formatted_date)
             return formatted_date
         except AttributeError:
             formatted_date = self._today()
-            cprint(f"- {tr('Ship by')}: {formatted_date}", "success")
+            cfield("Ship by", formatted_date)
             return formatted_date
 
     @staticmethod
@@ -337,10 +334,10 @@ class EbayParser(BaseParser):
         """Extracts the product title"""
         try:
             listing_title = item.find("span", class_="PSEUDOLINK").text.strip()
-            cprint(f"- {tr('Product title')}: {listing_title}", "success")
+            cfield("Product title", listing_title)
             return listing_title
         except AttributeError:
-            cprint(tr("||| Could not get the listing title |||"), "error")
+            cmessage("||| Could not get the listing title |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -350,18 +347,16 @@ class EbayParser(BaseParser):
             link = item.find("div", class_="details").find("a", href=True)
             if link:
                 listing_link = link.get("href").strip()
-                cprint(f"- {tr('Listing link')}: {listing_link}", "success")
+                cfield("Listing link", listing_link)
                 return listing_link
             else:
-                cprint(tr("||| Could not find the listing link |||"), "error")
+                cmessage("||| Could not find the listing link |||", "error")
                 return ERROR_VALUE
         except Exception as e:
-            cprint(
-                tr(
-                    "||| Error while searching for the listing link: {error} |||",
-                    error=str(e),
-                ),
+            cmessage(
+                "||| Error while searching for the listing link: {error} |||",
                 "error",
+                error=str(e),
             )
             return ERROR_VALUE
 
@@ -378,7 +373,7 @@ class EbayParser(BaseParser):
                     or "Manufacturer Part Number" in el.text.strip()
                 ):
                     sku = el.find("dd", class_="info-value").text.strip()
-                    cprint(f"- {tr('Item SKU')}: {sku}", "success")
+                    cfield("Item SKU", sku)
                     return sku
         except AttributeError:
             if "(" in listing_title:
@@ -388,13 +383,11 @@ class EbayParser(BaseParser):
                 sku = listing_title.split(" ")[-1].strip()
                 if len(sku) == 1:
                     sku = listing_title.split(" ")[-2].strip()
-            cprint(
-                tr(
-                    "The SKU was taken from the title, verify it after it lands in the spreadsheet!"
-                ),
+            cmessage(
+                "The SKU was taken from the title, verify it after it lands in the spreadsheet!",
                 "warning",
             )
-            cprint(f"- {tr('Item SKU')}: {sku}", "success")
+            cfield("Item SKU", sku)
             return sku
         return None
 
@@ -407,10 +400,10 @@ class EbayParser(BaseParser):
                 .find("span", class_="sh-bold")
                 .text.strip()
             )
-            cprint(f"- {tr('Quantity')}: {quantity}", "success")
+            cfield("Quantity", quantity)
             return int(quantity)
         except AttributeError:
-            cprint(tr("||| Could not get the quantity |||"), "error")
+            cmessage("||| Could not get the quantity |||", "error")
             return ERROR_VALUE
 
     def __get_customization(self, item: Any) -> str | None:
@@ -436,11 +429,12 @@ class EbayParser(BaseParser):
                 "\n".join(customization_list) if customization_list else None
             )
 
-            cprint(f"- {tr('Customization')}:\n{customization}", "success")
+            cfield("Customization", customization)
             return customization
         except Exception as e:
-            cprint(
-                tr("||| Error while getting the customization: {error} |||", error=e),
+            cmessage(
+                "||| Error while getting the customization: {error} |||",
                 "warning",
+                error=e,
             )
             return None
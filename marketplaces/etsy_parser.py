@@ -5,8 +5,7 @@ import re
 from typing import Any
 
 
-from core.console import cprint
-from core.i18n import tr
+from core.console import cfield, cmessage
 from core.constants import ERROR_VALUE
 from marketplaces.base_parser import BaseParser, OrderItem
 
@@ -110,8 +109,8 @@ class EtsyParser(BaseParser):
             height = float(size[1].strip())
             return float(min(width, height))
         except (AttributeError, ValueError):
-            cprint(
-                tr("||| Could not get the smaller size for sheet routing |||"), "error"
+            cmessage(
+                "||| Could not get the smaller size for sheet routing |||", "error"
             )
             return ERROR_VALUE
 
@@ -137,7 +136,7 @@ class EtsyParser(BaseParser):
                     date_str = date_match.group()
                     date_obj = datetime.datetime.strptime(date_str, "%b %d, %Y")
                     formatted = date_obj.strftime("%d.%m.%Y")
-                    cprint(f"- {tr('Ship by')}: {formatted}", "success")
+                    cfield("Ship by", formatted)
                     return formatted
 
             if "Ship by" in block_text:
@@ -146,7 +145,7 @@ class EtsyParser(BaseParser):
                     date_str = date_match.group(1)
                     date_obj = datetime.datetime.strptime(date_str, "%b %d, %Y")
                     formatted = date_obj.strftime("%d.%m.%Y")
-                    cprint(f"- {tr('Ship by')}: {formatted}", "success")
+                    cfield("Ship by", formatted)
                     return formatted
 
             return self._today()
@@ -163,17 +162,18 @@ class EtsyParser(BaseParser):
             for match in listing_url_matches:
                 listing_url = match.group(1)
                 listing_urls.append(listing_url)
-                cprint(f"- {tr('Listing link')}: {listing_url}", "success")
+                cfield("Listing link", listing_url)
 
             if not listing_urls:
-                cprint(tr("||| No listing links found |||"), "error")
+                cmessage("||| No listing links found |||", "error")
                 return [ERROR_VALUE]
 
             return listing_urls
         except Exception as e:
-            cprint(
-                tr("||| Error while getting the listing links: {error} |||", error=e),
+            cmessage(
+                "||| Error while getting the listing links: {error} |||",
                 "error",
+                error=e,
             )
             return [ERROR_VALUE]
 
@@ -187,10 +187,10 @@ class EtsyParser(BaseParser):
                 .find("a", classname="text-gray-darker")
                 .text.strip()
             )
-            cprint(f"- {tr('Shop name')}: {store_title}", "success")
+            cfield("Shop name", store_title)
             return store_title
         except AttributeError:
-            cprint(tr("||| Could not get the shop name |||"), "error")
+            cmessage("||| Could not get the shop name |||", "error")
             return ERROR_VALUE
 
     def __get_order_id(self) -> str:
@@ -203,10 +203,10 @@ class EtsyParser(BaseParser):
                 .find("a", classname="strong")
                 .text.strip()
             )
-            cprint(f"- {tr('Order ID')}: {order_id}", "success")
+            cfield("Order ID", order_id)
             return order_id
         except AttributeError:
-            cprint(tr("||| Could not get the order ID |||"), "error")
+            cmessage("||| Could not get the order ID |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -225,10 +225,10 @@ class EtsyParser(BaseParser):
                     if listing_link
                     else item.select_one("p.wt-text-title-small--tight").text.strip()
                 )
-            cprint(f"- {tr('Product title')}: {listing_title}", "success")
+            cfield("Product title", listing_title)
             return listing_title
         except AttributeError:
-            cprint(tr("||| Could not get the listing title |||"), "error")
+            cmessage("||| Could not get the listing title |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -242,17 +242,15 @@ class EtsyParser(BaseParser):
                 .text.strip()
             )
         except AttributeError:
-            cprint(
-                tr(
-                    "The SKU is not specified on the listing, trying to get it from the product title"
-                ),
+            cmessage(
+                "The SKU is not specified on the listing, trying to get it from the product title",
                 "warning",
             )
             sku = listing_title.split(" ")[-1]
             if sku.isdigit():
                 sku = listing_title.split(" ")[-2:]
                 sku = " ".join(sku)
-        cprint(f"- {tr('Item SKU')}: {sku}", "success")
+        cfield("Item SKU", sku)
         return sku
 
     def __get_address(self) -> str:
@@ -287,11 +285,11 @@ class EtsyParser(BaseParser):
             full_address += f"{address_parts.get('city', '')}, {address_parts.get('state', '')} {address_parts.get('zip_code', '')}\n"
             full_address += f"{address_parts.get('country_name', '')}"
 
-            cprint(f"- {tr('Customer address')}:\n{full_address}", "success")
+            cfield("Customer address", full_address)
             return full_address
 
         except AttributeError:
-            cprint(tr("||| Could not get the customer address |||"), "error")
+            cmessage("||| Could not get the customer address |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -314,7 +312,7 @@ class EtsyParser(BaseParser):
             customization_items = re.sub(
                 r"\bNon\s*-\s*Woven\b", "Non-Woven", customization_items, flags=re.I
             )
-            cprint(f"- {tr('Customization')}:\n{customization_items}", "success")
+            cfield("Customization", customization_items)
             return customization_items
         except AttributeError:
             return ""
@@ -337,20 +335,18 @@ class EtsyParser(BaseParser):
             if size_pattern and len(size_pattern) >= 2:
                 width, height = size_pattern[:2]
                 size = f"{width}x{height}"
-                cprint(f"- {tr('Product size')}: {size} inches", "success")
+                cfield("Product size", f"{size} inches")
                 return size
             else:
-                cprint(
-                    tr(
-                        "||| Could not recognize the size from the text: {text} |||",
-                        text=size_text,
-                    ),
+                cmessage(
+                    "||| Could not recognize the size from the text: {text} |||",
                     "warning",
+                    text=size_text,
                 )
                 return ERROR_VALUE
 
         except AttributeError:
-            cprint(tr("||| Could not get the product size |||"), "error")
+            cmessage("||| Could not get the product size |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -358,10 +354,10 @@ class EtsyParser(BaseParser):
         """Extracts the item quantity in the order"""
         try:
             quantity = item.select_one("td.col-xs-2.pl-xs-0.text-center").text.strip()
-            cprint(f"- {tr('Quantity')}: {quantity}", "success")
+            cfield("Quantity", quantity)
             return int(quantity)
         except AttributeError:
-            cprint(tr("||| Could not get the quantity |||"), "error")
+            cmessage("||| Could not get the quantity |||", "error")
             return ERROR_VALUE
 
     def __get_shipping_price(self) -> float | str:
@@ -378,16 +374,13 @@ class EtsyParser(BaseParser):
                     )
                     shipping_price = price_div.text.strip()
                     shipping_price_value = self._parse_money(shipping_price)
-                    cprint(
-                        f"- {tr('Shipping price charged')}: {shipping_price_value}",
-                        "success",
-                    )
+                    cfield("Shipping price charged", shipping_price_value)
                     return shipping_price_value
 
-            cprint(tr("||| Shipping price charged not found |||"), "error")
+            cmessage("||| Shipping price charged not found |||", "error")
             return ERROR_VALUE
         except AttributeError:
-            cprint(tr("||| Shipping price charged not found |||"), "error")
+            cmessage("||| Shipping price charged not found |||", "error")
             return ERROR_VALUE
 
     def __get_items_total(self) -> float | str:
@@ -399,10 +392,10 @@ class EtsyParser(BaseParser):
                 .text.strip()
             )
             items_total = self._parse_money(items_total)
-            cprint(f"- {tr('Items total')}: {items_total}", "success")
+            cfield("Items total", items_total)
             return items_total
         except (AttributeError, ValueError):
-            cprint(tr("||| Could not get the items total |||"), "error")
+            cmessage("||| Could not get the items total |||", "error")
             return ERROR_VALUE
 
     def __get_shipping_total_value(self) -> int | float | str:
@@ -419,10 +412,10 @@ class EtsyParser(BaseParser):
                     shipping_cost = self._parse_money(total.text)
                     total_shipping += shipping_cost
 
-            cprint(f"- {tr('Shipping paid by us')}: {total_shipping}", "success")
+            cfield("Shipping paid by us", total_shipping)
             return total_shipping
         except (AttributeError, ValueError):
-            cprint(tr("||| Could not get the shipping amount we paid |||"), "error")
+            cmessage("||| Could not get the shipping amount we paid |||", "error")
             return ERROR_VALUE
 
     def __get_postal_service(self) -> str | None | Any:
@@ -436,7 +429,7 @@ class EtsyParser(BaseParser):
             )
             if postal_service == "UPS®":
                 postal_service = postal_service.strip("®")
-            cprint(f"- {tr('Carrier')}: {postal_service}", "success")
+            cfield("Carrier", postal_service)
             return postal_service
         except AttributeError:
             try:
@@ -449,16 +442,14 @@ class EtsyParser(BaseParser):
                         if "Shipped" in p.text or "Shipping" in p.text:
                             postal_service = p.text.split(" ")[-1]
 
-                            cprint(
-                                f"- {tr('Carrier (label bought outside Etsy)')}: "
-                                f"{postal_service}",
-                                "success",
+                            cfield(
+                                "Carrier (label bought outside Etsy)", postal_service
                             )
                             return postal_service
-                cprint(tr("||| Could not get the carrier name |||"), "error")
+                cmessage("||| Could not get the carrier name |||", "error")
                 return ERROR_VALUE
             except AttributeError:
-                cprint(tr("||| Could not get the carrier name |||"), "error")
+                cmessage("||| Could not get the carrier name |||", "error")
                 return ERROR_VALUE
 
     def __get_tracking_number(self) -> str:
@@ -467,10 +458,10 @@ class EtsyParser(BaseParser):
             tracking_number = (
                 self.soup.find("div", class_="col-xs-9 wt-wrap").find("a").text.strip()
             )
-            cprint(f"- {tr('Tracking number')}: {tracking_number}", "success")
+            cfield("Tracking number", tracking_number)
             return tracking_number
         except AttributeError:
-            cprint(tr("||| Could not get the tracking number |||"), "error")
+            cmessage("||| Could not get the tracking number |||", "error")
             return ERROR_VALUE
 
     def __get_tracking_link(
@@ -485,7 +476,7 @@ class EtsyParser(BaseParser):
                 self.soup.find("div", class_="col-xs-9 wt-wrap").find("a").get("href")
             )
         except AttributeError:
-            cprint(tr("||| Could not get the tracking link |||"), "error")
+            cmessage("||| Could not get the tracking link |||", "error")
             return ERROR_VALUE
 
     def __get_shipping_type(self) -> str:
@@ -498,10 +489,10 @@ class EtsyParser(BaseParser):
             )
             if shipping_type == "Standard Shipping":
                 shipping_type = "Standard"
-            cprint(f"- {tr('Shipping method')}: {shipping_type}", "success")
+            cfield("Shipping method", shipping_type)
             return shipping_type
         except AttributeError:
-            cprint(tr("||| Shipping method not found |||"), "error")
+            cmessage("||| Shipping method not found |||", "error")
             return ERROR_VALUE
 
     def __get_gift_details(self) -> str | None:
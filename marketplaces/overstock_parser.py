@@ -5,8 +5,7 @@ import re
 from typing import Any
 
 
-from core.console import cprint
-from core.i18n import tr
+from core.console import cfield, cmessage
 from core.constants import ERROR_VALUE
 from marketplaces.base_parser import BaseParser, OrderItem
 
@@ -85,21 +84,21 @@ class OverstockParser(BaseParser):
             for el in order_id_div:
                 if el.find("h6").text.strip() == "Retailer Order #":
                     order_id = el.find("p").text.strip()
-                    cprint(f"- {tr('Order ID')}: {order_id}", "success")
+                    cfield("Order ID", order_id)
                     return order_id
             return None
         except AttributeError:
-            cprint(tr("||| Could not get the order ID |||"), "error")
+            cmessage("||| Could not get the order ID |||", "error")
             return ERROR_VALUE
 
     def __get_store_title(self) -> str:
         """Extracts the shop name"""
         try:
             store_title = self.soup.find("div", id="soChannel").find("p").text.strip()
-            cprint(f"- {tr('Shop name')}: {store_title}", "success")
+            cfield("Shop name", store_title)
             return store_title
         except AttributeError:
-            cprint(tr("||| Could not get the shop name |||"), "error")
+            cmessage("||| Could not get the shop name |||", "error")
             return ERROR_VALUE
 
     def __get_address(self) -> str | None:
@@ -112,10 +111,10 @@ class OverstockParser(BaseParser):
                 for address_parts in address_parts
                 if address_parts.strip()
             )
-            cprint(f"- {tr('Shipping address')}:\n{address}", "success")
+            cfield("Shipping address", address)
             return address
         except AttributeError:
-            cprint(tr("||| Could not get the shipping address |||"), "error")
+            cmessage("||| Could not get the shipping address |||", "error")
             return ERROR_VALUE
 
     def __get_items_total(self) -> float | str:
@@ -126,10 +125,10 @@ class OverstockParser(BaseParser):
             for row in items_rows:
                 items_total += float(row.text.strip().replace("$", ""))
 
-            cprint(f"- {tr('Order total')}: {items_total}", "success")
+            cfield("Order total", items_total)
             return items_total
         except AttributeError:
-            cprint(tr("||| Could not get the order total |||"), "error")
+            cmessage("||| Could not get the order total |||", "error")
             return ERROR_VALUE
 
     def __get_listing_links(self) -> list[str]:
@@ -143,17 +142,18 @@ class OverstockParser(BaseParser):
             for match in listing_url_matches:
                 listing_url = match.group(1)
                 listing_urls.append(listing_url)
-                cprint(f"- {tr('Listing link')}: {listing_url}", "success")
+                cfield("Listing link", listing_url)
 
             if not listing_urls:
-                cprint(tr("||| No listing links found |||"), "error")
+                cmessage("||| No listing links found |||", "error")
                 return [ERROR_VALUE]
 
             return listing_urls
         except Exception as e:
-            cprint(
-                tr("||| Error while getting the listing links: {error} |||", error=e),
+            cmessage(
+                "||| Error while getting the listing links: {error} |||",
                 "error",
+                error=e,
             )
             return [ERROR_VALUE]
 
@@ -164,10 +164,10 @@ class OverstockParser(BaseParser):
             listing_title = item.find("p", class_="listing-title")
             if listing_title:
                 listing_title = listing_title.text.strip()
-            cprint(f"- {tr('Product title')}: {listing_title}", "success")
+            cfield("Product title", listing_title)
             return listing_title
         except AttributeError:
-            cprint(tr("||| Could not get the listing title |||"), "error")
+            cmessage("||| Could not get the listing title |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -175,10 +175,10 @@ class OverstockParser(BaseParser):
         """Extracts the SKU"""
         try:
             sku = item.find("div").text.strip()
-            cprint(f"- {tr('Item SKU')}: {sku}", "success")
+            cfield("Item SKU", sku)
             return sku
         except AttributeError:
-            cprint(tr("||| Could not get the SKU |||"), "error")
+            cmessage("||| Could not get the SKU |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -226,17 +226,17 @@ class OverstockParser(BaseParser):
                 customization_list.append(color_customization)
 
             customization = "\n".join(customization_list)
-            cprint(f"- {tr('Customization')}:\n{customization}", "success")
+            cfield("Customization", customization)
             return customization
 
         except AttributeError:
-            cprint(
-                tr("||| Could not get the customization, it may not be specified |||"),
+            cmessage(
+                "||| Could not get the customization, it may not be specified |||",
                 "warning",
             )
             return ""
         except ValueError as e:
-            cprint(tr("||| Error: {error} |||", error=e), "error")
+            cmessage("||| Error: {error} |||", "error", error=e)
             return ""
 
     @staticmethod
@@ -246,10 +246,10 @@ class OverstockParser(BaseParser):
             quantity_cell = item.find_previous_sibling("td", id="lineQuantityCell")
             if quantity_cell:
                 quantity = quantity_cell.text.strip()
-                cprint(f"- {tr('Quantity')}: {quantity}", "success")
+                cfield("Quantity", quantity)
                 return int(quantity)
         except AttributeError:
-            cprint(tr("||| Could not get the quantity |||"), "error")
+            cmessage("||| Could not get the quantity |||", "error")
         return ERROR_VALUE
 
     def __get_postal_service(self) -> str:
@@ -258,10 +258,10 @@ class OverstockParser(BaseParser):
             postal_service = self.soup.find_all(
                 "span", class_="carrierCode existing_carrier"
             )[0].text.strip()
-            cprint(f"- {tr('Carrier')}: {postal_service}", "success")
+            cfield("Carrier", postal_service)
             return postal_service
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the carrier |||"), "error")
+            cmessage("||| Could not get the carrier |||", "error")
             return ERROR_VALUE
 
     def __get_tracking_number(self) -> str:
@@ -270,10 +270,10 @@ class OverstockParser(BaseParser):
             tracking_number = self.soup.find_all(
                 "span", class_="existing_tracking_number"
             )[0].text.strip()
-            cprint(f"- {tr('Tracking number')}: {tracking_number}", "success")
+            cfield("Tracking number", tracking_number)
             return tracking_number
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the tracking number |||"), "error")
+            cmessage("||| Could not get the tracking number |||", "error")
             return ERROR_VALUE
 
     def __get_tracking_link(
@@ -291,7 +291,7 @@ class OverstockParser(BaseParser):
             )
             return tracking_link
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the tracking link |||"), "error")
+            cmessage("||| Could not get the tracking link |||", "error")
             return ERROR_VALUE
 
     def __get_shipping_type(self) -> str:
@@ -300,10 +300,10 @@ class OverstockParser(BaseParser):
             shipping_type = (
                 self.soup.find("div", id="soShipMethod").find("p").text.strip()
             )
-            cprint(f"- {tr('Shipping method')}: {shipping_type}", "success")
+            cfield("Shipping method", shipping_type)
             return shipping_type
         except AttributeError:
-            cprint(tr("||| Could not get the shipping method |||"), "error")
+            cmessage("||| Could not get the shipping method |||", "error")
             return ERROR_VALUE
 
     def __ship_by_date(self) -> str:
@@ -317,10 +317,10 @@ class OverstockParser(BaseParser):
                 formatted_date = datetime.datetime.strptime(
                     ship_by_date, "%m/%d/%Y"
                 ).strftime("%d.%m.%Y")
-                cprint(f"- {tr('Ship by')}: {formatted_date}", "success")
+                cfield("Ship by", formatted_date)
                 return formatted_date
             return self._today()
         except (AttributeError, IndexError):
             formatted_date = self._today()
-            cprint(f"- {tr('Ship by')}: {formatted_date}", "success")
+            cfield("Ship by", formatted_date)
             return formatted_date
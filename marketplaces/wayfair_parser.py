@@ -5,8 +5,7 @@ import re
 from typing import Any
 
 
-from core.console import cprint
-from core.i18n import tr
+from core.console import cfield, cmessage
 from core.constants import ERROR_VALUE, WALLPAPER_PATTERN
 from marketplaces.base_parser import BaseParser, OrderItem
 
@@ -86,10 +85,10 @@ class WayfairParser(BaseParser):
                 class_="b62nt518y mb5j687 mb5j68d mb5j68v",
                 attrs={"data-hb-id": "Heading"},
             ).text.strip()
-            cprint(f"- {tr('Order ID')}: {order_id}", "success")
+            cfield("Order ID", order_id)
             return order_id
         except AttributeError:
-            cprint(tr("||| Could not get the order ID |||"), "error")
+            cmessage("||| Could not get the order ID |||", "error")
             return ERROR_VALUE
 
     def __get_store_title(self) -> str:
@@ -98,10 +97,10 @@ class WayfairParser(BaseParser):
             store_title = self.soup.find_all(
                 "strong", {"data-tag-default": "order-details_orderDetails_strong"}
             )[-1].text.strip()
-            cprint(f"- {tr('Shop name')}: {store_title}", "success")
+            cfield("Shop name", store_title)
             return store_title
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the shop name |||"), "error")
+            cmessage("||| Could not get the shop name |||", "error")
             return ERROR_VALUE
 
     def __get_address(self) -> str | None:
@@ -112,11 +111,11 @@ class WayfairParser(BaseParser):
             )[0]
             if address_block:
                 address = "\n".join(address_block.stripped_strings)
-                cprint(f"- {tr('Shipping address')}:\n{address}", "success")
+                cfield("Shipping address", address)
                 return address
             return None
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the shipping address |||"), "error")
+            cmessage("||| Could not get the shipping address |||", "error")
             return ERROR_VALUE
 
     def __get_items_total(self) -> float | str:
@@ -126,10 +125,10 @@ class WayfairParser(BaseParser):
                 "strong", attrs={"data-tag-default": "order-details_orderDetails_Text"}
             )[4].text.strip()
             items_total = float(items_total.strip("$").replace(",", ""))
-            cprint(f"- {tr('Order total')}: {items_total}", "success")
+            cfield("Order total", items_total)
             return items_total
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the order total |||"), "error")
+            cmessage("||| Could not get the order total |||", "error")
             return ERROR_VALUE
 
     def __get_postal_service(self) -> str:
@@ -147,10 +146,10 @@ class WayfairParser(BaseParser):
                 postal_service = "USPS"
             if postal_service == "United Parcel Service":
                 postal_service = "UPS"
-            cprint(f"- {tr('Carrier')}: {postal_service}", "success")
+            cfield("Carrier", postal_service)
             return postal_service
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the carrier |||"), "error")
+            cmessage("||| Could not get the carrier |||", "error")
             return ERROR_VALUE
 
     def __get_tracking_number(self) -> str:
@@ -175,10 +174,10 @@ class WayfairParser(BaseParser):
             if ", " in tracking_number:
                 tracking_number = tracking_number.split(", ")
                 tracking_number = "\n".join(tracking_number)
-            cprint(f"- {tr('Tracking number')}: {tracking_number}", "success")
+            cfield("Tracking number", tracking_number)
             return tracking_number
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the tracking number |||"), "error")
+            cmessage("||| Could not get the tracking number |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -212,12 +211,12 @@ class WayfairParser(BaseParser):
                     tracking_links[tracking_link] = None
 
             if not tracking_links:
-                cprint(tr("||| Could not get the tracking link |||"), "error")
+                cmessage("||| Could not get the tracking link |||", "error")
                 return ERROR_VALUE
 
             return "\n\n".join(tracking_links)
         except AttributeError:
-            cprint(tr("||| Could not get the tracking link |||"), "error")
+            cmessage("||| Could not get the tracking link |||", "error")
             return ERROR_VALUE
 
     def __get_shipping_type(self) -> str:
@@ -228,10 +227,10 @@ class WayfairParser(BaseParser):
             )[8].text.strip()
             if shipping_type.startswith("FedEx"):
                 shipping_type = shipping_type.replace("FedEx", "").strip()
-            cprint(f"- {tr('Shipping method')}: {shipping_type}", "success")
+            cfield("Shipping method", shipping_type)
             return shipping_type
         except (AttributeError, IndexError):
-            cprint(tr("||| Could not get the shipping method |||"), "error")
+            cmessage("||| Could not get the shipping method |||", "error")
             return ERROR_VALUE
 
     def __ship_by_date(self) -> str:
@@ -243,11 +242,11 @@ class WayfairParser(BaseParser):
             formatted_date = datetime.datetime.strptime(
                 ship_by_date, "%m/%d/%Y"
             ).strftime("%d.%m.%Y")
-            cprint(f"- {tr('Ship by')}: {formatted_date}", "success")
+            cfield("Ship by", formatted_date)
             return formatted_date
         except (AttributeError, IndexError):
             formatted_date = self._today()
-            cprint(f"- {tr('Ship by')}: {formatted_date}", "success")
+            cfield("Ship by", formatted_date)
             return formatted_date
 
     def __get_listing_links(self) -> list[str]:
@@ -260,17 +259,18 @@ class WayfairParser(BaseParser):
             for match in listing_url_matches:
                 listing_url = match.group(1)
                 listing_urls.append(listing_url)
-                cprint(f"- {tr('Listing link')}: {listing_url}", "success")
+                cfield("Listing link", listing_url)
 
             if not listing_urls:
-                cprint(tr("||| No listing links found |||"), "error")
+                cmessage("||| No listing links found |||", "error")
                 return [ERROR_VALUE]
 
             return listing_urls
         except Exception as e:
-            cprint(
-                tr("||| Error while getting the listing links: {error} |||", error=e),
+            cmessage(
+                "||| Error while getting the listing links: {error} |||",
                 "error",
+                error=e,
             )
             return [ERROR_VALUE]
 
@@ -291,10 +291,10 @@ class WayfairParser(BaseParser):
                 if title.find_parent("div", class_="b62nt5ct")
             ]
             listing_title = "".join(listing_titles)
-            cprint(f"- {tr('Product title')}: {listing_title}", "success")
+            cfield("Product title", listing_title)
             return listing_title
         except AttributeError:
-            cprint(tr("||| Could not get the listing title |||"), "error")
+            cmessage("||| Could not get the listing title |||", "error")
             return ERROR_VALUE
 
     @staticmethod
@@ -310,10 +310,10 @@ class WayfairParser(BaseParser):
                 )
             ]
             sku = "".join(skus)
-            cprint(f"- {tr('Item SKU')}: {sku}", "success")
+            cfield("Item SKU", sku)
             return sku
         except AttributeError:
-            cprint(tr("||| Could not get the SKU |||"), "error")
+            cmessage("||| Could not get the SKU |||", "error")
             return ERROR_VALUE
 
     def __get_customization(
@@ -352,17 +352,17 @@ class WayfairParser(BaseParser):
                     customization_list.append(f"Personalization: {customization_text}")
 
             customization = "\n".join(customization_list)
-            cprint(f"- {tr('Customization')}:\n{customization}", "success")
+            cfield("Customization", customization)
             return customization
 
         except AttributeError:
-            cprint(
-                tr("||| Could not get the customization, it may not be specified |||"),
+            cmessage(
+                "||| Could not get the customization, it may not be specified |||",
                 "warning",
             )
             return ""
         except ValueError as e:
-            cprint(tr("||| Error: {error} |||", error=e), "error")
+            cmessage("||| Error: {error} |||", "error", error=e)
             return ""
 
     def __get_material_from_sku(self) -> str | None:
@@ -452,8 +452,8 @@ class WayfairParser(BaseParser):
                 )
             ]
             quantity = "".join(quantities[2])
-            cprint(f"- {tr('Quantity')}: {quantity}", "success")
+            cfield("Quantity", quantity)
             return int(quantity)
         except AttributeError:
-            cprint(tr("||| Could not get the quantity |||"), "error")
+            cmessage("||| Could not get the quantity |||", "error")
             return ERROR_VALUE
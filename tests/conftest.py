@@ -4,7 +4,41 @@ require no config/.env and never touch the network."""
 import os
 import sys
 
+import pytest
+
 os.environ.setdefault("TABLE_ID", "test-table-id")
 os.environ.setdefault("SHIPPING_LABEL_FOLDER", "test-folder-id")
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_spool(tmp_path, monkeypatch):
+    """Runs never read or fill the real offline spool and run history next
+    to the project."""
+    import core.history
+    import core.spool
+
+    monkeypatch.setattr(
+        core.spool, "get_spool_path", lambda: str(tmp_path / "spool.sqlite3")
+    )
+    monkeypatch.setattr(
+        core.history, "get_history_path", lambda: str(tmp_path / "history.sqlite3")
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_logs(tmp_path, monkeypatch):
+    """File logs, run reports, profiles and the event log go to the test's
+    temporary folder, never into logs/ of the working tree."""
+    import core.console
+    import core.event_log
+    import core.paths
+    import core.timing
+
+    logs_dir = str(tmp_path / "logs")
+    modules = [core.paths, core.console, core.event_log, core.timing]
+    if "ui.backend" in sys.modules:
+        modules.append(sys.modules["ui.backend"])
+    for module in modules:
+        monkeypatch.setattr(module, "get_logs_dir", lambda: logs_dir)
@@ -0,0 +1,93 @@
+"""Google API call accounting."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from google_api.stats import ApiStats, CountingHttp, classify
+
+SHEET = "https://sheets.googleapis.com/v4/spreadsheets/abc123"
+DRIVE = "https://www.googleapis.com/drive/v3/files"
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "expected"),
+    [
+        ("GET", SHEET + "?includeGridData=false", ("sheets", "spreadsheets.get")),
+        ("POST", SHEET + ":batchUpdate", ("sheets", "spreadsheets.batchUpdate")),
+        ("PUT", SHEET + "/values/%27a%27%21A5", ("sheets", "values.update")),
+        ("GET", SHEET + "/values:batchGet?ranges=x", ("sheets", "values.batchGet")),
+        ("POST", SHEET + "/values/A1:append", ("sheets", "values.append")),
+        ("GET", DRIVE + "?q=name", ("drive", "files.list")),
+        ("GET", DRIVE + "/fileId", ("drive", "files.get")),
+        (
+            "POST",
+            "https://www.googleapis.com/upload/drive/v3/files?uploadType=multipart",
+            ("drive", "files.create"),
+        ),
+    ],
+)
+def test_requests_are_mapped_to_api_methods(method, url, expected):
+    assert classify(method, url) == expected
+
+
+def test_counts_bytes_errors_throttling_and_retries():
+    stats = ApiStats(clock=lambda: 100.0)
+    url = SHEET + "/values/A1"
+
+    stats.record("PUT", url, 429, 0.2, sent=100, received=50)
+    stats.record("PUT", url, 200, 0.1, sent=100, received=60)
+    stats.record("PUT", url, 200, 0.3, sent=100, received=60)
+    stats.count("writer.append_order")
+
+    snapshot = stats.snapshot()
+    method = snapshot["methods"]["sheets values.update"]
+    assert method["calls"] == 3
+    assert (method["errors"], method["throttled"], method["retries"]) == (1, 1, 1)
+    assert (method["bytes_sent"], method["bytes_received"]) == (300, 170)
+    assert method["max_seconds"] == 0.3
+    assert snapshot["operations"] == {"writer.append_order": 1}
+    assert snapshot["per_minute"]["sheets.write"] == 3
+    assert snapshot["peak_per_minute"]["sheets.write"] == 3
+
+    summary = stats.summary()
+    assert summary["sheetsCalls"] == 3
+    assert (summary["throttled"], summary["retries"]) == (1, 1)
+    assert summary["sheetsWritesPerMinute"] == 3
+    assert summary["sheetsWritesQuota"] == 60
+    assert len(stats.report_lines()) > 3
+
+
+def test_rolling_window_forgets_old_requests_but_reset_keeps_it():
+    now = [0.0]
+    stats = ApiStats(clock=lambda: now[0])
+    stats.record("GET", DRIVE + "?q=a", 200, 0.05)
+    now[0] = 30.0
+    stats.record("GET", DRIVE + "?q=b", 200, 0.05)
+
+    stats.reset()
+    assert stats.snapshot()["methods"] == {}
+    assert stats.per_minute()["drive.read"] == 2
+
+    now[0] = 75.0
+    assert stats.per_minute()["drive.read"] == 1
+
+
+def test_counting_http_records_drive_requests():
+    stats = ApiStats()
+    inner = SimpleNamespace(
+        request=lambda uri, method, body=None, **kwargs: (
+            SimpleNamespace(status=200),
+            b'{"files": []}',
+        ),
+        credentials="creds",
+    )
+    http = CountingHttp(inner, stats)
+
+    response, content = http.request(DRIVE + "?q=x", "GET", headers={})
+
+    assert response.status == 200
+    assert content == b'{"files": []}'
+    assert http.credentials == "creds"
+    method = stats.snapshot()["methods"]["drive files.list"]
+    assert (method["calls"], method["bytes_received"]) == (1, 13)
@@ -0,0 +1,85 @@
+"""Credential manager tests: proactive refresh without touching the network."""
+
+import threading
+from datetime import UTC, datetime, timedelta
+
+from google_api.auth import CredentialManager
+
+
+def _utcnow():
+    # google-auth keeps the expiry as naive UTC
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class _FakeCredentials:
+    def __init__(self, expires_in=None):
+        self.token = "t" if expires_in is not None else None
+        self.expiry = (
+            _utcnow() + timedelta(seconds=expires_in)
+            if expires_in is not None
+            else None
+        )
+        self.refreshed = threading.Event()
+        self.refresh_count = 0
+
+    def refresh(self, request):
+        self.refresh_count += 1
+        self.token = f"t{self.refresh_count}"
+        self.expiry = _utcnow() + timedelta(hours=1)
+        self.refreshed.set()
+
+
+def _manager(credentials, margin=300):
+    return CredentialManager(
+        loader=lambda: credentials, request_factory=object, margin=margin
+    )
+
+
+def test_credentials_are_loaded_once_and_shared():
+    loads = []
+    manager = CredentialManager(
+        loader=lambda: loads.append(1) or _FakeCredentials(), request_factory=object
+    )
+    assert manager.credentials() is manager.credentials()
+    assert loads == [1]
+
+
+def test_missing_token_is_fetched():
+    credentials = _FakeCredentials()
+    _manager(credentials).refresh_if_needed()
+    assert credentials.refresh_count == 1
+
+
+def test_token_close_to_expiry_is_refreshed_early():
+    credentials = _FakeCredentials(expires_in=120)
+    _manager(credentials, margin=300).refresh_if_needed()
+    assert credentials.refresh_count == 1
+
+
+def test_fresh_token_is_left_alone():
+    credentials = _FakeCredentials(expires_in=3000)
+    _manager(credentials, margin=300).refresh_if_needed()
+    assert credentials.refresh_count == 0
+
+
+def test_warm_up_refreshes_in_the_background():
+    credentials = _FakeCredentials()
+    manager = _manager(credentials)
+    try:
+        manager.warm_up()
+        manager.warm_up()
+        assert credentials.refreshed.wait(timeout=2)
+    finally:
+        manager.stop()
+    assert credentials.refresh_count == 1
+
+
+def test_warm_up_survives_loader_errors():
+    def broken():
+        raise FileNotFoundError("config/token.json")
+
+    manager = CredentialManager(loader=broken, request_factory=object)
+    try:
+        manager.warm_up()
+    finally:
+        manager.stop()
@@ -0,0 +1,97 @@
+"""Benchmark harness tests: synthetic pages still match the parsers, and the
+regression check compares like with like."""
+
+import pytest
+
+from bench.fakes import HEADERS, OfflineFinder, OfflineWriter
+from bench.generators import GENERATORS, generate, orders_file
+from bench.runner import compare, config_from_argv, find_baseline, save_record
+from core import console
+from core.constants import COL_FILE_LINK, COL_ORDER_ID, ERROR_VALUE, FILE_NOT_FOUND
+from core.dispatcher import detect_marketplace
+from core.processor import process_order_list, split_orders
+
+
+@pytest.mark.parametrize("marketplace", list(GENERATORS))
+def test_generated_pages_are_detected_and_parsed(marketplace):
+    page = generate(marketplace, 7, items=3, filler_kb=4)
+    spec = detect_marketplace(page)
+    assert spec is not None and spec.name == marketplace
+
+    with console.capture() as events:
+        parser = spec.parser_cls(page, finder=OfflineFinder())
+        rows = parser.parse_order()
+        assert isinstance(parser.get_smaller_size(), float)
+
+    assert len(rows) == 3
+    for row in rows:
+        assert row[COL_ORDER_ID]
+        assert ERROR_VALUE not in row.values()
+    assert rows[0][COL_FILE_LINK] != FILE_NOT_FOUND
+    assert not [e for e in events if e.level == "error"]
+
+
+def test_mixed_batch_runs_end_to_end_offline():
+    orders = split_orders(orders_file(10, items=2))
+    writer = OfflineWriter()
+    results = []
+    ok, failed = process_order_list(
+        orders, writer=writer, finder=OfflineFinder(), result_callback=results.append
+    )
+    assert (ok, failed) == (10, 0)
+    rows = [
+        row
+        for worksheet in writer.spreadsheet.worksheets.values()
+        for row in worksheet.rows[1:]
+    ]
+    assert len(rows) == 20
+    assert all(len(row) == len(HEADERS) for row in rows)
+    assert {r.marketplace for r in results} == set(GENERATORS)
+
+
+def _record(commit, best_ms, **workload):
+    return {
+        "commit": commit,
+        "dirty": False,
+        "created": f"2026-01-01T00:00:0{len(commit) % 10}",
+        "workload": {"items": 3, **workload},
+        "results": {"etsy.soup": {"best_ms": best_ms}},
+    }
+
+
+def test_regressions_over_the_threshold_are_reported():
+    baseline = _record("aaa", 10.0)
+    assert compare(_record("bbb", 12.0), baseline, threshold=0.25) == []
+    ((name, previous, current, change),) = compare(
+        _record("bbb", 13.0), baseline, threshold=0.25
+    )
+    assert (name, previous, current) == ("etsy.soup", 10.0, 13.0)
+    assert change == pytest.approx(0.3)
+
+
+def test_baseline_is_the_latest_other_commit_on_the_same_workload(tmp_path):
+    save_record(_record("a1", 10.0), str(tmp_path))
+    save_record(_record("b22", 11.0, filler_kb=1), str(tmp_path))
+    current = _record("c333", 12.0)
+    save_record(current, str(tmp_path))
+
+    assert find_baseline(current, results_dir=str(tmp_path))["commit"] == "a1"
+    assert find_baseline(current, "c3", results_dir=str(tmp_path))["commit"] == "c333"
+    assert find_baseline(current, "b2", results_dir=str(tmp_path)) is None
+
+
+def test_bench_options_are_read_from_argv():
+    config = config_from_argv(
+        [
+            "--items",
+            "5",
+            "--marketplace",
+            "etsy,EBAY",
+            "--threshold",
+            "0.1",
+            "--no-save",
+        ]
+    )
+    assert (config.items, config.threshold, config.save) == (5, 0.1, False)
+    assert config.marketplaces == ("Etsy", "Ebay")
+    assert config_from_argv([]).marketplaces == tuple(GENERATORS)
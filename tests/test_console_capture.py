@@ -7,7 +7,7 @@ from core import console
 
 def test_capture_buffers_and_replay_emits_in_order():
     received = []
-    console.subscribe(lambda text, level: received.append((text, level)))
+    console.subscribe(lambda event: received.append((event.text, event.level)))
     try:
         with console.capture() as lines:
             console.cprint("inside the buffer", level="success")
@@ -23,14 +23,16 @@ def test_capture_buffers_and_replay_emits_in_order():
 def test_capture_is_thread_local():
     """One thread's buffer never captures another thread's output."""
     received = []
-    console.subscribe(lambda text, level: received.append(text))
+    console.subscribe(lambda event: received.append(event.text))
     barrier = threading.Barrier(2)
 
     def worker():
         with console.capture() as lines:
             barrier.wait()
             console.cprint("from the worker thread")
-        assert lines == ["info:from the worker thread"]
+        assert [(e.level, e.text) for e in lines] == [
+            ("info", "from the worker thread")
+        ]
 
     thread = threading.Thread(target=worker)
     thread.start()
@@ -49,13 +51,13 @@ def test_nested_capture_restores_previous_buffer():
         with console.capture() as inner:
             console.cprint("b")
         console.cprint("c")
-    assert inner == ["info:b"]
-    assert outer == ["info:a", "info:c"]
+    assert [e.text for e in inner] == ["b"]
+    assert [e.text for e in outer] == ["a", "c"]
 
 
 def test_level_controls_subscriber_output():
     received = []
-    console.subscribe(lambda text, level: received.append((text, level)))
+    console.subscribe(lambda event: received.append((event.text, event.level)))
     try:
         with console.capture() as lines:
             console.cprint("all good", level="success")
@@ -74,7 +76,7 @@ def test_level_controls_subscriber_output():
 def test_style_does_not_affect_level_sent_to_subscribers():
     """style= overrides terminal color but subscribers still get the level."""
     received = []
-    console.subscribe(lambda text, level: received.append((text, level)))
+    console.subscribe(lambda event: received.append((event.text, event.level)))
     try:
         with console.capture() as lines:
             console.cprint("etsy banner", level="header", style="green")
@@ -82,3 +84,93 @@ def test_style_does_not_affect_level_sent_to_subscribers():
         assert received == [("etsy banner", "header")]
     finally:
         console._subscribers.clear()
+
+
+def test_structured_events_keep_their_fields():
+    from core import i18n
+
+    received = []
+    console.subscribe(received.append)
+    i18n.set_language("en")
+    try:
+        with console.capture() as events:
+            console.cbanner("Etsy", style="green")
+            console.cfield("Order ID", 3672188392)
+            console.cmessage("||| Could not get the SKU |||", "error")
+            console.cmessage(
+                "---Routing to sheet: {sheet}---", "success", sheet="22 roll"
+            )
+            console.cmessage("<<<Order added to the spreadsheet>>>", "success")
+        console.replay(events)
+        messages = [e.message for e in received]
+    finally:
+        console._subscribers.clear()
+
+    assert [e.kind for e in received] == ["banner", "field", "problem", "note", "done"]
+    banner, order_id, problem, note, done = received
+    assert (banner.marketplace, banner.level, banner.style) == (
+        "Etsy",
+        "header",
+        "green",
+    )
+    assert (order_id.key, order_id.value, order_id.level) == (
+        "Order ID",
+        "3672188392",
+        "success",
+    )
+    assert note.args == {"sheet": "22 roll"}
+    assert (problem.level, done.level) == ("error", "success")
+    assert messages[2:] == [
+        "Could not get the SKU",
+        "Routing to sheet: 22 roll",
+        "Order added to the spreadsheet",
+    ]
+
+
+def test_events_render_the_classic_console_lines():
+    from core import i18n
+
+    try:
+        i18n.set_language("en")
+        assert console.LogEvent("banner", marketplace="Etsy").text == (
+            "----- New order Etsy -----"
+        )
+        assert console.LogEvent("field", key="Quantity", value="2").text == (
+            "- Quantity: 2"
+        )
+        assert console.LogEvent(
+            "field", key="Customer address", value="John\n42 Oak"
+        ).text == ("- Customer address:\nJohn\n42 Oak")
+        i18n.set_language("ru")
+        assert console.LogEvent("field", key="Quantity", value="2").text == (
+            "- Количество: 2"
+        )
+    finally:
+        i18n.set_language("en")
+
+
+def test_events_are_rendered_again_after_a_language_switch():
+    from core import i18n
+
+    event = console.LogEvent("field", key="Order ID", value="42")
+    try:
+        i18n.set_language("en")
+        assert event.text == "- Order ID: 42"
+        i18n.set_language("ru")
+        assert event.text == "- Номер заказа: 42"
+        assert event.render("uk") == "- Номер замовлення: 42"
+    finally:
+        i18n.set_language("en")
+
+
+def test_messages_without_markers_are_translated_too():
+    from core import i18n
+
+    with console.capture() as events:
+        console.cmessage("File {path} not found.", path="orders.txt")
+    try:
+        i18n.set_language("ru")
+        assert events[0].kind == "plain"
+        assert events[0].text == "Файл orders.txt не найден."
+    finally:
+        i18n.set_language("en")
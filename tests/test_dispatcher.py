@@ -35,3 +35,30 @@ def test_etsy_wins_over_amazon_keyword():
 
 def test_unknown_returns_none():
     assert detect_marketplace("plain text with no markers") is None
+
+
+def test_parsers_are_loaded_lazily_on_first_use():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import core.processor\n"
+        "from core.dispatcher import detect_marketplace\n"
+        "assert 'marketplaces.etsy_parser' not in sys.modules\n"
+        "assert 'bs4' not in sys.modules and 'gspread' not in sys.modules\n"
+        "spec = detect_marketplace('etsy.com')\n"
+        "assert spec.parser_cls.__name__ == 'EtsyParser'\n"
+        "assert 'marketplaces.amazon_parser' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_spec_accepts_a_parser_class_directly():
+    from core.dispatcher import MarketplaceSpec
+
+    class Parser:
+        pass
+
+    spec = MarketplaceSpec("X", lambda order: True, Parser, "")
+    assert spec.parser_cls is Parser
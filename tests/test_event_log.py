@@ -0,0 +1,106 @@
+"""Tests for the structured JSONL event log and its queries."""
+
+import json
+from datetime import date
+
+from core import console
+from core.console import cfield, cmessage, order_scope
+from core.event_log import (
+    EventLog,
+    EventQuery,
+    event_log_files,
+    event_query_from_argv,
+    format_record,
+    query_events,
+)
+from core.i18n import tr
+from core.processor import OrderResult
+
+
+def _run_orders(log_dir):
+    log = EventLog(str(log_dir))
+    try:
+        for number, order_id in ((1, "111-1"), (2, "222-2")):
+            with order_scope("run1", number):
+                cfield("Order ID", order_id)
+                if number == 2:
+                    cmessage(
+                        "!!!Could not read {path}: {error}!!!",
+                        "error",
+                        path="x",
+                        error="boom",
+                    )
+            result = OrderResult(number, "Amazon", ok=number == 1, order_id=order_id)
+            result.timings = [("parse", 0.01), ("write", 0.02)]
+            log.log_result("run1", result)
+        cmessage("---Unrelated---")
+        log.flush()
+    finally:
+        log.close()
+
+
+def test_records_are_compact_json_lines(tmp_path):
+    _run_orders(tmp_path)
+
+    (path,) = event_log_files(str(tmp_path))
+    with open(path, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert all(", " not in line and '": ' not in line for line in lines)
+    assert records[0]["run"] == "run1" and records[0]["order"] == 1
+    assert records[0]["key"] == "Order ID" and records[0]["value"] == "111-1"
+    order = records[1]
+    assert order["kind"] == "order" and order["status"] == "written"
+    assert order["ms"] == {"parse": 10.0, "write": 20.0}
+    assert "order" not in records[-1]
+
+
+def test_query_by_order_id_and_errors(tmp_path):
+    _run_orders(tmp_path)
+
+    second = query_events(EventQuery(order_id="222-2"), str(tmp_path))
+    assert [record.get("kind") for record in second] == ["field", "problem", "order"]
+    assert {record["order"] for record in second} == {2}
+    message = tr("!!!Could not read {path}: {error}!!!", path="x", error="boom")
+    assert format_record(second[1]).endswith(f"#2  {message}")
+
+    errors = query_events(EventQuery(error=""), str(tmp_path))
+    assert [record["kind"] for record in errors] == ["problem", "order"]
+    assert query_events(EventQuery(error="BOOM"), str(tmp_path))[0]["order"] == 2
+    assert query_events(EventQuery(order_id="999"), str(tmp_path)) == []
+
+
+def test_files_are_listed_oldest_first_and_limited_by_days(tmp_path):
+    for name in (
+        "events_2026-07-05.jsonl",
+        "events_2026-07-05.jsonl.1",
+        "events_2026-07-04.jsonl.2",
+        "events_2026-07-04.jsonl",
+        "parser_2026-07-05.log",
+    ):
+        (tmp_path / name).write_text("", encoding="utf-8")
+
+    names = [path.rsplit("/", 1)[-1] for path in event_log_files(str(tmp_path))]
+    assert names == [
+        "events_2026-07-04.jsonl.2",
+        "events_2026-07-04.jsonl",
+        "events_2026-07-05.jsonl.1",
+        "events_2026-07-05.jsonl",
+    ]
+    recent = event_log_files(str(tmp_path), days=1, today=date(2026, 7, 5))
+    assert len(recent) == 2
+
+
+def test_query_from_argv():
+    assert event_query_from_argv(["--cli"]) is None
+    assert event_query_from_argv(["--events", "123"]) == EventQuery(order_id="123")
+    assert event_query_from_argv(["--events", "--errors", "--days", "3"]) == (
+        EventQuery(error="", days=3)
+    )
+    assert event_query_from_argv(["--events", "--errors", "quota"]).error == "quota"
+
+
+def test_closed_log_stops_listening(tmp_path):
+    log = EventLog(str(tmp_path))
+    log.close()
+    assert log.log_event not in console._subscribers
@@ -0,0 +1,183 @@
+"""The fake Google server: the real gspread and Drive clients pointed at it."""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from bench.fake_google import FakeGoogleConfig, FakeGoogleServer, config_from_argv
+from bench.fakes import HEADERS
+from config.settings import get_settings
+from core.constants import COL_ORDER_ID, COL_QUANTITY, SHEET_22_ROLL, SHEET_ERROR
+from google_api import auth
+from google_api.endpoint import redirect_url
+
+
+@pytest.fixture
+def server():
+    with FakeGoogleServer(FakeGoogleConfig(quotas={})) as running:
+        yield running
+
+
+@pytest.fixture
+def pointed_at(server, monkeypatch):
+    """Routes the app's Google clients to the fake server for one test."""
+    yield from _point_at(server, monkeypatch)
+
+
+@pytest.fixture
+def full_grid(monkeypatch):
+    """A fake server whose sheets have no rows below the header."""
+    with FakeGoogleServer(FakeGoogleConfig(quotas={}, row_count=1)) as running:
+        yield from _point_at(running, monkeypatch)
+
+
+def _point_at(server, monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_ENDPOINT", server.url)
+    monkeypatch.setattr(auth, "_manager", auth.CredentialManager())
+    monkeypatch.setattr(auth, "_thread_local", threading.local())
+    get_settings.cache_clear()
+    auth.get_gspread_client.cache_clear()
+    yield server
+    get_settings.cache_clear()
+    auth.get_gspread_client.cache_clear()
+
+
+def _request(server, method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(server.url + path, data=data, method=method)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read() or b"{}")
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_redirect_url_keeps_path_and_query():
+    url = "https://sheets.googleapis.com/v4/spreadsheets/abc/values/A1?x=1"
+    assert redirect_url(url, "http://127.0.0.1:9") == (
+        "http://127.0.0.1:9/v4/spreadsheets/abc/values/A1?x=1"
+    )
+    assert redirect_url("https://example.com/a", "http://127.0.0.1:9") == (
+        "https://example.com/a"
+    )
+
+
+def test_writer_appends_orders_through_gspread(pointed_at):
+    from google_api.gsheet_writer import GSheetWriter
+
+    items = [
+        {COL_ORDER_ID: "1001", COL_QUANTITY: 1},
+        {COL_ORDER_ID: "1001", COL_QUANTITY: 2},
+    ]
+    writer = GSheetWriter()
+    assert writer.append_order(items, "svg", 20.0) == SHEET_22_ROLL
+    assert writer.append_order(items[:1], "Unknown", "") == SHEET_ERROR
+    assert writer.append_order(items[:1], "svg", 20.0) == SHEET_22_ROLL
+
+    rows = pointed_at.api.sheet_rows("test-table-id", SHEET_22_ROLL)
+    order_col = HEADERS.index(COL_ORDER_ID)
+    assert rows[0] == HEADERS
+    assert [row[order_col] for row in rows[1:]] == ["1001", "1001", "1001"]
+    assert len(pointed_at.api.sheet_rows("test-table-id", SHEET_ERROR)) == 2
+
+    writer.revalidate()
+    assert writer._next_rows[SHEET_22_ROLL] == 5
+
+
+def test_writer_grows_a_full_grid_with_append_dimension(full_grid):
+    from google_api.gsheet_writer import GSheetWriter, OrderWrite
+
+    items = [
+        {COL_ORDER_ID: "1001", COL_QUANTITY: 1},
+        {COL_ORDER_ID: "1001", COL_QUANTITY: 2},
+    ]
+    writer = GSheetWriter()
+    writer.append_order(items, "svg", 20.0)
+    writer.append_orders([OrderWrite(items, "svg", 20.0)] * 2)
+    writer.revalidate()
+    writer.append_order(items[:1], "svg", 20.0)
+
+    rows = full_grid.api.sheet_rows("test-table-id", SHEET_22_ROLL)
+    assert len(rows) == 8
+    assert writer._grid_rows[SHEET_22_ROLL] == 8
+
+
+def test_finder_searches_and_uploads_through_the_drive_client(
+    pointed_at, tmp_path, monkeypatch
+):
+    from google_api.gdrive_finder import GoogleDriveFinder
+
+    pointed_at.api.add_file("Old label.pdf")
+    finder = GoogleDriveFinder()
+    found = finder.search_file_by_name("name contains 'Blue Sky'")
+    assert found is not None and found[0]["name"] == "24x36 Blue Sky.svg"
+    assert finder.search_file_by_name("name contains 'nothing.pdf'") is None
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "1001.pdf").write_bytes(b"%PDF-1.4 label")
+    link = finder.upload_shipping_labels("1001")
+    assert link and link.startswith("https://drive.google.com/file/d/")
+    assert not (tmp_path / "1001.pdf").exists()
+
+    status, changes = _request(pointed_at, "GET", "/drive/v3/changes?pageToken=1")
+    names = [change["file"]["name"] for change in changes["changes"]]
+    assert status == 200
+    assert names == ["Old label.pdf", "24x36 Blue Sky.svg", "1001.pdf"]
+    assert changes["changes"][-1]["file"]["size"] == str(len(b"%PDF-1.4 label"))
+    assert changes["changes"][-1]["file"]["parents"] == ["test-folder-id"]
+
+
+def test_writes_beyond_the_grid_are_rejected(server):
+    path = "/v4/spreadsheets/t:batchUpdate"
+    body = {
+        "requests": [{"repeatCell": {"range": {"sheetId": 0, "endRowIndex": 5000}}}]
+    }
+    status, error = _request(server, "POST", path, body)
+    assert status == 400
+    assert "exceeds grid limits" in error["error"]["message"]
+
+    append = {"requests": [{"appendDimension": {"sheetId": 0, "length": 5000}}]}
+    assert _request(server, "POST", path, append)[0] == 200
+    assert _request(server, "POST", path, body)[0] == 200
+
+
+def test_quota_answers_429_once_the_window_is_full():
+    config = FakeGoogleConfig(quotas={"sheets.read": 2})
+    with FakeGoogleServer(config) as server:
+        statuses = [_request(server, "GET", "/v4/spreadsheets/t")[0] for _ in range(3)]
+        assert statuses == [200, 200, 429]
+        _, error = _request(server, "GET", "/v4/spreadsheets/t")
+        assert error["error"]["status"] == "RESOURCE_EXHAUSTED"
+        assert server.api.stats()["throttled"] == 2
+        # Drive has its own bucket.
+        assert _request(server, "GET", "/drive/v3/files?q=")[0] == 200
+
+
+def test_injected_errors_and_latency():
+    config = FakeGoogleConfig(error_5xx=1.0, latency_ms=30, quotas={})
+    with FakeGoogleServer(config) as server:
+        started = time.perf_counter()
+        status, error = _request(server, "GET", "/drive/v3/files?q=")
+        assert time.perf_counter() - started >= 0.03
+    assert status in (500, 503)
+    # Drive errors carry the reason list the client back-off looks at.
+    assert error["error"]["errors"][0]["reason"] == "backendError"
+
+
+def test_unsupported_drive_query_is_a_bad_request(server):
+    status, _ = _request(server, "GET", "/drive/v3/files?q=modifiedTime+%3E+1")
+    assert status == 400
+
+
+def test_config_from_argv():
+    config, port = config_from_argv(
+        ["--port", "9000", "--latency-ms", "50", "--quota", "sheets.write=10"]
+    )
+    assert port == 9000
+    assert config.latency_ms == 50
+    assert config.quotas["sheets.write"] == 10
+    assert config_from_argv(["--no-quota"])[0].quotas == {}
@@ -0,0 +1,74 @@
+"""Tests for the asynchronous, rotating file log."""
+
+import logging
+import queue
+from datetime import date
+from logging.handlers import QueueHandler
+
+from core.console import BatchingListener, LogFileHandler
+
+
+class _Clock:
+    def __init__(self, day):
+        self.day = day
+
+    def __call__(self):
+        return self.day
+
+
+def _logger(handler):
+    log_queue = queue.Queue()
+    listener = BatchingListener(log_queue, handler)
+    logger = logging.getLogger(f"test_file_log_{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return logger, log_queue, listener
+
+
+def test_lines_reach_the_file_through_the_listener(tmp_path):
+    handler = LogFileHandler(str(tmp_path), today=_Clock(date(2026, 7, 5)))
+    logger, log_queue, listener = _logger(handler)
+    try:
+        for number in range(100):
+            logger.info("line %d", number)
+        log_queue.join()
+        lines = (tmp_path / "parser_2026-07-05.log").read_text("utf-8").splitlines()
+    finally:
+        listener.stop()
+        handler.close()
+
+    assert lines == [f"line {number}" for number in range(100)]
+
+
+def test_a_new_day_starts_a_new_file(tmp_path):
+    clock = _Clock(date(2026, 7, 5))
+    handler = LogFileHandler(str(tmp_path), today=clock)
+    record = logging.LogRecord("t", logging.INFO, "", 0, "%s", ("first",), None)
+    handler.handle(record)
+    clock.day = date(2026, 7, 6)
+    record.args = ("second",)
+    handler.handle(record)
+    handler.close()
+
+    assert (tmp_path / "parser_2026-07-05.log").read_text("utf-8") == "first\n"
+    assert (tmp_path / "parser_2026-07-06.log").read_text("utf-8") == "second\n"
+
+
+def test_a_large_day_file_is_rotated(tmp_path):
+    handler = LogFileHandler(
+        str(tmp_path), max_bytes=50, backup_count=2, today=_Clock(date(2026, 7, 5))
+    )
+    for number in range(10):
+        line = f"{number}" + "x" * 19
+        handler.handle(logging.LogRecord("t", logging.INFO, "", 0, line, (), None))
+    handler.close()
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert names == [
+        "parser_2026-07-05.log",
+        "parser_2026-07-05.log.1",
+        "parser_2026-07-05.log.2",
+    ]
+    assert (tmp_path / "parser_2026-07-05.log").read_text("utf-8").startswith("8")
@@ -1,10 +1,13 @@
 """Tests for row layout, insertion and batch formatting."""
 
 from google_api.gsheet_writer import (
+    build_append_rows_request,
     build_format_requests,
     build_insert_rows_request,
     build_merge_requests,
     build_rows,
+    coalesce_requests,
+    compile_layout,
 )
 
 HEADERS = ["Status", "Order ID", "Title", "Total"]
@@ -27,6 +30,27 @@ def test_build_rows_ignores_unknown_keys_and_keeps_blanks():
     assert rows == [["", "1", "", ""]]
 
 
+def test_layout_resolves_the_formatting_columns_once():
+    layout = compile_layout(("Status", "Order ID", "Postal Service", "Order ID"))
+
+    assert layout.status_column == 0
+    assert layout.highlight_columns == (1,)
+    assert layout.merge_columns == (2,)
+    assert "Track ID" in layout.missing
+    assert compile_layout(tuple(HEADERS)) is compile_layout(tuple(HEADERS))
+
+
+def test_repeated_column_gets_the_value_in_its_last_copy_and_format_in_the_first():
+    headers = ("Status", "Order ID", "Title", "Order ID")
+    layout = compile_layout(headers)
+
+    assert layout.build_rows([{"Order ID": "7", "Title": "Decal"}]) == [
+        ["", "", "Decal", "7"]
+    ]
+    assert build_rows([{"Order ID": "7"}], list(headers)) == [["", "", "", "7"]]
+    assert layout.highlight_columns == (1,)
+
+
 def test_build_insert_rows_request_exact_position():
     request = build_insert_rows_request(sheet_id=7, start_row_index=104, num_rows=2)
     dimension = request["insertDimension"]
@@ -101,3 +125,70 @@ def test_merge_requests_only_for_multi_item_orders():
     assert merge["range"]["endRowIndex"] == 13
     assert merge["range"]["startColumnIndex"] == 2
     assert merge["range"]["endColumnIndex"] == 3
+
+
+def _order_formats(start, rows, rgb):
+    return [
+        build_insert_rows_request(7, start, rows),
+        *build_format_requests(7, start, rows, 4, [1], 0, rgb),
+    ]
+
+
+def test_coalesce_merges_consecutive_orders_on_a_sheet():
+    red = {"red": 1.0, "green": 0.0, "blue": 0.0}
+    blue = {"red": 0.0, "green": 0.0, "blue": 1.0}
+    requests = [
+        *_order_formats(10, 2, red),
+        *_order_formats(12, 1, blue),
+        *_order_formats(13, 3, blue),
+    ]
+
+    merged = coalesce_requests(requests)
+
+    inserts = [r["insertDimension"]["range"] for r in merged if "insertDimension" in r]
+    assert [(r["startIndex"], r["endIndex"]) for r in inserts] == [(10, 16)]
+    assert "insertDimension" in merged[0]
+    cells = [r["repeatCell"] for r in merged[1:]]
+    clip = [c for c in cells if c["fields"] == "userEnteredFormat.wrapStrategy"]
+    assert [(c["range"]["startRowIndex"], c["range"]["endRowIndex"]) for c in clip] == [
+        (10, 16)
+    ]
+    highlights = [c for c in cells if c["range"]["startColumnIndex"] == 1]
+    assert [c["cell"]["userEnteredFormat"]["backgroundColor"] for c in highlights] == [
+        red,
+        blue,
+    ]
+    # One insert, one CLIP, one Status and the two per-order highlights
+    assert len(merged) == 1 + 1 + 1 + 2
+
+
+def test_coalesce_keeps_grid_appends_next_to_inserts_of_other_sheets():
+    append = build_append_rows_request(1, 3)
+    first = build_insert_rows_request(2, 5, 2)
+    second = build_insert_rows_request(2, 7, 1)
+
+    assert coalesce_requests([append, first, second]) == [
+        append,
+        build_insert_rows_request(2, 5, 3),
+    ]
+
+
+def test_coalesce_drops_repeated_formatting():
+    clip = build_format_requests(7, 0, 3, 4, [], 0, {})[0]
+    inner = build_format_requests(7, 1, 1, 4, [], 0, {})[0]
+
+    assert coalesce_requests([clip, inner, clip]) == [clip]
+
+
+def test_coalesce_keeps_requests_that_a_different_format_separates():
+    clip = build_format_requests(7, 0, 1, 4, [], 0, {})[0]
+    later = build_format_requests(7, 1, 1, 4, [], 0, {})[0]
+    other = {
+        "repeatCell": {
+            **clip["repeatCell"],
+            "range": {**clip["repeatCell"]["range"], "endRowIndex": 2},
+            "cell": {"userEnteredFormat": {"wrapStrategy": "WRAP"}},
+        }
+    }
+
+    assert coalesce_requests([clip, other, later]) == [clip, other, later]
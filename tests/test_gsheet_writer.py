@@ -1,10 +1,14 @@
 """GSheetWriter.append_order tests on a fake client: positional insertion
-(like insert_row), request order and local free-row tracking."""
+(like insert_row), appends at the end of the grid, request order and local
+free-row tracking."""
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 import google_api.gsheet_writer as writer_module
-from google_api.gsheet_writer import GSheetWriter
+from google_api.errors import PartialWriteError
+from google_api.gsheet_writer import GSheetWriter, OrderWrite
 
 HEADERS = [
     "Status",
@@ -33,11 +37,13 @@ HEADERS = [
 ]
 
 
-def _make_writer(existing_rows=104):
-    """GSheetWriter with a fake worksheet holding existing_rows rows of data."""
+def _make_writer(existing_rows=104, grid_rows=1000):
+    """GSheetWriter with a fake worksheet holding existing_rows rows of data
+    in a grid of grid_rows rows."""
     worksheet = MagicMock()
     worksheet.title = "22 roll"
     worksheet.id = 7
+    worksheet.row_count = grid_rows
     worksheet.row_values.return_value = HEADERS
     worksheet.get_all_values.return_value = [["x"]] * existing_rows
 
@@ -114,7 +120,177 @@ def test_next_row_tracked_locally_without_rereading_sheet():
     assert value_ranges == ["A105", "A107"]
 
 
+def test_rows_at_the_end_of_the_grid_are_appended_not_inserted():
+    writer, _, calls = _make_writer(existing_rows=104, grid_rows=104)
+
+    writer.append_order(_order(2), "svg", 10.0)
+    writer.append_order(_order(1), "svg", 10.0)
+
+    first, second = [c[1]["requests"] for c in calls if c[0] == "batch_update"][::2]
+    assert not any("insertDimension" in r for r in first + second)
+    assert first[0] == {
+        "appendDimension": {"sheetId": 7, "dimension": "ROWS", "length": 2}
+    }
+    assert second[0]["appendDimension"]["length"] == 1
+    assert first[1]["repeatCell"]["range"]["startRowIndex"] == 104
+    value_ranges = [c[1] for c in calls if c[0] == "values_update"]
+    assert value_ranges == ["A105", "A107"]
+    assert writer._grid_rows["22 roll"] == 107
+
+
 def test_empty_order_writes_nothing():
     writer, worksheet, calls = _make_writer()
     writer.append_order([], "svg", 10.0)
     assert calls == []
+
+
+def _value_ranges(writer, header, tail):
+    writer.spreadsheet.values_batch_get.return_value = {
+        "valueRanges": [{"values": [header]}, {"values": tail}]
+    }
+
+
+def test_revalidate_moves_cursor_below_rows_added_by_others():
+    writer, worksheet, calls = _make_writer(existing_rows=104)
+    writer.append_order(_order(1), "svg", 10.0)  # cursor -> 106
+
+    _value_ranges(writer, HEADERS, [["x"], ["added"], ["by hand"]])
+    writer.revalidate()
+
+    ranges = writer.spreadsheet.values_batch_get.call_args.args[0]
+    assert ranges == ["'22 roll'!1:1", "'22 roll'!A105:W"]
+    writer.append_order(_order(1), "svg", 10.0)
+    assert calls[-1][1] == "A108"
+    assert worksheet.get_all_values.call_count == 1
+
+
+def test_revalidate_recounts_when_last_written_row_is_gone():
+    writer, worksheet, _calls = _make_writer(existing_rows=104)
+    writer.append_order(_order(1), "svg", 10.0)
+
+    _value_ranges(writer, HEADERS, [])
+    writer.revalidate()
+    writer.append_order(_order(1), "svg", 10.0)
+
+    assert worksheet.get_all_values.call_count == 2
+
+
+def test_revalidate_resets_caches_on_api_error():
+    writer, _worksheet, _calls = _make_writer(existing_rows=104)
+    writer.append_order(_order(1), "svg", 10.0)
+
+    writer.spreadsheet.values_batch_get.side_effect = RuntimeError("sheet deleted")
+    writer.revalidate()
+    writer.append_order(_order(1), "svg", 10.0)
+
+    assert writer.spreadsheet.worksheet.call_count == 2
+
+
+def test_append_orders_batches_every_order_into_three_calls():
+    writer, _, calls = _make_writer(existing_rows=104)
+    orders = [OrderWrite(_order(2), "svg", 10.0), OrderWrite(_order(1), "svg", 10.0)]
+
+    assert writer.append_orders(orders) == ["22 roll", "22 roll"]
+
+    spreadsheet = writer.spreadsheet
+    inserts, merges = [
+        c.args[0]["requests"] for c in spreadsheet.batch_update.call_args_list
+    ]
+    ranges = [r["insertDimension"]["range"] for r in inserts if "insertDimension" in r]
+    assert [(r["startIndex"], r["endIndex"]) for r in ranges] == [(104, 107)]
+    assert all("mergeCells" in r for r in merges)
+    body = spreadsheet.values_batch_update.call_args.args[0]
+    assert [d["range"] for d in body["data"]] == ["'22 roll'!A105", "'22 roll'!A107"]
+    assert body["valueInputOption"] == "USER_ENTERED"
+    assert writer._next_rows["22 roll"] == 108
+    assert calls == []
+
+
+def test_append_orders_grows_the_grid_once_per_sheet():
+    writer, _, _ = _make_writer(existing_rows=104, grid_rows=104)
+    orders = [OrderWrite(_order(2), "svg", 10.0), OrderWrite(_order(1), "svg", 10.0)]
+
+    writer.append_orders(orders)
+
+    requests = writer.spreadsheet.batch_update.call_args_list[0].args[0]["requests"]
+    assert requests[0] == {
+        "appendDimension": {"sheetId": 7, "dimension": "ROWS", "length": 3}
+    }
+    assert not any("insertDimension" in r for r in requests)
+    body = writer.spreadsheet.values_batch_update.call_args.args[0]
+    assert [d["range"] for d in body["data"]] == ["'22 roll'!A105", "'22 roll'!A107"]
+    assert writer._grid_rows["22 roll"] == 107
+
+
+def test_revalidate_rereads_the_grid_size_once():
+    writer, _, calls = _make_writer(existing_rows=104, grid_rows=104)
+    writer.append_order(_order(1), "svg", 10.0)
+
+    _value_ranges(writer, HEADERS, [["x"]])
+    writer.spreadsheet.fetch_sheet_metadata.return_value = {
+        "sheets": [
+            {"properties": {"title": "22 roll", "gridProperties": {"rowCount": 900}}}
+        ]
+    }
+    writer.revalidate()
+    writer.append_order(_order(1), "svg", 10.0)
+    writer.append_order(_order(1), "svg", 10.0)
+
+    assert writer.spreadsheet.fetch_sheet_metadata.call_count == 1
+    requests = calls[-4][1]["requests"]
+    assert requests[0]["insertDimension"]["range"]["startIndex"] == 105
+    assert writer._grid_rows["22 roll"] == 902
+
+
+def test_failed_batch_drops_the_row_cursor():
+    writer, _, _ = _make_writer(existing_rows=104)
+    writer.spreadsheet.batch_update.side_effect = ConnectionError("offline")
+
+    with pytest.raises(ConnectionError):
+        writer.append_orders([OrderWrite(_order(1), "svg", 10.0)])
+    assert "22 roll" not in writer._next_rows
+
+
+def test_batch_failing_after_the_insert_is_a_partial_write():
+    writer, _, _ = _make_writer(existing_rows=104)
+    writer.spreadsheet.values_batch_update.side_effect = ConnectionError("offline")
+
+    with pytest.raises(PartialWriteError) as raised:
+        writer.append_orders([OrderWrite(_order(2), "svg", 10.0)])
+    assert isinstance(raised.value.error, ConnectionError)
+    assert raised.value.where == "22 roll rows 105-106"
+
+
+def test_order_failing_at_the_merges_keeps_its_rows():
+    writer, worksheet, calls = _make_writer(existing_rows=104)
+    batch_update = worksheet.spreadsheet.batch_update.side_effect
+
+    def fail_merges(body):
+        if "mergeCells" in body["requests"][0]:
+            raise ConnectionError("offline")
+        batch_update(body)
+
+    worksheet.spreadsheet.batch_update.side_effect = fail_merges
+
+    with pytest.raises(PartialWriteError) as raised:
+        writer.append_order(_order(2), "svg", 10.0)
+    assert "without their cell merges" in raised.value.done
+    assert writer._next_rows["22 roll"] == 107
+    assert [c[0] for c in calls] == ["batch_update", "values_update"]
+
+
+def test_layout_is_compiled_once_and_follows_header_changes():
+    writer, _worksheet, calls = _make_writer(existing_rows=104)
+    writer.append_order(_order(1), "svg", 10.0)
+    layout = writer._layouts["22 roll"]
+    writer.append_order(_order(2), "svg", 10.0)
+    assert writer._layouts["22 roll"] is layout
+
+    moved = ["Note", *HEADERS]
+    _value_ranges(writer, moved, [["x"]])
+    writer.revalidate()
+    writer.append_order(_order(1), "svg", 10.0)
+
+    assert writer._layouts["22 roll"].headers == tuple(moved)
+    assert calls[-1][2][0][0] == ""
+    assert calls[-1][2][0][moved.index("Order ID")] != ""
@@ -0,0 +1,77 @@
+"""Run history: saving runs with rows and timings, and finding orders again."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+from bench.fakes import OfflineFinder, OfflineWriter
+from bench.generators import orders_file
+from core.history import RunHistory, history_query_from_argv
+from core.processor import OrderResult, process_order_list, split_orders
+
+
+def test_a_run_is_saved_with_rows_routing_and_timings(tmp_path):
+    history = RunHistory(str(tmp_path / "history.sqlite3"))
+    orders = split_orders(orders_file(3, items=2, filler_kb=0))
+    results: list[OrderResult] = []
+    process_order_list(
+        orders,
+        result_callback=results.append,
+        writer=OfflineWriter(),
+        finder=OfflineFinder(),
+        history=history,
+    )
+
+    order_id = results[1].order_id
+    assert order_id
+    (entry,) = history.find(order_id)
+    assert entry.status == "written"
+    assert entry.sheet == results[1].sheet
+    assert entry.row == results[1].row and entry.row > 1
+    assert entry.extension == results[1].extension
+    assert entry.items == 2
+    assert "parse" in entry.timings and entry.total_ms > 0
+    # Rows follow each other on a sheet
+    rows = sorted(r.row for r in results if r.sheet == results[0].sheet)
+    assert rows == sorted(set(rows))
+
+
+def test_query_filters_and_newest_first(tmp_path):
+    history = RunHistory(str(tmp_path / "history.sqlite3"))
+    history.record_run(
+        [
+            OrderResult(1, "Etsy", True, order_id="A", sheet="22 Roll", row=5),
+            OrderResult(2, "Amazon", False, order_id="B", error="bad HTML"),
+        ],
+        1.5,
+    )
+    history.record_run([OrderResult(1, "Etsy", False, order_id="A", spooled=True)], 1)
+
+    assert [e.status for e in history.find("A")] == ["spooled", "written"]
+    assert [e.order_id for e in history.query(marketplace="Etsy")] == ["A", "A"]
+    assert [e.error for e in history.query(status="failed")] == ["bad HTML"]
+    assert history.query(since="2999-01-01") == []
+    assert len(history.query(limit=1)) == 1
+
+
+def test_runs_keep_their_start_time(tmp_path):
+    path = str(tmp_path / "history.sqlite3")
+    history = RunHistory(path)
+    results = [OrderResult(1, "Etsy", True, order_id="A")]
+    history.record_run(results, 90, started=datetime(2026, 7, 5, 10, 0, 0))
+    before = datetime.now() - timedelta(seconds=3600)
+    history.record_run(results, 3600)
+
+    connection = sqlite3.connect(path)
+    try:
+        starts = [row[0] for row in connection.execute("SELECT started FROM runs")]
+    finally:
+        connection.close()
+    assert starts[0] == "2026-07-05T10:00:00"
+    assert abs(datetime.fromisoformat(starts[1]) - before) < timedelta(seconds=5)
+    assert datetime.fromisoformat(history.find("A")[0].processed) > before
+
+
+def test_history_argv():
+    assert history_query_from_argv(["--cli"]) is None
+    assert history_query_from_argv(["--history"]) == ""
+    assert history_query_from_argv(["--history", "123-456"]) == "123-456"
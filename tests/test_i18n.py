@@ -7,9 +7,11 @@ import re
 from core import i18n
 from core.i18n import _CATALOG, banner_words, tr
 
+_KEYED_CALLS = {"tr", "cfield", "cmessage"}
+
 
 def _source_tr_keys() -> set[str]:
-    """Every literal key passed to tr() anywhere in the project sources.
+    """Every literal key passed to tr(), cfield() or cmessage() in the sources.
 
     Implicit string concatenation is merged by the parser, so multi-line
     keys are collected correctly.
@@ -23,7 +25,7 @@ def _source_tr_keys() -> set[str]:
             if (
                 isinstance(node, ast.Call)
                 and isinstance(node.func, ast.Name)
-                and node.func.id == "tr"
+                and node.func.id in _KEYED_CALLS
                 and node.args
                 and isinstance(node.args[0], ast.Constant)
                 and isinstance(node.args[0].value, str)
@@ -95,3 +97,25 @@ def test_banner_parses_in_every_language():
         entry = parse_entry(f"----- {word} Etsy -----")
         assert entry["kind"] == "banner", word
         assert entry["marketplace"] == "Etsy"
+
+
+def test_translate_renders_in_any_language_without_switching():
+    try:
+        i18n.set_language("uk")
+        assert i18n.translate("New order", language="ru") == "Новый заказ"
+        assert i18n.translate("New order", language="en") == "New order"
+        assert (
+            i18n.translate("File {path} not found.", {"path": "a.txt"}, "ru")
+            == "Файл a.txt не найден."
+        )
+        assert i18n.translate("New order") == "Нове замовлення"
+        assert i18n.get_language() == "uk"
+    finally:
+        i18n.set_language("en")
+
+
+def test_compiled_tables_cover_every_real_translation():
+    for lang, catalog in _CATALOG.items():
+        table = i18n._TABLES[lang]
+        assert all(table.get(key, key) == value for key, value in catalog.items())
+    assert i18n._TABLES["en"] == {}
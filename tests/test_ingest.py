@@ -0,0 +1,149 @@
+"""HTTP ingestion: the persistent job queue, batching worker and endpoints."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+import core.session as session_module
+from bench.fakes import OfflineFinder
+from bench.generators import orders_file
+from core.ingest import (
+    TOKEN_HEADER,
+    IngestConfig,
+    IngestWorker,
+    JobQueue,
+    ingest_config_from_argv,
+    ingest_token,
+    make_server,
+)
+from core.processor import OrderResult, split_orders
+from core.session import ProcessingSession
+from core.sinks import SinkConfig
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+
+@pytest.fixture
+def worker(queue, tmp_path):
+    session = ProcessingSession(
+        sink=SinkConfig("jsonl", str(tmp_path / "out.jsonl")),
+        finder_factory=OfflineFinder,
+    )
+    with patch.object(session_module, "ensure_fresh_credentials"):
+        yield IngestWorker(queue, session, batch_window=0, batch_size=2)
+    session.close()
+
+
+@pytest.fixture
+def server(queue, worker):
+    server = make_server(queue, worker, port=0, token="secret")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _request(url, data=None, content_type="text/html", token="secret"):
+    headers = {"Content-Type": content_type}
+    if token is not None:
+        headers[TOKEN_HEADER] = token
+    request = urllib.request.Request(url, data=data, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_posted_orders_are_processed_in_batches(server, worker, queue):
+    html = orders_file(3, items=1, filler_kb=0).encode("utf-8")
+    status, body = _request(f"{server}/orders", html)
+    assert status == 202 and len(body["jobs"]) == 3
+
+    first = body["jobs"][0]
+    assert _request(f"{server}/jobs/{first}")[1]["status"] == "queued"
+
+    assert worker.process_batch() == 2
+    assert worker.process_batch() == 1
+    assert worker.process_batch() == 0
+
+    status, job = _request(f"{server}/jobs/{first}")
+    assert status == 200 and job["status"] == "done"
+    assert job["result"]["ok"] and job["result"]["items"] == 1
+    assert job["result"]["sheet"]
+    _, listing = _request(f"{server}/jobs?status=done")
+    assert [j["id"] for j in listing["jobs"]] == body["jobs"][::-1]
+
+
+def test_json_body_and_bad_requests(server):
+    order = split_orders(orders_file(1, items=1, filler_kb=0))[0]
+    payload = json.dumps({"html": order}).encode("utf-8")
+    assert _request(f"{server}/orders", payload, "application/json")[0] == 202
+    assert _request(f"{server}/orders", b"   ")[0] == 400
+    assert _request(f"{server}/orders", b"{", "application/json")[0] == 400
+    assert _request(f"{server}/jobs/999")[0] == 404
+    assert _request(f"{server}/jobs?status=lost")[0] == 400
+    assert _request(f"{server}/nowhere")[0] == 404
+
+
+def test_requests_without_the_token_or_as_plain_text_are_refused(server, queue):
+    order = split_orders(orders_file(1, items=1, filler_kb=0))[0].encode("utf-8")
+    assert _request(f"{server}/orders", order, token=None)[0] == 401
+    assert _request(f"{server}/orders", order, token="guess")[0] == 401
+    assert _request(f"{server}/jobs", token=None)[0] == 401
+    # What a cross-site form or fetch without a preflight can send
+    assert _request(f"{server}/orders", order, "text/plain")[0] == 415
+    assert queue.count() == 0
+
+
+def test_token_is_created_once_and_kept(tmp_path):
+    path = str(tmp_path / "ingest_token.txt")
+    token = ingest_token(path)
+    assert len(token) >= 32
+    assert ingest_token(path) == token
+
+
+def test_jobs_survive_a_restart_and_failures_are_kept(queue):
+    queue.add(["<html>a</html>", "<html>b</html>"])
+    assert [job_id for job_id, _ in queue.claim(5)] == [1, 2]
+
+    # The process stopped mid-batch: the jobs run again on the next start
+    assert JobQueue(queue.path).requeue_running() == 2
+    claimed = queue.claim(5)
+    queue.finish(1, OrderResult(number=1, marketplace=None, ok=False, error="x"))
+    queue.fail([job_id for job_id, _ in claimed], "connection reset")
+    assert queue.get(1)["result"]["error"] == "x"
+    assert queue.get(2)["result"] == {"ok": False, "error": "connection reset"}
+    assert queue.count("failed") == 2
+
+
+def test_worker_picks_up_jobs_left_from_a_previous_run(worker, queue):
+    queue.add(split_orders(orders_file(1, items=1, filler_kb=0)))
+    queue.claim()
+    stop = threading.Event()
+    thread = threading.Thread(target=worker.run, args=(stop,))
+    thread.start()
+    try:
+        for _ in range(100):
+            if queue.count("done"):
+                break
+            stop.wait(0.05)
+    finally:
+        stop.set()
+        thread.join()
+    assert queue.count("done") == 1
+
+
+def test_ingest_config_from_argv():
+    assert ingest_config_from_argv(["--cli"]) is None
+    assert ingest_config_from_argv(["--serve"]) == IngestConfig()
+    config = ingest_config_from_argv(["--serve", "9000", "--batch-window", "2"])
+    assert (config.port, config.batch_window) == (9000, 2.0)
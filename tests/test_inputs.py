@@ -0,0 +1,75 @@
+"""CLI inputs: expanding files, folders and globs and reading them in parallel."""
+
+import gzip
+import io
+
+import pytest
+
+from core.inputs import expand_inputs, inputs_from_argv, read_inputs
+
+
+def _order(n):
+    return f"<html>order {n}</html>"
+
+
+@pytest.fixture
+def exports(tmp_path):
+    folder = tmp_path / "exports"
+    folder.mkdir()
+    (folder / "b.html").write_text(_order(2), "utf-8")
+    (folder / "a.html").write_text(_order(1), "utf-8")
+    (folder / "c.html.gz").write_bytes(gzip.compress(_order(3).encode()))
+    (folder / "notes.pdf").write_bytes(b"%PDF")
+    return folder
+
+
+def test_folders_and_globs_expand_sorted_in_argument_order(exports, tmp_path):
+    orders = tmp_path / "orders.txt"
+    orders.write_text(_order(0) + _order(0), "utf-8")
+
+    paths = expand_inputs([str(orders), str(exports), str(exports / "[ab].html")])
+    names = [p.replace("\\", "/").rsplit("/", 1)[-1] for p in paths]
+    assert names == ["orders.txt", "a.html", "b.html", "c.html.gz", "a.html", "b.html"]
+
+
+def test_read_inputs_keeps_order_and_reports_unreadable_files(exports, tmp_path):
+    missing = str(tmp_path / "missing.txt")
+    batch = read_inputs([str(exports), missing], max_workers=3)
+
+    assert [order.split()[1] for order in batch.orders] == ["1", "2", "3"]
+    assert batch.files == 3
+    assert [path for path, _ in batch.errors] == [missing]
+
+
+def test_gzip_from_stdin(monkeypatch):
+    data = gzip.compress((_order(1) + "\n" + _order(2)).encode())
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(data)))
+    assert len(read_inputs(["-"]).orders) == 2
+
+
+def test_zstd_input(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "orders.txt.zst"
+    path.write_bytes(zstandard.ZstdCompressor().compress(_order(1).encode()))
+    assert read_inputs([str(path)]).orders == ["<html>order 1"]
+
+
+def test_inputs_from_argv():
+    assert inputs_from_argv(["--cli"]) is None
+    assert inputs_from_argv(["--input", "a.txt", "dir", "-", "--stats"]) == [
+        "a.txt",
+        "dir",
+        "-",
+    ]
+
+
+def test_streaming_split_matches_split_orders(tmp_path):
+    from bench.generators import orders_file
+    from core.inputs import iter_input
+    from core.processor import iter_orders, split_orders
+
+    content = orders_file(5, items=2, filler_kb=3)
+    path = tmp_path / "bundle.txt.gz"
+    path.write_bytes(gzip.compress(content.encode("utf-8")))
+    streamed = list(iter_orders(iter_input(str(path), chunk_bytes=1000)))
+    assert streamed == split_orders(content)
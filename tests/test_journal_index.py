@@ -0,0 +1,82 @@
+"""Journal search index: substring queries, problem flags and spilled rows."""
+
+from unittest.mock import patch
+
+from ui.journal_index import JournalIndex
+from ui.journal_store import JournalEntry, JournalStore
+
+
+def _matching(index: JournalIndex) -> list[int]:
+    return [row for row in range(len(index)) if index.matches(row)]
+
+
+def test_query_matches_case_insensitive_substrings():
+    index = JournalIndex()
+    index.extend(
+        [
+            ("- SKU: AB-123", "success"),
+            ("||| Could not get the SKU |||", "error"),
+            ("- Tracking: 1Z999", "success"),
+            ("--- Sheet BLUE ---", "warning"),
+        ]
+    )
+
+    assert _matching(index) == [0, 1, 2, 3]
+    index.set_query("sku")
+    assert _matching(index) == [0, 1]
+    index.set_query("sKu: ab")
+    assert _matching(index) == [0]
+    index.set_query("u")
+    assert _matching(index) == [0, 1, 3]
+    index.set_query("nothing like this")
+    assert _matching(index) == []
+    index.set_query("")
+    assert _matching(index) == [0, 1, 2, 3]
+    assert [index.is_problem(row) for row in range(4)] == [False, True, False, True]
+
+
+def test_growing_query_narrows_and_new_rows_are_matched_on_arrival():
+    index = JournalIndex()
+    index.extend([("order 15", "info"), ("order 16", "info"), ("border", "info")])
+
+    index.set_query("ord")
+    assert _matching(index) == [0, 1, 2]
+    index.set_query("order 1")
+    assert _matching(index) == [0, 1]
+
+    index.extend([("Order 17", "info"), ("other", "info")])
+    assert _matching(index) == [0, 1, 3]
+
+    index.clear()
+    assert len(index) == 0
+    index.extend([("order 100", "info")])
+    assert _matching(index) == [0]
+
+
+def test_index_follows_the_store_window_and_searches_spilled_rows():
+    store = JournalStore(window=4, spill_chunk=2, page_size=3, page_cache=1)
+    index = JournalIndex(store)
+    for i in range(20):
+        level = "error" if i % 5 == 0 else "info"
+        entry = JournalEntry(f"Order {i}", level, "", "plain", "", "", "", "")
+        store.append(entry)
+        index.extend([(entry.text, entry.level)])
+
+    assert len(index) == 20
+    assert len(index._texts) <= 4
+    assert all(row >= store.spilled for p in index._postings.values() for row in p)
+
+    # Filtering and searching never page entries in from the spill file
+    with (
+        patch.object(JournalStore, "__getitem__", side_effect=AssertionError),
+        patch.object(JournalStore, "iter_entries", side_effect=AssertionError),
+    ):
+        assert [row for row in range(20) if index.is_problem(row)] == [0, 5, 10, 15]
+        index.set_query("order 1")
+        assert _matching(index) == [1, *range(10, 20)]
+        index.set_query("order 15")
+        assert _matching(index) == [15]
+        index.set_query("r 3")
+        assert _matching(index) == [3]
+        index.set_query("1")
+        assert _matching(index) == [1, *range(10, 20)]
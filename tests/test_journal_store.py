@@ -0,0 +1,64 @@
+"""Journal store: spilling old entries to disk, paging them back and export."""
+
+import io
+
+import pytest
+
+from ui.journal_store import JournalEntry, JournalStore
+
+
+def _entry(i: int) -> JournalEntry:
+    return JournalEntry(
+        text=f"- SKU: {i}\nline two «ü»",
+        level="success",
+        time="12:00:00",
+        kind="field",
+        marketplace="",
+        key="SKU",
+        value=str(i),
+        message="",
+    )
+
+
+def test_old_entries_spill_to_disk_and_page_back_in():
+    store = JournalStore(window=10, spill_chunk=4, page_size=3, page_cache=2)
+    for start in range(0, 100, 7):
+        store.extend(_entry(i) for i in range(start, min(start + 7, 100)))
+
+    assert len(store) == 100
+    assert store.spilled >= 90
+    assert len(store._window) <= 10
+    assert [store[i].value for i in range(100)] == [str(i) for i in range(100)]
+    assert [store[i].value for i in reversed(range(100))] == [
+        str(i) for i in reversed(range(100))
+    ]
+    assert store[-1] == _entry(99)
+    assert len(store._pages) <= 2
+    with pytest.raises(IndexError):
+        store[100]
+
+
+def test_partially_cached_page_is_refreshed_after_more_spilling():
+    store = JournalStore(window=2, spill_chunk=1, page_size=4)
+    store.extend(_entry(i) for i in range(4))
+    assert store[0].value == "0"  # caches page 0 with two spilled rows
+
+    store.extend(_entry(i) for i in range(4, 8))
+
+    assert [store[i].value for i in range(8)] == [str(i) for i in range(8)]
+
+
+def test_export_streams_every_entry_and_clear_resets():
+    store = JournalStore(window=5, spill_chunk=2)
+    store.extend(_entry(i) for i in range(12))
+
+    out = io.StringIO()
+    store.write_text(out)
+
+    assert out.getvalue() == "".join(_entry(i).text + "\n" for i in range(12))
+    assert list(store.iter_text()) == [_entry(i).text for i in range(12)]
+
+    store.clear()
+    assert len(store) == 0 and store.spilled == 0
+    store.append(_entry(1))
+    assert store[0] == _entry(1)
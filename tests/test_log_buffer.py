@@ -0,0 +1,44 @@
+"""Journal buffer: batched UI signals and lossless draining across threads."""
+
+import threading
+
+from ui.log_buffer import JournalBuffer
+
+
+def test_push_signals_once_per_full_batch():
+    buffer: JournalBuffer[int] = JournalBuffer(batch_size=3)
+
+    assert [buffer.push(i) for i in range(7)] == [
+        False,
+        False,
+        True,
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert buffer.drain() == list(range(7))
+    assert buffer.drain() == []
+    assert [buffer.push(i) for i in range(3)] == [False, False, True]
+
+
+def test_concurrent_pushes_are_drained_in_order_without_loss():
+    buffer: JournalBuffer[tuple[int, int]] = JournalBuffer(batch_size=50)
+    drained: list[tuple[int, int]] = []
+
+    def produce(thread: int) -> None:
+        for i in range(1000):
+            buffer.push((thread, i))
+
+    threads = [threading.Thread(target=produce, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        drained.extend(buffer.drain())
+    for thread in threads:
+        thread.join()
+    drained.extend(buffer.drain())
+
+    assert len(drained) == 4000
+    for t in range(4):
+        assert [i for owner, i in drained if owner == t] == list(range(1000))
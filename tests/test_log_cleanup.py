@@ -51,3 +51,29 @@ def test_uses_default_retention_from_constants(tmp_path):
     _touch(tmp_path, "parser_2020-01-01.log")
     deleted = cleanup_old_logs(str(tmp_path), today=date(2026, 7, 5))
     assert deleted == 1
+
+
+def test_old_timing_reports_are_cleaned_up_too(tmp_path):
+    old = _touch(tmp_path, "run_2026-06-20_10-00-00.json")
+    same_second = _touch(tmp_path, "run_2026-06-20_10-00-00-250 (1).json")
+    fresh = _touch(tmp_path, "run_2026-07-04_23-59-59-999.json")
+    odd = _touch(tmp_path, "run_2026-06-20.json")
+
+    deleted = cleanup_old_logs(str(tmp_path), max_age_days=7, today=date(2026, 7, 5))
+
+    assert deleted == 2
+    assert not old.exists()
+    assert not same_second.exists()
+    assert fresh.exists()
+    assert odd.exists()
+
+
+def test_rotated_parser_logs_are_cleaned_up_too(tmp_path):
+    old = _touch(tmp_path, "parser_2026-06-20.log.2")
+    fresh = _touch(tmp_path, "parser_2026-07-04.log.1")
+
+    deleted = cleanup_old_logs(str(tmp_path), max_age_days=7, today=date(2026, 7, 5))
+
+    assert deleted == 1
+    assert not old.exists()
+    assert fresh.exists()
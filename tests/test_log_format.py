@@ -69,3 +69,34 @@ def test_linkify_escapes_html():
     result = linkify("<b> and a link https://a.example/x?q=1&y=2")
     assert result.startswith("&lt;b&gt;")
     assert '<a href="https://a.example/x?q=1&amp;y=2">' in result
+
+
+def test_entries_from_events_need_no_parsing():
+    from core import i18n
+    from core.console import LogEvent
+    from ui.log_format import entry_from_event
+
+    try:
+        i18n.set_language("en")
+        banner = entry_from_event(LogEvent("banner", "header", marketplace="Etsy"))
+        assert (banner["kind"], banner["marketplace"]) == ("banner", "Etsy")
+
+        field = entry_from_event(
+            LogEvent("field", "success", key="Tracking link", value="https://a.b/x")
+        )
+        assert field["kind"] == "field"
+        assert field["key"] == "Tracking link"
+        assert '<a href="https://a.b/x">' in field["value"]
+
+        problem = entry_from_event(
+            LogEvent("problem", "error", key="||| Could not get the SKU |||")
+        )
+        assert (problem["kind"], problem["message"]) == (
+            "problem",
+            "Could not get the SKU",
+        )
+
+        plain = entry_from_event(LogEvent("plain", value="---Orders Parser v7---"))
+        assert plain["kind"] == "note"
+    finally:
+        i18n.set_language("en")
@@ -0,0 +1,76 @@
+"""Order archive: per-marketplace dictionaries and random access by order ID."""
+
+import zlib
+
+from bench.generators import generate
+from core.order_archive import (
+    DICTIONARY_SAMPLES,
+    OrderArchive,
+    order_archive_from_argv,
+    reprocess_ids_from_argv,
+    train_dictionary,
+)
+from core.processor import OrderResult
+
+
+def _fill(archive, count, marketplace="etsy", start=0):
+    orders = {}
+    for number in range(start, start + count):
+        order = generate(marketplace, number, items=2, filler_kb=2)
+        archive.add(order, order_id=f"{marketplace}-{number}", marketplace="Etsy")
+        orders[f"{marketplace}-{number}"] = order
+    return orders
+
+
+def test_orders_read_back_by_id_across_dictionaries(tmp_path):
+    archive = OrderArchive(str(tmp_path / "archive.sqlite3"))
+    orders = _fill(archive, DICTIONARY_SAMPLES + 4)
+    archive.train("Etsy")
+    orders |= _fill(archive, 2, start=100)
+
+    reopened = OrderArchive(archive.path)
+    for order_id, order in orders.items():
+        assert reopened.get(order_id) == order
+    assert reopened.get("missing") is None
+    assert reopened.order_ids("Etsy") == list(orders)
+
+
+def test_dictionary_compresses_better_than_plain_zlib(tmp_path):
+    archive = OrderArchive(str(tmp_path / "archive.sqlite3"))
+    _fill(archive, DICTIONARY_SAMPLES)
+    before = archive.sizes()
+    later = _fill(archive, 10, start=50)
+    after = archive.sizes()
+
+    stored = after[1] - before[1]
+    plain = sum(
+        len(zlib.compress(order.encode("utf-8"), 9)) for order in later.values()
+    )
+    assert stored < plain * 0.9
+
+
+def test_train_dictionary_keeps_shared_markup_only():
+    shared = '<div class="order-header-with-a-long-name">'
+    samples = [f"{shared}<p>unique text number {n}</p>" for n in range(4)]
+    zdict = train_dictionary(samples)
+    assert shared.encode() in zdict
+    assert b"unique text number" not in zdict
+
+
+def test_results_without_text_are_skipped(tmp_path):
+    archive = OrderArchive(str(tmp_path / "archive.sqlite3"))
+    archive.add_result(OrderResult(number=1, marketplace=None, ok=False))
+    archive.add_result(
+        OrderResult(1, "Etsy", True, order_id="7", order_text="<html>x</html>")
+    )
+    assert archive.order_ids() == ["7"]
+
+
+def test_argv():
+    assert order_archive_from_argv(["--cli"]) is None
+    assert order_archive_from_argv(["--order-archive", "a.db"]).path == "a.db"
+    assert order_archive_from_argv(["--order-archive", "--stats"]).path.endswith(
+        "order_archive.sqlite3"
+    )
+    assert reprocess_ids_from_argv(["--reprocess", "1, 2,"]) == ["1", "2"]
+    assert reprocess_ids_from_argv([]) is None
@@ -23,6 +23,9 @@ def test_first_customization_picks_first_non_empty():
 
 
 class _FakeWriter:
+    buffered = 0
+    last_row = None
+
     def __init__(self):
         self.appended = []
 
@@ -30,6 +33,9 @@ class _FakeWriter:
         self.appended.append((order_data, extension, smaller_size, customization))
         return "22 roll"
 
+    def flush(self):
+        pass
+
 
 class _FakeParser:
     """A parser that always succeeds"""
@@ -153,3 +159,64 @@ def test_result_callback_receives_ordered_results():
 def test_failed_result_keeps_order_text_for_retry():
     (ok, failed), writer = _run("etsy A</html>", _BrokenParser)
     assert (ok, failed) == (0, 1)
+
+
+def test_results_carry_stage_timings_and_the_run_report_is_saved(tmp_path):
+    from core.processor import OrderResult
+
+    results: list[OrderResult] = []
+    fake_writer = _FakeWriter()
+    with (
+        patch.object(processor_module, "GSheetWriter", return_value=fake_writer),
+        patch.object(processor_module, "GoogleDriveFinder", return_value=object()),
+        patch.object(processor_module, "detect_marketplace") as detect,
+        patch("core.timing.get_logs_dir", return_value=str(tmp_path)),
+    ):
+        from core.dispatcher import MarketplaceSpec
+
+        detect.side_effect = lambda order: MarketplaceSpec(
+            "Etsy", lambda o: True, _FakeParser, "green"
+        )
+        processor_module.process_orders(
+            "a</html>b</html>", result_callback=results.append, report=True
+        )
+
+    for result in results:
+        assert [stage for stage, _ in result.timings] == [
+            "detect",
+            "extract",
+            "parse",
+            "write",
+        ]
+    (report_path,) = tmp_path.glob("run_*.json")
+    assert '"write"' in report_path.read_text(encoding="utf-8")
+
+
+def test_selected_orders_are_profiled_in_their_parse_threads(tmp_path):
+    from core.profiling import ProfileConfig
+
+    class BusyParser(_FakeParser):
+        def parse_order(self):
+            sum(i * i for i in range(20_000))
+            return super().parse_order()
+
+    fake_writer = _FakeWriter()
+    with (
+        patch.object(processor_module, "GSheetWriter", return_value=fake_writer),
+        patch.object(processor_module, "GoogleDriveFinder", return_value=object()),
+        patch.object(processor_module, "detect_marketplace") as detect,
+        patch("core.paths.get_logs_dir", return_value=str(tmp_path)),
+    ):
+        from core.dispatcher import MarketplaceSpec
+
+        detect.side_effect = lambda order: MarketplaceSpec(
+            "Etsy", lambda o: True, BusyParser, "green"
+        )
+        process_orders(
+            "a</html>b</html>c</html>",
+            profile=ProfileConfig(orders=frozenset({2})),
+        )
+
+    (collapsed,) = tmp_path.glob("profile_*.collapsed")
+    assert "parse_order (test_processor.py:" in collapsed.read_text(encoding="utf-8")
+    assert len(list(tmp_path.glob("profile_*.pstats"))) == 1
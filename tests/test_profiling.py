@@ -0,0 +1,226 @@
+"""Startup profiler tests: import timing and milestones."""
+
+import os
+import sys
+
+from core.profiling import ImportProfiler
+
+
+def test_import_times_are_recorded_with_nesting(tmp_path, monkeypatch):
+    (tmp_path / "prof_outer.py").write_text("import prof_inner\n", encoding="utf-8")
+    (tmp_path / "prof_inner.py").write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        import prof_outer  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("prof_outer", None)
+        sys.modules.pop("prof_inner", None)
+
+    outer_total, outer_self = profiler.timings["prof_outer"]
+    inner_total, _ = profiler.timings["prof_inner"]
+    assert outer_total >= inner_total
+    assert outer_self <= outer_total
+    assert profiler.total == outer_total
+
+
+def test_report_lists_milestones_and_modules():
+    profiler = ImportProfiler()
+    profiler.timings = {"slow": (0.2, 0.1), "fast": (0.01, 0.01)}
+    profiler.mark("first frame")
+    lines = profiler.report(top=1)
+    assert lines[0].startswith("first frame: ")
+    assert lines[1].startswith("imports: 2 modules")
+    assert lines[2].endswith("slow")
+    assert len(lines) == 3
+
+
+def test_profile_options_are_read_from_argv():
+    from core.profiling import ProfileConfig, profile_config_from_argv
+
+    assert profile_config_from_argv(["main.py", "--profile-startup"]) is None
+    assert profile_config_from_argv(["main.py", "--profile"]) == ProfileConfig()
+    config = profile_config_from_argv(
+        [
+            "main.py",
+            "--profile=sample",
+            "--profile-orders",
+            "2,5-7",
+            "--profile-marketplace",
+            "Etsy, amazon",
+        ]
+    )
+    assert config == ProfileConfig(
+        mode="sample",
+        orders=frozenset({2, 5, 6, 7}),
+        marketplaces=frozenset({"etsy", "amazon"}),
+    )
+    assert config.wants(6, "eBay") and config.wants(1, "ETSY")
+    assert not config.wants(1, "eBay")
+    # a filter alone turns profiling on
+    assert profile_config_from_argv(["--profile-orders", "3"]).orders == {3}
+
+
+def _busy(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def test_cprofile_merges_sections_from_several_threads(tmp_path):
+    import pstats
+    import threading
+
+    from core.profiling import ProfileConfig, RunProfiler
+
+    profiler = RunProfiler(ProfileConfig(orders=frozenset({1, 2})))
+
+    def parse(number: int) -> None:
+        with profiler.order(number, "Etsy"):
+            _busy(20_000)
+
+    threads = [threading.Thread(target=parse, args=(n,)) for n in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    pstats_path, collapsed_path = profiler.save(str(tmp_path))
+
+    stats = pstats.Stats(pstats_path)
+    (busy,) = [key for key in stats.stats if key[2] == "_busy"]  # type: ignore[attr-defined]
+    assert stats.stats[busy][1] == 2  # type: ignore[attr-defined]
+    with open(collapsed_path, encoding="utf-8") as f:
+        assert "_busy (test_profiling.py:" in f.read()
+
+
+def test_sampler_records_stacks_of_registered_threads_only(tmp_path):
+    import pstats
+    import threading
+
+    from core.profiling import SamplingProfiler
+
+    sampler = SamplingProfiler()
+    inside = threading.Event()
+    done = threading.Event()
+
+    def work() -> None:
+        with sampler.sampling():
+            inside.set()
+            done.wait()
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    inside.wait()
+    for _ in range(3):
+        sampler.sample()
+    done.set()
+    thread.join()
+    sampler.sample()  # nothing registered any more
+
+    assert sum(sampler.samples.values()) == 3
+    (line,) = sampler.collapsed_lines()
+    assert "work (test_profiling.py:" in line and line.endswith(" 3")
+
+    import marshal
+
+    path = tmp_path / "sampled.pstats"
+    path.write_bytes(marshal.dumps(sampler.pstats_data()))
+    stats = pstats.Stats(str(path))
+    (work,) = [key for key in stats.stats if key[2] == "work"]  # type: ignore[attr-defined]
+    assert stats.stats[work][3] == 3 * sampler.interval  # type: ignore[attr-defined]
+
+
+def test_parallel_sections_share_one_profiler(tmp_path):
+    import pstats
+    import threading
+
+    from core.profiling import ProfileConfig, RunProfiler
+
+    profiler = RunProfiler(ProfileConfig())
+    errors: list[BaseException] = []
+    start = threading.Event()
+
+    def parse(number: int) -> None:
+        start.wait()
+        try:
+            with profiler.order(number, "Etsy"):
+                _busy(50_000)
+        except BaseException as error:  # noqa: BLE001
+            errors.append(error)
+
+    threads = [threading.Thread(target=parse, args=(n,)) for n in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    stats = pstats.Stats(profiler.save(str(tmp_path))[0])
+    # Every thread's work is in the profile (the generator steps of all three
+    # _busy() calls; cProfile's caller links may blur while threads overlap)
+    (steps,) = [key for key in stats.stats if key[2] == "<genexpr>"]  # type: ignore[attr-defined]
+    assert stats.stats[steps][1] > 3 * 50_000  # type: ignore[attr-defined]
+
+
+def test_profiled_sections_overlap_instead_of_taking_turns():
+    import threading
+
+    from core.profiling import ProfileConfig, RunProfiler
+
+    profiler = RunProfiler(ProfileConfig())
+    both_inside = threading.Barrier(2, timeout=5)
+    errors: list[BaseException] = []
+
+    def parse(number: int) -> None:
+        try:
+            with profiler.order(number, "Etsy"):
+                both_inside.wait()
+        except BaseException as error:  # noqa: BLE001
+            errors.append(error)
+
+    threads = [threading.Thread(target=parse, args=(n,)) for n in (1, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_profiles_saved_in_the_same_millisecond_keep_apart(tmp_path):
+    from unittest.mock import patch
+
+    from core import profiling
+
+    profiler = profiling.RunProfiler(profiling.ProfileConfig())
+    with profiler.section():
+        _busy(1000)
+    fixed = profiling.datetime(2026, 7, 5, 10, 0, 0, 250000)
+    with patch.object(profiling, "datetime") as clock:
+        clock.now.return_value = fixed
+        first = profiler.save(str(tmp_path))
+        second = profiler.save(str(tmp_path))
+
+    names = [os.path.basename(path) for path in first + second]
+    assert names == [
+        "profile_2026-07-05_10-00-00-250.pstats",
+        "profile_2026-07-05_10-00-00-250.collapsed",
+        "profile_2026-07-05_10-00-00-250 (1).pstats",
+        "profile_2026-07-05_10-00-00-250 (1).collapsed",
+    ]
+
+
+def test_sampler_thread_runs_only_inside_sections():
+    from core.profiling import ProfileConfig, RunProfiler
+
+    profiler = RunProfiler(ProfileConfig(mode="sample"))
+    assert profiler._sampler is not None
+    assert profiler._sampler._thread is None
+
+    with profiler.section():
+        assert profiler._sampler._thread is not None
+        _busy(50_000)
+
+    assert profiler._sampler._thread is None
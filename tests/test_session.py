@@ -0,0 +1,82 @@
+"""Warm processing session tests: reuse across runs and idle expiry."""
+
+from unittest.mock import MagicMock, patch
+
+import core.session as session_module
+from core.session import ProcessingSession
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run(session, orders=("a</html>",)):
+    with (
+        patch.object(session_module, "process_order_list") as process,
+        patch.object(session_module, "ensure_fresh_credentials"),
+    ):
+        process.return_value = (len(orders), 0)
+        result = session.process_order_list(list(orders))
+    return result, process.call_args.kwargs
+
+
+def test_second_run_reuses_writer_finder_and_pool():
+    writers = [MagicMock(), MagicMock()]
+    with (
+        patch.object(session_module, "GSheetWriter", side_effect=writers) as writer_cls,
+        patch.object(session_module, "GoogleDriveFinder") as finder_cls,
+    ):
+        session = ProcessingSession(clock=_Clock())
+        _, first = _run(session)
+        _, second = _run(session)
+        session.close()
+
+    assert writer_cls.call_count == 1
+    assert finder_cls.call_count == 1
+    assert first["writer"] is second["writer"] is writers[0]
+    assert first["executor"] is second["executor"]
+    writers[0].revalidate.assert_called_once()
+    second["finder"].clear_cache.assert_called_once()
+
+
+def test_idle_session_is_released_and_rebuilt():
+    clock = _Clock()
+    with (
+        patch.object(session_module, "GSheetWriter") as writer_cls,
+        patch.object(session_module, "GoogleDriveFinder"),
+    ):
+        session = ProcessingSession(idle_timeout=60, clock=clock)
+        _run(session)
+        clock.now = 30
+        assert session.expire_if_idle() is False
+        assert session.is_warm
+
+        clock.now = 100
+        assert session.expire_if_idle() is True
+        assert not session.is_warm
+
+        _run(session)
+        session.close()
+
+    assert writer_cls.call_count == 2
+
+
+def test_unexpected_error_drops_the_warm_state():
+    with (
+        patch.object(session_module, "GSheetWriter"),
+        patch.object(session_module, "GoogleDriveFinder"),
+        patch.object(session_module, "ensure_fresh_credentials"),
+        patch.object(
+            session_module, "process_order_list", side_effect=RuntimeError("boom")
+        ),
+    ):
+        session = ProcessingSession(clock=_Clock())
+        try:
+            session.process_order_list(["a"])
+        except RuntimeError:
+            pass
+    assert not session.is_warm
@@ -0,0 +1,196 @@
+"""Local output sinks: routing, buffered bulk writes and the dry-run pipeline."""
+
+import csv
+import json
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+import core.session as session_module
+from bench.fakes import OfflineFinder
+from bench.generators import orders_file
+from core.constants import COL_ORDER_ID, COL_QUANTITY, SHEET_22_ROLL, SHEET_ERROR
+from core.processor import process_order_list, split_orders
+from core.session import ProcessingSession
+from core.sinks import (
+    CsvSink,
+    JsonlSink,
+    SinkConfig,
+    SqliteSink,
+    sink_config,
+    sink_config_from_argv,
+)
+
+_ITEMS = [
+    {COL_ORDER_ID: "1001", COL_QUANTITY: 1},
+    {COL_ORDER_ID: "1001", COL_QUANTITY: 2},
+]
+
+
+def test_jsonl_sink_routes_like_the_spreadsheet_and_buffers(tmp_path):
+    path = tmp_path / "out" / "orders.jsonl"
+    sink = JsonlSink(str(path))
+    assert sink.append_order(_ITEMS, "svg", 20.0) == SHEET_22_ROLL
+    assert sink.append_order(_ITEMS[:1], "Unknown", "") == SHEET_ERROR
+    assert sink.append_order([], "svg", 20.0) is None
+    assert not path.exists()
+
+    sink.flush()
+    records = [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+    assert [r["sheet"] for r in records] == [SHEET_22_ROLL, SHEET_22_ROLL, SHEET_ERROR]
+    assert records[1]["row"][COL_QUANTITY] == 2
+    assert records[0]["row"]["Status"] == ""
+
+
+def test_full_buffer_is_written_before_the_end_of_the_run(tmp_path):
+    path = tmp_path / "orders.jsonl"
+    sink = JsonlSink(str(path), buffer_rows=3)
+    sink.append_order(_ITEMS, "svg", 20.0)
+    assert not path.exists()
+    sink.append_order(_ITEMS[:1], "svg", 20.0)
+    assert len(path.read_text("utf-8").splitlines()) == 3
+
+
+def test_rows_stay_buffered_when_the_write_fails(tmp_path):
+    path = tmp_path / "orders.jsonl"
+    sink = JsonlSink(str(path))
+    sink.append_order(_ITEMS, "svg", 20.0)
+
+    failing = patch.object(JsonlSink, "_write", side_effect=OSError("disk full"))
+    with failing, pytest.raises(OSError):
+        sink.flush()
+    assert not path.exists()
+
+    sink.flush()
+    assert len(path.read_text("utf-8").splitlines()) == 2
+
+
+def test_csv_sink_writes_one_file_per_sheet_with_a_header(tmp_path):
+    sink = CsvSink(str(tmp_path))
+    sink.append_order(_ITEMS, "svg", 20.0)
+    sink.flush()
+    sink.append_order(_ITEMS[:1], "svg", 20.0)
+    sink.append_order(_ITEMS[:1], "Unknown", "")
+    sink.flush()
+
+    with open(tmp_path / f"{SHEET_22_ROLL}.csv", encoding="utf-8-sig") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == sink.headers
+    assert [row[sink.headers.index(COL_QUANTITY)] for row in rows[1:]] == [
+        "1",
+        "2",
+        "1",
+    ]
+    assert (tmp_path / f"{SHEET_ERROR}.csv").exists()
+
+
+def test_sqlite_sink_inserts_rows_and_adds_missing_columns(tmp_path):
+    path = str(tmp_path / "orders.sqlite3")
+    first = SqliteSink(path, headers=[COL_ORDER_ID])
+    first.append_order(_ITEMS, "svg", 20.0)
+    first.flush()
+
+    second = SqliteSink(path, headers=[COL_ORDER_ID, COL_QUANTITY])
+    second.append_order(_ITEMS[:1], "Unknown", "")
+    second.flush()
+
+    connection = sqlite3.connect(path)
+    rows = connection.execute(
+        f'SELECT sheet, "{COL_ORDER_ID}", "{COL_QUANTITY}" FROM rows ORDER BY id'
+    ).fetchall()
+    connection.close()
+    assert rows == [
+        (SHEET_22_ROLL, "1001", None),
+        (SHEET_22_ROLL, "1001", None),
+        (SHEET_ERROR, "1001", 1),
+    ]
+
+
+def test_sink_config_parsing():
+    assert sink_config("") is None
+    assert sink_config("Sheets") is None
+    assert sink_config("csv", "/tmp/x") == SinkConfig("csv", "/tmp/x")
+    assert sink_config_from_argv(["--cli", "--sink", "sqlite"]) == SinkConfig("sqlite")
+    assert sink_config_from_argv(["--cli"]) is None
+    assert SinkConfig("jsonl").target.endswith("orders.jsonl")
+    with pytest.raises(ValueError):
+        sink_config("xlsx")
+
+
+def test_dry_run_pipeline_writes_every_order_locally(tmp_path):
+    path = tmp_path / "orders.jsonl"
+    orders = split_orders(orders_file(8, items=2, filler_kb=0))
+    ok, failed = process_order_list(
+        orders, writer=JsonlSink(str(path)), finder=OfflineFinder()
+    )
+    assert (ok, failed) == (8, 0)
+    records = [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+    assert len(records) == 16
+    assert all(record["row"][COL_ORDER_ID] for record in records)
+
+
+class _FirstWriteFails(JsonlSink):
+    def __init__(self, path, **kwargs):
+        super().__init__(path, **kwargs)
+        self.writes = 0
+
+    def _write(self, orders):
+        self.writes += 1
+        if self.writes == 1:
+            raise OSError("disk full")
+        super()._write(orders)
+
+
+def test_order_whose_bulk_write_fails_is_failed_and_never_written(tmp_path):
+    path = tmp_path / "orders.jsonl"
+    sink = _FirstWriteFails(str(path), buffer_rows=4)
+    orders = split_orders(orders_file(4, items=2, filler_kb=0))
+    results = []
+    ok, failed = process_order_list(
+        orders, result_callback=results.append, writer=sink, finder=OfflineFinder()
+    )
+
+    assert (ok, failed) == (3, 1)
+    assert [(r.number, r.ok) for r in results] == [
+        (1, True),
+        (2, False),
+        (3, True),
+        (4, True),
+    ]
+    records = [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+    written = [record["row"][COL_ORDER_ID] for record in records]
+    assert results[1].order_id not in written
+    assert len(written) == 6
+
+
+def test_orders_of_a_failed_last_write_are_failed_and_dropped(tmp_path):
+    sink = JsonlSink(str(tmp_path / "orders.jsonl"))
+    orders = split_orders(orders_file(3, items=1, filler_kb=0))
+    results = []
+    with patch.object(JsonlSink, "_write", side_effect=OSError("disk full")):
+        ok, failed = process_order_list(
+            orders, result_callback=results.append, writer=sink, finder=OfflineFinder()
+        )
+
+    assert (ok, failed) == (0, 3)
+    assert [r.error for r in results] == ["disk full"] * 3
+    assert sink.buffered == 0
+
+
+def test_session_switches_to_a_new_sink(tmp_path):
+    with (
+        patch.object(session_module, "GSheetWriter") as writer_cls,
+        patch.object(session_module, "GoogleDriveFinder"),
+        patch.object(session_module, "ensure_fresh_credentials"),
+        patch.object(session_module, "process_order_list") as process,
+    ):
+        process.return_value = (1, 0)
+        session = ProcessingSession()
+        session.process_order_list(["a"])
+        session.sink = SinkConfig("jsonl", str(tmp_path / "o.jsonl"))
+        session.process_order_list(["a"])
+        session.close()
+
+    assert writer_cls.call_count == 1
+    assert isinstance(process.call_args.kwargs["writer"], JsonlSink)
@@ -0,0 +1,239 @@
+"""Offline spool: classifying outages, spooling a run and replaying it in order."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from bench.fakes import HEADERS, OfflineFinder, OfflineWriter
+from core.constants import (
+    COL_ORDER_ID,
+    COL_SHIPPING_LABEL,
+    LABEL_PENDING,
+    SHEET_22_ROLL,
+)
+from core.processor import _ParsedOrder, process_order_list
+from core.spool import Spool, replay_spool
+from google_api.errors import PartialWriteError, is_unavailable
+from google_api.gsheet_writer import OrderWrite
+
+
+def _api_error(code):
+    from gspread.exceptions import APIError
+
+    response = MagicMock()
+    response.json.return_value = {"error": {"code": code, "message": "x"}}
+    return APIError(response)
+
+
+def _order(order_id, label=""):
+    return OrderWrite(
+        [{COL_ORDER_ID: order_id, COL_SHIPPING_LABEL: label}], "svg", 20.0
+    )
+
+
+class _FlakyWriter(OfflineWriter):
+    """Writes normally until ``down`` is set, then fails like a dead network."""
+
+    def __init__(self, error=None, down_after=None):
+        super().__init__()
+        self.down = False
+        self.down_after = down_after
+        self.error = error or ConnectionError("network is unreachable")
+
+    def append_order(self, *args, **kwargs):
+        if self.down_after is not None:
+            self.down = self.down_after == 0
+            self.down_after -= 1
+        if self.down:
+            raise self.error
+        return super().append_order(*args, **kwargs)
+
+    def append_orders(self, orders):
+        if self.down:
+            raise self.error
+        return super().append_orders(orders)
+
+    def written_ids(self):
+        rows = self.spreadsheet.worksheets[SHEET_22_ROLL].rows[1:]
+        return [row[HEADERS.index(COL_ORDER_ID)] for row in rows]
+
+
+def _fake_parse(number, order, finder, profiler=None):
+    """Every order parses into one 22 roll item with the text as its ID."""
+    items = [{COL_ORDER_ID: order, COL_SHIPPING_LABEL: ""}]
+    return _ParsedOrder(number, order, "Amazon", [], [], items, "svg", 20.0)
+
+
+def test_unavailable_errors_are_told_apart():
+    from googleapiclient.errors import HttpError
+
+    assert is_unavailable(ConnectionError())
+    assert is_unavailable(TimeoutError())
+    assert is_unavailable(_api_error(503))
+    assert is_unavailable(_api_error(429))
+    assert is_unavailable(HttpError(MagicMock(status=500), b""))
+    assert not is_unavailable(_api_error(400))
+    assert not is_unavailable(FileNotFoundError())
+    assert not is_unavailable(ValueError("bad value"))
+
+
+def test_outage_sends_the_rest_of_the_run_to_the_spool(monkeypatch):
+    monkeypatch.setattr("core.processor._parse_one", _fake_parse)
+    writer = _FlakyWriter(down_after=1)
+    spool = Spool()
+    orders = [f"order-{n}" for n in range(1, 5)]
+    results = []
+    ok, failed = process_order_list(
+        orders,
+        result_callback=results.append,
+        writer=writer,
+        finder=OfflineFinder(),
+        spool=spool,
+    )
+
+    assert (ok, failed) == (1, 0)
+    assert [r.spooled for r in results] == [False, True, True, True]
+    assert results[1].sheet == SHEET_22_ROLL
+    assert [entry.order_id for entry in spool.pending()] == orders[1:]
+
+    # Once Google is back, the next run writes the spool first, in order.
+    writer.down, writer.down_after = False, None
+    process_order_list(["order-5"], writer=writer, finder=OfflineFinder(), spool=spool)
+    assert writer.written_ids() == [f"order-{n}" for n in range(1, 6)]
+    assert spool.count() == 0
+
+
+def test_replay_batches_writes_and_stops_while_google_is_down():
+    spool = Spool()
+    for n in range(5):
+        spool.add(_order(f"A-{n}"), sheet=SHEET_22_ROLL)
+
+    writer = _FlakyWriter(error=_api_error(503))
+    writer.down = True
+    result = replay_spool(writer, OfflineFinder(), spool, batch_size=2)
+    assert (result.written, result.left, result.stopped) == (0, 5, True)
+
+    writer.down = False
+    result = replay_spool(writer, OfflineFinder(), spool, batch_size=2)
+    assert (result.written, result.left) == (5, 0)
+    assert writer.written_ids() == [f"A-{n}" for n in range(5)]
+    # Every order got its rows; consecutive orders share one insert per batch.
+    inserts = [
+        r["insertDimension"]["range"]
+        for r in writer.spreadsheet.requests
+        if "insertDimension" in r
+    ]
+    assert len(inserts) == 3
+    assert sum(r["endIndex"] - r["startIndex"] for r in inserts) == 5
+
+
+def test_rejected_order_is_kept_aside_and_the_rest_goes_through():
+    spool = Spool()
+    for order_id in ("A-1", "BAD", "A-3"):
+        spool.add(_order(order_id), sheet=SHEET_22_ROLL)
+
+    class _Picky(_FlakyWriter):
+        def append_orders(self, orders):
+            if any(order.order_items[0][COL_ORDER_ID] == "BAD" for order in orders):
+                raise _api_error(400)
+            return super().append_orders(orders)
+
+    writer = _Picky()
+    result = replay_spool(writer, OfflineFinder(), spool)
+    assert (result.written, result.failed, result.left) == (2, 1, 0)
+    assert writer.written_ids() == ["A-1", "A-3"]
+    assert [entry.order_id for entry in spool.failed()] == ["BAD"]
+
+
+def _partial(error):
+    return PartialWriteError("blank rows were added", "22 roll rows 2-2", error)
+
+
+def test_order_written_in_part_fails_instead_of_going_to_the_spool(monkeypatch):
+    monkeypatch.setattr("core.processor._parse_one", _fake_parse)
+
+    class _CutOff(_FlakyWriter):
+        def append_order(self, *args, **kwargs):
+            if self.down_after == 0:
+                self.down_after = None
+                self.down = True
+                raise _partial(ConnectionError("reset"))
+            return super().append_order(*args, **kwargs)
+
+    writer = _CutOff(down_after=1)
+    spool = Spool()
+    results = []
+    process_order_list(
+        ["order-1", "order-2", "order-3"],
+        result_callback=results.append,
+        writer=writer,
+        finder=OfflineFinder(),
+        spool=spool,
+    )
+
+    assert [(r.ok, r.spooled) for r in results] == [
+        (True, False),
+        (False, False),
+        (False, True),
+    ]
+    assert "blank rows were added" in results[1].error
+    assert [entry.order_id for entry in spool.pending()] == ["order-3"]
+
+
+def test_batch_written_in_part_is_kept_aside_not_replayed():
+    spool = Spool()
+    for order_id in ("A-1", "A-2", "A-3"):
+        spool.add(_order(order_id), sheet=SHEET_22_ROLL)
+
+    class _CutOff(_FlakyWriter):
+        def append_orders(self, orders):
+            raise _partial(_api_error(503))
+
+    result = replay_spool(_CutOff(), OfflineFinder(), spool, batch_size=2)
+    assert (result.written, result.failed, result.left) == (0, 2, 1)
+    assert [entry.order_id for entry in spool.failed()] == ["A-1", "A-2"]
+    assert "22 roll rows 2-2" in spool.failed()[0].failed
+
+
+def test_pending_label_is_uploaded_before_the_order_is_written():
+    spool = Spool()
+    spool.add(_order("L-1", label=LABEL_PENDING), sheet=SHEET_22_ROLL)
+    finder = OfflineFinder()
+
+    finder.upload_shipping_labels = lambda order_id: LABEL_PENDING  # type: ignore[method-assign]
+    writer = _FlakyWriter()
+    assert replay_spool(writer, finder, spool).left == 1
+    assert writer.written_ids() == []
+
+    del finder.upload_shipping_labels
+    assert replay_spool(writer, finder, spool).left == 0
+    row = writer.spreadsheet.worksheets[SHEET_22_ROLL].rows[1]
+    assert row[HEADERS.index(COL_SHIPPING_LABEL)].endswith("L-1.pdf/view")
+
+
+def test_spool_keeps_values_and_is_created_lazily(tmp_path):
+    spool = Spool(str(tmp_path / "sub" / "spool.sqlite3"))
+    assert spool.count() == 0 and spool.pending() == []
+    assert not (tmp_path / "sub").exists()
+
+    spool.add(
+        OrderWrite([{COL_ORDER_ID: "1", "Quantity": 2}], "Unknown", ""), sheet="ERROR"
+    )
+    entry = spool.pending()[0]
+    assert entry.order == OrderWrite(
+        [{COL_ORDER_ID: "1", "Quantity": 2}], "Unknown", ""
+    )
+    assert entry.sheet == "ERROR"
+
+
+@pytest.mark.parametrize("code", [400, 403])
+def test_request_errors_still_fail_the_order(monkeypatch, code):
+    writer = _FlakyWriter(error=_api_error(code))
+    writer.down = True
+    spool = Spool()
+    monkeypatch.setattr("core.processor._parse_one", _fake_parse)
+    ok, failed = process_order_list(
+        ["x"], writer=writer, finder=OfflineFinder(), spool=spool
+    )
+    assert (ok, failed) == (0, 1)
+    assert spool.count() == 0
@@ -0,0 +1,93 @@
+"""Stage timings and the run performance report."""
+
+import json
+import os
+import threading
+from unittest.mock import patch
+
+from core import timing
+from core.processor import OrderResult
+
+
+def test_stages_are_recorded_per_thread_and_only_while_recording():
+    with timing.stage("ignored"):
+        pass
+
+    seen: dict[str, list[str]] = {}
+
+    def work(name: str) -> None:
+        with (
+            timing.recording() as timings,
+            timing.stage(f"{name}.outer"),
+            timing.stage(f"{name}.inner"),
+        ):
+            pass
+        seen[name] = [stage for stage, _ in timings]
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {"a": ["a.inner", "a.outer"], "b": ["b.inner", "b.outer"]}
+
+
+def test_recording_into_keeps_timings_of_a_failed_block():
+    target: timing.Timings = []
+    try:
+        with timing.recording(target), timing.stage("write"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert [stage for stage, _ in target] == ["write"]
+
+
+def test_percentiles_use_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert timing.percentile(values, 0.5) == 50.0
+    assert timing.percentile(values, 0.95) == 95.0
+    assert timing.percentile([], 0.5) == 0.0
+
+
+def test_report_groups_by_stage_marketplace_and_sheet(tmp_path):
+    results = [
+        OrderResult(1, "Etsy", True, sheet="22 roll", timings=[("soup", 0.010)]),
+        OrderResult(2, "Etsy", True, sheet="22 roll", timings=[("soup", 0.030)]),
+        OrderResult(3, "Amazon", False, timings=[("soup", 0.020), ("write", 0.5)]),
+        OrderResult(4, "Amazon", False, spooled=True),
+    ]
+
+    report = timing.build_report(results, wall_seconds=1.5)
+
+    counts = report["orders"], report["ok"], report["spooled"], report["failed"]
+    assert counts == (4, 2, 1, 1)
+    assert report["wall_ms"] == 1500.0
+    assert report["stages"]["soup"] == {
+        "count": 3,
+        "total_ms": 60.0,
+        "p50_ms": 20.0,
+        "p95_ms": 30.0,
+        "max_ms": 30.0,
+    }
+    assert report["marketplaces"]["Etsy"]["orders"] == 2
+    assert report["marketplaces"]["Amazon"]["stages"]["write"]["max_ms"] == 500.0
+    assert list(report["sheets"]) == ["22 roll"]
+    assert [name for name, _ in timing.slowest_stages(report)] == ["write", "soup"]
+
+    path = timing.write_report(report, str(tmp_path))
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == report
+
+
+def test_reports_written_in_the_same_millisecond_do_not_overwrite(tmp_path):
+    fixed = timing.datetime(2026, 7, 5, 10, 0, 0, 250000)
+    with patch.object(timing, "datetime") as clock:
+        clock.now.return_value = fixed
+        first = timing.write_report({"orders": 1}, str(tmp_path))
+        second = timing.write_report({"orders": 2}, str(tmp_path))
+
+    assert os.path.basename(first) == "run_2026-07-05_10-00-00-250.json"
+    assert os.path.basename(second) == "run_2026-07-05_10-00-00-250 (1).json"
+    with open(first, encoding="utf-8") as f:
+        assert json.load(f) == {"orders": 1}
@@ -0,0 +1,158 @@
+"""Watch-folder mode: picking up settled files, archiving, labels, inotify."""
+
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import core.session as session_module
+from bench.fakes import OfflineFinder
+from bench.generators import orders_file
+from core.paths import unique_path
+from core.session import ProcessingSession
+from core.sinks import SinkConfig
+from core.watch import InotifyWatcher, WatchConfig, WatchDaemon, watch_config_from_argv
+from google_api.gdrive_finder import GoogleDriveFinder
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    config = WatchConfig(
+        inbox=str(tmp_path / "inbox"), archive=str(tmp_path / "archive")
+    )
+    os.makedirs(config.inbox)
+    session = ProcessingSession(
+        sink=SinkConfig("jsonl", str(tmp_path / "out.jsonl")),
+        finder_factory=OfflineFinder,
+    )
+    with patch.object(session_module, "ensure_fresh_credentials"):
+        yield WatchDaemon(config, session)
+    session.close()
+
+
+def _age(path, seconds):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def _rows(tmp_path):
+    path = tmp_path / "out.jsonl"
+    return [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+
+
+def test_settled_order_files_are_processed_and_archived(daemon, tmp_path):
+    inbox = tmp_path / "inbox"
+    first = inbox / "orders.txt"
+    first.write_text(orders_file(2, items=1, filler_kb=0), "utf-8")
+    second = inbox / "more.html"
+    second.write_text(orders_file(1, items=2, filler_kb=0), "utf-8")
+    _age(first, 10)
+    _age(second, 5)
+    (inbox / "notes.docx").write_bytes(b"ignored")
+    (inbox / "1001.pdf").write_bytes(b"%PDF waits for its order")
+
+    assert daemon.poll_once() is None
+    assert len(_rows(tmp_path)) == 4
+    assert sorted(os.listdir(inbox)) == ["1001.pdf", "notes.docx"]
+    archived = os.listdir(tmp_path / "archive")
+    (dated,) = [d for d in archived if d not in ("failed", "processing")]
+    assert os.listdir(tmp_path / "archive" / "processing") == []
+    assert sorted(os.listdir(tmp_path / "archive" / dated)) == [
+        "more.html",
+        "orders.txt",
+    ]
+
+
+def test_files_still_being_written_wait_to_settle(daemon, tmp_path):
+    fresh = tmp_path / "inbox" / "orders.txt"
+    fresh.write_text(orders_file(1, items=1, filler_kb=0), "utf-8")
+
+    wait = daemon.poll_once()
+    assert wait is not None and 0 < wait <= daemon.config.settle_seconds
+    assert fresh.exists()
+
+    _age(fresh, 10)
+    daemon.poll_once()
+    assert not fresh.exists()
+
+
+def test_unreadable_file_goes_to_the_failed_folder(daemon, tmp_path):
+    broken = tmp_path / "inbox" / "orders.txt"
+    broken.write_bytes(b"\xff\xfe\x00 not utf-8 \xc3")
+    _age(broken, 10)
+
+    daemon.poll_once()
+    assert os.listdir(tmp_path / "archive" / "failed") == ["orders.txt"]
+
+
+def test_locked_file_stays_in_the_inbox_until_it_can_be_taken(daemon, tmp_path):
+    locked = tmp_path / "inbox" / "orders.txt"
+    locked.write_text(orders_file(1, items=1, filler_kb=0), "utf-8")
+    _age(locked, 10)
+
+    with patch("core.watch.shutil.move", side_effect=PermissionError("locked")):
+        daemon.poll_once()
+    assert locked.exists()
+    assert not (tmp_path / "out.jsonl").exists()
+
+    daemon.poll_once()
+    assert not locked.exists()
+    assert len(_rows(tmp_path)) == 1
+
+
+def test_file_that_cannot_be_archived_is_not_processed_again(daemon, tmp_path):
+    inbox = tmp_path / "inbox"
+    (inbox / "orders.txt").write_text(orders_file(1, items=1, filler_kb=0), "utf-8")
+    _age(inbox / "orders.txt", 10)
+    real_move = shutil.move
+
+    def move(source, target):
+        if "processing" in str(source):
+            raise PermissionError("locked")
+        return real_move(source, target)
+
+    with patch("core.watch.shutil.move", side_effect=move):
+        daemon.poll_once()
+        daemon.poll_once()
+    assert os.listdir(tmp_path / "archive" / "processing") == ["orders.txt"]
+    assert len(_rows(tmp_path)) == 1
+
+
+def test_finder_looks_in_label_folders_and_archives_uploads(tmp_path):
+    inbox, archive = tmp_path / "inbox", tmp_path / "labels"
+    inbox.mkdir()
+    (inbox / "7.pdf").write_bytes(b"%PDF")
+    finder = GoogleDriveFinder(label_dirs=[str(inbox)], label_archive=str(archive))
+
+    assert (str(inbox), "7.pdf") in finder._label_files()
+    archive.mkdir()
+    (archive / "7.pdf").write_bytes(b"older")
+    finder._dispose_label(str(inbox / "7.pdf"))
+    assert sorted(os.listdir(archive)) == ["7 (1).pdf", "7.pdf"]
+    assert unique_path(str(archive), "x/7.pdf").endswith("7 (2).pdf")
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+def test_inotify_wakes_up_when_a_file_is_saved(tmp_path):
+    watcher = InotifyWatcher(str(tmp_path))
+    timer = threading.Timer(0.05, (tmp_path / "orders.txt").write_text, ["x"])
+    timer.start()
+    started = time.perf_counter()
+    watcher.wait(5.0, threading.Event())
+    watcher.close()
+    timer.join()
+    assert time.perf_counter() - started < 0.9
+
+
+def test_watch_config_from_argv():
+    assert watch_config_from_argv(["--cli"]) is None
+    config = watch_config_from_argv(["--watch", "--poll-interval", "2.5"])
+    assert config == WatchConfig(poll_seconds=2.5)
+    assert config.inbox_dir.endswith("inbox")
+    config = watch_config_from_argv(["--watch", "D:\\in", "--archive", "D:\\done"])
+    assert (config.inbox, config.archive) == ("D:\\in", "D:\\done")
@@ -2,6 +2,7 @@
 
 import os
 import sys
+from typing import cast
 
 
 def run_app() -> None:
@@ -9,11 +10,21 @@ def run_app() -> None:
     from PySide6.QtCore import QTranslator
     from PySide6.QtGui import QGuiApplication, QIcon
     from PySide6.QtQml import QQmlApplicationEngine
+    from PySide6.QtQuick import QQuickWindow
     from PySide6.QtQuickControls2 import QQuickStyle
 
     from core.paths import resource_path
+    from core.profiling import (
+        mark_startup,
+        report_startup,
+        startup_profiling_enabled,
+    )
+    from google_api.auth import warm_up_credentials
     from ui.backend import Backend
 
+    # The first access token is fetched while QML is loading
+    warm_up_credentials()
+
     QQuickStyle.setStyle("Material")
 
     app = QGuiApplication(sys.argv)
@@ -25,6 +36,7 @@ def run_app() -> None:
         app.setWindowIcon(QIcon(icon_path))
 
     backend = Backend()
+    app.aboutToQuit.connect(backend.shutdown)
     engine = QQmlApplicationEngine()
 
     translator = QTranslator(app)
@@ -53,6 +65,17 @@ def run_app() -> None:
     if not engine.rootObjects():
         print("Failed to load the UI (ui/qml/Main.qml)", file=sys.stderr)
         sys.exit(1)
+    mark_startup("QML loaded")
+
+    if startup_profiling_enabled():
+        window = cast(QQuickWindow, engine.rootObjects()[0])
+
+        def on_first_frame() -> None:
+            window.frameSwapped.disconnect(on_first_frame)
+            mark_startup("first frame")
+            report_startup()
+
+        window.frameSwapped.connect(on_first_frame)
 
     exit_code = app.exec()
     del engine
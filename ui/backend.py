@@ -1,8 +1,10 @@
 """Python backend of the desktop UI (PySide6 + QML)."""
 
 import os
-from dataclasses import dataclass
+import sqlite3
+from dataclasses import asdict
 from datetime import datetime
+from typing import cast
 
 from PySide6.QtCore import (
     Property,
@@ -13,6 +15,7 @@ from PySide6.QtCore import (
     QSortFilterProxyModel,
     Qt,
     QThread,
+    QTimer,
     QUrl,
     Signal,
     Slot,
@@ -22,26 +25,46 @@ from PySide6.QtGui import QDesktopServices
 from core import console
 from core import i18n as core_i18n
 from core.i18n import tr
-from core.constants import APP_VERSION
+from core.constants import APP_VERSION, SESSION_IDLE_TIMEOUT_MINUTES
 from core.paths import get_logs_dir, get_orders_file_path
-from core.processor import OrderResult, process_order_list, split_orders
-from ui.log_format import parse_entry
+from core.processor import OrderResult, split_orders
+from core.profiling import ProfileConfig, profile_config_from_argv
+from core.session import ProcessingSession
+from core.spool import ReplayResult
+from core.sinks import SINK_KINDS, SinkConfig, sink_config
+from google_api.stats import get_api_stats
+from ui.journal_index import JournalIndex
+from ui.journal_store import JournalEntry, JournalStore
+from ui.log_buffer import FLUSH_INTERVAL_MS, JournalBuffer
+from ui.log_format import LogEntry, entry_from_event, parse_entry
+
+# How often the offline spool is retried while the app sits idle
+SPOOL_REPLAY_INTERVAL_MS = 60_000
+
+
+def _make_entry(text: str, level: str, parsed: LogEntry) -> JournalEntry:
+    return JournalEntry(
+        text=text,
+        level=level,
+        time=datetime.now().strftime("%H:%M:%S"),
+        kind=parsed["kind"],
+        marketplace=parsed["marketplace"],
+        key=parsed["key"],
+        value=parsed["value"],
+        message=parsed["message"],
+    )
 
 
-@dataclass
-class _LogEntry:
-    text: str
-    level: str
-    time: str
-    kind: str
-    marketplace: str
-    key: str
-    value: str
-    message: str
+def _entry_from_event(event: console.LogEvent) -> JournalEntry:
+    return _make_entry(event.text, event.level, entry_from_event(event))
 
 
 class LogModel(QAbstractListModel):
-    """All journal entries of the current run (structured)."""
+    """All journal entries of the current run (structured).
+
+    Entries live in a JournalStore: only the newest ones stay in memory,
+    older rows are paged back in from disk when the view scrolls to them.
+    """
 
     TextRole = Qt.ItemDataRole.UserRole + 1
     LevelRole = Qt.ItemDataRole.UserRole + 2
@@ -65,7 +88,8 @@ class LogModel(QAbstractListModel):
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        self._entries: list[_LogEntry] = []
+        self._entries = JournalStore()
+        self.search_index = JournalIndex(self._entries)
 
     def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802
         return 0 if parent.isValid() else len(self._entries)
@@ -90,34 +114,40 @@ class LogModel(QAbstractListModel):
         return dict(self._ROLES)
 
     def append(self, text: str, level: str) -> None:
-        parsed = parse_entry(text)
+        """Appends a free-form line (parsed for its markers)."""
+        self.extend([_make_entry(text, level, parse_entry(text))])
+
+    def extend(self, entries: list[JournalEntry]) -> None:
+        """Appends a batch of ready entries in one model update."""
+        if not entries:
+            return
         position = len(self._entries)
-        self.beginInsertRows(QModelIndex(), position, position)
-        self._entries.append(
-            _LogEntry(
-                text=text,
-                level=level,
-                time=datetime.now().strftime("%H:%M:%S"),
-                kind=parsed["kind"],
-                marketplace=parsed["marketplace"],
-                key=parsed["key"],
-                value=parsed["value"],
-                message=parsed["message"],
-            )
-        )
+        self.beginInsertRows(QModelIndex(), position, position + len(entries) - 1)
+        self._entries.extend(entries)
+        self.search_index.extend((entry.text, entry.level) for entry in entries)
         self.endInsertRows()
 
     def clear(self) -> None:
         self.beginResetModel()
         self._entries.clear()
+        self.search_index.clear()
         self.endResetModel()
 
     def plain_text(self) -> str:
-        return "\n".join(entry.text for entry in self._entries)
+        return "\n".join(self._entries.iter_text())
+
+    def write_text(self, path: str) -> None:
+        """Streams the plain-text journal into a file."""
+        with open(path, "w", encoding="utf-8") as f:
+            self._entries.write_text(f)
 
 
 class LogFilterModel(QSortFilterProxyModel):
-    """Journal filters: "problems only" and substring search."""
+    """Journal filters: "problems only" and substring search.
+
+    Both are answered from the LogModel's search index; only rows already
+    spilled to disk are read back, page by page.
+    """
 
     filtersChanged = Signal()
 
@@ -145,22 +175,20 @@ class LogFilterModel(QSortFilterProxyModel):
     def _set_search(self, value: str) -> None:
         if self._search != value:
             self._search = value
+            self._index().set_query(value)
             self.invalidateRowsFilter()
             self.filtersChanged.emit()
 
     search = Property(str, _get_search, _set_search, notify=filtersChanged)
 
+    def _index(self) -> JournalIndex:
+        return cast(LogModel, self.sourceModel()).search_index
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # noqa: N802
-        index = self.sourceModel().index(source_row, 0, source_parent)
-        if self._errors_only:
-            level = self.sourceModel().data(index, LogModel.LevelRole)
-            if level not in ("error", "warning"):
-                return False
-        if self._search:
-            text = self.sourceModel().data(index, LogModel.TextRole) or ""
-            if self._search.lower() not in text.lower():
-                return False
-        return True
+        index = self._index()
+        if self._errors_only and not index.is_problem(source_row):
+            return False
+        return index.matches(source_row)
 
 
 class OrdersModel(QAbstractListModel):
@@ -173,6 +201,7 @@ class OrdersModel(QAbstractListModel):
     ItemsRole = Qt.ItemDataRole.UserRole + 5
     OkRole = Qt.ItemDataRole.UserRole + 6
     ErrorRole = Qt.ItemDataRole.UserRole + 7
+    SpooledRole = Qt.ItemDataRole.UserRole + 8
 
     _ROLES = {
         NumberRole: b"number",
@@ -182,6 +211,7 @@ class OrdersModel(QAbstractListModel):
         ItemsRole: b"items",
         OkRole: b"ok",
         ErrorRole: b"error",
+        SpooledRole: b"spooled",
     }
 
     def __init__(self, parent=None) -> None:
@@ -203,6 +233,7 @@ class OrdersModel(QAbstractListModel):
             self.ItemsRole: result.items,
             self.OkRole: result.ok,
             self.ErrorRole: result.error or "",
+            self.SpooledRole: result.spooled,
         }.get(role)
 
     def roleNames(self):  # noqa: N802
@@ -220,37 +251,57 @@ class OrdersModel(QAbstractListModel):
         self.endResetModel()
 
     def failed_order_texts(self) -> list[str]:
-        return [r.order_text for r in self._results if not r.ok and r.order_text]
+        return [
+            r.order_text
+            for r in self._results
+            if not r.ok and not r.spooled and r.order_text
+        ]
 
 
 class Worker(QThread):
     """Processes a batch of orders in the background.
 
-    Subscribes to the console for the duration of the run: all parser
-    messages flow to the GUI via the logLine signal (and still into the
-    file log).
+    Subscribes to the console for the duration of the run: parser events
+    are turned into journal entries right here, on the worker thread, and
+    queued in ``journal`` (they still go to the file log as well). The GUI
+    drains the queue on a timer; logBatchReady only asks for an early
+    drain when a full batch is waiting, so a big run costs a handful of
+    cross-thread signals instead of one per line.
     """
 
-    logLine = Signal(str, str)
+    logBatchReady = Signal()
     progressChanged = Signal(int, int)
     orderFinished = Signal(object)
     finishedWithSummary = Signal(int, int)
     fatalError = Signal(str)
 
-    def __init__(self, orders: list[str], parent=None) -> None:
+    def __init__(
+        self,
+        orders: list[str],
+        session: ProcessingSession,
+        parent=None,
+        profile: ProfileConfig | None = None,
+    ) -> None:
         super().__init__(parent)
         self._orders = orders
+        self._session = session
+        self._profile = profile
+        self.journal: JournalBuffer[JournalEntry] = JournalBuffer()
 
     def run(self) -> None:  # noqa: D102
-        def on_console(text: str, level: str) -> None:
-            self.logLine.emit(text, level)
+        def on_console(event: console.LogEvent) -> None:
+            if self.journal.push(_entry_from_event(event)):
+                self.logBatchReady.emit()
 
         console.subscribe(on_console)
+        get_api_stats().reset()
         try:
-            ok, failed = process_order_list(
+            ok, failed = self._session.process_order_list(
                 self._orders,
                 progress_callback=lambda cur, tot: self.progressChanged.emit(cur, tot),
                 result_callback=lambda res: self.orderFinished.emit(res),
+                report=True,
+                profile=self._profile,
             )
             self.finishedWithSummary.emit(ok, failed)
         except Exception as error:  # noqa: BLE001
@@ -259,6 +310,26 @@ class Worker(QThread):
             console.unsubscribe(on_console)
 
 
+class SpoolReplayer(QThread):
+    """Writes the offline spool (core/spool.py) in the background."""
+
+    replayed = Signal(object)
+
+    def __init__(self, session: ProcessingSession, parent=None) -> None:
+        super().__init__(parent)
+        self._session = session
+
+    def run(self) -> None:
+        try:
+            result = self._session.replay_spool()
+        except Exception as error:  # noqa: BLE001
+            console.cmessage(
+                "!!!Could not read the offline spool: {error}!!!", "error", error=error
+            )
+            result = None
+        self.replayed.emit(result)
+
+
 class Backend(QObject):
     """The QML <-> Python bridge."""
 
@@ -268,6 +339,10 @@ class Backend(QObject):
     ordersPathChanged = Signal()
     summaryChanged = Signal()
     languageChanged = Signal()
+    apiStatsChanged = Signal()
+    profilingChanged = Signal()
+    sinkChanged = Signal()
+    spooledChanged = Signal()
     notify = Signal(str, "QVariantMap")
 
     def __init__(self, parent=None) -> None:
@@ -278,6 +353,7 @@ class Backend(QObject):
         self._orders_model = OrdersModel(self)
 
         self._worker: Worker | None = None
+        self._journal: JournalBuffer[JournalEntry] | None = None
         self._running = False
         self._progress = 0
         self._total = 0
@@ -286,11 +362,46 @@ class Backend(QObject):
         self._orders_path = get_orders_file_path()
         self._ok = 0
         self._failed = 0
+        self._profiling = False
 
         self._settings = QSettings("DanielK", "OrdersParserByDK")
         self._language = str(self._settings.value("ui/language", "en"))
         core_i18n.set_language(self._language)
 
+        # Google clients, sheet caches and parse threads survive between runs
+        # and retries; the timer releases them once the app sits idle.
+        idle_minutes = float(
+            self._settings.value("session/idleMinutes", SESSION_IDLE_TIMEOUT_MINUTES)
+        )
+        self._sink = str(self._settings.value("output/sink", "sheets"))
+        self._session = ProcessingSession(
+            idle_timeout=idle_minutes * 60, sink=self._sink_config()
+        )
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setInterval(60_000)
+        self._idle_timer.timeout.connect(self._session.expire_if_idle)
+        self._idle_timer.start()
+
+        # Orders Google could not take wait in the offline spool; they are
+        # retried in the background while no run is in progress.
+        self._replayer: SpoolReplayer | None = None
+        self._queued_worker: Worker | None = None
+        self._spooled = self._count_spooled()
+        self._spool_timer = QTimer(self)
+        self._spool_timer.setInterval(SPOOL_REPLAY_INTERVAL_MS)
+        self._spool_timer.timeout.connect(self._replay_spool)
+        self._spool_timer.start()
+
+        # The live Google API panel refreshes once a second during a run.
+        self._api_stats: dict = get_api_stats().summary()
+        self._api_stats_timer = QTimer(self)
+        self._api_stats_timer.setInterval(1000)
+        self._api_stats_timer.timeout.connect(self._refresh_api_stats)
+
+        self._journal_timer = QTimer(self)
+        self._journal_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._journal_timer.timeout.connect(self._drain_journal)
+
     @Property(str, constant=True)
     def appVersion(self) -> str:  # noqa: N802
         return APP_VERSION
@@ -344,6 +455,101 @@ class Backend(QObject):
             core_i18n.set_language(code)
             self.languageChanged.emit()
 
+    @Property("QVariantMap", notify=apiStatsChanged)
+    def apiStats(self) -> dict:
+        return self._api_stats
+
+    def _refresh_api_stats(self) -> None:
+        self._api_stats = get_api_stats().summary()
+        self.apiStatsChanged.emit()
+
+    @Property(bool, notify=profilingChanged)
+    def profiling(self) -> bool:
+        """Hidden diagnostics toggle (Ctrl+Shift+P): profile the next runs."""
+        return self._profiling
+
+    @profiling.setter
+    def profiling(self, enabled: bool) -> None:
+        if enabled != self._profiling:
+            self._profiling = enabled
+            self.profilingChanged.emit()
+
+    def _profile_config(self) -> ProfileConfig | None:
+        """Profiling settings: mode and order / marketplace filters live in
+        QSettings ("profile/mode", "profile/orders", "profile/marketplaces")
+        and use the same syntax as the --profile... CLI options."""
+        if not self._profiling:
+            return None
+        argv = ["--profile=" + str(self._settings.value("profile/mode", "cprofile"))]
+        for key, flag in (
+            ("profile/orders", "--profile-orders"),
+            ("profile/marketplaces", "--profile-marketplace"),
+        ):
+            value = str(self._settings.value(key, ""))
+            if value:
+                argv += [flag, value]
+        return profile_config_from_argv(argv)
+
+    @Property(str, notify=sinkChanged)
+    def sink(self) -> str:
+        """Where the rows go: "sheets" or a local sink (jsonl, csv, sqlite)."""
+        return self._sink
+
+    @sink.setter
+    def sink(self, kind: str) -> None:
+        if kind in ("sheets", *SINK_KINDS) and kind != self._sink:
+            self._sink = kind
+            self._settings.setValue("output/sink", kind)
+            self._session.sink = self._sink_config()
+            self.sinkChanged.emit()
+
+    def _sink_config(self) -> SinkConfig | None:
+        """The local output; its path is the optional "output/path" setting."""
+        try:
+            return sink_config(self._sink, str(self._settings.value("output/path", "")))
+        except ValueError:
+            self._sink = "sheets"
+            return None
+
+    @Property(int, notify=spooledChanged)
+    def spooledCount(self) -> int:
+        """Orders waiting in the offline spool for Google to come back."""
+        return self._spooled
+
+    def _count_spooled(self) -> int:
+        try:
+            return self._session.spool.count()
+        except Exception:  # noqa: BLE001
+            return 0
+
+    def _refresh_spooled(self) -> None:
+        spooled = self._count_spooled()
+        if spooled != self._spooled:
+            self._spooled = spooled
+            self.spooledChanged.emit()
+
+    def _replay_spool(self) -> None:
+        if self._running or self._replayer is not None or self._sink != "sheets":
+            return
+        self._refresh_spooled()
+        if not self._spooled:
+            return
+        self._replayer = SpoolReplayer(self._session, self)
+        self._replayer.replayed.connect(self._on_replayed)
+        self._replayer.finished.connect(self._replayer.deleteLater)
+        self._replayer.start()
+
+    def _on_replayed(self, result: ReplayResult | None) -> None:
+        self._replayer = None
+        self._refresh_spooled()
+        if result is not None and result.written:
+            self.notify.emit(
+                "spool_replayed", {"written": result.written, "left": result.left}
+            )
+        if self._queued_worker is not None:
+            worker, self._queued_worker = self._queued_worker, None
+            worker.start()
+
     @Property(str, notify=ordersPathChanged)
     def ordersPath(self) -> str:  # noqa: N802
         return self._orders_path
@@ -415,6 +621,14 @@ class Backend(QObject):
         if failed_orders:
             self._start(failed_orders)
 
+    @Slot()
+    def shutdown(self) -> None:
+        """Releases the warm processing session (called when the app quits)."""
+        self._idle_timer.stop()
+        self._spool_timer.stop()
+        if not self._running:
+            self._session.close()
+
     @Slot()
     def openSpreadsheet(self) -> None:  # noqa: N802
         url = self.spreadsheetUrl
@@ -427,10 +641,30 @@ class Backend(QObject):
         os.makedirs(logs_dir, exist_ok=True)
         QDesktopServices.openUrl(QUrl.fromLocalFile(logs_dir))
 
+    @Slot(str, result="QVariantList")
+    def orderHistory(self, order_id: str) -> list:
+        """Every time the order was processed (core/history.py), newest first."""
+        try:
+            entries = self._session.history.find(order_id.strip())
+        except (OSError, sqlite3.Error):
+            return []
+        return [asdict(entry) for entry in entries]
+
     @Slot(result=str)
     def logAsText(self) -> str:  # noqa: N802
         return self._log_model.plain_text()
 
+    @Slot(str)
+    def saveLog(self, target: str) -> None:
+        """Saves the journal to a text file without building it in memory."""
+        path = QUrl(target).toLocalFile() if target.startswith("file:") else target
+        try:
+            self._log_model.write_text(path)
+        except OSError as error:
+            self.notify.emit("log_save_error", {"error": str(error)})
+            return
+        self.notify.emit("log_saved", {"path": path})
+
     def _start(self, orders: list[str]) -> None:
         if self._running:
             return
@@ -447,14 +681,33 @@ class Backend(QObject):
         self.runningChanged.emit()
         self._set_status("processing", total=self._total)
 
-        self._worker = Worker(orders, self)
-        self._worker.logLine.connect(self._log_model.append)
+        self._worker = Worker(
+            orders, self._session, self, profile=self._profile_config()
+        )
+        self._journal = self._worker.journal
+        self._worker.logBatchReady.connect(self._drain_journal)
         self._worker.progressChanged.connect(self._on_progress)
         self._worker.orderFinished.connect(self._on_order_finished)
         self._worker.finishedWithSummary.connect(self._on_finished)
         self._worker.fatalError.connect(self._on_fatal)
         self._worker.finished.connect(self._worker.deleteLater)
-        self._worker.start()
+        if self._replayer is not None:
+            # The session is busy with the spool: start right after it
+            self._queued_worker = self._worker
+        else:
+            self._worker.start()
+        self._journal_timer.start()
+        self._api_stats_timer.start()
+
+    def _drain_journal(self) -> None:
+        if self._journal is not None:
+            self._log_model.extend(self._journal.drain())
+
+    def _stop_journal(self) -> None:
+        self._journal_timer.stop()
+        self._drain_journal()
+        self._api_stats_timer.stop()
+        self._refresh_api_stats()
 
     def _on_progress(self, current: int, total: int) -> None:
         self._progress = current
@@ -466,17 +719,20 @@ class Backend(QObject):
         self._orders_model.append(result)
         if result.ok:
             self._ok += 1
-        else:
+        elif not result.spooled:
             self._failed += 1
         self.summaryChanged.emit()
 
     def _on_finished(self, ok: int, failed: int) -> None:
+        self._stop_journal()
+        self._refresh_spooled()
         self._running = False
         self.runningChanged.emit()
         self._set_status("done", ok=ok, failed=failed)
         self.notify.emit("finished", {"ok": ok, "failed": failed})
 
     def _on_fatal(self, message: str) -> None:
+        self._stop_journal()
         self._running = False
         self.runningChanged.emit()
         self._log_model.append(tr("Fatal error: {message}", message=message), "error")
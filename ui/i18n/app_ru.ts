@@ -1,6 +1,24 @@
 <?xml version="1.0" encoding="utf-8"?>
 <!DOCTYPE TS>
 <TS version="2.1" language="ru">
+<context>
+    <name>ApiStatsBar</name>
+    <message>
+        <location filename="../qml/components/ApiStatsBar.qml" line="16"/>
+        <source>Sheets: %1 requests · %2/%3 reads and %4/%5 writes per minute</source>
+        <translation>Sheets: запросов %1 · в минуту чтений %2/%3, записей %4/%5</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/ApiStatsBar.qml" line="25"/>
+        <source>Drive: %1 requests · %2 per minute</source>
+        <translation>Drive: запросов %1 · %2 в минуту</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/ApiStatsBar.qml" line="31"/>
+        <source>429: %1 · retries: %2</source>
+        <translation>429: %1 · повторов: %2</translation>
+    </message>
+</context>
 <context>
     <name>HeaderBar</name>
     <message>
@@ -14,6 +32,49 @@
         <translation>Папка с логами</translation>
     </message>
 </context>
+<context>
+    <name>HistoryPanel</name>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="35"/>
+        <source>written</source>
+        <translation>записан</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="36"/>
+        <source>spooled</source>
+        <translation>в очереди</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="37"/>
+        <source>failed</source>
+        <translation>ошибка</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="53"/>
+        <source>Order ID…</source>
+        <translation>ID заказа…</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="57"/>
+        <source>Look up</source>
+        <translation>Найти</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="66"/>
+        <source>This order is not in the run history</source>
+        <translation>Этого заказа нет в истории запусков</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="118"/>
+        <source>sheet: %1, row %2</source>
+        <translation>лист: %1, строка %2</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="119"/>
+        <source>sheet: %1</source>
+        <translation>лист: %1</translation>
+    </message>
+</context>
 <context>
     <name>LaunchPanel</name>
     <message>
@@ -42,17 +103,42 @@
         <translation>Обзор…</translation>
     </message>
     <message>
-        <location filename="../qml/components/LaunchPanel.qml" line="47"/>
+        <location filename="../qml/components/LaunchPanel.qml" line="50"/>
+        <source>To Google Sheets</source>
+        <translation>В Google Таблицы</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="51"/>
+        <source>Dry run: JSONL</source>
+        <translation>Пробный запуск: JSONL</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="52"/>
+        <source>Dry run: CSV</source>
+        <translation>Пробный запуск: CSV</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="53"/>
+        <source>Dry run: SQLite</source>
+        <translation>Пробный запуск: SQLite</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="61"/>
+        <source>Rows are saved to the output folder, the spreadsheet is not touched</source>
+        <translation>Строки сохраняются в папку output, таблица не меняется</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="64"/>
         <source>Processing…</source>
         <translation>Обработка…</translation>
     </message>
     <message>
-        <location filename="../qml/components/LaunchPanel.qml" line="47"/>
+        <location filename="../qml/components/LaunchPanel.qml" line="64"/>
         <source>Process orders</source>
         <translation>Обработать заказы</translation>
     </message>
     <message>
-        <location filename="../qml/components/LaunchPanel.qml" line="53"/>
+        <location filename="../qml/components/LaunchPanel.qml" line="70"/>
         <source>Retry failed (%1)</source>
         <translation>Повторить ошибки (%1)</translation>
     </message>
@@ -68,98 +154,163 @@
 <context>
     <name>LogPanel</name>
     <message>
-        <location filename="../qml/components/LogPanel.qml" line="26"/>
+        <location filename="../qml/components/LogPanel.qml" line="18"/>
+        <source>Save the journal</source>
+        <translation>Сохранить журнал</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LogPanel.qml" line="21"/>
+        <source>Text files (*.txt)</source>
+        <translation>Текстовые файлы (*.txt)</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LogPanel.qml" line="21"/>
+        <source>All files (*)</source>
+        <translation>Все файлы (*)</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LogPanel.qml" line="36"/>
         <source>Search the journal…</source>
         <translation>Поиск по журналу…</translation>
     </message>
     <message>
-        <location filename="../qml/components/LogPanel.qml" line="31"/>
+        <location filename="../qml/components/LogPanel.qml" line="41"/>
         <source>Problems only</source>
         <translation>Только проблемы</translation>
     </message>
     <message>
-        <location filename="../qml/components/LogPanel.qml" line="37"/>
+        <location filename="../qml/components/LogPanel.qml" line="47"/>
         <source>Copy</source>
         <translation>Копировать</translation>
     </message>
+    <message>
+        <location filename="../qml/components/LogPanel.qml" line="56"/>
+        <source>Save…</source>
+        <translation>Сохранить…</translation>
+    </message>
 </context>
 <context>
     <name>Main</name>
     <message>
-        <location filename="../qml/Main.qml" line="14"/>
+        <location filename="../qml/Main.qml" line="16"/>
         <source>Orders Parser v%1 by Daniel K</source>
         <translation>Orders Parser v%1 by Daniel K</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="40"/>
+        <location filename="../qml/Main.qml" line="42"/>
         <source>Orders file not found</source>
         <translation>Файл с заказами не найден</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="43"/>
+        <location filename="../qml/Main.qml" line="45"/>
         <source>Could not read the orders file</source>
         <translation>Не удалось прочитать файл с заказами</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="46"/>
+        <location filename="../qml/Main.qml" line="48"/>
         <source>The orders file is empty</source>
         <translation>Файл с заказами пуст</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="47"/>
+        <location filename="../qml/Main.qml" line="49"/>
         <source>No orders were found in %1</source>
         <translation>В %1 не найдено ни одного заказа</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="50"/>
+        <location filename="../qml/Main.qml" line="52"/>
         <source>Nothing to process</source>
         <translation>Нечего обрабатывать</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="51"/>
+        <location filename="../qml/Main.qml" line="53"/>
         <source>No orders were found in the pasted text</source>
         <translation>Во вставленном тексте не найдено ни одного заказа</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="55"/>
+        <location filename="../qml/Main.qml" line="57"/>
         <source>Finished with errors</source>
         <translation>Завершено с ошибками</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="56"/>
+        <location filename="../qml/Main.qml" line="58"/>
         <source>Orders written: %1, failed: %2. Check the journal and the spreadsheet!</source>
         <translation>Записано заказов: %1, с ошибками: %2. Проверьте журнал и данные в таблице!</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="58"/>
+        <location filename="../qml/Main.qml" line="60"/>
         <source>All orders processed</source>
         <translation>Все заказы обработаны</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="59"/>
+        <location filename="../qml/Main.qml" line="61"/>
         <source>Orders written: %1. Please double-check the data in the spreadsheet!</source>
         <translation>Записано заказов: %1. Проверьте внимательно данные в таблице!</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="62"/>
+        <location filename="../qml/Main.qml" line="64"/>
+        <source>Spooled orders written</source>
+        <translation>Заказы из очереди записаны</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="66"/>
+        <source>%1 order(s) from the offline spool are in the spreadsheet, %2 still waiting</source>
+        <translation>Заказов из офлайн-очереди записано в таблицу: %1, ещё ждут: %2</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="67"/>
+        <source>%1 order(s) from the offline spool are in the spreadsheet</source>
+        <translation>Заказов из офлайн-очереди записано в таблицу: %1</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="70"/>
+        <source>Journal saved</source>
+        <translation>Журнал сохранён</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="73"/>
+        <source>Could not save the journal</source>
+        <translation>Не удалось сохранить журнал</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="76"/>
         <source>Processing stopped</source>
         <translation>Обработка прервана</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="101"/>
+        <location filename="../qml/Main.qml" line="95"/>
+        <source>Profiling enabled</source>
+        <translation>Профилирование включено</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="95"/>
+        <source>Profiling disabled</source>
+        <translation>Профилирование выключено</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="96"/>
+        <source>Profiles of the next runs are saved to the logs folder</source>
+        <translation>Профили следующих запусков сохраняются в папку с логами</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="130"/>
         <source>Journal</source>
         <translation>Журнал</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="102"/>
+        <location filename="../qml/Main.qml" line="131"/>
         <source>Orders (%1)</source>
         <translation>Заказы (%1)</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="103"/>
+        <location filename="../qml/Main.qml" line="132"/>
         <source>Paste HTML</source>
         <translation>Вставить HTML</translation>
     </message>
+    <message>
+        <location filename="../qml/Main.qml" line="133"/>
+        <source>History</source>
+        <translation>История</translation>
+    </message>
 </context>
 <context>
     <name>NotificationPopup</name>
@@ -172,12 +323,17 @@
 <context>
     <name>OrdersPanel</name>
     <message>
-        <location filename="../qml/components/OrdersPanel.qml" line="82"/>
+        <location filename="../qml/components/OrdersPanel.qml" line="74"/>
+        <source>Waiting in the offline spool until Google is reachable</source>
+        <translation>Ждёт в офлайн-очереди, пока Google недоступен</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/OrdersPanel.qml" line="92"/>
         <source>sheet: %1</source>
         <translation>лист: %1</translation>
     </message>
     <message numerus="yes">
-        <location filename="../qml/components/OrdersPanel.qml" line="88"/>
+        <location filename="../qml/components/OrdersPanel.qml" line="98"/>
         <source>%n item(s)</source>
         <translation>
             <numerusform>%n товар</numerusform>
@@ -275,5 +431,10 @@
         <source>Failed</source>
         <translation>Ошибки</translation>
     </message>
+    <message>
+        <location filename="../qml/components/SummaryBar.qml" line="48"/>
+        <source>Waiting for Google</source>
+        <translation>Ждут Google</translation>
+    </message>
 </context>
 </TS>
@@ -1,6 +1,24 @@
 <?xml version="1.0" encoding="utf-8"?>
 <!DOCTYPE TS>
 <TS version="2.1" language="uk">
+<context>
+    <name>ApiStatsBar</name>
+    <message>
+        <location filename="../qml/components/ApiStatsBar.qml" line="16"/>
+        <source>Sheets: %1 requests · %2/%3 reads and %4/%5 writes per minute</source>
+        <translation>Sheets: запитів %1 · за хвилину читань %2/%3, записів %4/%5</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/ApiStatsBar.qml" line="25"/>
+        <source>Drive: %1 requests · %2 per minute</source>
+        <translation>Drive: запитів %1 · %2 за хвилину</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/ApiStatsBar.qml" line="31"/>
+        <source>429: %1 · retries: %2</source>
+        <translation>429: %1 · повторів: %2</translation>
+    </message>
+</context>
 <context>
     <name>HeaderBar</name>
     <message>
@@ -14,6 +32,49 @@
         <translation>Папка з логами</translation>
     </message>
 </context>
+<context>
+    <name>HistoryPanel</name>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="35"/>
+        <source>written</source>
+        <translation>записано</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="36"/>
+        <source>spooled</source>
+        <translation>у черзі</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="37"/>
+        <source>failed</source>
+        <translation>помилка</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="53"/>
+        <source>Order ID…</source>
+        <translation>ID замовлення…</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="57"/>
+        <source>Look up</source>
+        <translation>Знайти</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="66"/>
+        <source>This order is not in the run history</source>
+        <translation>Цього замовлення немає в історії запусків</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="118"/>
+        <source>sheet: %1, row %2</source>
+        <translation>лист: %1, рядок %2</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/HistoryPanel.qml" line="119"/>
+        <source>sheet: %1</source>
+        <translation>лист: %1</translation>
+    </message>
+</context>
 <context>
     <name>LaunchPanel</name>
     <message>
@@ -42,17 +103,42 @@
         <translation>Огляд…</translation>
     </message>
     <message>
-        <location filename="../qml/components/LaunchPanel.qml" line="47"/>
+        <location filename="../qml/components/LaunchPanel.qml" line="50"/>
+        <source>To Google Sheets</source>
+        <translation>У Google Таблиці</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="51"/>
+        <source>Dry run: JSONL</source>
+        <translation>Пробний запуск: JSONL</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="52"/>
+        <source>Dry run: CSV</source>
+        <translation>Пробний запуск: CSV</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="53"/>
+        <source>Dry run: SQLite</source>
+        <translation>Пробний запуск: SQLite</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="61"/>
+        <source>Rows are saved to the output folder, the spreadsheet is not touched</source>
+        <translation>Рядки зберігаються в папку output, таблиця не змінюється</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LaunchPanel.qml" line="64"/>
         <source>Processing…</source>
         <translation>Обробка…</translation>
     </message>
     <message>
-        <location filename="../qml/components/LaunchPanel.qml" line="47"/>
+        <location filename="../qml/components/LaunchPanel.qml" line="64"/>
         <source>Process orders</source>
         <translation>Обробити замовлення</translation>
     </message>
     <message>
-        <location filename="../qml/components/LaunchPanel.qml" line="53"/>
+        <location filename="../qml/components/LaunchPanel.qml" line="70"/>
         <source>Retry failed (%1)</source>
         <translation>Повторити помилки (%1)</translation>
     </message>
@@ -68,98 +154,163 @@
 <context>
     <name>LogPanel</name>
     <message>
-        <location filename="../qml/components/LogPanel.qml" line="26"/>
+        <location filename="../qml/components/LogPanel.qml" line="18"/>
+        <source>Save the journal</source>
+        <translation>Зберегти журнал</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LogPanel.qml" line="21"/>
+        <source>Text files (*.txt)</source>
+        <translation>Текстові файли (*.txt)</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LogPanel.qml" line="21"/>
+        <source>All files (*)</source>
+        <translation>Усі файли (*)</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/LogPanel.qml" line="36"/>
         <source>Search the journal…</source>
         <translation>Пошук у журналі…</translation>
     </message>
     <message>
-        <location filename="../qml/components/LogPanel.qml" line="31"/>
+        <location filename="../qml/components/LogPanel.qml" line="41"/>
         <source>Problems only</source>
         <translation>Лише проблеми</translation>
     </message>
     <message>
-        <location filename="../qml/components/LogPanel.qml" line="37"/>
+        <location filename="../qml/components/LogPanel.qml" line="47"/>
         <source>Copy</source>
         <translation>Копіювати</translation>
     </message>
+    <message>
+        <location filename="../qml/components/LogPanel.qml" line="56"/>
+        <source>Save…</source>
+        <translation>Зберегти…</translation>
+    </message>
 </context>
 <context>
     <name>Main</name>
     <message>
-        <location filename="../qml/Main.qml" line="14"/>
+        <location filename="../qml/Main.qml" line="16"/>
         <source>Orders Parser v%1 by Daniel K</source>
         <translation>Orders Parser v%1 by Daniel K</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="40"/>
+        <location filename="../qml/Main.qml" line="42"/>
         <source>Orders file not found</source>
         <translation>Файл замовлень не знайдено</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="43"/>
+        <location filename="../qml/Main.qml" line="45"/>
         <source>Could not read the orders file</source>
         <translation>Не вдалося прочитати файл з замовленнями</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="46"/>
+        <location filename="../qml/Main.qml" line="48"/>
         <source>The orders file is empty</source>
         <translation>Файл з замовленнями порожній</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="47"/>
+        <location filename="../qml/Main.qml" line="49"/>
         <source>No orders were found in %1</source>
         <translation>У %1 не знайдено жодного замовлення</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="50"/>
+        <location filename="../qml/Main.qml" line="52"/>
         <source>Nothing to process</source>
         <translation>Немає що обробляти</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="51"/>
+        <location filename="../qml/Main.qml" line="53"/>
         <source>No orders were found in the pasted text</source>
         <translation>У вставленому тексті не знайдено жодного замовлення</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="55"/>
+        <location filename="../qml/Main.qml" line="57"/>
         <source>Finished with errors</source>
         <translation>Завершено з помилками</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="56"/>
+        <location filename="../qml/Main.qml" line="58"/>
         <source>Orders written: %1, failed: %2. Check the journal and the spreadsheet!</source>
         <translation>Записано замовлень: %1, з помилками: %2. Перевірте журнал і дані в таблиці!</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="58"/>
+        <location filename="../qml/Main.qml" line="60"/>
         <source>All orders processed</source>
         <translation>Усі замовлення оброблено</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="59"/>
+        <location filename="../qml/Main.qml" line="61"/>
         <source>Orders written: %1. Please double-check the data in the spreadsheet!</source>
         <translation>Записано замовлень: %1. Уважно перевірте дані в таблиці!</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="62"/>
+        <location filename="../qml/Main.qml" line="64"/>
+        <source>Spooled orders written</source>
+        <translation>Замовлення з черги записано</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="66"/>
+        <source>%1 order(s) from the offline spool are in the spreadsheet, %2 still waiting</source>
+        <translation>Замовлень з офлайн-черги записано до таблиці: %1, ще чекають: %2</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="67"/>
+        <source>%1 order(s) from the offline spool are in the spreadsheet</source>
+        <translation>Замовлень з офлайн-черги записано до таблиці: %1</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="70"/>
+        <source>Journal saved</source>
+        <translation>Журнал збережено</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="73"/>
+        <source>Could not save the journal</source>
+        <translation>Не вдалося зберегти журнал</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="76"/>
         <source>Processing stopped</source>
         <translation>Обробку перервано</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="101"/>
+        <location filename="../qml/Main.qml" line="95"/>
+        <source>Profiling enabled</source>
+        <translation>Профілювання увімкнено</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="95"/>
+        <source>Profiling disabled</source>
+        <translation>Профілювання вимкнено</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="96"/>
+        <source>Profiles of the next runs are saved to the logs folder</source>
+        <translation>Профілі наступних запусків зберігаються в папку з логами</translation>
+    </message>
+    <message>
+        <location filename="../qml/Main.qml" line="130"/>
         <source>Journal</source>
         <translation>Журнал</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="102"/>
+        <location filename="../qml/Main.qml" line="131"/>
         <source>Orders (%1)</source>
         <translation>Замовлення (%1)</translation>
     </message>
     <message>
-        <location filename="../qml/Main.qml" line="103"/>
+        <location filename="../qml/Main.qml" line="132"/>
         <source>Paste HTML</source>
         <translation>Вставити HTML</translation>
     </message>
+    <message>
+        <location filename="../qml/Main.qml" line="133"/>
+        <source>History</source>
+        <translation>Історія</translation>
+    </message>
 </context>
 <context>
     <name>NotificationPopup</name>
@@ -172,12 +323,17 @@
 <context>
     <name>OrdersPanel</name>
     <message>
-        <location filename="../qml/components/OrdersPanel.qml" line="82"/>
+        <location filename="../qml/components/OrdersPanel.qml" line="74"/>
+        <source>Waiting in the offline spool until Google is reachable</source>
+        <translation>Чекає в офлайн-черзі, доки Google недоступний</translation>
+    </message>
+    <message>
+        <location filename="../qml/components/OrdersPanel.qml" line="92"/>
         <source>sheet: %1</source>
         <translation>лист: %1</translation>
     </message>
     <message numerus="yes">
-        <location filename="../qml/components/OrdersPanel.qml" line="88"/>
+        <location filename="../qml/components/OrdersPanel.qml" line="98"/>
         <source>%n item(s)</source>
         <translation>
             <numerusform>%n товар</numerusform>
@@ -275,5 +431,10 @@
         <source>Failed</source>
         <translation>Помилки</translation>
     </message>
+    <message>
+        <location filename="../qml/components/SummaryBar.qml" line="48"/>
+        <source>Waiting for Google</source>
+        <translation>Чекають на Google</translation>
+    </message>
 </context>
 </TS>
@@ -0,0 +1,163 @@
+"""Search index behind the journal filters (substring search, problems only)."""
+
+import zlib
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ui.journal_store import JournalStore
+
+PROBLEM_LEVELS = frozenset({"error", "warning"})
+
+# Queries shorter than this are answered by scanning the lowercased texts.
+_GRAM = 3
+# Joins the texts of a compressed block (never part of a journal line)
+_SEPARATOR = "\0"
+
+
+class JournalIndex:
+    """Keeps the journal searchable as entries arrive.
+
+    Every row keeps a "problem" flag (one byte). Rows of the store's
+    in-memory window also keep their lowercased text and trigrams (row
+    lists per trigram); when the store spills rows to disk, their texts are
+    compressed here in blocks and their trigrams are dropped, so the index
+    never reads the spill file and stays a fraction of the journal's size.
+    A query is answered by intersecting the posting lists of its trigrams
+    and confirming the substring on the few candidates, and by searching
+    the decompressed blocks of the spilled rows. The matches of the current
+    query are kept and updated as rows arrive; when the query grows, only
+    the previous matches of the window are re-checked. Without a store every
+    row stays in the window.
+    """
+
+    def __init__(self, store: "JournalStore | None" = None) -> None:
+        self._store = store
+        # Rows before this one are spilled: only in the compressed blocks
+        self._first = 0
+        self._texts: list[str] = []
+        self._problems = bytearray()
+        self._postings: dict[str, array] = {}
+        # zlib-compressed texts of spilled rows, joined by _SEPARATOR
+        self._blocks: list[bytes] = []
+        self._block_starts = array("I")
+        self._query = ""
+        self._matches: set[int] = set()
+
+    def __len__(self) -> int:
+        return self._first + len(self._texts)
+
+    def extend(self, entries: Iterable[tuple[str, str]]) -> None:
+        """Indexes ``(text, level)`` pairs appended to the journal."""
+        for text, level in entries:
+            row = len(self)
+            lowered = text.lower()
+            self._texts.append(lowered)
+            self._problems.append(level in PROBLEM_LEVELS)
+            for gram in _trigrams(lowered):
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = array("I")
+                postings.append(row)
+            if self._query and self._query in lowered:
+                self._matches.add(row)
+        if self._store is not None and self._store.spilled > self._first:
+            self._forget(self._store.spilled)
+
+    def clear(self) -> None:
+        self._first = 0
+        self._texts.clear()
+        self._problems.clear()
+        self._postings.clear()
+        self._blocks.clear()
+        self._block_starts = array("I")
+        self._matches.clear()
+
+    def is_problem(self, row: int) -> bool:
+        return bool(self._problems[row])
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    def set_query(self, query: str) -> None:
+        """Switches the current search (case-insensitive substring)."""
+        query = query.lower()
+        if query == self._query:
+            return
+        if not query:
+            self._matches = set()
+        elif self._query and self._query in query:
+            # The query only grew: narrow the previous matches of the window.
+            first = self._first
+            self._matches = {
+                row
+                for row in self._matches
+                if row >= first and query in self._texts[row - first]
+            }
+            self._matches.update(self._search_spilled(query))
+        else:
+            self._matches = set(self._search_spilled(query))
+            self._matches.update(self._search(query))
+        self._query = query
+
+    def matches(self, row: int) -> bool:
+        """Whether ``row`` matches the current query (always, if there is none)."""
+        return not self._query or row in self._matches
+
+    def _forget(self, first: int) -> None:
+        """Moves the rows before ``first`` (now on disk) into a compressed block."""
+        count = min(first, len(self)) - self._first
+        block = _SEPARATOR.join(self._texts[:count])
+        self._blocks.append(zlib.compress(block.encode("utf-8")))
+        self._block_starts.append(self._first)
+        del self._texts[:count]
+        for gram in list(self._postings):
+            postings = self._postings[gram]
+            keep = bisect_left(postings, first)
+            if keep == len(postings):
+                del self._postings[gram]
+            elif keep:
+                del postings[:keep]
+        self._first += count
+
+    def _search_spilled(self, query: str) -> Iterator[int]:
+        if _SEPARATOR in query:
+            return
+        for start, block in zip(self._block_starts, self._blocks, strict=True):
+            text = zlib.decompress(block).decode("utf-8")
+            row, line_start = start, 0
+            found = text.find(query)
+            while found >= 0:
+                row += text.count(_SEPARATOR, line_start, found)
+                yield row
+                line_start = text.find(_SEPARATOR, found)
+                if line_start < 0:
+                    break
+                found = text.find(query, line_start)
+
+    def _search(self, query: str) -> Iterable[int]:
+        texts = self._texts
+        first = self._first
+        if len(query) < _GRAM:
+            return (first + row for row, text in enumerate(texts) if query in text)
+
+        lists = []
+        for gram in set(_trigrams(query)):
+            postings = self._postings.get(gram)
+            if postings is None:
+                return ()
+            lists.append(postings)
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for postings in lists[1:]:
+            candidates.intersection_update(postings)
+            if not candidates:
+                return ()
+        return (row for row in candidates if query in texts[row - first])
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + _GRAM] for i in range(len(text) - _GRAM + 1)}
@@ -0,0 +1,170 @@
+"""Journal storage with a bounded in-memory window and an on-disk spill file."""
+
+import json
+import tempfile
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import IO
+
+# Newest entries kept in memory for the ListView.
+WINDOW_SIZE = 2000
+# Entries moved to disk at once when the window overflows.
+SPILL_CHUNK = 500
+# Spilled entries are paged back in by this many, a few pages at a time.
+PAGE_SIZE = 256
+PAGE_CACHE = 8
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    text: str
+    level: str
+    time: str
+    kind: str
+    marketplace: str
+    key: str
+    value: str
+    message: str
+
+
+class JournalStore:
+    """Append-only list of journal entries whose memory use stays flat.
+
+    The newest ``window`` entries live in memory. Older ones are written as
+    JSON lines to an anonymous temporary file; an array of byte offsets
+    maps a row number to its line, so random access (the ListView
+    scrolling back) reads one page and exports stream the file.
+    """
+
+    def __init__(
+        self,
+        window: int = WINDOW_SIZE,
+        spill_chunk: int = SPILL_CHUNK,
+        page_size: int = PAGE_SIZE,
+        page_cache: int = PAGE_CACHE,
+    ) -> None:
+        self._window_size = window
+        self._spill_chunk = max(1, min(spill_chunk, window))
+        self._page_size = page_size
+        self._page_cache = page_cache
+        self._window: deque[JournalEntry] = deque()
+        self._offsets = array("q")
+        self._file: IO[bytes] | None = None
+        self._end = 0
+        self._pages: OrderedDict[int, list[JournalEntry]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._window)
+
+    @property
+    def spilled(self) -> int:
+        """Number of entries that currently live on disk."""
+        return len(self._offsets)
+
+    def __getitem__(self, row: int) -> JournalEntry:
+        if row < 0:
+            row += len(self)
+        spilled = len(self._offsets)
+        if row >= spilled:
+            return self._window[row - spilled]
+        if row < 0:
+            raise IndexError(row)
+        page = self._page(row // self._page_size)
+        return page[row % self._page_size]
+
+    def extend(self, entries: Iterable[JournalEntry]) -> None:
+        self._window.extend(entries)
+        if len(self._window) > self._window_size:
+            overflow = len(self._window) - self._window_size
+            chunks = -(-overflow // self._spill_chunk)
+            self._spill(min(len(self._window), chunks * self._spill_chunk))
+
+    def append(self, entry: JournalEntry) -> None:
+        self.extend((entry,))
+
+    def iter_entries(self) -> Iterator[JournalEntry]:
+        """Yields every entry in order, streaming the spilled part from disk."""
+        spilled = len(self._offsets)
+        for start in range(0, spilled, self._page_size):
+            # Read page by page without going through the cache, so a long
+            # export does not evict the pages the view is showing.
+            yield from self._read(start, min(start + self._page_size, spilled))
+        yield from list(self._window)
+
+    def iter_text(self) -> Iterator[str]:
+        for entry in self.iter_entries():
+            yield entry.text
+
+    def write_text(self, stream: IO[str]) -> None:
+        """Writes the plain-text journal to ``stream`` one line at a time."""
+        for text in self.iter_text():
+            stream.write(text)
+            stream.write("\n")
+
+    def clear(self) -> None:
+        self._window.clear()
+        self._offsets = array("q")
+        self._pages.clear()
+        self._end = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    close = clear
+
+    def _spill(self, count: int) -> None:
+        if self._file is None:
+            # Open for the life of the store; clear() closes it
+            self._file = tempfile.TemporaryFile(  # noqa: SIM115
+                prefix="journal-", suffix=".jsonl"
+            )
+        self._file.seek(self._end)
+        lines = []
+        for _ in range(count):
+            line = _encode(self._window.popleft())
+            self._offsets.append(self._end)
+            self._end += len(line)
+            lines.append(line)
+        self._file.write(b"".join(lines))
+        # The last page may have been cached while it was still partial.
+        self._pages.pop((len(self._offsets) - count) // self._page_size, None)
+
+    def _page(self, number: int) -> list[JournalEntry]:
+        page = self._pages.get(number)
+        if page is not None:
+            self._pages.move_to_end(number)
+            return page
+
+        start = number * self._page_size
+        page = self._read(start, min(start + self._page_size, len(self._offsets)))
+        self._pages[number] = page
+        if len(self._pages) > self._page_cache:
+            self._pages.popitem(last=False)
+        return page
+
+    def _read(self, start: int, stop: int) -> list[JournalEntry]:
+        assert self._file is not None
+        end = self._offsets[stop] if stop < len(self._offsets) else self._end
+        self._file.seek(self._offsets[start])
+        data = self._file.read(end - self._offsets[start])
+        return [_decode(line) for line in data.splitlines()]
+
+
+def _encode(entry: JournalEntry) -> bytes:
+    fields = (
+        entry.text,
+        entry.level,
+        entry.time,
+        entry.kind,
+        entry.marketplace,
+        entry.key,
+        entry.value,
+        entry.message,
+    )
+    return json.dumps(fields, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _decode(line: bytes) -> JournalEntry:
+    return JournalEntry(*json.loads(line))
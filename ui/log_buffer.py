@@ -0,0 +1,41 @@
+"""Thread-safe hand-off of journal entries from the worker to the GUI thread."""
+
+import threading
+from typing import Generic, TypeVar
+
+# The GUI drains the buffer on a timer at roughly this interval...
+FLUSH_INTERVAL_MS = 50
+# ...or earlier, as soon as this many entries are waiting.
+BATCH_SIZE = 256
+
+T = TypeVar("T")
+
+
+class JournalBuffer(Generic[T]):  # noqa: UP046
+    """Collects entries on the worker thread and hands them over in batches.
+
+    ``push`` returns True exactly once per batch, when the buffer reaches
+    ``batch_size``, so the worker can nudge the GUI with a single signal
+    instead of one per line. Everything else is picked up by the periodic
+    ``drain``.
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE) -> None:
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._items: list[T] = []
+
+    def push(self, item: T) -> bool:
+        with self._lock:
+            self._items.append(item)
+            return len(self._items) == self._batch_size
+
+    def drain(self) -> list[T]:
+        """Takes every pending entry (possibly none) in arrival order."""
+        with self._lock:
+            items, self._items = self._items, []
+        return items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
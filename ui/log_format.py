@@ -1,9 +1,14 @@
-"""Parses parser console messages into structured entries for the UI."""
+"""Turns console output into structured entries for the UI.
+
+Structured LogEvents map onto entries field by field; only free-form
+"plain" lines (headers, tracebacks) still go through the regex parser.
+"""
 
 import html
 import re
 from typing import TypedDict
 
+from core.console import LogEvent
 from core.i18n import banner_words
 
 
@@ -89,3 +94,26 @@ def parse_entry(text: str) -> LogEntry:
 
     entry["message"] = linkify(stripped)
     return entry
+
+
+def entry_from_event(event: LogEvent) -> LogEntry:
+    """Builds a journal entry straight from a LogEvent, without regex parsing."""
+    if event.kind == "plain":
+        return parse_entry(event.text)
+
+    entry: LogEntry = {
+        "kind": event.kind,
+        "marketplace": "",
+        "key": "",
+        "value": "",
+        "message": "",
+    }
+    if event.kind == "banner":
+        entry["marketplace"] = event.marketplace
+        entry["message"] = html.escape(f"New order {event.marketplace}")
+    elif event.kind == "field":
+        entry["key"] = event.label
+        entry["value"] = linkify(event.value.strip())
+    else:
+        entry["message"] = linkify(event.message)
+    return entry
@@ -60,6 +60,18 @@ ApplicationWindow {
                     notification.show("success", qsTr("All orders processed"),
                                       qsTr("Orders written: %1. Please double-check the data in the spreadsheet!").arg(args.ok))
                 break
+            case "spool_replayed":
+                notification.show("success", qsTr("Spooled orders written"),
+                                  args.left > 0
+                                  ? qsTr("%1 order(s) from the offline spool are in the spreadsheet, %2 still waiting").arg(args.written).arg(args.left)
+                                  : qsTr("%1 order(s) from the offline spool are in the spreadsheet").arg(args.written))
+                break
+            case "log_saved":
+                notification.show("success", qsTr("Journal saved"), args.path)
+                break
+            case "log_save_error":
+                notification.show("error", qsTr("Could not save the journal"), args.error)
+                break
             case "fatal":
                 notification.show("error", qsTr("Processing stopped"), args.error)
                 break
@@ -74,6 +86,17 @@ ApplicationWindow {
         }
     }
 
+    // Hidden diagnostics toggle: profile the next runs (files go to the logs folder)
+    Shortcut {
+        sequence: "Ctrl+Shift+P"
+        onActivated: {
+            App.profiling = !App.profiling
+            notification.show("warning",
+                               App.profiling ? qsTr("Profiling enabled") : qsTr("Profiling disabled"),
+                               qsTr("Profiles of the next runs are saved to the logs folder"))
+        }
+    }
+
     NotificationPopup {
         id: notification
         parent: Overlay.overlay
@@ -97,12 +120,17 @@ ApplicationWindow {
             Layout.fillWidth: true
         }
 
+        ApiStatsBar {
+            Layout.fillWidth: true
+        }
+
         TabBar {
             id: tabBar
             Layout.fillWidth: true
             TabButton { text: qsTr("Journal") }
             TabButton { text: qsTr("Orders (%1)").arg(App.okCount + App.failedCount) }
             TabButton { text: qsTr("Paste HTML") }
+            TabButton { text: qsTr("History") }
         }
 
         StackLayout {
@@ -113,6 +141,7 @@ ApplicationWindow {
             LogPanel { }
             OrdersPanel { }
             PastePanel { }
+            HistoryPanel { }
         }
     }
 }
@@ -0,0 +1,36 @@
+import QtQuick
+import QtQuick.Controls
+import QtQuick.Layouts
+
+// Live Google API usage of the current run: requests, per-minute rate
+// against the quota, 429 responses and retries.
+RowLayout {
+    id: root
+
+    readonly property var stats: App.apiStats
+
+    spacing: 16
+    visible: stats.sheetsCalls > 0 || stats.driveCalls > 0
+
+    Label {
+        text: qsTr("Sheets: %1 requests · %2/%3 reads and %4/%5 writes per minute")
+            .arg(root.stats.sheetsCalls)
+            .arg(root.stats.sheetsReadsPerMinute).arg(root.stats.sheetsReadsQuota)
+            .arg(root.stats.sheetsWritesPerMinute).arg(root.stats.sheetsWritesQuota)
+        color: root.stats.sheetsWritesPerMinute >= root.stats.sheetsWritesQuota * 0.8
+               ? Theme.yellow : Theme.textMuted
+        font.pixelSize: 12
+    }
+    Label {
+        text: qsTr("Drive: %1 requests · %2 per minute")
+            .arg(root.stats.driveCalls).arg(root.stats.driveReadsPerMinute + root.stats.driveWritesPerMinute)
+        color: Theme.textMuted
+        font.pixelSize: 12
+    }
+    Label {
+        text: qsTr("429: %1 · retries: %2").arg(root.stats.throttled).arg(root.stats.retries)
+        color: root.stats.throttled > 0 ? Theme.red : Theme.textMuted
+        font.pixelSize: 12
+    }
+    Item { Layout.fillWidth: true }
+}
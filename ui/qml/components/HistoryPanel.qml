@@ -0,0 +1,133 @@
+import QtQuick
+import QtQuick.Controls
+import QtQuick.Layouts
+
+// History tab: every past run of an order, looked up by its ID.
+Rectangle {
+    id: root
+
+    property var entries: []
+    property bool searched: false
+
+    radius: 10
+    color: Theme.surface
+    border.color: Theme.border
+    border.width: 1
+
+    function lookUp() {
+        const orderId = orderField.text.trim()
+        if (orderId === "")
+            return
+        entries = App.orderHistory(orderId)
+        searched = true
+    }
+
+    function statusColor(status) {
+        switch (status) {
+        case "written": return Theme.green
+        case "spooled": return Theme.yellow
+        default:        return Theme.red
+        }
+    }
+
+    function statusText(status) {
+        switch (status) {
+        case "written": return qsTr("written")
+        case "spooled": return qsTr("spooled")
+        default:        return qsTr("failed")
+        }
+    }
+
+    ColumnLayout {
+        anchors.fill: parent
+        anchors.margins: 10
+        spacing: 8
+
+        RowLayout {
+            Layout.fillWidth: true
+            spacing: 10
+
+            TextField {
+                id: orderField
+                Layout.preferredWidth: 260
+                placeholderText: qsTr("Order ID…")
+                onAccepted: root.lookUp()
+            }
+            Button {
+                text: qsTr("Look up")
+                enabled: orderField.text.trim() !== ""
+                onClicked: root.lookUp()
+            }
+            Item { Layout.fillWidth: true }
+        }
+
+        Label {
+            visible: root.searched && root.entries.length === 0
+            text: qsTr("This order is not in the run history")
+            color: Theme.textMuted
+            font.pixelSize: 13
+        }
+
+        ListView {
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            clip: true
+            model: root.entries
+            spacing: 6
+            boundsBehavior: Flickable.StopAtBounds
+            ScrollBar.vertical: ScrollBar {}
+
+            delegate: Rectangle {
+                width: ListView.view.width
+                implicitHeight: row.implicitHeight + 16
+                radius: 8
+                color: Theme.surfaceLight
+                border.color: Theme.border
+                border.width: 1
+
+                RowLayout {
+                    id: row
+                    anchors.fill: parent
+                    anchors.margins: 8
+                    spacing: 12
+
+                    Label {
+                        text: modelData.processed.replace("T", " ")
+                        color: Theme.textMuted
+                        font.pixelSize: 12
+                    }
+
+                    Label {
+                        text: modelData.marketplace || ""
+                        color: Theme.marketplaceColor(modelData.marketplace)
+                        font.pixelSize: 11
+                        font.bold: true
+                    }
+
+                    Label {
+                        text: modelData.error || ""
+                        color: Theme.red
+                        font.pixelSize: 11
+                        elide: Text.ElideRight
+                        Layout.fillWidth: true
+                    }
+
+                    Label {
+                        visible: !!modelData.sheet
+                        text: modelData.row
+                              ? qsTr("sheet: %1, row %2").arg(modelData.sheet).arg(modelData.row)
+                              : qsTr("sheet: %1").arg(modelData.sheet)
+                        color: Theme.textMuted
+                        font.pixelSize: 12
+                    }
+                    Label {
+                        text: root.statusText(modelData.status)
+                        color: root.statusColor(modelData.status)
+                        font.pixelSize: 12
+                        font.bold: true
+                    }
+                }
+            }
+        }
+    }
+}
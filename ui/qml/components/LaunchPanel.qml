@@ -43,6 +43,23 @@ Rectangle {
                 enabled: !App.running
                 onClicked: fileDialog.open()
             }
+            ComboBox {
+                id: sinkBox
+                Layout.preferredWidth: 170
+                model: [
+                    { code: "sheets", label: qsTr("To Google Sheets") },
+                    { code: "jsonl", label: qsTr("Dry run: JSONL") },
+                    { code: "csv", label: qsTr("Dry run: CSV") },
+                    { code: "sqlite", label: qsTr("Dry run: SQLite") }
+                ]
+                textRole: "label"
+                valueRole: "code"
+                enabled: !App.running
+                Component.onCompleted: currentIndex = indexOfValue(App.sink)
+                onActivated: App.sink = currentValue
+                ToolTip.visible: hovered && App.sink !== "sheets"
+                ToolTip.text: qsTr("Rows are saved to the output folder, the spreadsheet is not touched")
+            }
             Button {
                 text: App.running ? qsTr("Processing…") : qsTr("Process orders")
                 highlighted: true
@@ -1,6 +1,7 @@
 import QtQuick
 import QtQuick.Controls
 import QtQuick.Layouts
+import QtQuick.Dialogs
 import Qt.labs.qmlmodels
 
 // Journal tab: search, "problems only" filter, copy button and the log list.
@@ -12,6 +13,15 @@ Rectangle {
     border.color: Theme.border
     border.width: 1
 
+    FileDialog {
+        id: saveDialog
+        title: qsTr("Save the journal")
+        fileMode: FileDialog.SaveFile
+        defaultSuffix: "txt"
+        nameFilters: [qsTr("Text files (*.txt)"), qsTr("All files (*)")]
+        onAccepted: App.saveLog(selectedFile)
+    }
+
     ColumnLayout {
         anchors.fill: parent
         anchors.margins: 10
@@ -42,6 +52,11 @@ Rectangle {
                     hiddenCopy.copy()
                 }
             }
+            Button {
+                text: qsTr("Save…")
+                flat: true
+                onClicked: saveDialog.open()
+            }
         }
 
         // invisible buffer used as a clipboard bridge for the Copy button
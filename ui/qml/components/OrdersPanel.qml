@@ -25,7 +25,9 @@ Rectangle {
             implicitHeight: row.implicitHeight + 16
             radius: 8
             color: Theme.surfaceLight
-            border.color: model.ok ? Theme.border : Qt.alpha(Theme.red, 0.5)
+            border.color: model.ok ? Theme.border
+                        : model.spooled ? Qt.alpha(Theme.yellow, 0.5)
+                        : Qt.alpha(Theme.red, 0.5)
             border.width: 1
 
             RowLayout {
@@ -68,7 +70,15 @@ Rectangle {
                         Layout.fillWidth: true
                     }
                     Label {
-                        visible: !model.ok
+                        visible: model.spooled
+                        text: qsTr("Waiting in the offline spool until Google is reachable")
+                        color: Theme.yellow
+                        font.pixelSize: 11
+                        elide: Text.ElideRight
+                        Layout.fillWidth: true
+                    }
+                    Label {
+                        visible: !model.ok && !model.spooled
                         text: model.error
                         color: Theme.red
                         font.pixelSize: 11
@@ -78,20 +88,20 @@ Rectangle {
                 }
 
                 Label {
-                    visible: model.ok
+                    visible: model.ok || model.spooled
                     text: qsTr("sheet: %1").arg(model.sheet)
                     color: Theme.textMuted
                     font.pixelSize: 12
                 }
                 Label {
-                    visible: model.ok
+                    visible: model.ok || model.spooled
                     text: qsTr("%n item(s)", "", model.items)
                     color: Theme.textMuted
                     font.pixelSize: 12
                 }
                 Label {
-                    text: model.ok ? "✓" : "✕"
-                    color: model.ok ? Theme.green : Theme.red
+                    text: model.ok ? "✓" : model.spooled ? "⧗" : "✕"
+                    color: model.ok ? Theme.green : model.spooled ? Theme.yellow : Theme.red
                     font.pixelSize: 16
                     font.bold: true
                 }
@@ -43,6 +43,12 @@ RowLayout {
         value: App.failedCount
         accent: App.failedCount > 0 ? Theme.red : Theme.textMuted
     }
+    StatCard {
+        visible: App.spooledCount > 0
+        label: qsTr("Waiting for Google")
+        value: App.spooledCount
+        accent: Theme.yellow
+    }
 
     Item { Layout.fillWidth: true }
 